@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 
+import asyncio
 import json
 import os
 import re
@@ -11,11 +12,15 @@ import subprocess
 import tempfile
 import time
 from collections import Counter
+from collections.abc import Callable, Coroutine, Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache, partial
 from pathlib import Path
+from typing import Any
 
 
-from .platform import amplifier_home, no_editor_message
+from .platform import amplifier_home, amplifier_projects_dir, no_editor_message
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -30,7 +35,9 @@ from textual.widgets import (
 )
 from textual import work
 from textual.css.query import NoMatches
+from textual.message import Message
 from textual.timer import Timer
+from textual.widget import Widget
 
 from .log import logger
 from .history import PromptHistory
@@ -57,17 +64,23 @@ from .constants import (
     MODEL_CONTEXT_WINDOWS,
     MODES,
     PROMPT_TEMPLATES,
+    RESTORE_CONCURRENCY,
     SLASH_COMMANDS,
+    TRANSCRIPT_HISTORY_BATCH,
+    TRANSCRIPT_TAIL_MESSAGES,
 )
 from .widgets import (
+    ASSISTANT_MESSAGE_TYPES,
     AmplifierCommandProvider,
     AssistantMessage,
     Attachment,
     ChatInput,
+    ChatRecord,
     ErrorMessage,
     FindBar,
     FoldToggle,
     HistorySearchBar,
+    LazyCollapsible,
     MessageMeta,
     NoteMessage,
     AgentTreePanel,
@@ -76,16 +89,29 @@ from .widgets import (
     PinnedPanelItem,
     ProjectPanel,
     ProcessingIndicator,
+    SessionTreeEntry,
+    SessionTreeGroup,
+    SessionTreeIndex,
     ShortcutOverlay,
+    StreamedAssistantMessage,
+    StreamingMarkdown,
     SuggestionBar,
     SystemMessage,
     TabBar,
     TabState,
+    ThemedRenderable,
     TodoPanel,
     UserMessage,
+    VirtualTranscript,
+    assistant_markdown_theme,
+    make_session_tree_entry,
 )
+from .widgets.session_tree import FILTER_DEBOUNCE_SECONDS
 
+from .core._json import DECODE_ERRORS as JSON_DECODE_ERRORS, loads as json_loads
 from .core.app_base import SharedAppBase
+from .core.conversation import ConversationState
+from .core.session_catalog import SessionCatalog
 
 from .commands import (
     AgentCommandsMixin,
@@ -137,18 +163,74 @@ from .persistence import (
     TagStore,
     TemplateStore,
 )
+from .persistence._base import JsonStore
 
+from .core.features.transcript_index import TranscriptIndex
 from .core.features.auto_tagger import (
     AutoTagger,
     AutoTagState,
     make_anthropic_auto_tagger,
 )
+from .core.features.llm_jobs import LLMJobQueue
+from .core.features.ui_events import UiEventBus
+from .core.features.autosave_journal import (
+    WORKSPACE_FILE,
+    AutosaveJournal,
+    TabCheckpoint,
+    autosave_mtime,
+    list_autosaves,
+    load_autosave,
+)
+from .core.message_store import MessageStore, topic_words
+from .core.features.process_runner import run_git_async
+from .core.features.context_profiler import estimate_tokens
 from ._utils import _context_color, _copy_to_clipboard, _get_tool_label  # noqa: E402
+from .transcript_loader import TranscriptTailReader
 
 
 _amp_home = amplifier_home()
 
 
+class AutoTagsReady(Message):
+    """Posted (from an LLM worker thread) when an auto-tag job finished.
+
+    ``error`` is set (and ``tags`` is ``None``) when the job failed or
+    timed out.
+    """
+
+    def __init__(
+        self, session: object, tags: list[str] | None, error: str | None = None
+    ) -> None:
+        self.session = session
+        self.tags = tags
+        self.error = error
+        super().__init__()
+
+
+class UiEventsPending(Message):
+    """Posted (from a streaming thread) when UI updates are waiting on the bus."""
+
+
+@dataclass
+class _ReplayBatch:
+    """Replay records parsed from a run of transcript messages.
+
+    ``search_index`` / ``msg_index`` of the records count from the start of
+    the batch; ``search`` holds the matching ``_search_messages`` entries.
+    """
+
+    records: list[ChatRecord] = field(default_factory=list)
+    search: MessageStore = field(default_factory=MessageStore)
+    last_assistant: ChatRecord | None = None
+    total_words: int = 0
+    user_message_count: int = 0
+    user_words: int = 0
+    assistant_message_count: int = 0
+    assistant_words: int = 0
+    tool_call_count: int = 0
+    tool_usage: Counter[str] = field(default_factory=Counter)
+
+
 class AmplifierTuiApp(
     MonitorCommandsMixin,
     TerminalCommandsMixin,
@@ -322,6 +404,7 @@ class AmplifierTuiApp(
         self._amplifier_available = True
         self._amplifier_ready = False
         self._session_list_data: list[dict] = []
+        self._session_tree_index = SessionTreeIndex()
         self._sidebar_visible = False
         self._spinner_frame = 0
         self._spinner_timer: Timer | None = None
@@ -382,8 +465,8 @@ class AmplifierTuiApp(
         # URL/reference collector (/ref command)
         self._session_refs: list[dict] = []
 
-        # Search index: parallel list of (role, text, widget) for /search
-        self._search_messages: list[tuple[str, str, Static | None]] = []
+        # Search index: (role, text, widget) records for /search, with totals
+        self._search_messages = MessageStore()
 
         # Cross-session search results (for /search open N)
         self._last_search_results: list[dict] = []
@@ -417,6 +500,7 @@ class AmplifierTuiApp(
 
         # Crash-recovery draft timer (debounced save)
         self._crash_draft_timer: Timer | None = None
+        self._session_filter_timer: Timer | None = None
 
         # Draft auto-save change detection
         self._last_saved_draft: str = ""
@@ -459,6 +543,12 @@ class AmplifierTuiApp(
         self._autosave_interval: int = self._prefs.autosave.interval
         self._last_autosave: float = 0.0
         self._autosave_timer: Timer | None = None
+        self._autosave_journal = AutosaveJournal(
+            AUTOSAVE_DIR, keep=MAX_AUTOSAVES_PER_TAB
+        )
+
+        # UI updates posted by streaming threads, applied once per frame
+        self._ui_events = UiEventBus(lambda: self.post_message(UiEventsPending()))
 
         # File attachments (cleared after sending)
         self._attachments: list[Attachment] = []
@@ -495,11 +585,17 @@ class AmplifierTuiApp(
         self._tag_store = TagStore(_amp_home / "tui-session-tags.json")
         self._clipboard_store = ClipboardStore(_amp_home / "tui-clipboard-ring.json")
 
+        # Cross-session transcript search (sidebar >, /search, /sessions search)
+        self._transcript_index = TranscriptIndex(_amp_home / "tui-transcript-index.db")
+
         # ── Auto-tagging ──────────────────────────────────────────
         self._auto_tag_state = AutoTagState(_amp_home / "tui-auto-tag-state.json")
         self._auto_tagger: AutoTagger | None = None
         self._auto_tag_timer: Timer | None = None
 
+        # Background LLM calls (auto-tags, monitor summaries)
+        self._llm_jobs = LLMJobQueue(max_workers=2)
+
         # Recently included files (/include recent)
         self._recent_includes: list[str] = []
 
@@ -531,7 +627,7 @@ class AmplifierTuiApp(
         self._context_history = ContextHistory()
 
         # Session dashboard stats (/dashboard command)
-        self._dashboard_stats = DashboardStats()
+        self._dashboard_stats = DashboardStats.persistent()
 
     # ── Layout ──────────────────────────────────────────────────
 
@@ -669,6 +765,9 @@ class AmplifierTuiApp(
         # Initialize tab bar
         self._update_tab_bar()
 
+        # Load branch/status in the background so the first /git is instant
+        self._run_background(self._git_state.prefetch(), group="git")
+
         # Show UI immediately, defer Amplifier import to background
         self._show_welcome()
         self.query_one("#chat-input", ChatInput).focus()
@@ -730,6 +829,9 @@ class AmplifierTuiApp(
         # Heavy import in background
         self._init_amplifier_worker()
 
+        # Build / catch up the transcript search index off the UI thread
+        self._transcript_index.refresh_in_background()
+
     @work(thread=True)
     def _init_amplifier_worker(self) -> None:
         """Import Amplifier in background so UI appears instantly."""
@@ -773,6 +875,10 @@ class AmplifierTuiApp(
 
         self._amplifier_ready = True
 
+        # Pre-start idle sessions so new tabs and /new skip the cold start
+        if self._prefs.environment.session_pool:
+            self.session_manager.enable_pool(self._prefs.environment.session_pool)
+
         # Now handle resume or initial prompt
         if self.resume_session_ids:
             self._restore_multi_sessions_worker(self.resume_session_ids)
@@ -857,6 +963,7 @@ class AmplifierTuiApp(
         # Don't persist widget refs across tab switches (they belong to the DOM)
         tab.stream_widget = None
         tab.stream_container = None
+        tab.stream_markdown = None
         # Preserve unsent input text across tab switches
         try:
             tab.input_text = self.query_one("#chat-input", ChatInput).text
@@ -1019,7 +1126,7 @@ class AmplifierTuiApp(
 
         # Reset app state for new tab
         self._session_title = ""
-        self._search_messages = []
+        self._search_messages = MessageStore()
         self._total_words = 0
         self._user_message_count = 0
         self._assistant_message_count = 0
@@ -1070,6 +1177,7 @@ class AmplifierTuiApp(
             self._exit_tab_split()
 
         closing_tab = self._tabs[index]
+        self._ui_events.discard(closing_tab.conversation.conversation_id)
 
         # Remove the container widget
         try:
@@ -1503,91 +1611,33 @@ class AmplifierTuiApp(
     def _do_autosave(self) -> None:
         """Auto-save ALL tabs and workspace state.
 
-        Silently fails — never interrupts the user.
+        Only messages added or changed since the last checkpoint are
+        queued; the journal writes them on its own thread.  Silently
+        fails — never interrupts the user.
         """
         if not self._autosave_enabled:
             return
         try:
             # Sync active tab state so all tabs are up-to-date
             self._save_current_tab_state()
-
-            ts = int(time.time())
-            saved_tabs_info: list[dict] = []
-
-            for tab in self._tabs:
-                messages = tab.conversation.search_messages
-                tab_id = tab.tab_id
-
-                if not messages:
-                    # Track the tab but no autosave file
-                    saved_tabs_info.append(
-                        {
-                            "tab_id": tab_id,
-                            "name": tab.custom_name or tab.name,
-                            "autosave_file": None,
-                        }
+            self._autosave_journal.checkpoint(
+                [
+                    TabCheckpoint(
+                        tab_id=tab.tab_id,
+                        name=tab.custom_name or tab.name,
+                        messages=tab.conversation.search_messages,
+                        session_id=tab.conversation.session_id or "",
+                        title=tab.conversation.title or "",
                     )
-                    continue
-
-                session_data = {
-                    "session_id": tab.conversation.session_id or "",
-                    "session_title": tab.conversation.title or "",
-                    "tab_id": tab_id,
-                    "tab_name": tab.custom_name or tab.name,
-                    "saved_at": datetime.now().isoformat(),
-                    "message_count": len(messages),
-                    "messages": [
-                        {"role": role, "content": content}
-                        for role, content, _widget in messages
-                    ],
-                }
-
-                filename = f"autosave-{tab_id}-{ts}.json"
-                filepath = AUTOSAVE_DIR / filename
-                filepath.write_text(
-                    json.dumps(session_data, indent=2, ensure_ascii=False),
-                    encoding="utf-8",
-                )
-
-                saved_tabs_info.append(
-                    {
-                        "tab_id": tab_id,
-                        "name": tab.custom_name or tab.name,
-                        "autosave_file": filename,
-                    }
-                )
-
-                # Rotate old auto-saves for this tab
-                self._rotate_autosaves(tab_id)
-
-            # Write workspace state (tab layout + references to autosave files)
-            workspace_state = {
-                "saved_at": datetime.now().isoformat(),
-                "active_tab_index": self._active_tab_index,
-                "tab_counter": self._tab_counter,
-                "tabs": saved_tabs_info,
-            }
-            ws_path = AUTOSAVE_DIR / "workspace-state.json"
-            ws_path.write_text(
-                json.dumps(workspace_state, indent=2, ensure_ascii=False),
-                encoding="utf-8",
+                    for tab in self._tabs
+                ],
+                active_tab_index=self._active_tab_index,
+                tab_counter=self._tab_counter,
             )
-
             self._last_autosave = time.time()
         except OSError:
             logger.debug("auto-save failed", exc_info=True)
 
-    def _rotate_autosaves(self, tab_id: str) -> None:
-        """Keep only the last MAX_AUTOSAVES_PER_TAB files per tab."""
-        try:
-            pattern = f"autosave-{tab_id}-*.json"
-            files = sorted(AUTOSAVE_DIR.glob(pattern), key=lambda f: f.stat().st_mtime)
-            while len(files) > MAX_AUTOSAVES_PER_TAB:
-                oldest = files.pop(0)
-                oldest.unlink(missing_ok=True)
-        except OSError:
-            logger.debug("failed to rotate autosaves", exc_info=True)
-
     def _check_autosave_recovery(self) -> None:
         """Check for workspace or auto-save files on startup and auto-restore."""
         try:
@@ -1595,7 +1645,7 @@ class AmplifierTuiApp(
                 return
 
             # First check for workspace state (multi-tab restore)
-            ws_path = AUTOSAVE_DIR / "workspace-state.json"
+            ws_path = AUTOSAVE_DIR / WORKSPACE_FILE
             if ws_path.exists():
                 ws_age = (time.time() - ws_path.stat().st_mtime) / 60
                 if ws_age < 60:  # Less than 1 hour old
@@ -1603,15 +1653,10 @@ class AmplifierTuiApp(
                     return
 
             # Fall back to individual autosave notification
-            autosaves = sorted(
-                AUTOSAVE_DIR.glob("autosave-*.json"),
-                key=lambda f: f.stat().st_mtime,
-                reverse=True,
-            )
+            autosaves = list_autosaves(AUTOSAVE_DIR)
             if not autosaves:
                 return
-            latest = autosaves[0]
-            age_minutes = (time.time() - latest.stat().st_mtime) / 60
+            age_minutes = (time.time() - autosave_mtime(autosaves[0])) / 60
             if age_minutes < 60:  # Only offer if less than 1 hour old
                 self._add_system_message(
                     f"Auto-save found ({age_minutes:.0f} min ago). "
@@ -1645,11 +1690,7 @@ class AmplifierTuiApp(
     def _autosave_restore(self, file_index: int | None = None) -> None:
         """Show available auto-saves or restore one by number."""
         try:
-            autosaves = sorted(
-                AUTOSAVE_DIR.glob("autosave-*.json"),
-                key=lambda f: f.stat().st_mtime,
-                reverse=True,
-            )
+            autosaves = list_autosaves(AUTOSAVE_DIR)
         except OSError:
             logger.debug("failed to list autosaves", exc_info=True)
             autosaves = []
@@ -1673,9 +1714,12 @@ class AmplifierTuiApp(
         lines = ["Available auto-saves:"]
         for i, f in enumerate(autosaves[:10], 1):
             try:
-                age = (time.time() - f.stat().st_mtime) / 60
+                age = (time.time() - autosave_mtime(f)) / 60
                 size = f.stat().st_size / 1024
-                data = json.loads(f.read_text(encoding="utf-8"))
+                journal = f.with_suffix(".jsonl")
+                if journal.exists():
+                    size += journal.stat().st_size / 1024
+                data = load_autosave(f)
                 title = data.get("session_title", "")
                 msg_count = data.get("message_count", "?")
                 label = f" — {title}" if title else ""
@@ -1698,7 +1742,7 @@ class AmplifierTuiApp(
         )
 
         # Check for workspace state
-        ws_path = AUTOSAVE_DIR / "workspace-state.json"
+        ws_path = AUTOSAVE_DIR / WORKSPACE_FILE
         if ws_path.exists():
             try:
                 ws = json.loads(ws_path.read_text(encoding="utf-8"))
@@ -1716,7 +1760,7 @@ class AmplifierTuiApp(
     def _restore_autosave_file(self, filepath: Path) -> None:
         """Restore messages from a single auto-save file into a new tab."""
         try:
-            data = json.loads(filepath.read_text(encoding="utf-8"))
+            data = load_autosave(filepath)
         except (OSError, json.JSONDecodeError) as exc:
             self._add_system_message(f"Failed to read auto-save: {exc}")
             return
@@ -1752,7 +1796,7 @@ class AmplifierTuiApp(
 
     def _restore_workspace_from_command(self) -> None:
         """Handle /autosave restore workspace command."""
-        ws_path = AUTOSAVE_DIR / "workspace-state.json"
+        ws_path = AUTOSAVE_DIR / WORKSPACE_FILE
         if not ws_path.exists():
             self._add_system_message("No workspace state found.")
             return
@@ -1794,7 +1838,7 @@ class AmplifierTuiApp(
                 continue
 
             try:
-                data = json.loads(filepath.read_text(encoding="utf-8"))
+                data = load_autosave(filepath)
             except (OSError, json.JSONDecodeError):
                 logger.debug(
                     "failed to read tab autosave during restore", exc_info=True
@@ -2076,7 +2120,7 @@ class AmplifierTuiApp(
     def _scroll_to_pinned_message(self, msg_index: int) -> None:
         """Scroll the chat view to bring a pinned message into view."""
         if msg_index < len(self._search_messages):
-            widget = self._search_messages[msg_index][2]
+            widget = self._message_widget(msg_index)
             if widget is not None:
                 widget.scroll_visible(animate=True)
                 # Briefly highlight the message
@@ -2166,13 +2210,18 @@ class AmplifierTuiApp(
         Pinned sessions are rendered first under a dedicated group, then the
         remaining sessions are sorted/grouped per the active sort preference.
         Session ID is stored as node ``data`` for selection handling.
+
+        Labels and search keys are computed here, once per load, into a
+        :class:`SessionTreeIndex`; the filter input only shows and hides
+        its nodes.
         """
         self._session_list_data = []
         tree = self.query_one("#session-tree", Tree)
-        tree.clear()
-        tree.show_root = False
+        self._session_tree_index = SessionTreeIndex()
 
         if not sessions:
+            tree.clear()
+            tree.show_root = False
             tree.root.add_leaf("No sessions found")
             return
 
@@ -2180,6 +2229,20 @@ class AmplifierTuiApp(
         session_titles = self._load_session_titles()
         all_tags = self._tag_store.load()
 
+        def _entry(s: dict) -> SessionTreeEntry:
+            sid = s["session_id"]
+            session_tags = all_tags.get(sid, [])
+            self._session_list_data.append(s)
+            return make_session_tree_entry(
+                sid,
+                self._session_display_label(
+                    s, custom_names, session_titles, tags=session_tags
+                ),
+                self._session_display_label(s, custom_names, session_titles),
+                s["project"],
+                session_tags,
+            )
+
         # Partition into pinned / unpinned
         pinned = [s for s in sessions if s["session_id"] in self._pinned_sessions]
         unpinned = [s for s in sessions if s["session_id"] not in self._pinned_sessions]
@@ -2187,104 +2250,42 @@ class AmplifierTuiApp(
         # Sort unpinned according to preference
         unpinned = self._sort_sessions(unpinned, custom_names)
 
+        groups: list[SessionTreeGroup] = []
         # ── Pinned group ──
         if pinned:
-            pin_group = tree.root.add("▪ Pinned", expand=True)
-            for s in pinned:
-                sid = s["session_id"]
-                session_tags = all_tags.get(sid, [])
-                display = self._session_display_label(
-                    s, custom_names, session_titles, tags=session_tags
-                )
-                node = pin_group.add(display, data=sid)
-                # Show full info in child node
-                tag_info = (
-                    f"  {' '.join(f'#{t}' for t in session_tags)}"
-                    if session_tags
-                    else ""
+            groups.append(
+                SessionTreeGroup(
+                    key="\0pinned",
+                    title="▪ Pinned",
+                    counted=False,
+                    entries=[_entry(s) for s in pinned],
                 )
-                node.add_leaf(f"id: {sid[:12]}...{tag_info}")
-                node.collapse()
-                self._session_list_data.append(s)
+            )
 
-        # ── Unpinned, grouped ──
+        # ── Unpinned, grouped (by first tag or by project) — with counts ──
         mode = getattr(self._prefs, "session_sort", "date")
-        if mode == "tag":
-            # Group by first tag — with counts
-            tag_counts: dict[str, int] = {}
-            for s in unpinned:
-                st = all_tags.get(s["session_id"], [])
-                label = f"#{st[0]}" if st else "Untagged"
-                tag_counts[label] = tag_counts.get(label, 0) + 1
-
-            current_group: str | None = None
-            group_node = tree.root
-            for s in unpinned:
-                sid = s["session_id"]
-                session_tags = all_tags.get(sid, [])
-                first_tag = session_tags[0] if session_tags else "Untagged"
-                group_label = f"#{first_tag}" if session_tags else "Untagged"
-                if group_label != current_group:
-                    current_group = group_label
-                    count = tag_counts.get(group_label, 0)
-                    group_node = tree.root.add(
-                        f"{group_label} [dim]({count})[/dim]", expand=True
-                    )
-                display = self._session_display_label(
-                    s, custom_names, session_titles, tags=session_tags
-                )
-                session_node = group_node.add(display, data=sid)
-                tag_info = (
-                    f"  {' '.join(f'#{t}' for t in session_tags)}"
-                    if session_tags
-                    else ""
-                )
-                session_node.add_leaf(f"id: {sid[:12]}...{tag_info}")
-                session_node.collapse()
-                self._session_list_data.append(s)
-        else:
-            # Group by project (existing behavior) — with counts
-            project_counts: dict[str, int] = {}
-            for s in unpinned:
-                p = s["project"]
-                project_counts[p] = project_counts.get(p, 0) + 1
-
-            current_group: str | None = None
-            group_node = tree.root
-            for s in unpinned:
-                project = s["project"]
-                if project != current_group:
-                    current_group = project
-                    parts = project.split("/")
-                    short = "/".join(parts[-2:]) if len(parts) > 2 else project
-                    count = project_counts.get(project, 0)
-                    group_node = tree.root.add(
-                        f"{short} [dim]({count})[/dim]", expand=True
-                    )
-
-                sid = s["session_id"]
-                session_tags = all_tags.get(sid, [])
-                display = self._session_display_label(
-                    s, custom_names, session_titles, tags=session_tags
-                )
-                session_node = group_node.add(display, data=sid)
-                tag_info = (
-                    f"  {' '.join(f'#{t}' for t in session_tags)}"
-                    if session_tags
-                    else ""
-                )
-                session_node.add_leaf(f"id: {sid[:12]}...{tag_info}")
-                session_node.collapse()
-                self._session_list_data.append(s)
+        group: SessionTreeGroup | None = None
+        for s in unpinned:
+            if mode == "tag":
+                session_tags = all_tags.get(s["session_id"], [])
+                key = title = f"#{session_tags[0]}" if session_tags else "Untagged"
+            else:
+                key = s["project"]
+                parts = key.split("/")
+                title = "/".join(parts[-2:]) if len(parts) > 2 else key
+            if group is None or group.key != key:
+                group = SessionTreeGroup(key=key, title=title)
+                groups.append(group)
+            group.entries.append(_entry(s))
+
+        self._session_tree_index = SessionTreeIndex(groups)
+        query = self._session_filter_query()
+        self._session_tree_index.apply(tree, query)
 
         self._queue_auto_tagging(sessions, all_tags)
         # Start auto-tag timer if not running and there's pending work
-        if (
-            self._auto_tagger is not None
-            and self._auto_tagger.has_pending
-            and self._auto_tag_timer is None
-        ):
-            self._auto_tag_timer = self.set_interval(30.0, self._process_auto_tags)
+        if self._auto_tagger is not None and self._auto_tagger.has_pending:
+            self._ensure_auto_tag_timer()
 
     def _queue_auto_tagging(self, sessions: list[dict], all_tags: dict) -> None:
         """Queue untagged sessions for auto-tagging."""
@@ -2297,9 +2298,6 @@ class AmplifierTuiApp(
                 self._auto_tag_state,
                 tag_fn=tag_fn,
             )
-        from .platform import amplifier_projects_dir
-
-        sessions_dir = amplifier_projects_dir()
         for s in sessions:
             sid = s["session_id"]
             if all_tags.get(sid):
@@ -2307,43 +2305,71 @@ class AmplifierTuiApp(
             mtime = s["mtime"]
             if not self._auto_tagger.needs_tagging(sid, mtime):
                 continue
-            # Resolve session directory
-            try:
-                for project_dir in sessions_dir.iterdir():
-                    session_dir = project_dir / "sessions" / sid
-                    if session_dir.is_dir():
-                        self._auto_tagger.queue_session(
-                            sid, s["project"], session_dir, mtime
-                        )
-                        break
-            except Exception:
-                pass
+            session_dir = self._find_session_dir(sid)
+            if session_dir is not None:
+                self._auto_tagger.queue_session(sid, s["project"], session_dir, mtime)
 
     def _process_auto_tags(self) -> None:
-        """Process pending auto-tagging requests (slow timer)."""
+        """Dispatch up to 3 pending auto-tagging requests (slow timer).
+
+        The LLM calls run on ``_llm_jobs`` workers; results come back as
+        :class:`AutoTagsReady` messages.
+        """
+        tagger = self._auto_tagger
+        if tagger is None:
+            return
+        for pending in tagger.take_pending(max_count=3):
+
+            def _done(key: str, tags: list[str] | None, error: str | None, p=pending):
+                if tags is not None or error is not None:
+                    self.post_message(AutoTagsReady(p, tags, error))
+
+            if not self._llm_jobs.submit(
+                f"tags:{pending.session_id}",
+                lambda p=pending: tagger.generate_tags(p),
+                on_done=_done,
+            ):
+                # A job for this session is still in flight; try again later.
+                tagger.requeue(pending, retry=False)
+        if tagger.has_pending:
+            self._ensure_auto_tag_timer()
+        elif self._auto_tag_timer is not None:
+            self._auto_tag_timer.stop()
+            self._auto_tag_timer = None
+
+    def _ensure_auto_tag_timer(self) -> None:
+        if self._auto_tag_timer is None:
+            self._auto_tag_timer = self.set_interval(30.0, self._process_auto_tags)
+
+    def on_auto_tags_ready(self, message: AutoTagsReady) -> None:
+        """Store generated tags and refresh the sidebar to show them.
+
+        Failed or timed-out jobs put the session back on the queue.
+        """
         if self._auto_tagger is None:
             return
+        if message.tags is None:
+            if self._auto_tagger.requeue(message.session):  # type: ignore[arg-type]
+                self._ensure_auto_tag_timer()
+            return
         try:
-            processed = self._auto_tagger.process_pending(max_count=3)
-            if processed > 0:
-                # Refresh sidebar to show new tags
-                if self._session_list_data:
-                    self._populate_session_list(self._session_list_data)
-            if not self._auto_tagger.has_pending and self._auto_tag_timer is not None:
-                self._auto_tag_timer.stop()
-                self._auto_tag_timer = None
+            self._auto_tagger.apply_tags(message.session, message.tags)  # type: ignore[arg-type]
         except Exception:
             logger.debug("Auto-tag processing failed", exc_info=True)
+            return
+        if self._session_list_data:
+            self._populate_session_list(self._session_list_data)
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Filter the session tree as the user types in the filter input."""
         if event.input.id == "session-filter":
             value = event.value
+            if self._session_filter_timer is not None:
+                self._session_filter_timer.stop()
+                self._session_filter_timer = None
             if value.startswith(">"):
                 # Search mode: show hint instead of filtering metadata
-                tree = self.query_one("#session-tree", Tree)
-                tree.clear()
-                tree.show_root = False
+                tree = self._clear_session_tree()
                 query_part = value[1:].strip()
                 if query_part:
                     tree.root.add_leaf(
@@ -2352,7 +2378,10 @@ class AmplifierTuiApp(
                 else:
                     tree.root.add_leaf("Type query after > to search inside sessions")
             else:
-                self._filter_sessions(value)
+                # Debounced: a burst of keystrokes filters once.
+                self._session_filter_timer = self.set_timer(
+                    FILTER_DEBOUNCE_SECONDS, partial(self._filter_sessions, value)
+                )
         elif event.input.id == "find-input":
             self._find_execute_search(event.value)
 
@@ -2442,6 +2471,12 @@ class AmplifierTuiApp(
                 event.stop()
                 return
 
+            # Then a running /run or git command
+            if self._cancel_shell_commands():
+                event.prevent_default()
+                event.stop()
+                return
+
             # Exit focus mode first if active (only when input is empty
             # so we don't conflict with vim mode or other Escape uses)
             if self._focus_mode:
@@ -2467,104 +2502,36 @@ class AmplifierTuiApp(
                 pass
 
     def _filter_sessions(self, query: str) -> None:
-        """Rebuild the session tree showing only sessions matching *query*.
+        """Show only the sidebar sessions matching *query*.
 
-        Matches against session name/description, session ID, and project path.
-        Pinned sessions appear first under a dedicated group.
-        When the query is empty, all sessions are shown.
+        Matches against session name/description, session ID, project path
+        and tags (``#tag`` matches tags only).  Pinned sessions appear first
+        under a dedicated group.  When the query is empty, all sessions are
+        shown.  Only the nodes whose visibility changed are touched.
         """
-        tree = self.query_one("#session-tree", Tree)
-        tree.clear()
-        tree.show_root = False
-
-        sessions = self._session_list_data
-        if not sessions:
+        if self._session_filter_timer is not None:
+            self._session_filter_timer.stop()
+            self._session_filter_timer = None
+        if not len(self._session_tree_index):
             return
+        tree = self.query_one("#session-tree", Tree)
+        self._session_tree_index.apply(tree, query)
 
-        q = query.lower().strip()
-        custom_names = self._load_session_names()
-        session_titles = self._load_session_titles()
-        all_tags = self._tag_store.load()
-
-        def _matches(s: dict) -> bool:
-            """Return True if the session matches the current filter query."""
-            if not q:
-                return True
-            sid = s["session_id"]
-            tags = all_tags.get(sid, [])
-            # #prefix means tag-only search
-            if q.startswith("#"):
-                tag_q = q[1:]
-                return any(tag_q in t for t in tags)
-            display = self._session_display_label(s, custom_names, session_titles)
-            project = s["project"]
-            return (
-                q in display.lower()
-                or q in sid.lower()
-                or q in project.lower()
-                or any(q in t for t in tags)
-            )
-
-        # Partition into pinned / unpinned
-        pinned = [
-            s
-            for s in sessions
-            if s["session_id"] in self._pinned_sessions and _matches(s)
-        ]
-        unpinned = [
-            s
-            for s in sessions
-            if s["session_id"] not in self._pinned_sessions and _matches(s)
-        ]
-        matched = len(pinned) + len(unpinned)
-
-        # Sort unpinned according to preference
-        unpinned = self._sort_sessions(unpinned, custom_names)
-
-        # ── Pinned group ──
-        if pinned:
-            pin_group = tree.root.add("▪ Pinned", expand=True)
-            for s in pinned:
-                sid = s["session_id"]
-                session_tags = all_tags.get(sid, [])
-                display = self._session_display_label(
-                    s, custom_names, session_titles, tags=session_tags
-                )
-                node = pin_group.add(display, data=sid)
-                tag_info = (
-                    f"  {' '.join(f'#{t}' for t in session_tags)}"
-                    if session_tags
-                    else ""
-                )
-                node.add_leaf(f"id: {sid[:12]}...{tag_info}")
-                node.collapse()
-
-        # ── Unpinned, grouped by project — with counts ──
-        current_group: str | None = None
-        group_node = tree.root
-        for s in unpinned:
-            project = s["project"]
-            if project != current_group:
-                current_group = project
-                parts = project.split("/")
-                short = "/".join(parts[-2:]) if len(parts) > 2 else project
-                count = sum(1 for x in unpinned if x["project"] == project)
-                group_node = tree.root.add(f"{short} [dim]({count})[/dim]", expand=True)
-
-            sid = s["session_id"]
-            session_tags = all_tags.get(sid, [])
-            display = self._session_display_label(
-                s, custom_names, session_titles, tags=session_tags
-            )
-            session_node = group_node.add(display, data=sid)
-            tag_info = (
-                f"  {' '.join(f'#{t}' for t in session_tags)}" if session_tags else ""
-            )
-            session_node.add_leaf(f"id: {sid[:12]}...{tag_info}")
-            session_node.collapse()
+    def _session_filter_query(self) -> str:
+        """Current sidebar filter text, or "" in transcript-search mode."""
+        try:
+            value = self.query_one("#session-filter", Input).value
+        except NoMatches:
+            return ""
+        return "" if value.startswith(">") else value
 
-        if q and matched == 0:
-            tree.root.add_leaf("No matching sessions")
+    def _clear_session_tree(self) -> Tree:
+        """Empty the sidebar tree for search output (filtering rebuilds it)."""
+        tree = self.query_one("#session-tree", Tree)
+        self._session_tree_index.detach()
+        tree.clear()
+        tree.show_root = False
+        return tree
 
     # -- Sidebar transcript search (> prefix / /search integration) ----------
 
@@ -2576,130 +2543,11 @@ class AmplifierTuiApp(
         # Show progress immediately
         self.call_from_thread(self._sidebar_search_show_progress, query)
 
-        projects_dir = amplifier_projects_dir()
-        if not projects_dir.exists():
+        if not amplifier_projects_dir().exists():
             self.call_from_thread(self._display_search_results, [], query)
             return
 
-        query_lower = query.lower()
-        results: list[dict] = []
-
-        for project_dir in projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-            sessions_subdir = project_dir / "sessions"
-            if not sessions_subdir.exists():
-                continue
-
-            for session_dir in sessions_subdir.iterdir():
-                if not session_dir.is_dir():
-                    continue
-                # Skip sub-sessions (agent delegations)
-                if "_" in session_dir.name:
-                    continue
-
-                sid = session_dir.name
-                transcript = session_dir / "transcript.jsonl"
-                if not transcript.exists():
-                    continue
-
-                try:
-                    mtime = transcript.stat().st_mtime
-                except OSError:
-                    continue
-
-                # Read metadata
-                meta_name = ""
-                meta_desc = ""
-                metadata_path = session_dir / "metadata.json"
-                if metadata_path.exists():
-                    try:
-                        meta = json.loads(metadata_path.read_text(encoding="utf-8"))
-                        meta_name = meta.get("name", "")
-                        meta_desc = meta.get("description", "")
-                    except (OSError, json.JSONDecodeError):
-                        pass
-
-                # Derive project name
-                project_name = (
-                    project_dir.name.rsplit("-", 1)[-1]
-                    if "-" in project_dir.name
-                    else project_dir.name
-                )
-
-                # Scan transcript for matches
-                match_count = 0
-                first_snippet = ""
-                first_role = ""
-                try:
-                    with open(transcript, "r", encoding="utf-8") as fh:
-                        for raw_line in fh:
-                            raw_line = raw_line.strip()
-                            if not raw_line:
-                                continue
-                            try:
-                                msg = json.loads(raw_line)
-                            except json.JSONDecodeError:
-                                continue
-                            role = msg.get("role", "")
-                            if role not in ("user", "assistant"):
-                                continue
-                            content = self._extract_transcript_text(
-                                msg.get("content", "")
-                            )
-                            content_lower = content.lower()
-                            start = 0
-                            while True:
-                                idx = content_lower.find(query_lower, start)
-                                if idx == -1:
-                                    break
-                                match_count += 1
-                                if match_count == 1:
-                                    snip_start = max(0, idx - 40)
-                                    snip_end = min(len(content), idx + len(query) + 40)
-                                    snippet = content[snip_start:snip_end].replace(
-                                        "\n", " "
-                                    )
-                                    if snip_start > 0:
-                                        snippet = "..." + snippet
-                                    if snip_end < len(content):
-                                        snippet = snippet + "..."
-                                    first_snippet = snippet
-                                    first_role = role
-                                start = idx + 1
-                except OSError:
-                    continue
-
-                # Also check metadata fields
-                for meta_field in (meta_name, meta_desc):
-                    if meta_field and query_lower in meta_field.lower():
-                        if not first_snippet:
-                            first_snippet = meta_field.replace("\n", " ")[:100]
-                            first_role = "metadata"
-                            match_count = max(match_count, 1)
-                        break
-
-                if match_count > 0:
-                    from datetime import datetime
-
-                    results.append(
-                        {
-                            "session_id": sid,
-                            "mtime": mtime,
-                            "date_str": datetime.fromtimestamp(mtime).strftime(
-                                "%m/%d %H:%M"
-                            ),
-                            "match_count": match_count,
-                            "first_snippet": first_snippet,
-                            "first_role": first_role,
-                            "name": meta_name,
-                            "description": meta_desc,
-                            "project": project_name,
-                        }
-                    )
-
-        # Sort by most recent first
-        results.sort(key=lambda r: r["mtime"], reverse=True)
+        results = self._index_search_results(query)
 
         # Store for /search open N
         self._last_search_results = results
@@ -2710,9 +2558,7 @@ class AmplifierTuiApp(
     def _sidebar_search_show_progress(self, query: str) -> None:
         """Show a 'Searching...' indicator in the sidebar tree."""
         try:
-            tree = self.query_one("#session-tree", Tree)
-            tree.clear()
-            tree.show_root = False
+            tree = self._clear_session_tree()
             tree.root.add_leaf(f"Searching for '{query}'...")
         except Exception:
             pass
@@ -2720,13 +2566,10 @@ class AmplifierTuiApp(
     def _display_search_results(self, results: list[dict], query: str) -> None:
         """Populate the sidebar tree with cross-session search results."""
         try:
-            tree = self.query_one("#session-tree", Tree)
+            tree = self._clear_session_tree()
         except Exception:
             return
 
-        tree.clear()
-        tree.show_root = False
-
         if not results:
             tree.root.add_leaf(f"No matches for '{query}'")
             return
@@ -2939,15 +2782,14 @@ class AmplifierTuiApp(
             self._find_update_counter()
             return
 
-        search_q = query if self._find_case_sensitive else query.lower()
-
-        for i, (_role, text, widget) in enumerate(self._search_messages):
-            hay = text if self._find_case_sensitive else text.lower()
-            if search_q in hay:
-                self._find_matches.append(i)
-                if widget is not None:
-                    widget.add_class("find-match")
-                    self._find_highlighted.add(i)
+        self._find_matches = self._search_messages.find(
+            query, case_sensitive=self._find_case_sensitive
+        )
+        for i in self._find_matches:
+            widget = self._search_messages[i].widget
+            if widget is not None:
+                widget.add_class("find-match")
+                self._find_highlighted.add(i)
 
         if self._find_matches:
             self._find_index = 0
@@ -2984,7 +2826,7 @@ class AmplifierTuiApp(
                     w.remove_class("find-current")
 
         msg_idx = self._find_matches[self._find_index]
-        widget = self._search_messages[msg_idx][2]
+        widget = self._message_widget(msg_idx)
         if widget is not None:
             widget.add_class("find-current")
             try:
@@ -3071,6 +2913,17 @@ class AmplifierTuiApp(
 
         # Save workspace state (all tabs) so it can be restored on next launch
         self._do_autosave()
+        self._autosave_journal.flush(timeout=5.0)
+
+        # Drop queued LLM work; write out store changes still waiting on
+        # the write-behind thread
+        self._llm_jobs.shutdown()
+        JsonStore.flush_all()
+
+        # End the idle pre-started sessions on the pool's own thread; don't
+        # wait for it, the UI is still up
+        if self.session_manager:
+            self.session_manager.close_pool(timeout=0)
 
         if self.session_manager and getattr(self.session_manager, "session", None):
             self._update_status("Saving session...")
@@ -3145,7 +2998,7 @@ class AmplifierTuiApp(
         self._session_refs = []
         self._message_pins = []
         self._session_notes = []
-        self._search_messages = []
+        self._search_messages = MessageStore()
         self._session_start_time = time.monotonic()
         self._update_pinned_panel()
         self._update_word_count_display()
@@ -3163,7 +3016,7 @@ class AmplifierTuiApp(
         self._assistant_words = 0
         self._response_times = []
         self._tool_usage = {}
-        self._search_messages = []
+        self._search_messages = MessageStore()
         self._update_word_count_display()
 
     def action_toggle_auto_scroll(self) -> None:
@@ -4151,15 +4004,13 @@ class AmplifierTuiApp(
 
         Returns (session_id, error_message).  On success error_message is empty.
         """
-        sessions = SessionManager.list_all_sessions(limit=500)
-
-        # Exact match
-        for s in sessions:
-            if s["session_id"] == partial:
-                return partial, ""
-
-        # Prefix match
-        matches = [s for s in sessions if s["session_id"].startswith(partial)]
+        catalog = SessionCatalog.for_dir(amplifier_projects_dir())
+        matches = [
+            e.as_dict()
+            for e in catalog.match_prefix(partial)
+            if e.is_root and catalog.refresh_entry(e)
+        ]
+        matches.sort(key=lambda s: s["mtime"], reverse=True)
         if len(matches) == 1:
             return matches[0]["session_id"], ""
         if len(matches) > 1:
@@ -4290,8 +4141,8 @@ class AmplifierTuiApp(
                         if not raw_line:
                             continue
                         try:
-                            msg = json.loads(raw_line)
-                        except json.JSONDecodeError:
+                            msg = json_loads(raw_line)
+                        except JSON_DECODE_ERRORS:
                             continue
                         role = msg.get("role", "unknown")
                         msg_counts[role] += 1
@@ -4552,8 +4403,6 @@ class AmplifierTuiApp(
             /commit nopush   Stage all, generate message, commit (skip push)
             /commit info     Show what would be committed (dry run)
         """
-        import subprocess
-
         if not self._amplifier_ready:
             self._add_system_message("Amplifier not ready yet.")
             return
@@ -4561,49 +4410,31 @@ class AmplifierTuiApp(
         cwd = self._get_session_project_dir()
         info_mode = "info" in args.lower()
         do_push = "nopush" not in args.lower() and not info_mode
+        self._run_background(
+            self._commit_changes(cwd, info_mode, do_push), group="shell"
+        )
 
+    async def _commit_changes(self, cwd: str, info_mode: bool, do_push: bool) -> None:
+        """The git side of /commit (see :meth:`_cmd_commit`)."""
         try:
-            # Verify we're in a git repo
-            check = subprocess.run(
-                ["git", "rev-parse", "--is-inside-work-tree"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                cwd=cwd,
-            )
-            if check.returncode != 0:
+            # Fresh status: the work tree may have changed since the last read
+            state, _ = await self._git_state.get(cwd, max_age=0)
+            if state is None:
                 self._add_system_message(f"Not a git repository: {cwd}")
                 return
 
-            # Get current branch
-            branch_result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                cwd=cwd,
-            )
-            branch = branch_result.stdout.strip() or "(detached)"
+            branch = state.branch or "(detached)"
 
             # Check for any changes (staged + unstaged + untracked)
-            status = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                cwd=cwd,
-            )
-            if not status.stdout.strip():
+            if state.clean:
                 self._add_system_message("No changes to commit (working tree clean).")
                 return
 
             # /commit info -- dry run: show what would be committed and stop
             if info_mode:
-                from pathlib import Path
-
                 project_label = Path(cwd).name
                 # Categorise porcelain lines
-                lines = status.stdout.strip().splitlines()
+                lines = state.status
                 staged = [ln for ln in lines if ln and ln[0] not in (" ", "?")]
                 unstaged = [ln for ln in lines if len(ln) > 1 and ln[1] in ("M", "D")]
                 untracked = [ln for ln in lines if ln.startswith("??")]
@@ -4634,37 +4465,17 @@ class AmplifierTuiApp(
                 return
 
             # Auto-stage everything
-            stage_result = subprocess.run(
-                ["git", "add", "-A"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                cwd=cwd,
-            )
-            if stage_result.returncode != 0:
-                self._add_system_message(
-                    f"Failed to stage changes: {stage_result.stderr.strip()}"
-                )
+            ok, output = await self._run_git_async("add", "-A", cwd=cwd)
+            if not ok:
+                self._add_system_message(f"Failed to stage changes: {output}")
                 return
 
             # Get the diff summary and content for the LLM
-            diff_summary = subprocess.run(
-                ["git", "diff", "--staged", "--stat"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                cwd=cwd,
-            ).stdout.strip()
-
-            diff_content = subprocess.run(
-                ["git", "diff", "--staged"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=cwd,
-            ).stdout[:4000]
-
-            from pathlib import Path
+            (_, diff_summary), (_, diff_content) = await asyncio.gather(
+                self._run_git_async("diff", "--staged", "--stat", cwd=cwd),
+                run_git_async("diff", "--staged", cwd=cwd, timeout=30),
+            )
+            diff_content = diff_content[:4000]
 
             project_label = Path(cwd).name
 
@@ -4697,10 +4508,6 @@ class AmplifierTuiApp(
             self._start_processing("Generating commit")
             self._send_message_worker(msg)
 
-        except subprocess.TimeoutExpired:
-            self._add_system_message("Git command timed out.")
-        except FileNotFoundError:
-            self._add_system_message("Git not found in PATH.")
         except Exception as e:
             self._add_system_message(f"Error: {e}")
 
@@ -4978,15 +4785,13 @@ class AmplifierTuiApp(
             dt = getattr(ts_widget, "_created_at", None)
             if dt is None:
                 continue
-            content: str = getattr(ts_widget, "_meta_content", "")
+            tokens: int = getattr(ts_widget, "_meta_tokens", 0)
             response_time: float | None = getattr(
                 ts_widget, "_meta_response_time", None
             )
             parts: list[str] = [self._format_timestamp(dt)]
-            if content:
-                tokens = len(content) // 4
-                if tokens > 0:
-                    parts.append(f"~{tokens} tokens")
+            if tokens > 0:
+                parts.append(f"~{tokens} tokens")
             if response_time is not None:
                 parts.append(f"⏱ {response_time:.1f}s")
             ts_widget.update(" · ".join(parts))
@@ -4997,7 +4802,9 @@ class AmplifierTuiApp(
         # An "exchange" is an assistant message together with its preceding
         # user message.  An orphan user message (no response yet) also counts
         # as one exchange.
-        to_remove: list[tuple[str, str, Static | None]] = []
+        # Positions are tracked rather than entries: entries compare by value,
+        # so repeated messages (and unmounted ``None`` widgets) are ambiguous.
+        remove_indices: list[int] = []
         remaining = count
         i = len(self._search_messages) - 1
 
@@ -5011,13 +4818,13 @@ class AmplifierTuiApp(
 
             if role == "assistant":
                 # Found an assistant message — include it
-                to_remove.append(self._search_messages[i])
+                remove_indices.append(i)
                 # Look backward for the paired user message
                 j = i - 1
                 while j >= 0:
                     r2 = self._search_messages[j][0]
                     if r2 == "user":
-                        to_remove.append(self._search_messages[j])
+                        remove_indices.append(j)
                         i = j - 1
                         break
                     elif r2 == "system":
@@ -5034,24 +4841,18 @@ class AmplifierTuiApp(
 
             elif role == "user":
                 # Orphan user message (no assistant response yet)
-                to_remove.append(self._search_messages[i])
+                remove_indices.append(i)
                 remaining -= 1
                 i -= 1
             else:
                 i -= 1
 
-        if not to_remove:
+        if not remove_indices:
             self._add_system_message("Nothing to undo.")
             return
 
-        # Build a set of indices for fast removal from _search_messages
-        indices_to_remove: set[int] = set()
-        for entry in to_remove:
-            try:
-                idx = self._search_messages.index(entry)
-                indices_to_remove.add(idx)
-            except ValueError:
-                pass
+        to_remove = [self._search_messages[idx] for idx in remove_indices]
+        indices_to_remove = set(remove_indices)
 
         # Remove widgets from the DOM (message + adjacent meta / fold toggle)
         for _role, _content, widget in to_remove:
@@ -5098,10 +4899,13 @@ class AmplifierTuiApp(
         # Remove entries from _search_messages (in reverse index order)
         for idx in sorted(indices_to_remove, reverse=True):
             del self._search_messages[idx]
+        transcript = self._active_transcript()
+        if transcript is not None:
+            transcript.discard(indices_to_remove)
 
         # If the last assistant widget was among those removed, update the ref
         for _role, _content, widget in to_remove:
-            if widget is self._last_assistant_widget:
+            if widget is not None and widget is self._last_assistant_widget:
                 self._last_assistant_widget = None
                 self._last_assistant_text = ""
                 break
@@ -5123,101 +4927,16 @@ class AmplifierTuiApp(
 
     @staticmethod
     def _top_words(
-        messages: list[tuple[str, str, object]], n: int = 10
+        messages: Iterable[tuple[str, str, object]], n: int = 10
     ) -> list[tuple[str, int]]:
         """Get top N most frequent meaningful words from messages."""
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "to",
-            "of",
-            "in",
-            "for",
-            "on",
-            "with",
-            "at",
-            "by",
-            "from",
-            "it",
-            "this",
-            "that",
-            "and",
-            "or",
-            "but",
-            "not",
-            "no",
-            "i",
-            "you",
-            "we",
-            "they",
-            "he",
-            "she",
-            "my",
-            "your",
-            "do",
-            "does",
-            "did",
-            "have",
-            "has",
-            "had",
-            "will",
-            "would",
-            "can",
-            "could",
-            "should",
-            "if",
-            "as",
-            "so",
-            "up",
-            "out",
-            "just",
-            "also",
-            "very",
-            "all",
-            "any",
-            "some",
-            "me",
-            "its",
-            "than",
-            "then",
-            "into",
-            "about",
-            "more",
-            "when",
-            "what",
-            "how",
-            "which",
-            "there",
-            "their",
-            "them",
-            "these",
-            "those",
-            "other",
-            "each",
-            "here",
-            "where",
-            "been",
-            "being",
-            "both",
-            "same",
-            "own",
-            "such",
-        }
-        words: list[str] = []
+        if isinstance(messages, MessageStore):
+            return messages.top_words(n)  # kept up to date as messages change
+        words: Counter[str] = Counter()
         for role, content, _ in messages:
             if role.lower() in ("user", "assistant") and content:
-                for word in content.lower().split():
-                    word = word.strip(".,!?:;\"'()[]{}#`*_-/\\")
-                    if len(word) > 2 and word not in stop_words and word.isalpha():
-                        words.append(word)
-        return Counter(words).most_common(n)
+                words.update(topic_words(content))
+        return words.most_common(n)
 
     @staticmethod
     def _format_count(n: int) -> str:
@@ -5288,7 +5007,7 @@ class AmplifierTuiApp(
             return
 
         ts_color = self._prefs.colors.timestamp
-        for widget in chat_view.children:
+        for widget in self._chat_widgets(chat_view):
             classes = widget.classes if hasattr(widget, "classes") else set()
 
             if "msg-timestamp" in classes:
@@ -5391,10 +5110,15 @@ class AmplifierTuiApp(
         widget.styles.color = c.note_text
         widget.styles.border_left = ("thick", c.note_border)
 
-    def _replay_notes(self) -> None:
-        """Re-mount note widgets when restoring a session."""
-        chat_view = self._active_chat_view()
-        for note in self._session_notes:
+    def _replay_notes(self, tab: TabState | None = None) -> None:
+        """Re-mount note widgets when restoring a session (into *tab* if given)."""
+        if tab is None:
+            chat_view = self._active_chat_view()
+            notes, search = self._session_notes, self._search_messages
+        else:
+            chat_view = self.query_one(f"#{tab.container_id}", ScrollableContainer)
+            notes, search = tab.conversation.notes, tab.conversation.search_messages
+        for note in notes:
             try:
                 ts = datetime.fromisoformat(note["created_at"]).strftime("%H:%M")
             except (ValueError, TypeError):
@@ -5404,7 +5128,7 @@ class AmplifierTuiApp(
             msg = NoteMessage(note_text)
             chat_view.mount(msg)
             self._style_note(msg)
-            self._search_messages.append(("note", note["text"], msg))
+            search.append(("note", note["text"], msg))
 
     _SORT_MODES = ("date", "name", "project", "tag")
 
@@ -5477,7 +5201,7 @@ class AmplifierTuiApp(
         assistant_widgets = [
             w
             for w in self.query(".assistant-message")
-            if isinstance(w, AssistantMessage)
+            if isinstance(w, ASSISTANT_MESSAGE_TYPES)
         ]
         if not assistant_widgets:
             self._add_system_message("No assistant message to bookmark.")
@@ -5520,7 +5244,7 @@ class AmplifierTuiApp(
         assistant_widgets = [
             w
             for w in self.query(".assistant-message")
-            if isinstance(w, AssistantMessage)
+            if isinstance(w, ASSISTANT_MESSAGE_TYPES)
         ]
         if not assistant_widgets:
             self._add_system_message("No assistant messages to bookmark.")
@@ -5659,7 +5383,7 @@ class AmplifierTuiApp(
         assistant_widgets = [
             w
             for w in self.query(".assistant-message")
-            if isinstance(w, AssistantMessage)
+            if isinstance(w, ASSISTANT_MESSAGE_TYPES)
         ]
         if not assistant_widgets:
             self._add_system_message("No assistant message to bookmark.")
@@ -5728,6 +5452,18 @@ class AmplifierTuiApp(
                 widget.scroll_visible()
                 self._add_system_message(f"Bookmark {num}/{total}: {bm['label']}")
                 return
+        transcript = self._active_transcript()
+        record = (
+            transcript.find(lambda r: r.msg_index == target_idx)
+            if transcript is not None
+            else None
+        )
+        if transcript is not None and record is not None:
+            widget = transcript.realize(record)
+            if widget is not None:
+                widget.scroll_visible()
+                self._add_system_message(f"Bookmark {num}/{total}: {bm['label']}")
+                return
         self._add_system_message(
             f"Bookmark {num} widget not found (message may have been cleared)."
         )
@@ -5735,8 +5471,8 @@ class AmplifierTuiApp(
     def _cmd_last(self, args: str = "") -> None:
         """Scroll to the last user prompt (or Nth from end)."""
         user_msgs = [
-            (text, widget)
-            for role, text, widget in self._search_messages
+            (text, i)
+            for i, (role, text, _widget) in enumerate(self._search_messages)
             if role == "user"
         ]
         if not user_msgs:
@@ -5760,7 +5496,8 @@ class AmplifierTuiApp(
             )
             return
 
-        text, widget = user_msgs[-n]
+        text, index = user_msgs[-n]
+        widget = self._message_widget(index)
         if widget is not None:
             widget.scroll_visible()
             preview = text.split("\n")[0][:80]
@@ -5843,16 +5580,15 @@ class AmplifierTuiApp(
                 return None
             dt = datetime.now()
         parts: list[str] = [self._format_timestamp(dt)]
-        # Rough token estimate (~4 chars per token)
-        if content:
-            tokens = len(content) // 4
-            if tokens > 0:
-                parts.append(f"~{tokens} tokens")
+        # Token estimate, kept on the widget for _refresh_timestamps
+        tokens = estimate_tokens(content)
+        if tokens > 0:
+            parts.append(f"~{tokens} tokens")
         if response_time is not None:
             parts.append(f"⏱ {response_time:.1f}s")
         widget = MessageMeta(" · ".join(parts), classes="msg-timestamp")
         widget._created_at = dt  # type: ignore[attr-defined]
-        widget._meta_content = content  # type: ignore[attr-defined]
+        widget._meta_tokens = tokens  # type: ignore[attr-defined]
         widget._meta_response_time = response_time  # type: ignore[attr-defined]
         widget.styles.color = self._prefs.colors.timestamp
         return widget
@@ -5880,7 +5616,7 @@ class AmplifierTuiApp(
         widget.styles.color = c.user_text
         widget.styles.border_left = ("thick", c.user_border)
 
-    def _style_assistant(self, widget: Markdown) -> None:
+    def _style_assistant(self, widget: Markdown | Static) -> None:
         """Apply preference colors to an assistant message."""
         c = self._prefs.colors
         widget.styles.color = c.assistant_text
@@ -5959,15 +5695,22 @@ class AmplifierTuiApp(
         widget.styles.color = c.error_text
         widget.styles.border_left = ("wide", c.error_border)
 
-    def _maybe_add_fold_toggle(self, widget: Static, content: str) -> None:
-        """Add a fold toggle after a long message for expand/collapse."""
+    def _make_fold_toggle(
+        self, widget: Static, content: str, *, folded: bool = True
+    ) -> FoldToggle | None:
+        """Return a fold toggle for a long message, or *None* if it is short."""
         line_count = content.count("\n") + 1
         if line_count <= self._fold_threshold:
-            return
-        chat_view = self._active_chat_view()
-        widget.add_class("folded")
-        toggle = FoldToggle(widget, line_count, folded=True)
-        chat_view.mount(toggle, after=widget)
+            return None
+        if folded:
+            widget.add_class("folded")
+        return FoldToggle(widget, line_count, folded=folded)
+
+    def _maybe_add_fold_toggle(self, widget: Static, content: str) -> None:
+        """Add a fold toggle after a long message for expand/collapse."""
+        toggle = self._make_fold_toggle(widget, content)
+        if toggle is not None:
+            self._active_chat_view().mount(toggle, after=widget)
 
     def _add_user_message(self, text: str, ts: datetime | None = None) -> None:
         chat_view = self._active_chat_view()
@@ -5980,7 +5723,7 @@ class AmplifierTuiApp(
         self._scroll_if_auto(msg)
         self._search_messages.append(("user", text, msg))
         self._maybe_add_fold_toggle(msg, text)
-        words = self._count_words(text)
+        words = self._search_messages[-1].words
         self._total_words += words
         self._user_message_count += 1
         self._user_words += words
@@ -6007,7 +5750,7 @@ class AmplifierTuiApp(
         self._last_assistant_widget = msg
         self._search_messages.append(("assistant", text, msg))
         self._maybe_add_fold_toggle(msg, text)
-        words = self._count_words(text)
+        words = self._search_messages[-1].words
         self._total_words += words
         self._assistant_message_count += 1
         self._assistant_words += words
@@ -6034,23 +5777,52 @@ class AmplifierTuiApp(
         self._search_messages.append(("system", text, msg))
         return msg
 
+    def _replace_system_message(self, message: Any, text: str) -> None:
+        """Replace a message's text in place (see ``SharedAppBase``)."""
+        if message is None or not message.is_attached:
+            self._add_system_message(text)
+            return
+        message.update(text)
+        self._search_messages.replace_text(message, text)
+        self._scroll_if_auto(message)
+
+    def _run_background(
+        self, coro: Coroutine[Any, Any, None], *, group: str = "commands"
+    ) -> None:
+        """Run a command coroutine as a worker; Escape cancels "shell" ones."""
+        self.run_worker(coro, group=group, exit_on_error=False)
+
+    def _cancel_shell_commands(self) -> bool:
+        """Cancel running /run, /git, /diff and /include commands."""
+        running = [w for w in self.workers if w.group == "shell" and w.is_running]
+        for worker in running:
+            worker.cancel()
+        return bool(running)
+
     def _add_thinking_block(self, text: str) -> None:
         chat_view = self._active_chat_view()
+        collapsible = self._make_thinking_widget(text)
+        chat_view.mount(collapsible)
+        self._search_messages.append(("thinking", text, collapsible))
+
+    def _make_thinking_widget(self, text: str) -> LazyCollapsible:
+        """Build the collapsed, styled block for one thinking block."""
         # Show abbreviated preview, full text on expand
-        preview = text.split("\n")[0][:55]
+        preview = text.split("\n", 1)[0][:55]
         if len(text) > 55:
             preview += "..."
-        full_text = text[:800] + "..." if len(text) > 800 else text
-        inner = Static(full_text, classes="thinking-text")
-        collapsible = Collapsible(
-            inner,
+
+        def render() -> str:
+            return text[:800] + "..." if len(text) > 800 else text
+
+        collapsible = LazyCollapsible(
+            render,
             title=f"\u25b6 Thinking: {preview}",
-            collapsed=True,
+            body_classes="thinking-text",
             classes="thinking-block",
         )
-        chat_view.mount(collapsible)
-        self._style_thinking(collapsible, inner)
-        self._search_messages.append(("thinking", text, collapsible))
+        self._style_thinking(collapsible, collapsible.body)
+        return collapsible
 
     # -- Panel helper methods (called via call_from_thread) ------------------
 
@@ -6109,59 +5881,70 @@ class AmplifierTuiApp(
         self._tool_call_count += 1
         self._tool_usage[tool_name] = self._tool_usage.get(tool_name, 0) + 1
         chat_view = self._active_chat_view()
+        collapsible = self._make_tool_widget(tool_name, tool_input, result)
+        chat_view.mount(collapsible)
+        self._scroll_if_auto(collapsible)
+
+    def _make_tool_widget(
+        self,
+        tool_name: str,
+        tool_input: dict | str | None = None,
+        result: str = "",
+    ) -> LazyCollapsible:
+        """Build the collapsed, styled block for one tool call.
 
+        Only the title is computed here; the detail text (or diff) is built
+        the first time the block is expanded.
+        """
         # --- Inline diff for file-edit tools ---
         if tool_name in ("edit_file", "write_file") and isinstance(tool_input, dict):
             rendered = self._render_file_edit_diff(tool_name, tool_input)
             if rendered is not None:
-                title, diff_text = rendered
-                inner = Static(diff_text, markup=True, classes="tool-detail tool-diff")
-                collapsible = Collapsible(
-                    inner,
+                title, render_diff = rendered
+                collapsible = LazyCollapsible(
+                    render_diff,
                     title=title,
-                    collapsed=True,
+                    body_classes="tool-detail tool-diff",
+                    classes="tool-use",
                 )
-                collapsible.add_class("tool-use")
-                chat_view.mount(collapsible)
-                self._style_tool(collapsible, inner)
-                self._scroll_if_auto(collapsible)
-                return
-
-        detail_parts: list[str] = []
-        if tool_input:
-            input_str = (
-                json.dumps(tool_input, indent=2)
-                if isinstance(tool_input, dict)
-                else str(tool_input)
-            )
-            if len(input_str) > 800:
-                input_str = input_str[:800] + "..."
-            detail_parts.append(f"Input:\n{input_str}")
-        if result:
-            r = result[:8000] + "\n... (truncated)" if len(result) > 8000 else result
-            detail_parts.append(f"Result:\n{r}")
-
-        detail = "\n\n".join(detail_parts) if detail_parts else "(no details)"
+                self._style_tool(collapsible, collapsible.body)
+                return collapsible
+
+        def render() -> str:
+            detail_parts: list[str] = []
+            if tool_input:
+                input_str = (
+                    json.dumps(tool_input, indent=2)
+                    if isinstance(tool_input, dict)
+                    else str(tool_input)
+                )
+                if len(input_str) > 800:
+                    input_str = input_str[:800] + "..."
+                detail_parts.append(f"Input:\n{input_str}")
+            if result:
+                r = (
+                    result[:8000] + "\n... (truncated)"
+                    if len(result) > 8000
+                    else result
+                )
+                detail_parts.append(f"Result:\n{r}")
+            return "\n\n".join(detail_parts) if detail_parts else "(no details)"
 
         title = self._tool_title(tool_name, tool_input, result)
-        inner = Static(detail, classes="tool-detail")
-        collapsible = Collapsible(
-            inner,
-            title=title,
-            collapsed=True,
+        collapsible = LazyCollapsible(
+            render, title=title, body_classes="tool-detail", classes="tool-use"
         )
-        collapsible.add_class("tool-use")
-        chat_view.mount(collapsible)
-        self._style_tool(collapsible, inner)
-        self._scroll_if_auto(collapsible)
+        self._style_tool(collapsible, collapsible.body)
+        return collapsible
 
     def _render_file_edit_diff(
         self, tool_name: str, tool_input: dict
-    ) -> tuple[str, str] | None:
-        """Build an inline diff for edit_file / write_file.
+    ) -> tuple[str, Callable[[], str]] | None:
+        """Prepare an inline diff for edit_file / write_file.
 
-        Returns ``(title, rich_markup_text)`` or *None* if the input
-        doesn't contain the expected keys.
+        Returns ``(title, render)`` where ``render()`` builds (once) the
+        Rich-markup diff text, or *None* if the input doesn't contain the
+        expected keys.
         """
         from .features.diff_view import (
             diff_summary,
@@ -6179,18 +5962,18 @@ class AmplifierTuiApp(
             new = tool_input.get("new_string")
             if old is None or new is None:
                 return None
-            diff_text = format_edit_diff(file_path, old, new)
+            render = cache(partial(format_edit_diff, file_path, old, new))
             title = f"\u25b6 {diff_summary(file_path, old, new)}"
         else:  # write_file
             content = tool_input.get("content")
             if content is None:
                 return None
-            diff_text = format_new_file_diff(file_path, content)
+            render = cache(partial(format_new_file_diff, file_path, content))
             title = f"\u25b6 {new_file_summary(file_path, content)}"
 
-        # Store for /diff last
-        self._last_file_edit_diff = (title, diff_text)  # type: ignore[attr-defined]
-        return title, diff_text
+        # Store for /diff last (shares the render with the tool block)
+        self._last_file_edit_diff = (title, render)  # type: ignore[attr-defined]
+        return title, render
 
     def _show_error(self, error_text: str) -> None:
         chat_view = self._active_chat_view()
@@ -6314,6 +6097,8 @@ class AmplifierTuiApp(
         conv = tab.conversation
         if not conv.is_processing:
             return  # Already finished (e.g. cancel + worker finally)
+        # Updates still queued from a cancelled stream would re-add its spinner
+        self._ui_events.discard(conv.conversation_id)
         conv.is_processing = False
         tab.processing_label = ""
         tab.status_activity_label = "Ready"
@@ -6324,6 +6109,7 @@ class AmplifierTuiApp(
         tab.stream_widget = None
         tab.stream_container = None
         tab.stream_block_type = ""
+        tab.stream_markdown = None
         inp = self.query_one("#chat-input", ChatInput)
         inp.placeholder = "Message..."
         inp.focus()
@@ -6633,10 +6419,8 @@ class AmplifierTuiApp(
             total = 0
             if sm:
                 total = sm.total_input_tokens + sm.total_output_tokens
-            if total == 0 and self._search_messages:
-                total = sum(
-                    len(content) // 4 for _role, content, _w in self._search_messages
-                )
+            if total == 0:
+                total = self._search_messages.total_tokens
 
             if total > 0 and window > 0:
                 used = self._format_token_count(total)
@@ -6676,10 +6460,8 @@ class AmplifierTuiApp(
                 total = (getattr(sm, "total_input_tokens", 0) or 0) + (
                     getattr(sm, "total_output_tokens", 0) or 0
                 )
-            if total == 0 and self._search_messages:
-                total = sum(
-                    len(content) // 4 for _role, content, _w in self._search_messages
-                )
+            if total == 0:
+                total = self._search_messages.total_tokens
             pct = min(100.0, total / window * 100) if total > 0 else 0.0
             ctx_history = getattr(self, "_context_history", None)
             if ctx_history is not None:
@@ -6787,19 +6569,44 @@ class AmplifierTuiApp(
 
     # --- Streaming callback overrides (called from BACKGROUND THREAD) ---
     # These implement the abstract _on_stream_* methods from SharedAppBase.
-    # All UI updates are marshalled to the main thread via call_from_thread.
+    # UI updates are queued on the UI event bus without blocking the
+    # worker; the main thread applies them once per frame.  Keyed updates
+    # (status, indicator, token display) only keep the latest value.
+
+    def on_ui_events_pending(self, message: UiEventsPending) -> None:
+        """Drain queued UI updates, at most once per frame."""
+        delay = self._ui_events.delay()
+        if delay:
+            self.set_timer(delay, self._ui_events.drain)
+        else:
+            self._ui_events.drain()
+
+    def _run_after_ui_events(self, callback: Any, *args: Any, **kwargs: Any) -> Any:
+        """Apply queued UI updates, then run *callback* (main thread).
+
+        Workers call this through ``call_from_thread`` for updates that
+        must land after everything the stream has posted, e.g. finishing
+        the turn.
+        """
+        self._ui_events.drain()
+        return callback(*args, **kwargs)
 
     def _on_stream_block_start(self, conversation_id: str, block_type: str) -> None:
-        self.call_from_thread(self._begin_streaming_block, block_type, conversation_id)
+        self._ui_events.post(
+            conversation_id, self._begin_streaming_block, block_type, conversation_id
+        )
 
     def _on_stream_block_delta(
         self, conversation_id: str, block_type: str, accumulated_text: str
     ) -> None:
-        self.call_from_thread(
+        # Carries the full text so far: only the newest delta matters.
+        self._ui_events.post(
+            conversation_id,
             self._update_streaming_content,
             block_type,
             accumulated_text,
             conversation_id,
+            key="delta",
         )
 
     def _on_stream_block_end(
@@ -6809,30 +6616,36 @@ class AmplifierTuiApp(
         final_text: str,
         had_block_start: bool,
     ) -> None:
+        post = self._ui_events.post
         if had_block_start:
             # Streaming widget exists - finalize it with complete text
-            self.call_from_thread(
-                self._finalize_streaming_block, block_type, final_text, conversation_id
+            post(
+                conversation_id,
+                self._finalize_streaming_block,
+                block_type,
+                final_text,
+                conversation_id,
             )
         else:
             # No start event received - direct display (fallback)
-            self.call_from_thread(self._remove_processing_indicator)
+            post(conversation_id, self._remove_processing_indicator, key="indicator")
             if block_type in ("thinking", "reasoning"):
-                self.call_from_thread(self._add_thinking_block, final_text)
+                post(conversation_id, self._add_thinking_block, final_text)
             else:
-                self.call_from_thread(self._add_assistant_message, final_text)
+                post(conversation_id, self._add_assistant_message, final_text)
 
     def _on_stream_tool_start(
         self, conversation_id: str, name: str, tool_input: dict
     ) -> None:
+        post = self._ui_events.post
         # Feed todo tool calls to the TodoPanel
         if name == "todo" and isinstance(tool_input, dict):
-            self.call_from_thread(self._update_todo_panel, tool_input)
+            post(conversation_id, self._update_todo_panel, tool_input)
         # Feed delegate tool calls to the AgentTreePanel
         if is_delegate_tool(name) and isinstance(tool_input, dict):
             agent_name = tool_input.get("agent", "unknown")
             agent_key = make_delegate_key(tool_input)
-            self.call_from_thread(self._update_agent_tree_start, agent_name, agent_key)
+            post(conversation_id, self._update_agent_tree_start, agent_name, agent_key)
         # Look up per-conversation state for tool count
         tab = self._tab_for_conversation(conversation_id)
         conv = tab.conversation if tab else None
@@ -6852,31 +6665,42 @@ class AmplifierTuiApp(
         if tab:
             tab.processing_label = bare
             tab.status_activity_label = label
-        self.call_from_thread(self._ensure_processing_indicator, bare)
-        self.call_from_thread(self._update_status, label)
+        post(conversation_id, self._ensure_processing_indicator, bare, key="indicator")
+        post(conversation_id, self._update_status, label, key="status")
 
     def _on_stream_tool_end(
         self, conversation_id: str, name: str, tool_input: dict, result: str
     ) -> None:
+        post = self._ui_events.post
         # Update AgentTreePanel on delegate completion
         if is_delegate_tool(name) and isinstance(tool_input, dict):
             agent_key = make_delegate_key(tool_input)
             d_status = "failed" if result.startswith("Error") else "completed"
             summary = result[:100] if result else ""
-            self.call_from_thread(
-                self._update_agent_tree_end, agent_key, d_status, summary
+            post(
+                conversation_id,
+                self._update_agent_tree_end,
+                agent_key,
+                d_status,
+                summary,
             )
         tab = self._tab_for_conversation(conversation_id)
         if tab:
             tab.processing_label = "Thinking"
             tab.status_activity_label = "Thinking..."
-        self.call_from_thread(self._add_tool_use, name, tool_input, result)
-        self.call_from_thread(self._ensure_processing_indicator, "Thinking")
-        self.call_from_thread(self._update_status, "Thinking...")
+        post(conversation_id, self._add_tool_use, name, tool_input, result)
+        post(
+            conversation_id,
+            self._ensure_processing_indicator,
+            "Thinking",
+            key="indicator",
+        )
+        post(conversation_id, self._update_status, "Thinking...", key="status")
 
     def _on_stream_usage_update(self, conversation_id: str) -> None:
-        self.call_from_thread(self._update_token_display)
-        self.call_from_thread(self._record_context_snapshot)
+        post = self._ui_events.post
+        post(conversation_id, self._update_token_display, key="tokens")
+        post(conversation_id, self._record_context_snapshot, key="context")
 
     # ── Streaming Display ─────────────────────────────────────────
 
@@ -6926,6 +6750,7 @@ class AmplifierTuiApp(
             self._scroll_if_auto(widget)
             tab.stream_widget = widget
             tab.stream_container = None
+            tab.stream_markdown = StreamingMarkdown()
 
         tab.stream_block_type = block_type
         conv.stream_accumulated_text = ""
@@ -6941,7 +6766,9 @@ class AmplifierTuiApp(
 
         For text blocks, renders progressively through Rich Markdown so
         the user sees formatted output (headings, code, lists) as it
-        streams in.  Falls back to plain text on any rendering error.
+        streams in.  Completed blocks are rendered once and cached by
+        ``tab.stream_markdown``; only the open tail is re-parsed per
+        delta.  Falls back to plain text on any rendering error.
         """
         tab = (
             self._tab_for_conversation(conversation_id)
@@ -6955,9 +6782,15 @@ class AmplifierTuiApp(
 
         if block_type not in ("thinking", "reasoning"):
             try:
-                from rich.markdown import Markdown as RichMarkdown
-
-                tab.stream_widget.update(RichMarkdown(display_text))
+                if tab.stream_markdown is None:
+                    tab.stream_markdown = StreamingMarkdown()
+                tab.stream_markdown.update(text)
+                tab.stream_widget.update(
+                    ThemedRenderable(
+                        tab.stream_markdown.renderable(),
+                        assistant_markdown_theme(self),
+                    )
+                )
             except Exception:
                 logger.debug(
                     "Rich Markdown rendering failed, falling back to plain text",
@@ -6976,8 +6809,10 @@ class AmplifierTuiApp(
         """Replace the streaming Static with the final rendered widget.
 
         Called on content_block:end. For text blocks, swaps the fast
-        Static with a proper Markdown widget for rich rendering.
-        For thinking blocks, collapses and sets the preview title.
+        Static with a :class:`StreamedAssistantMessage` that reuses the
+        block renders cached while streaming (a full ``AssistantMessage``
+        is only built when no stream renderer exists).  For thinking
+        blocks, collapses and sets the preview title.
         """
         tab = (
             self._tab_for_conversation(conversation_id)
@@ -7007,7 +6842,11 @@ class AmplifierTuiApp(
             self._last_assistant_text = text
             old = tab.stream_widget
             if old:
-                msg = AssistantMessage(text)
+                msg: Static | AssistantMessage
+                if tab.stream_markdown is not None:
+                    msg = StreamedAssistantMessage(tab.stream_markdown.finish(text))
+                else:
+                    msg = AssistantMessage(text)
                 msg.msg_index = self._assistant_msg_index  # type: ignore[attr-defined]
                 self._assistant_msg_index += 1
                 chat_view.mount(msg, before=old)
@@ -7036,6 +6875,7 @@ class AmplifierTuiApp(
         tab.stream_widget = None
         tab.stream_container = None
         tab.stream_block_type = ""
+        tab.stream_markdown = None
 
     # ── Workers (background execution) ──────────────────────────
 
@@ -7100,15 +6940,21 @@ class AmplifierTuiApp(
 
             # Fallback: if no hooks fired, show the full response
             if not conv.got_stream_content and response:
-                self.call_from_thread(self._add_assistant_message, response)
+                self.call_from_thread(
+                    self._run_after_ui_events, self._add_assistant_message, response
+                )
 
         except Exception as e:
             logger.debug("send message worker failed", exc_info=True)
             if conv.streaming_cancelled:
                 return  # Suppress errors from cancelled workers
-            self.call_from_thread(self._show_error, str(e))
+            self.call_from_thread(self._run_after_ui_events, self._show_error, str(e))
         finally:
-            self.call_from_thread(self._finish_processing, conversation_id=cid)
+            self.call_from_thread(
+                self._run_after_ui_events,
+                self._finish_processing,
+                conversation_id=cid,
+            )
 
     @work(thread=True, group="send-message")
     async def _resume_session_worker(self, session_id: str) -> None:
@@ -7182,8 +7028,16 @@ class AmplifierTuiApp(
                     prompt, conversation_id=cid
                 )
                 if not conv.got_stream_content and response:
-                    self.call_from_thread(self._add_assistant_message, response)
-                self.call_from_thread(self._finish_processing, conversation_id=cid)
+                    self.call_from_thread(
+                        self._run_after_ui_events,
+                        self._add_assistant_message,
+                        response,
+                    )
+                self.call_from_thread(
+                    self._run_after_ui_events,
+                    self._finish_processing,
+                    conversation_id=cid,
+                )
 
         except Exception as e:
             logger.debug("resume session worker failed", exc_info=True)
@@ -7196,8 +7050,11 @@ class AmplifierTuiApp(
 
         Called when the TUI is launched with ``--sessions id1,id2,...``.
         The first session resumes in the initial "Main" tab; subsequent
-        sessions each get a new tab.  After all tabs are populated the
-        view switches back to the first tab.
+        sessions each get a new tab.  Up to :data:`RESTORE_CONCURRENCY`
+        sessions are resumed at once, each while its transcript tail is
+        parsed off the UI thread, and every tab is filled in as soon as its
+        session is ready.  Whichever tab is active when a slot frees up goes
+        next.
         """
         if self.session_manager is None:
             self.call_from_thread(
@@ -7205,180 +7062,218 @@ class AmplifierTuiApp(
             )
             return
 
-        total = len(session_ids)
-        for i, session_id in enumerate(session_ids):
-            # For sessions beyond the first, create a new tab
-            if i > 0:
+        tabs = self.call_from_thread(self._open_restore_tabs, session_ids)
+        pending = list(zip(tabs, session_ids))
+        total = len(pending)
+        done = 0
+
+        def next_job() -> tuple[TabState, str] | None:
+            pending[:] = [job for job in pending if job[0] in self._tabs]
+            if not pending:
+                return None  # the rest were closed while queued
+            active = self._tabs[self._active_tab_index]
+            job = next((job for job in pending if job[0] is active), pending[0])
+            pending.remove(job)
+            return job
+
+        async def runner() -> None:
+            nonlocal done
+            while (job := next_job()) is not None:
+                await self._restore_tab_session(*job)
+                done += 1
                 self.call_from_thread(
-                    self._create_new_tab, session_id[:8], show_welcome=False
+                    self._update_status, f"Restored {done}/{total} sessions..."
                 )
 
-            # Grab the now-active tab's conversation binding
-            tab = self._tabs[self._active_tab_index]
-            conv = tab.conversation
-            cid = conv.conversation_id
+        self.call_from_thread(self._update_status, f"Restoring {total} sessions...")
+        await asyncio.gather(
+            *(runner() for _ in range(min(RESTORE_CONCURRENCY, total)))
+        )
 
-            self.call_from_thread(self._clear_welcome)
-            self.call_from_thread(
-                self._update_status, f"Loading session {i + 1}/{total}..."
-            )
+        self.call_from_thread(self._update_tab_bar)
+        self.call_from_thread(self._update_session_display)
+        self.call_from_thread(self._update_token_display)
+        self.call_from_thread(self._update_status, "Ready")
 
-            try:
-                # Render the transcript into the chat view
-                transcript_path = self.session_manager.get_session_transcript_path(
-                    session_id
-                )
-                self.call_from_thread(self._display_transcript, transcript_path)
-
-                # Best-effort working directory lookup
-                working_dir = None
-                for s in getattr(self, "_session_list_data", []):
-                    if s.get("session_id") == session_id:
-                        pp = s.get("project_path")
-                        if pp:
-                            candidate = Path(pp)
-                            if candidate.is_dir():
-                                working_dir = candidate
-                        break
+    def _open_restore_tabs(self, session_ids: list[str]) -> list[TabState]:
+        """Create the tabs for a multi-session restore, marked as queued.
 
-                model = self._prefs.preferred_model or ""
-                await self.session_manager.resume_session(
-                    session_id,
-                    conversation_id=cid,
-                    model_override=model,
-                    working_dir=working_dir,
-                )
+        The current tab takes the first session.  Stops early at
+        :data:`MAX_TABS`; the returned list is as long as the tabs opened.
+        """
+        first = self._tabs[self._active_tab_index]
+        tabs = [first]
+        for session_id in session_ids[1:]:
+            count = len(self._tabs)
+            self._create_new_tab(session_id[:8], show_welcome=False)
+            if len(self._tabs) == count:
+                break
+            tabs.append(self._tabs[self._active_tab_index])
+        self._switch_to_tab(self._tabs.index(first))
+        self._clear_welcome()
+        for tab in tabs:
+            tab.restore_label = "queued"
+        self._update_tab_bar()
+        return tabs
+
+    async def _restore_tab_session(self, tab: TabState, session_id: str) -> None:
+        """Resume *session_id* into *tab* while its transcript is parsed."""
+        assert self.session_manager is not None
+        self.call_from_thread(self._set_restore_label, tab, "loading")
+
+        # Best-effort working directory lookup
+        working_dir = None
+        for s in getattr(self, "_session_list_data", []):
+            if s.get("session_id") == session_id:
+                pp = s.get("project_path")
+                if pp:
+                    candidate = Path(pp)
+                    if candidate.is_dir():
+                        working_dir = candidate
+                break
 
-                # Use the session title as the tab name
-                title = self._load_session_title_for(session_id)
-                if title:
-                    self._session_title = title
-                    tab.name = title
-                    tab.custom_name = title
-                    self.call_from_thread(self._apply_session_title)
+        transcript_path = self.session_manager.get_session_transcript_path(session_id)
+        tail, resumed = await asyncio.gather(
+            asyncio.to_thread(self._read_transcript_tail, transcript_path),
+            self.session_manager.resume_session(
+                session_id,
+                conversation_id=tab.conversation.conversation_id,
+                model_override=self._prefs.preferred_model or "",
+                working_dir=working_dir,
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(tail, BaseException):
+            logger.debug("Failed to read transcript of %s", session_id, exc_info=tail)
+            tail = None
+        error = resumed if isinstance(resumed, BaseException) else None
+        if error is not None:
+            logger.debug("Failed to resume session %s", session_id, exc_info=error)
+        self.call_from_thread(self._fill_restored_tab, tab, session_id, tail, error)
+
+    def _set_restore_label(self, tab: TabState, label: str) -> None:
+        tab.restore_label = label
+        self._update_tab_bar()
 
-            except Exception as e:
-                logger.debug("Failed to resume session %s", session_id, exc_info=True)
-                self.call_from_thread(
-                    self._add_system_message,
-                    f"Failed to resume {session_id}: {e}",
-                )
+    def _fill_restored_tab(
+        self,
+        tab: TabState,
+        session_id: str,
+        tail: tuple[TranscriptTailReader, _ReplayBatch] | None,
+        error: BaseException | None,
+    ) -> None:
+        """Show a restored session in its tab.
 
-        # Switch back to the first tab and refresh all chrome
-        if total > 1:
-            self.call_from_thread(self._switch_to_tab, 0)
+        A tab other than the active one is filled in place -- its own
+        container and :class:`ConversationState` -- so the user's tab, input,
+        focus and split view are left alone.
+        """
+        tab.restore_label = ""
+        if tab not in self._tabs:
+            return  # closed while restoring
+        active = tab is self._tabs[self._active_tab_index]
+        if tail is not None:
+            if active:
+                self._show_transcript(*tail)
+            else:
+                self._show_transcript_in_tab(tab, session_id, *tail)
+        if error is not None:
+            text = f"Failed to resume {session_id}: {error}"
+            if active:
+                self._add_system_message(text)
+            else:
+                self._add_tab_system_message(tab, text)
+        else:
+            # Use the session title as the tab name
+            title = self._load_session_title_for(session_id)
+            if title:
+                tab.name = title
+                tab.custom_name = title
+                if active:
+                    self._session_title = title
+                    self._apply_session_title()
+                else:
+                    tab.conversation.title = title
+        self._update_tab_bar()
 
-        self.call_from_thread(self._update_tab_bar)
-        self.call_from_thread(self._update_session_display)
-        self.call_from_thread(self._update_token_display)
-        self.call_from_thread(self._update_status, "Ready")
+    def _add_tab_system_message(self, tab: TabState, text: str) -> None:
+        """Append a system message to a tab that is not the active one."""
+        chat_view = self.query_one(f"#{tab.container_id}", ScrollableContainer)
+        msg = SystemMessage(text)
+        chat_view.mount(msg)
+        self._style_system(msg)
+        tab.conversation.search_messages.append(("system", text, msg))
 
     # ── Transcript Display ──────────────────────────────────────
 
     def _display_transcript(self, transcript_path: Path) -> None:
-        """Render a session transcript in the chat view."""
-        from .transcript_loader import load_transcript, parse_message_blocks
+        """Render a session transcript in the chat view.
+
+        Only the last :data:`TRANSCRIPT_TAIL_MESSAGES` messages are read here,
+        backwards from the end of the file; the rest of the history is read
+        and parsed by :meth:`_transcript_history_worker`.  Blocks become
+        lightweight :class:`ChatRecord` entries inside a
+        :class:`VirtualTranscript`, which only mounts widgets near the
+        viewport.  ``_search_messages`` entries for replayed messages hold
+        ``None`` until their widget is mounted.
+        """
+        self._show_transcript(*self._read_transcript_tail(transcript_path))
+
+    def _read_transcript_tail(
+        self, transcript_path: Path
+    ) -> tuple[TranscriptTailReader, _ReplayBatch]:
+        """Read and parse the tail of a transcript (safe off the UI thread)."""
+        reader = TranscriptTailReader(transcript_path)
+        batch = self._parse_transcript_messages(
+            reader.read_older(TRANSCRIPT_TAIL_MESSAGES)
+        )
+        return reader, batch
 
+    def _show_transcript(
+        self, reader: TranscriptTailReader, batch: _ReplayBatch
+    ) -> None:
+        """Display a parsed transcript tail in the active tab."""
         chat_view = self._active_chat_view()
 
         # Clear existing content
         for child in list(chat_view.children):
             child.remove()
 
-        self._total_words = 0
-        self._user_message_count = 0
-        self._assistant_message_count = 0
-        self._tool_call_count = 0
-        self._user_words = 0
-        self._assistant_words = 0
+        self._total_words = batch.total_words
+        self._user_message_count = batch.user_message_count
+        self._assistant_message_count = batch.assistant_message_count
+        self._tool_call_count = batch.tool_call_count
+        self._user_words = batch.user_words
+        self._assistant_words = batch.assistant_words
         self._response_times = []
-        self._tool_usage = {}
-        self._assistant_msg_index = 0
+        self._tool_usage = dict(batch.tool_usage)
+        self._assistant_msg_index = batch.assistant_message_count
         self._last_assistant_widget = None
         self._session_start_time = time.monotonic()
-        self._search_messages = []
-        tool_results: dict[str, str] = {}
-
-        for msg in load_transcript(transcript_path):
-            msg_ts = self._extract_transcript_timestamp(msg)
-            ts_shown = False
-            blocks = parse_message_blocks(msg)
-            for block in blocks:
-                if block.kind == "user":
-                    if not ts_shown:
-                        ts_widget = self._make_message_meta(
-                            dt=msg_ts, fallback_now=False
-                        )
-                        if ts_widget:
-                            chat_view.mount(ts_widget)
-                        ts_shown = True
-                    widget = UserMessage(block.content)
-                    chat_view.mount(widget)
-                    self._style_user(widget)
-                    self._search_messages.append(("user", block.content, widget))
-                    self._maybe_add_fold_toggle(widget, block.content)
-                    words = self._count_words(block.content)
-                    self._total_words += words
-                    self._user_message_count += 1
-                    self._user_words += words
-
-                elif block.kind == "text":
-                    if not ts_shown:
-                        ts_widget = self._make_message_meta(
-                            dt=msg_ts, fallback_now=False
-                        )
-                        if ts_widget:
-                            chat_view.mount(ts_widget)
-                        ts_shown = True
-                    self._last_assistant_text = block.content
-                    widget = AssistantMessage(block.content)
-                    widget.msg_index = self._assistant_msg_index  # type: ignore[attr-defined]
-                    self._assistant_msg_index += 1
-                    self._last_assistant_widget = widget
-                    chat_view.mount(widget)
-                    self._style_assistant(widget)
-                    self._search_messages.append(("assistant", block.content, widget))
-                    self._maybe_add_fold_toggle(widget, block.content)
-                    words = self._count_words(block.content)
-                    self._total_words += words
-                    self._assistant_message_count += 1
-                    self._assistant_words += words
-
-                elif block.kind == "thinking":
-                    preview = block.content.split("\n")[0][:55]
-                    if len(block.content) > 55:
-                        preview += "..."
-                    full_text = (
-                        block.content[:800] + "..."
-                        if len(block.content) > 800
-                        else block.content
-                    )
-                    inner = Static(full_text, classes="thinking-text")
-                    collapsible = Collapsible(
-                        inner,
-                        title=f"\u25b6 Thinking: {preview}",
-                        collapsed=True,
-                        classes="thinking-block",
-                    )
-                    chat_view.mount(collapsible)
-                    self._style_thinking(collapsible, inner)
-
-                elif block.kind == "tool_use":
-                    result = tool_results.get(block.tool_id, "")
-                    self._add_tool_use(block.tool_name, block.tool_input, result)
-
-                elif block.kind == "tool_result":
-                    tool_results[block.tool_id] = block.content
-
+        self._search_messages = batch.search
+        search = self._search_messages
+        if batch.last_assistant is not None:
+            self._last_assistant_text = batch.last_assistant.content
+            batch.last_assistant.data["last"] = True
+
+        transcript = VirtualTranscript(
+            batch.records,
+            self._build_transcript_widgets,
+            on_realize=partial(self._on_transcript_realize, search),
+            on_release=partial(self._on_transcript_release, search),
+        )
+        transcript.history_pending = not reader.exhausted
+        chat_view.mount(transcript)
         self._update_word_count_display()
 
         # Restore bookmarks for this session
         self._session_bookmarks = self._load_session_bookmarks()
-        self._apply_bookmark_classes()
 
         # Restore message pins for this session
         self._message_pins = self._load_message_pins()
-        self._apply_pin_classes()
+        if not transcript.history_pending:
+            self._apply_bookmark_classes()
+            self._apply_pin_classes()
         self._update_pinned_panel()
 
         # Restore saved references for this session
@@ -7396,6 +7291,336 @@ class AmplifierTuiApp(
             self._active_search_query = ""
             self._show_find_bar(query)
 
+        if transcript.history_pending:
+            conv = self._tabs[self._active_tab_index].conversation
+            self._transcript_history_worker(reader, transcript, conv)
+
+    def _show_transcript_in_tab(
+        self,
+        tab: TabState,
+        session_id: str,
+        reader: TranscriptTailReader,
+        batch: _ReplayBatch,
+    ) -> None:
+        """Display a parsed transcript tail in a tab that is not the active one.
+
+        Like :meth:`_show_transcript`, but the counters and per-session data
+        go into the tab's :class:`ConversationState`, which
+        :meth:`_load_tab_state` picks up when the user switches to it.
+        """
+        conv = tab.conversation
+        chat_view = self.query_one(f"#{tab.container_id}", ScrollableContainer)
+        for child in list(chat_view.children):
+            child.remove()
+
+        conv.total_words = batch.total_words
+        conv.user_message_count = batch.user_message_count
+        conv.assistant_message_count = batch.assistant_message_count
+        conv.tool_call_count = batch.tool_call_count
+        conv.user_words = batch.user_words
+        conv.assistant_words = batch.assistant_words
+        conv.response_times = []
+        conv.tool_usage = dict(batch.tool_usage)
+        conv.assistant_msg_index = batch.assistant_message_count
+        conv.search_messages = batch.search
+        tab.last_assistant_widget = None
+        if batch.last_assistant is not None:
+            conv.last_assistant_text = batch.last_assistant.content
+            batch.last_assistant.data["last"] = True
+
+        transcript = VirtualTranscript(
+            batch.records,
+            self._build_transcript_widgets,
+            on_realize=partial(self._on_transcript_realize, batch.search),
+            on_release=partial(self._on_transcript_release, batch.search),
+        )
+        transcript.history_pending = not reader.exhausted
+        chat_view.mount(transcript)
+
+        conv.bookmarks = self._load_session_bookmarks(session_id)
+        conv.pins = self._pin_store.load(session_id)
+        conv.refs = self._load_session_refs(session_id)
+        conv.notes = self._note_store.load(session_id)
+        self._replay_notes(tab)
+        chat_view.scroll_end(animate=False)
+
+        if transcript.history_pending:
+            self._transcript_history_worker(reader, transcript, conv)
+
+    def _parse_transcript_messages(self, messages: list[dict]) -> _ReplayBatch:
+        """Turn transcript messages into replay records.
+
+        Touches no widgets or app state, so it is safe to call off the UI
+        thread.
+        """
+        from .transcript_loader import parse_message_blocks
+
+        batch = _ReplayBatch()
+        records = batch.records
+        search = batch.search
+        tool_records: dict[str, ChatRecord] = {}
+        show_timestamps = self._prefs.display.show_timestamps
+
+        for msg in messages:
+            msg_ts = self._extract_transcript_timestamp(msg)
+            ts_shown = False
+            for block in parse_message_blocks(msg):
+                if block.kind in ("user", "text"):
+                    if not ts_shown:
+                        if show_timestamps and msg_ts is not None:
+                            records.append(ChatRecord("meta", data={"ts": msg_ts}))
+                        ts_shown = True
+                    words = self._count_words(block.content)
+                    batch.total_words += words
+
+                if block.kind == "user":
+                    records.append(
+                        ChatRecord("user", block.content, search_index=len(search))
+                    )
+                    search.append(("user", block.content, None))
+                    batch.user_message_count += 1
+                    batch.user_words += words
+
+                elif block.kind == "text":
+                    batch.last_assistant = ChatRecord(
+                        "assistant",
+                        block.content,
+                        search_index=len(search),
+                        msg_index=batch.assistant_message_count,
+                    )
+                    records.append(batch.last_assistant)
+                    search.append(("assistant", block.content, None))
+                    batch.assistant_message_count += 1
+                    batch.assistant_words += words
+
+                elif block.kind == "thinking":
+                    records.append(ChatRecord("thinking", block.content))
+
+                elif block.kind == "tool_use":
+                    batch.tool_call_count += 1
+                    batch.tool_usage[block.tool_name] += 1
+                    record = ChatRecord(
+                        "tool",
+                        data={
+                            "name": block.tool_name,
+                            "input": block.tool_input,
+                            "result": None,
+                        },
+                    )
+                    records.append(record)
+                    if block.tool_id:
+                        tool_records[block.tool_id] = record
+
+                elif block.kind == "tool_result":
+                    # Kept as the lazy block; its text is built on realize.
+                    tool_record = tool_records.pop(block.tool_id, None)
+                    if tool_record is not None:
+                        tool_record.data["result"] = block
+
+        return batch
+
+    @work(thread=True)
+    def _transcript_history_worker(
+        self,
+        reader: TranscriptTailReader,
+        transcript: VirtualTranscript,
+        conv: ConversationState,
+    ) -> None:
+        """Read and parse the history preceding a displayed transcript tail."""
+        try:
+            chunks: list[list[dict]] = []
+            while not reader.exhausted:
+                chunks.append(reader.read_older(TRANSCRIPT_HISTORY_BATCH))
+            messages = [msg for chunk in reversed(chunks) for msg in chunk]
+            batch = self._parse_transcript_messages(messages)
+        except Exception:
+            logger.debug("failed to load transcript history", exc_info=True)
+            batch = _ReplayBatch()
+        self.call_from_thread(self._attach_transcript_history, transcript, conv, batch)
+
+    def _attach_transcript_history(
+        self,
+        transcript: VirtualTranscript,
+        conv: ConversationState,
+        batch: _ReplayBatch,
+    ) -> None:
+        """Put parsed history in front of a displayed transcript's tail.
+
+        Indices of the tail, and of anything added since, move up by the
+        size of the history so they count from the start of the session
+        again, which is what stored bookmarks and pins refer to.
+        """
+        transcript.history_pending = False
+        if not transcript.is_attached:
+            return  # another session was displayed or the tab was closed
+        active = conv is self._tabs[self._active_tab_index].conversation
+        holder, prefix = (self, "_") if active else (conv, "")
+        search = getattr(holder, prefix + "search_messages")
+
+        shift = len(batch.search)
+        msg_shift = batch.assistant_message_count
+        for record in transcript.records:
+            if record.search_index is not None:
+                record.search_index += shift
+            if record.msg_index is not None:
+                record.msg_index += msg_shift
+        for _role, _text, widget in search:
+            msg_index = getattr(widget, "msg_index", None)
+            if msg_index is not None:
+                widget.msg_index = msg_index + msg_shift  # type: ignore[union-attr]
+        search[:0] = batch.search
+
+        for name, value in (
+            ("total_words", batch.total_words),
+            ("user_message_count", batch.user_message_count),
+            ("assistant_message_count", batch.assistant_message_count),
+            ("tool_call_count", batch.tool_call_count),
+            ("user_words", batch.user_words),
+            ("assistant_words", batch.assistant_words),
+            ("assistant_msg_index", msg_shift),
+        ):
+            setattr(holder, prefix + name, getattr(holder, prefix + name) + value)
+        tool_usage = getattr(holder, prefix + "tool_usage")
+        for tool_name, count in batch.tool_usage.items():
+            tool_usage[tool_name] = tool_usage.get(tool_name, 0) + count
+        if batch.last_assistant is not None:
+            if not any(record.data.get("last") for record in transcript.records):
+                batch.last_assistant.data["last"] = True
+            if not getattr(holder, prefix + "last_assistant_text"):
+                setattr(
+                    holder, prefix + "last_assistant_text", batch.last_assistant.content
+                )
+
+        transcript.add_history(batch.records)
+        if not active:
+            return
+        self._find_matches = [idx + shift for idx in self._find_matches]
+        self._find_highlighted = {idx + shift for idx in self._find_highlighted}
+        for record in transcript.records:
+            if record.widget is not None:
+                self._on_transcript_realize(search, record)
+        self._apply_bookmark_classes()
+        self._apply_pin_classes()
+        self._update_pinned_panel()
+        self._update_word_count_display()
+
+    def _build_transcript_widgets(self, record: ChatRecord) -> list[Widget]:
+        """Create the widgets for a replayed record (primary widget first)."""
+        kind = record.kind
+        if kind == "meta":
+            meta = self._make_message_meta(dt=record.data["ts"], fallback_now=False)
+            return [meta] if meta else []
+
+        if kind in ("user", "assistant"):
+            widget: Static | AssistantMessage
+            if kind == "user":
+                widget = UserMessage(record.content)
+                self._style_user(widget)
+            else:
+                widget = AssistantMessage(record.content)
+                widget.msg_index = record.msg_index  # type: ignore[attr-defined]
+                self._style_assistant(widget)
+            folded = record.classes is None or "folded" in record.classes
+            toggle = self._make_fold_toggle(widget, record.content, folded=folded)
+            return [widget, toggle] if toggle else [widget]
+
+        if kind == "thinking":
+            return [self._make_thinking_widget(record.content)]
+
+        data = record.data
+        result = data["result"]
+        if result is not None:
+            result = result.content  # DisplayBlock: flattened on first render
+        return [self._make_tool_widget(data["name"], data["input"], result or "")]
+
+    def _on_transcript_realize(self, search: MessageStore, record: ChatRecord) -> None:
+        """Link a newly mounted record into ``_search_messages`` and restyle it."""
+        widget = record.widget
+        idx = record.search_index
+        if widget is None or idx is None or idx >= len(search):
+            return
+        search.set_widget(idx, widget)
+        if search is not self._search_messages:
+            return  # another tab's transcript
+        if record.data.get("last") and self._last_assistant_widget is None:
+            self._last_assistant_widget = widget
+        transcript = self._active_transcript()
+        if transcript is not None and transcript.history_pending:
+            return  # indices are provisional until the history is attached
+        # Re-derive state that lives outside the widget.
+        if record.msg_index is not None:
+            widget.set_class(
+                any(
+                    bm["message_index"] == record.msg_index
+                    for bm in self._session_bookmarks
+                ),
+                "bookmarked",
+            )
+        widget.set_class(
+            any(pin["index"] == idx for pin in self._message_pins), "pinned"
+        )
+        matched = idx in self._find_matches
+        widget.set_class(matched, "find-match")
+        if matched:
+            self._find_highlighted.add(idx)
+        current = (
+            self._find_matches[self._find_index]
+            if 0 <= self._find_index < len(self._find_matches)
+            else None
+        )
+        widget.set_class(idx == current, "find-current")
+
+    def _on_transcript_release(self, search: MessageStore, record: ChatRecord) -> None:
+        """Drop the widget ref of a record whose page is being unmounted."""
+        widget = record.widget
+        idx = record.search_index
+        if idx is not None and idx < len(search) and search[idx].widget is widget:
+            search.set_widget(idx, None)
+        if widget is not None and widget is self._last_assistant_widget:
+            self._last_assistant_widget = None
+
+    def _active_transcript(self) -> VirtualTranscript | None:
+        """Return the replayed transcript in the active chat view, if any."""
+        try:
+            chat_view = self._active_chat_view()
+        except NoMatches:
+            return None
+        for child in chat_view.children:
+            if isinstance(child, VirtualTranscript):
+                return child
+        return None
+
+    def _message_widget(self, index: int) -> Static | None:
+        """Return the widget of a ``_search_messages`` entry.
+
+        Replayed messages outside the mounted window are mounted on demand
+        so callers can scroll to them.
+        """
+        if not 0 <= index < len(self._search_messages):
+            return None
+        widget = self._search_messages[index][2]
+        if widget is None:
+            transcript = self._active_transcript()
+            record = (
+                transcript.find(lambda r: r.search_index == index)
+                if transcript is not None
+                else None
+            )
+            if transcript is not None and record is not None:
+                transcript.realize(record)
+                widget = self._search_messages[index][2]
+        return widget
+
+    def _chat_widgets(self, chat_view: ScrollableContainer) -> list[Widget]:
+        """Direct chat widgets, including the mounted part of a transcript."""
+        widgets: list[Widget] = []
+        for child in chat_view.children:
+            if isinstance(child, VirtualTranscript):
+                widgets.extend(child.mounted_widgets())
+            else:
+                widgets.append(child)
+        return widgets
+
 
 # ── Entry Point ─────────────────────────────────────────────────────
 
@@ -7406,6 +7631,8 @@ def run_app(
     initial_prompt: str | None = None,
 ) -> None:
     """Run the Amplifier TUI application."""
+    # Coalesce persistence-store writes off the UI thread (flushed on quit).
+    JsonStore.enable_write_behind()
     app = AmplifierTuiApp(
         resume_session_id=resume_session_id,
         resume_session_ids=resume_session_ids,
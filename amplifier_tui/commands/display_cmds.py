@@ -414,6 +414,9 @@ class DisplayCommandsMixin:
                 toggle._target.add_class("folded")
                 toggle.update(toggle._make_label(folded=True))
                 count += 1
+        transcript = self._active_transcript()
+        if transcript is not None:
+            transcript.set_released_class("folded", True)
         self._add_system_message(f"Folded {count} message{'s' if count != 1 else ''}")
 
     def _unfold_all_messages(self) -> None:
@@ -424,6 +427,9 @@ class DisplayCommandsMixin:
                 toggle._target.remove_class("folded")
                 toggle.update(toggle._make_label(folded=False))
                 count += 1
+        transcript = self._active_transcript()
+        if transcript is not None:
+            transcript.set_released_class("folded", False)
         self._add_system_message(f"Unfolded {count} message{'s' if count != 1 else ''}")
 
     def _toggle_fold_all(self) -> None:
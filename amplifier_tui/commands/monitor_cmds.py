@@ -10,10 +10,15 @@ Architecture
 * ``/monitor`` mounts a :class:`~textual.widgets.DataTable` and a header
   :class:`~textual.widgets.Static` into the panel, then starts two timers:
 
-  - **fast** (2 s) -- calls :meth:`SessionScanner.scan` and refreshes the
-    table.  This is pure filesystem reads, always instant.
-  - **slow** (15 s) -- calls :meth:`SessionSummarizer.process_pending` to
-    run queued LLM summarisations (haiku-class, ~$0.001 each).
+  - **fast** (0.25 s with filesystem notifications, else 2 s) -- calls
+    :meth:`SessionScanner.scan` and refreshes the table.  The scanner only
+    re-reads sessions whose files changed, and the table is only rebuilt
+    when a row's text changed.
+  - **slow** (15 s) -- hands queued summarisations (haiku-class, ~$0.001
+    each) to the app's :class:`~llm_jobs.LLMJobQueue`.  The LLM call runs
+    on a worker thread; the result comes back as a
+    :class:`MonitorSummaryReady` message and is applied on the UI thread.
+    The header line shows the job queue depth and latency.
 
 * ``/monitor close`` stops timers, unmounts children, hides panel.
 * ``/monitor big|small`` toggles panel height.
@@ -24,10 +29,12 @@ from __future__ import annotations
 import logging
 
 from textual.containers import Vertical
+from textual.message import Message
 from textual.timer import Timer
 from textual.widgets import DataTable, Static
 
-from amplifier_tui.features.session_scanner import SessionScanner
+from amplifier_tui.core.features.llm_jobs import LLMJobQueue
+from amplifier_tui.features.session_scanner import MonitoredSession, SessionScanner
 from amplifier_tui.features.session_summarizer import (
     SessionSummarizer,
     make_anthropic_summarizer,
@@ -45,6 +52,24 @@ _COLUMNS: list[tuple[str, str, int | None]] = [
     ("activity", "Status", None),  # None = auto / fill
 ]
 
+_HEADER_TEXT = " Session Monitor (/monitor close to exit, /monitor big|small to resize)"
+
+
+class MonitorSummaryReady(Message):
+    """Posted (from an LLM worker thread) when a summary job finished.
+
+    ``error`` is set (and ``summary`` is empty) when the job failed or
+    timed out.
+    """
+
+    def __init__(
+        self, session: MonitoredSession, summary: str, error: str | None = None
+    ) -> None:
+        self.session = session
+        self.summary = summary
+        self.error = error
+        super().__init__()
+
 
 class MonitorCommandsMixin:
     """Mixin providing the /monitor command (session monitor panel)."""
@@ -53,6 +78,9 @@ class MonitorCommandsMixin:
     _monitor_summarizer: SessionSummarizer | None = None
     _monitor_fast_timer: Timer | None = None
     _monitor_slow_timer: Timer | None = None
+    _monitor_interval: float = 0.0
+    _monitor_rows: list[tuple[str, ...]] | None = None
+    _llm_jobs: LLMJobQueue | None = None
 
     def _cmd_monitor(self, args: str = "") -> None:
         """Toggle or control the session monitor panel."""
@@ -105,7 +133,7 @@ class MonitorCommandsMixin:
 
         # Build scanner + summarizer on first open.
         if self._monitor_scanner is None:
-            self._monitor_scanner = SessionScanner()
+            self._monitor_scanner = SessionScanner(watch=True)
         if self._monitor_summarizer is None:
             summarize_fn = make_anthropic_summarizer()
             self._monitor_summarizer = SessionSummarizer(
@@ -113,10 +141,7 @@ class MonitorCommandsMixin:
             )
 
         # Mount header + table.
-        header = Static(
-            " Session Monitor (/monitor close to exit, /monitor big|small to resize)",
-            classes="monitor-header",
-        )
+        header = Static(_HEADER_TEXT, id="monitor-header", classes="monitor-header")
         table = DataTable(id="monitor-table", cursor_type="row", zebra_stripes=True)
         panel.mount(header)
         panel.mount(table)
@@ -128,19 +153,29 @@ class MonitorCommandsMixin:
             else:
                 table.add_column(label, key=key)
 
-        # Initial scan.
+        # Initial scan, and start summarising right away.
+        self._monitor_rows = None
         self._refresh_monitor_table()
+        self._process_monitor_summaries()
 
         # Start timers.
-        self._monitor_fast_timer = self.set_interval(  # type: ignore[attr-defined]
-            2.0, self._refresh_monitor_table
-        )
+        self._start_monitor_fast_timer()
         self._monitor_slow_timer = self.set_interval(  # type: ignore[attr-defined]
             15.0, self._process_monitor_summaries
         )
 
         panel.add_class("visible")
 
+    def _start_monitor_fast_timer(self) -> None:
+        """(Re)start the table timer at the scanner's current cadence."""
+        if self._monitor_fast_timer is not None:
+            self._monitor_fast_timer.stop()
+        assert self._monitor_scanner is not None
+        self._monitor_interval = self._monitor_scanner.refresh_interval
+        self._monitor_fast_timer = self.set_interval(  # type: ignore[attr-defined]
+            self._monitor_interval, self._refresh_monitor_table
+        )
+
     def _close_monitor_panel(self) -> None:
         # Stop timers first.
         if self._monitor_fast_timer is not None:
@@ -149,6 +184,9 @@ class MonitorCommandsMixin:
         if self._monitor_slow_timer is not None:
             self._monitor_slow_timer.stop()
             self._monitor_slow_timer = None
+        if self._monitor_scanner is not None:
+            self._monitor_scanner.close()
+        self._monitor_rows = None
 
         try:
             panel: Vertical = self.query_one("#monitor-panel", Vertical)  # type: ignore[attr-defined]
@@ -189,11 +227,16 @@ class MonitorCommandsMixin:
             return
 
         sessions = self._monitor_summarizer.scan(limit=10)
-
-        # Clear and rebuild rows.  DataTable doesn't support in-place row
-        # updates without row keys, and with only ~10 rows the cost is nil.
-        table.clear()
-
+        self._refresh_monitor_header()
+        # The watcher can die (e.g. inotify limits); drop to the poll cadence.
+        if (
+            self._monitor_scanner is not None
+            and self._monitor_fast_timer is not None
+            and self._monitor_scanner.refresh_interval != self._monitor_interval
+        ):
+            self._start_monitor_fast_timer()
+
+        rows: list[tuple[str, ...]] = []
         for s in sessions:
             icon = SessionScanner.state_icon(s.state)
             color = SessionScanner.state_color(s.state)
@@ -214,25 +257,77 @@ class MonitorCommandsMixin:
             state_cell = f"[{color}]{icon}[/{color}]"
             project_cell = s.project[:18] if len(s.project) > 18 else s.project
 
-            table.add_row(
-                state_cell,
-                project_cell,
-                model,
-                str(s.turn_count),
-                age,
-                f"[{color}]{activity}[/{color}]",
-                key=s.session_id,
+            rows.append(
+                (
+                    s.session_id,
+                    state_cell,
+                    project_cell,
+                    model,
+                    str(s.turn_count),
+                    age,
+                    f"[{color}]{activity}[/{color}]",
+                )
             )
 
-    def _process_monitor_summaries(self) -> None:
-        """Process pending LLM summarizations (slow timer)."""
-        if self._monitor_summarizer is None:
+        # At the watch cadence most refreshes change nothing; leave the
+        # table (and its cursor) alone then.
+        if rows == self._monitor_rows:
             return
+        self._monitor_rows = rows
 
+        # Clear and rebuild rows.  DataTable doesn't support in-place row
+        # updates without row keys, and with only ~10 rows the cost is nil.
+        table.clear()
+        for session_id, *cells in rows:
+            table.add_row(*cells, key=session_id)
+
+    def _refresh_monitor_header(self) -> None:
+        """Show LLM job queue depth and latency next to the panel title."""
+        if self._llm_jobs is None:
+            return
         try:
-            processed = self._monitor_summarizer.process_pending(max_count=3)
-            if processed > 0:
-                # Immediately refresh to show new summaries.
-                self._refresh_monitor_table()
+            header: Static = self.query_one("#monitor-header", Static)  # type: ignore[attr-defined]
         except Exception:
-            logger.debug("Monitor summary processing failed", exc_info=True)
+            return
+        stats = self._llm_jobs.stats()
+        if stats.depth or stats.completed or stats.failed or stats.timed_out:
+            header.update(f"{_HEADER_TEXT}  [dim]LLM: {stats.summary()}[/dim]")
+        else:
+            header.update(_HEADER_TEXT)
+
+    def _process_monitor_summaries(self) -> None:
+        """Dispatch pending LLM summarizations to the job queue (slow timer)."""
+        summarizer = self._monitor_summarizer
+        jobs = self._llm_jobs
+        if summarizer is None or jobs is None:
+            return
+
+        for session in summarizer.take_pending():
+
+            def _done(key: str, summary: str | None, error: str | None, s=session):
+                if error is not None:
+                    self.post_message(MonitorSummaryReady(s, "", error))  # type: ignore[attr-defined]
+                elif summary:
+                    self.post_message(MonitorSummaryReady(s, summary))  # type: ignore[attr-defined]
+
+            if not jobs.submit(
+                f"summary:{session.session_id}",
+                lambda s=session: summarizer.generate_summary(s),
+                on_done=_done,
+            ):
+                # A job for this session is still in flight; try again later.
+                summarizer.requeue(session, retry=False)
+        self._refresh_monitor_header()
+
+    def on_monitor_summary_ready(self, message: MonitorSummaryReady) -> None:
+        """Apply a finished summary and refresh the table immediately.
+
+        Failed or timed-out jobs put the session back on the queue.
+        """
+        if self._monitor_summarizer is None:
+            return
+        if message.error is not None:
+            self._monitor_summarizer.requeue(message.session)
+            return
+        self._monitor_summarizer.apply_summary(message.session, message.summary)
+        self._refresh_monitor_table()
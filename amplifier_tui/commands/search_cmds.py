@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-import json
 
 from textual import work
-from textual.widgets import Static
 
+from ..core.features.transcript_index import REFRESH_INTERVAL, make_snippet
 from ..log import logger
 from ..platform import amplifier_projects_dir
 
@@ -63,19 +62,18 @@ class SearchCommandsMixin:
         query_lower = query.lower()
         matches: list[dict] = []
 
-        for i, (role, msg_text, widget) in enumerate(self._search_messages):
-            if query_lower in msg_text.lower():
-                idx = msg_text.lower().index(query_lower)
-                start = max(0, idx - 30)
-                end = min(len(msg_text), idx + len(query) + 30)
-                snippet = msg_text[start:end].replace("\n", " ")
-                if start > 0:
-                    snippet = "..." + snippet
-                if end < len(msg_text):
-                    snippet = snippet + "..."
-                matches.append(
-                    {"index": i + 1, "role": role, "snippet": snippet, "widget": widget}
-                )
+        for i in self._search_messages.find(query):
+            record = self._search_messages[i]
+            msg_text = record.text
+            idx = record.lower.index(query_lower)
+            start = max(0, idx - 30)
+            end = min(len(msg_text), idx + len(query) + 30)
+            snippet = msg_text[start:end].replace("\n", " ")
+            if start > 0:
+                snippet = "..." + snippet
+            if end < len(msg_text):
+                snippet = snippet + "..."
+            matches.append({"index": i + 1, "role": record.role, "snippet": snippet})
 
         if not matches:
             self._add_system_message(f"No matches found for '{query}'")
@@ -90,8 +88,8 @@ class SearchCommandsMixin:
             lines.append(f"  ... and {count - 20} more")
         self._add_system_message("\n".join(lines))
 
-        # Scroll to the first match
-        first_widget = matches[0].get("widget")
+        # Scroll to the first match (mounting it if it was virtualized away)
+        first_widget = self._message_widget(matches[0]["index"] - 1)
         if first_widget is not None:
             try:
                 first_widget.scroll_visible()
@@ -119,137 +117,53 @@ class SearchCommandsMixin:
         self._active_search_query = getattr(self, "_last_search_query", "")
         self._sessions_open(sid)
 
+    def _index_search_results(self, query: str) -> list[dict]:
+        """Query the persistent transcript index for *query*.
+
+        Returns one result dict per matching session (most recent first),
+        shaped for the sidebar and ``/search`` displays.  Runs in a worker
+        thread; the index is refreshed at most once per ``REFRESH_INTERVAL``
+        and only re-reads transcripts that changed on disk.
+        """
+        index = self._transcript_index
+        index.refresh(max_age=REFRESH_INTERVAL)
+        results: list[dict] = []
+        for m in index.search(query, refresh=False):
+            if m.first_text:
+                first_snippet = make_snippet(m.first_text, query)
+                first_role = m.first_role
+            else:
+                first_snippet = m.meta_match.replace("\n", " ")[:100]
+                first_role = "metadata"
+            # Derive project name from the encoded directory name
+            project_name = (
+                m.project_dir.rsplit("-", 1)[-1]
+                if "-" in m.project_dir
+                else m.project_dir
+            )
+            results.append(
+                {
+                    "session_id": m.session_id,
+                    "mtime": m.mtime,
+                    "date_str": datetime.fromtimestamp(m.mtime).strftime("%m/%d %H:%M"),
+                    "match_count": m.match_count,
+                    "first_snippet": first_snippet,
+                    "first_role": first_role,
+                    "name": m.name,
+                    "description": m.description,
+                    "project": project_name,
+                }
+            )
+        return results
+
     @work(thread=True)
     def _search_all_sessions_worker(self, query: str) -> None:
         """Search transcript content across all saved sessions in a background thread."""
-        projects_dir = amplifier_projects_dir()
-        if not projects_dir.exists():
+        if not amplifier_projects_dir().exists():
             self.call_from_thread(self._add_system_message, "No saved sessions found.")
             return
 
-        query_lower = query.lower()
-        results: list[dict] = []
-
-        for project_dir in projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-            sessions_subdir = project_dir / "sessions"
-            if not sessions_subdir.exists():
-                continue
-
-            for session_dir in sessions_subdir.iterdir():
-                if not session_dir.is_dir():
-                    continue
-                # Skip sub-sessions (agent delegations)
-                if "_" in session_dir.name:
-                    continue
-
-                sid = session_dir.name
-                transcript = session_dir / "transcript.jsonl"
-                if not transcript.exists():
-                    continue
-
-                try:
-                    mtime = session_dir.stat().st_mtime
-                except OSError:
-                    continue
-
-                # Read metadata
-                meta_name = ""
-                meta_desc = ""
-                metadata_path = session_dir / "metadata.json"
-                if metadata_path.exists():
-                    try:
-                        meta = json.loads(metadata_path.read_text(encoding="utf-8"))
-                        meta_name = meta.get("name", "")
-                        meta_desc = meta.get("description", "")
-                    except (OSError, json.JSONDecodeError):
-                        logger.debug(
-                            "Failed to read session metadata from %s",
-                            metadata_path,
-                            exc_info=True,
-                        )
-
-                # Derive project name from the encoded directory name
-                project_name = (
-                    project_dir.name.rsplit("-", 1)[-1]
-                    if "-" in project_dir.name
-                    else project_dir.name
-                )
-
-                # Scan transcript for ALL matches (not just first)
-                match_count = 0
-                first_snippet = ""
-                first_role = ""
-                try:
-                    with open(transcript, "r", encoding="utf-8") as fh:
-                        for raw_line in fh:
-                            raw_line = raw_line.strip()
-                            if not raw_line:
-                                continue
-                            try:
-                                msg = json.loads(raw_line)
-                            except json.JSONDecodeError:
-                                continue
-                            role = msg.get("role", "")
-                            if role not in ("user", "assistant"):
-                                continue
-                            content = self._extract_transcript_text(
-                                msg.get("content", "")
-                            )
-                            content_lower = content.lower()
-                            # Count occurrences in this message
-                            start = 0
-                            while True:
-                                idx = content_lower.find(query_lower, start)
-                                if idx == -1:
-                                    break
-                                match_count += 1
-                                if match_count == 1:
-                                    # Capture snippet around first match
-                                    snip_start = max(0, idx - 40)
-                                    snip_end = min(len(content), idx + len(query) + 40)
-                                    snippet = content[snip_start:snip_end].replace(
-                                        "\n", " "
-                                    )
-                                    if snip_start > 0:
-                                        snippet = "..." + snippet
-                                    if snip_end < len(content):
-                                        snippet = snippet + "..."
-                                    first_snippet = snippet
-                                    first_role = role
-                                start = idx + 1
-                except OSError:
-                    continue
-
-                # Also check metadata fields
-                for meta_field in (meta_name, meta_desc):
-                    if meta_field and query_lower in meta_field.lower():
-                        if not first_snippet:
-                            first_snippet = meta_field.replace("\n", " ")[:100]
-                            first_role = "metadata"
-                            match_count = max(match_count, 1)
-                        break
-
-                if match_count > 0:
-                    results.append(
-                        {
-                            "session_id": sid,
-                            "mtime": mtime,
-                            "date_str": datetime.fromtimestamp(mtime).strftime(
-                                "%m/%d %H:%M"
-                            ),
-                            "match_count": match_count,
-                            "first_snippet": first_snippet,
-                            "first_role": first_role,
-                            "name": meta_name,
-                            "description": meta_desc,
-                            "project": project_name,
-                        }
-                    )
-
-        # Sort by most recent first
-        results.sort(key=lambda r: r["mtime"], reverse=True)
+        results = self._index_search_results(query)
 
         # Store for /search open N and sidebar integration
         self._last_search_results = results
@@ -325,12 +239,10 @@ class SearchCommandsMixin:
 
         # Search through messages
         search_pat = pattern if case_sensitive else pattern.lower()
-        matches: list[tuple[int, str, str, "Static | None"]] = []
+        matches: list[tuple[int, str, str]] = []
 
-        for i, (role, msg_text, widget) in enumerate(self._search_messages):
-            text_to_search = msg_text if case_sensitive else msg_text.lower()
-            if search_pat not in text_to_search:
-                continue
+        for i in self._search_messages.find(pattern, case_sensitive=case_sensitive):
+            role, msg_text, _widget = self._search_messages[i]
             # Find matching lines for context
             for line in msg_text.split("\n"):
                 line_search = line if case_sensitive else line.lower()
@@ -338,7 +250,7 @@ class SearchCommandsMixin:
                     preview = line.strip()
                     if len(preview) > 80:
                         preview = preview[:80] + "..."
-                    matches.append((i, role, preview, widget))
+                    matches.append((i, role, preview))
                     break  # one match per message is enough
 
         if not matches:
@@ -354,7 +266,7 @@ class SearchCommandsMixin:
 
         role_labels = {"user": "You", "assistant": "AI", "system": "Sys"}
         shown = min(count, 20)
-        for msg_idx, role, preview, _widget in matches[:shown]:
+        for msg_idx, role, preview in matches[:shown]:
             role_label = role_labels.get(role, role)
             lines.append(f"  [{role_label} #{msg_idx + 1}] {preview}")
 
@@ -363,8 +275,8 @@ class SearchCommandsMixin:
 
         self._add_system_message("\n".join(lines))
 
-        # Scroll to the first match
-        first_widget = matches[0][3]
+        # Scroll to the first match (mounting it if it was virtualized away)
+        first_widget = self._message_widget(matches[0][0])
         if first_widget is not None:
             try:
                 first_widget.scroll_visible()
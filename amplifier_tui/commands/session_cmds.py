@@ -4,10 +4,8 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-import json
 
 from textual import work
-from textual.widgets import Tree
 
 from ..platform import amplifier_projects_dir
 from ..preferences import (
@@ -24,8 +22,7 @@ class SessionCommandsMixin:
         """Show loading state then populate in background."""
         if not self._amplifier_available:
             return
-        tree = self.query_one("#session-tree", Tree)
-        tree.clear()
+        tree = self._clear_session_tree()
         tree.root.add_leaf("Loading sessions...")
         self._load_sessions_worker()
 
@@ -168,8 +165,7 @@ class SessionCommandsMixin:
 
     def _sessions_search(self, query: str) -> None:
         """Search across all saved sessions for matching text."""
-        projects_dir = amplifier_projects_dir()
-        if not projects_dir.exists():
+        if not amplifier_projects_dir().exists():
             self._add_system_message("No saved sessions found.")
             return
 
@@ -178,117 +174,56 @@ class SessionCommandsMixin:
         custom_names = self._load_session_names()
         session_titles = self._load_session_titles()
 
-        for project_dir in projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-            sessions_subdir = project_dir / "sessions"
-            if not sessions_subdir.exists():
+        # Runs on the UI thread: query the index as it stands and let a
+        # throttled background refresh pick up changes for the next query.
+        index = self._transcript_index
+        index.refresh_in_background()
+        hits = {m.session_id: m for m in index.search(query, refresh=False)}
+
+        for s in index.sessions():
+            sid = s.session_id
+            hit = hits.get(sid)
+
+            # Metadata first (name, description), then custom names / titles,
+            # then the session ID itself.
+            meta_match = hit.meta_match if hit else ""
+            if not meta_match:
+                for field in (
+                    custom_names.get(sid, ""),
+                    session_titles.get(sid, ""),
+                ):
+                    if field and query_lower in field.lower():
+                        meta_match = field
+                        break
+            if not meta_match and query_lower in sid.lower():
+                meta_match = f"(session ID: {sid})"
+
+            if meta_match:
+                preview, role = meta_match.replace("\n", " ")[:100], "metadata"
+            elif hit and hit.first_text:
+                preview, role = hit.first_text.replace("\n", " ")[:120], hit.first_role
+            else:
                 continue
 
-            for session_dir in sessions_subdir.iterdir():
-                if not session_dir.is_dir():
-                    continue
-                # Skip sub-sessions
-                if "_" in session_dir.name:
-                    continue
-
-                sid = session_dir.name
-                transcript = session_dir / "transcript.jsonl"
-                if not transcript.exists():
-                    continue
-
-                try:
-                    mtime = transcript.stat().st_mtime
-                except OSError:
-                    continue
-
-                # Search metadata first (name, description)
-                meta_match = ""
-                metadata_path = session_dir / "metadata.json"
-                meta_name = ""
-                meta_desc = ""
-                if metadata_path.exists():
-                    try:
-                        meta = json.loads(metadata_path.read_text(encoding="utf-8"))
-                        meta_name = meta.get("name", "")
-                        meta_desc = meta.get("description", "")
-                        for field in (meta_name, meta_desc):
-                            if query_lower in field.lower():
-                                meta_match = field
-                                break
-                    except (OSError, json.JSONDecodeError):
-                        logger.debug(
-                            "Failed to read metadata from %s",
-                            metadata_path,
-                            exc_info=True,
-                        )
-
-                # Search custom names / titles
-                if not meta_match:
-                    for field in (
-                        custom_names.get(sid, ""),
-                        session_titles.get(sid, ""),
-                    ):
-                        if field and query_lower in field.lower():
-                            meta_match = field
-                            break
-
-                # Search filename
-                if not meta_match and query_lower in sid.lower():
-                    meta_match = f"(session ID: {sid})"
-
-                # If metadata matched, record and skip transcript scan
-                if meta_match:
-                    results.append(
-                        {
-                            "session_id": sid,
-                            "mtime": mtime,
-                            "date_str": datetime.fromtimestamp(mtime).strftime(
-                                "%m/%d %H:%M"
-                            ),
-                            "match_preview": meta_match.replace("\n", " ")[:100],
-                            "match_role": "metadata",
-                            "name": meta_name,
-                            "description": meta_desc,
-                        }
-                    )
-                    continue
-
-                # Scan transcript lines for content match
-                try:
-                    with open(transcript, "r", encoding="utf-8") as fh:
-                        for raw_line in fh:
-                            raw_line = raw_line.strip()
-                            if not raw_line:
-                                continue
-                            try:
-                                msg = json.loads(raw_line)
-                            except json.JSONDecodeError:
-                                continue
-                            role = msg.get("role", "")
-                            if role not in ("user", "assistant"):
-                                continue
-                            text = self._extract_transcript_text(msg.get("content", ""))
-                            if query_lower in text.lower():
-                                preview = text.replace("\n", " ")[:120]
-                                results.append(
-                                    {
-                                        "session_id": sid,
-                                        "mtime": mtime,
-                                        "date_str": datetime.fromtimestamp(
-                                            mtime
-                                        ).strftime("%m/%d %H:%M"),
-                                        "match_preview": preview,
-                                        "match_role": role,
-                                        "name": meta_name,
-                                        "description": meta_desc,
-                                    }
-                                )
-                                break  # One match per session is enough
-                except OSError:
-                    continue
+            results.append(
+                {
+                    "session_id": sid,
+                    "mtime": s.mtime,
+                    "date_str": datetime.fromtimestamp(s.mtime).strftime("%m/%d %H:%M"),
+                    "match_preview": preview,
+                    "match_role": role,
+                    "name": s.name,
+                    "description": s.description,
+                }
+            )
 
         if not results:
+            if not index.ready:
+                self._add_system_message(
+                    f"No sessions matching '{query}' yet; the search index is "
+                    "still being built, try again shortly."
+                )
+                return
             self._add_system_message(f"No sessions matching '{query}'.")
             return
 
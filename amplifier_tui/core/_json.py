@@ -0,0 +1,33 @@
+"""JSON decoding for JSONL transcripts and event logs.
+
+Transcript consumers decode every line of files that run to tens of
+megabytes.  When the optional ``orjson`` package is installed
+(``pip install amplifier-tui[fast]``) it is used for these lines: about
+two to three times faster than the stdlib decoder, on ``str`` or raw
+``bytes`` lines alike (see ``tools/bench_transcript_parse.py``).  Without
+it the stdlib ``json`` module is used, with identical results for
+well-formed transcripts.
+
+Both backends raise a :class:`ValueError` subclass for malformed input
+(``json.JSONDecodeError``, ``orjson.JSONDecodeError`` and
+``UnicodeDecodeError`` all are), so callers catch :data:`DECODE_ERRORS`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None
+
+#: Exceptions raised for a malformed or non-UTF-8 line by either backend.
+DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+
+#: Name of the active backend ("orjson" or "json"); shown by benchmarks.
+BACKEND: str = "orjson" if orjson is not None else "json"
+
+#: Decode one JSON document from ``str`` or UTF-8 ``bytes``.
+loads: Callable[[str | bytes], Any] = orjson.loads if orjson is not None else json.loads
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import TYPE_CHECKING
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any
 
 from .conversation import ConversationState
 from .features.agent_tracker import is_delegate_tool, make_delegate_key
+from .features.git_state import GitStateCache
 from .session_manager import SessionManager
 
 if TYPE_CHECKING:
@@ -35,6 +38,12 @@ class SharedAppBase:
         # -- Active mode (per-conversation, but also on self for convenience) --
         self._active_mode: str | None = None
 
+        # -- Command coroutines scheduled by _run_background --
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # -- Branch/status per repository, shared by the git commands --
+        self._git_state = GitStateCache()
+
     # --- Multi-conversation helpers ---
 
     def _all_conversations(self) -> list:
@@ -80,6 +89,38 @@ class SharedAppBase:
     def _finish_processing(self, *, conversation_id: str = "") -> None:
         raise NotImplementedError
 
+    # --- Background commands (/run, /git, /diff, /include) ---
+
+    def _run_background(
+        self, coro: Coroutine[Any, Any, None], *, group: str = "commands"
+    ) -> None:
+        """Run a command coroutine without blocking the UI.
+
+        The default schedules *coro* on the running event loop (the web
+        frontend handles commands inside one), or runs it to completion
+        when no loop is running.  The TUI runs it as a worker in *group* so
+        Escape can cancel it.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(coro)
+            return
+        task = loop.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _replace_system_message(self, message: Any, text: str) -> None:
+        """Replace a message returned by ``_add_system_message`` with *text*.
+
+        Frontends whose messages cannot be updated in place return ``None``
+        from ``_add_system_message``; *text* is then posted as a new message.
+        """
+        if message is None:
+            self._add_system_message(text)
+        else:
+            message.update(text)
+
     # --- Abstract streaming display methods (called from BACKGROUND THREAD) ---
     # Subclasses must handle thread-safety (e.g., call_from_thread for TUI).
 
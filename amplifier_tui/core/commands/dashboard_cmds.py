@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
+
+from ..constants import _DASHBOARD_REFRESH_SECONDS
 
 
 class DashboardCommandsMixin:
@@ -12,17 +18,21 @@ class DashboardCommandsMixin:
         """Handle /dashboard subcommands."""
         sub = args.strip().lower() if args else ""
 
-        if not sub:
-            if not self._dashboard_stats.is_cached:  # type: ignore[attr-defined]
-                count = self._dashboard_stats.scan_sessions()  # type: ignore[attr-defined]
-                self._add_system_message(f"[dim]Scanned {count} sessions.[/dim]")  # type: ignore[attr-defined]
-            self._add_system_message(self._dashboard_stats.format_dashboard())  # type: ignore[attr-defined]
+        if sub == "usage" or sub.startswith("usage "):
+            days = _parse_period(sub[len("usage") :].strip() or "30d")
+            if days is None:
+                self._add_system_message(  # type: ignore[attr-defined]
+                    "Usage: /dashboard usage [N|Nd|Nw|Nm|Ny]  (e.g. 4w, 6m)"
+                )
+            else:
+                self._run_background(self._scan_usage(days), group="dashboard")  # type: ignore[attr-defined]
             return
 
-        if sub == "refresh":
-            count = self._dashboard_stats.scan_sessions()  # type: ignore[attr-defined]
-            self._add_system_message(f"Rescanned {count} sessions.")  # type: ignore[attr-defined]
-            self._add_system_message(self._dashboard_stats.format_dashboard())  # type: ignore[attr-defined]
+        if sub in ("", "refresh", "heatmap", "summary"):
+            if sub == "refresh" or not self._dashboard_stats.is_cached:  # type: ignore[attr-defined]
+                self._run_background(self._scan_dashboard(sub), group="dashboard")  # type: ignore[attr-defined]
+            else:
+                self._show_dashboard(sub)
             return
 
         if sub == "export":
@@ -37,18 +47,6 @@ class DashboardCommandsMixin:
                 self._add_system_message(f"[red]Export failed:[/red] {e}")  # type: ignore[attr-defined]
             return
 
-        if sub == "heatmap":
-            if not self._dashboard_stats.is_cached:  # type: ignore[attr-defined]
-                self._dashboard_stats.scan_sessions()  # type: ignore[attr-defined]
-            self._add_system_message(self._dashboard_stats.format_heatmap())  # type: ignore[attr-defined]
-            return
-
-        if sub == "summary":
-            if not self._dashboard_stats.is_cached:  # type: ignore[attr-defined]
-                self._dashboard_stats.scan_sessions()  # type: ignore[attr-defined]
-            self._add_system_message(self._dashboard_stats.format_summary())  # type: ignore[attr-defined]
-            return
-
         if sub == "clear":
             self._dashboard_stats.clear()  # type: ignore[attr-defined]
             self._add_system_message("Dashboard cache cleared.")  # type: ignore[attr-defined]
@@ -61,5 +59,82 @@ class DashboardCommandsMixin:
             "  /dashboard export     Export as HTML\n"
             "  /dashboard heatmap    Show activity heatmap only\n"
             "  /dashboard summary    Show summary stats only\n"
+            "  /dashboard usage [6m] Tokens by model, project and week\n"
             "  /dashboard clear      Clear cached stats"
         )
+
+    async def _scan_dashboard(self, sub: str) -> None:
+        """Scan session files in a thread, showing progress, then display."""
+        stats = self._dashboard_stats  # type: ignore[attr-defined]
+        count, message = await self._scan_with_progress(
+            "Scanning sessions", stats.scan_sessions
+        )
+        if sub == "refresh":
+            text = f"Rescanned {count} sessions ({stats.last_parsed} files changed)."
+        else:
+            text = f"[dim]Scanned {count} sessions.[/dim]"
+        self._replace_system_message(message, text)  # type: ignore[attr-defined]
+        self._show_dashboard(sub)
+
+    async def _scan_usage(self, days: int) -> None:
+        """Ingest new usage events in a thread, then show ``/dashboard usage``."""
+        stats = self._dashboard_stats  # type: ignore[attr-defined]
+        added, message = await self._scan_with_progress(
+            "Reading usage events", stats.scan_usage
+        )
+        self._replace_system_message(  # type: ignore[attr-defined]
+            message, f"[dim]{added:,} new usage events.[/dim]"
+        )
+        self._add_system_message(stats.format_usage(days))  # type: ignore[attr-defined]
+
+    async def _scan_with_progress(
+        self, label: str, scan: Callable[[Callable[[int, int], None]], int]
+    ) -> tuple[int, Any]:
+        """Run *scan* in a thread, updating a progress message meanwhile.
+
+        Returns the scan's result and the message (``None`` when the
+        frontend cannot update messages in place).
+        """
+        message = self._add_system_message(f"[dim]{label}…[/dim]")  # type: ignore[attr-defined]
+        progress = [0, 0]
+
+        def on_progress(done: int, total: int) -> None:
+            progress[:] = done, total  # called from the scan thread
+
+        async def refresh() -> None:
+            shown = 0
+            while True:
+                await asyncio.sleep(_DASHBOARD_REFRESH_SECONDS)
+                done, total = progress
+                if done != shown:
+                    shown = done
+                    message.update(f"[dim]{label}… {done:,}/{total:,} files[/dim]")
+
+        refresher = asyncio.ensure_future(refresh()) if message is not None else None
+        try:
+            result = await asyncio.to_thread(scan, on_progress)
+        finally:
+            if refresher is not None:
+                refresher.cancel()
+        return result, message
+
+    def _show_dashboard(self, sub: str) -> None:
+        stats = self._dashboard_stats  # type: ignore[attr-defined]
+        if sub == "heatmap":
+            self._add_system_message(stats.format_heatmap())  # type: ignore[attr-defined]
+        elif sub == "summary":
+            self._add_system_message(stats.format_summary())  # type: ignore[attr-defined]
+        else:
+            self._add_system_message(stats.format_dashboard())  # type: ignore[attr-defined]
+
+
+_PERIOD_RE = re.compile(r"(\d+)\s*([dwmy]?)")
+_PERIOD_DAYS = {"": 1, "d": 1, "w": 7, "m": 30, "y": 365}
+
+
+def _parse_period(text: str) -> int | None:
+    """Days in a period such as ``30``, ``30d``, ``4w``, ``6m`` or ``1y``."""
+    m = _PERIOD_RE.fullmatch(text)
+    if m is None or int(m.group(1)) == 0:
+        return None
+    return int(m.group(1)) * _PERIOD_DAYS[m.group(2)]
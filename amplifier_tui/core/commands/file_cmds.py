@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 from pathlib import Path
+import asyncio
 import os
-import subprocess
 
 from ..log import logger
 from ..constants import (
     _DANGEROUS_PATTERNS,
     _MAX_RUN_OUTPUT_LINES,
+    _RUN_REFRESH_SECONDS,
     _RUN_TIMEOUT,
 )
+from ..features.process_runner import run_process
 from ..preferences import (
     save_editor_auto_send,
     save_notification_enabled,
@@ -46,7 +48,7 @@ class FileCommandsMixin:
                 "  /run ls -la\n"
                 "  /run git status\n"
                 "  /! git diff     (shorthand)\n"
-                "\nTimeout: 30s. Max output: 100 lines."
+                "\nTimeout: 30s. Max output: 100 lines. Esc cancels."
             )
             return
 
@@ -62,47 +64,82 @@ class FileCommandsMixin:
         # Record in history so Ctrl+R can find it
         self._history.add(f"/run {text}", force=True)
 
+        self._run_background(self._run_shell_command(text), group="shell")
+
+    async def _run_shell_command(self, text: str) -> None:
+        """Run a /run command, streaming its stdout into one message.
+
+        Escape cancels the command (the TUI cancels the "shell" worker
+        group), which kills the process.
+        """
+        header = f"$ {text}"
+        message = self._add_system_message(f"{header}\n(running…)")
+        stdout: list[str] = []
+        shown = 0
+
+        async def refresh() -> None:
+            # Repaint at most every _RUN_REFRESH_SECONDS, however chatty
+            # the command is, and pick up the tail once it goes quiet.
+            nonlocal shown
+            while True:
+                await asyncio.sleep(_RUN_REFRESH_SECONDS)
+                if len(stdout) != shown:
+                    shown = len(stdout)
+                    partial = _format_run_output("".join(stdout), "", None)
+                    message.update(f"{header}\n```\n{partial}\n```\n(running…)")
+
+        refresher = asyncio.ensure_future(refresh()) if message is not None else None
         try:
-            result = subprocess.run(
+            result = await run_process(
                 text,
-                shell=True,  # noqa: S602  — needed for pipes/globs
-                capture_output=True,
-                text=True,
-                timeout=_RUN_TIMEOUT,
+                shell=True,  # needed for pipes/globs
                 cwd=os.getcwd(),
+                timeout=_RUN_TIMEOUT,
+                on_stdout=stdout.append,
             )
+        except asyncio.CancelledError:
+            output = _format_run_output("".join(stdout), "", None)
+            self._replace_system_message(
+                message, f"{header}\n```\n{output}\n```\n[cancelled]"
+            )
+            raise
+        except OSError as e:
+            logger.debug("Command execution failed", exc_info=True)
+            self._replace_system_message(message, f"Error running command: {e}")
+            return
+        finally:
+            if refresher is not None:
+                refresher.cancel()
 
-            output_parts: list[str] = []
-
-            if result.stdout:
-                lines = result.stdout.splitlines()
-                if len(lines) > _MAX_RUN_OUTPUT_LINES:
-                    output_parts.append("\n".join(lines[:_MAX_RUN_OUTPUT_LINES]))
-                    remaining = len(lines) - _MAX_RUN_OUTPUT_LINES
-                    output_parts.append(f"\n... ({remaining} more lines)")
-                else:
-                    output_parts.append(result.stdout.rstrip())
-
-            if result.stderr:
-                output_parts.append(f"\n[stderr]\n{result.stderr.rstrip()}")
-
-            if result.returncode != 0:
-                output_parts.append(f"\n[exit code: {result.returncode}]")
-
-            if not output_parts:
-                output_parts.append("(no output)")
+        if result.timed_out:
+            self._replace_system_message(
+                message, f"Command timed out after {_RUN_TIMEOUT}s: {text}"
+            )
+            return
+        output = _format_run_output(result.stdout, result.stderr, result.returncode)
+        self._replace_system_message(message, f"{header}\n```\n{output}\n```")
+        # The command may have touched the work tree, which .git doesn't track
+        self._git_state.invalidate(os.getcwd())
 
-            header = f"$ {text}"
-            output = "\n".join(output_parts)
-            self._add_system_message(f"{header}\n```\n{output}\n```")
+    # -- /include helpers ------------------------------------------------------
 
-        except subprocess.TimeoutExpired:
-            self._add_system_message(f"Command timed out after {_RUN_TIMEOUT}s: {text}")
-        except (subprocess.SubprocessError, OSError) as e:
-            logger.debug("Command execution failed", exc_info=True)
-            self._add_system_message(f"Error running command: {e}")
+    async def _include_project_info(self, kind: str) -> None:
+        """Show ``/include tree`` or ``/include git`` output (runs git)."""
+        from ..features.include_helpers import (
+            get_directory_tree_async,
+            get_git_status_and_diff_async,
+        )
 
-    # -- /include helpers ------------------------------------------------------
+        cwd = os.getcwd()
+        if kind == "tree":
+            tree = await get_directory_tree_async(cwd)
+            self._add_system_message(f"Project structure:\n```\n{tree}\n```")
+        else:
+            state, _ = await self._git_state.get(cwd)
+            git_info = await get_git_status_and_diff_async(
+                cwd, status=state.short_status(cwd) if state is not None else None
+            )
+            self._add_system_message(f"Git status:\n```\n{git_info}\n```")
 
     def _cmd_include(self, text: str) -> None:
         """Include file contents in the prompt.
@@ -114,11 +151,7 @@ class FileCommandsMixin:
           /include preview <path> Syntax-aware file preview (language, lines, size)
           /include <path>         Include file contents (original behaviour)
         """
-        from ..features.include_helpers import (
-            file_preview,
-            get_directory_tree,
-            get_git_status_and_diff,
-        )
+        from ..features.include_helpers import file_preview
 
         text = text.strip()
         if not text:
@@ -140,17 +173,8 @@ class FileCommandsMixin:
         # -- Subcommand routing (checked before path-based logic) ---------------
 
         # /include tree
-        if text == "tree":
-            cwd = os.getcwd()
-            tree = get_directory_tree(cwd)
-            self._add_system_message(f"Project structure:\n```\n{tree}\n```")
-            return
-
-        # /include git
-        if text == "git":
-            cwd = os.getcwd()
-            git_info = get_git_status_and_diff(cwd)
-            self._add_system_message(f"Git status:\n```\n{git_info}\n```")
+        if text in ("tree", "git"):
+            self._run_background(self._include_project_info(text), group="shell")
             return
 
         # /include recent
@@ -313,3 +337,28 @@ class FileCommandsMixin:
         save_notification_sound(self._prefs.notifications.sound_enabled)
         state = "on" if self._prefs.notifications.sound_enabled else "off"
         self._add_system_message(f"Notification sound: {state}")
+
+
+def _format_run_output(stdout: str, stderr: str, returncode: int | None) -> str:
+    """Format /run output: stdout capped at ``_MAX_RUN_OUTPUT_LINES`` lines."""
+    output_parts: list[str] = []
+
+    if stdout:
+        lines = stdout.splitlines()
+        if len(lines) > _MAX_RUN_OUTPUT_LINES:
+            output_parts.append("\n".join(lines[:_MAX_RUN_OUTPUT_LINES]))
+            remaining = len(lines) - _MAX_RUN_OUTPUT_LINES
+            output_parts.append(f"\n... ({remaining} more lines)")
+        else:
+            output_parts.append(stdout.rstrip())
+
+    if stderr:
+        output_parts.append(f"\n[stderr]\n{stderr.rstrip()}")
+
+    if returncode:
+        output_parts.append(f"\n[exit code: {returncode}]")
+
+    if not output_parts:
+        output_parts.append("(no output)")
+
+    return "\n".join(output_parts)
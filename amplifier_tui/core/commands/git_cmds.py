@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import difflib
+import os
 
 from ..features.git_integration import (
     run_git,
     looks_like_commit_ref,
     show_diff as _show_diff_text,
 )
+from ..features.process_runner import run_git_async
 
 
 class GitCommandsMixin:
@@ -21,16 +23,26 @@ class GitCommandsMixin:
         """
         return run_git(*args, cwd=cwd)
 
+    async def _run_git_async(
+        self, *args: str, cwd: str | None = None
+    ) -> tuple[bool, str]:
+        """Like :meth:`_run_git` without blocking the UI (for command handlers)."""
+        return await run_git_async(*args, cwd=cwd)
+
     # ------------------------------------------------------------------
     # Diff display helpers
     # ------------------------------------------------------------------
 
     def _cmd_git(self, text: str) -> None:
-        """Quick git operations (read-only)."""
+        """Quick git operations (read-only).
+
+        Handlers are coroutines run via ``_run_background``, so a slow
+        repository never blocks the UI.
+        """
         text = text.strip()
 
         if not text:
-            self._git_overview()
+            self._run_background(self._git_overview(), group="shell")
             return
 
         parts = text.split(None, 1)
@@ -50,75 +62,56 @@ class GitCommandsMixin:
 
         handler = handlers.get(subcmd)
         if handler:
-            handler(args)
+            self._run_background(handler(args), group="shell")
         else:
             self._add_system_message(
                 f"Unknown git subcommand: {subcmd}\n\n"
                 "Available: status (st), log, diff, branch (br), stash, blame"
             )
 
-    def _git_overview(self) -> None:
+    async def _git_overview(self) -> None:
         """Quick git overview: branch, status summary, ahead/behind."""
         from rich.markup import escape
 
-        ok, branch = self._run_git("branch", "--show-current")
-        if not ok:
-            self._add_system_message(f"Not a git repo or git error: {branch}")
+        state, error = await self._git_state.get()
+        if state is None:
+            self._add_system_message(f"Not a git repo or git error: {error}")
             return
-        branch = branch.strip() or "(detached HEAD)"
-
-        # Status summary
-        _, status_out = self._run_git("status", "--porcelain")
-        lines = [ln for ln in status_out.splitlines() if ln.strip()]
-        staged = sum(1 for ln in lines if ln[0] not in (" ", "?"))
-        modified = sum(1 for ln in lines if len(ln) > 1 and ln[1] == "M")
-        untracked = sum(1 for ln in lines if ln.startswith("??"))
-
-        # Ahead/behind
-        ahead, behind = 0, 0
-        ab_ok, ab_out = self._run_git(
-            "rev-list", "--left-right", "--count", "HEAD...@{upstream}"
-        )
-        if ab_ok and ab_out.strip():
-            ab_parts = ab_out.strip().split()
-            if len(ab_parts) == 2:
-                ahead, behind = int(ab_parts[0]), int(ab_parts[1])
-
-        # Last commit
-        _, last_commit = self._run_git("log", "-1", "--format=%h %s (%cr)")
-
-        parts = [f"[bold]Branch:[/bold] {escape(branch)}"]
-        if staged:
-            parts.append(f"  [green]Staged:[/green] {staged}")
-        if modified:
-            parts.append(f"  [yellow]Modified:[/yellow] {modified}")
-        if untracked:
-            parts.append(f"  [dim]Untracked:[/dim] {untracked}")
-        if ahead:
-            parts.append(f"  [cyan]↑ {ahead} ahead[/cyan]")
-        if behind:
-            parts.append(f"  [red]↓ {behind} behind[/red]")
-        if not (staged or modified or untracked):
+
+        parts = [f"[bold]Branch:[/bold] {escape(state.branch or '(detached HEAD)')}"]
+        if state.staged:
+            parts.append(f"  [green]Staged:[/green] {state.staged}")
+        if state.modified:
+            parts.append(f"  [yellow]Modified:[/yellow] {state.modified}")
+        if state.untracked:
+            parts.append(f"  [dim]Untracked:[/dim] {state.untracked}")
+        if state.ahead:
+            parts.append(f"  [cyan]↑ {state.ahead} ahead[/cyan]")
+        if state.behind:
+            parts.append(f"  [red]↓ {state.behind} behind[/red]")
+        if not (state.staged or state.modified or state.untracked):
             parts.append("  [green]Clean working tree[/green]")
-        if last_commit.strip():
-            parts.append(f"\n[dim]Last:[/dim] {escape(last_commit.strip())}")
+        if state.last_commit:
+            parts.append(f"\n[dim]Last:[/dim] {escape(state.last_commit)}")
 
         self._add_system_message("\n".join(parts))
 
-    def _git_status(self, args: str) -> None:
+    async def _git_status(self, args: str) -> None:
         """Detailed git status."""
-        ok, out = self._run_git("status", "--short", "--branch")
-        if not ok:
-            self._add_system_message(f"git status error: {out}")
+        state, error = await self._git_state.get()
+        if state is None:
+            self._add_system_message(f"git status error: {error}")
             return
+        status = state.short_status(os.getcwd())
+        out = "\n".join(filter(None, (state.header, status)))
         self._add_system_message(f"```\n{out}\n```")
 
-    def _git_log(self, args: str) -> None:
+    async def _git_log(self, args: str) -> None:
         """Recent commits."""
         n = "10"
         if args.strip().isdigit():
             n = args.strip()
-        ok, out = self._run_git(
+        ok, out = await self._run_git_async(
             "log",
             f"-{n}",
             "--format=%h %s (%cr) <%an>",
@@ -128,12 +121,12 @@ class GitCommandsMixin:
             return
         self._add_system_message(f"```\n{out}\n```")
 
-    def _git_diff_summary(self, args: str) -> None:
+    async def _git_diff_summary(self, args: str) -> None:
         """Diff summary or specific file diff."""
         if args.strip():
-            ok, out = self._run_git("diff", args.strip())
+            ok, out = await self._run_git_async("diff", args.strip())
         else:
-            ok, out = self._run_git("diff", "--stat")
+            ok, out = await self._run_git_async("diff", "--stat")
         if not ok:
             self._add_system_message(f"git diff error: {out}")
             return
@@ -150,17 +143,17 @@ class GitCommandsMixin:
         else:
             self._add_system_message(f"```\n{out}\n```")
 
-    def _git_branches(self, args: str) -> None:
+    async def _git_branches(self, args: str) -> None:
         """List branches."""
-        ok, out = self._run_git("branch", "-vv")
+        ok, out = await self._run_git_async("branch", "-vv")
         if not ok:
             self._add_system_message(f"git branch error: {out}")
             return
         self._add_system_message(f"```\n{out}\n```")
 
-    def _git_stashes(self, args: str) -> None:
+    async def _git_stashes(self, args: str) -> None:
         """List stashes."""
-        ok, out = self._run_git("stash", "list")
+        ok, out = await self._run_git_async("stash", "list")
         if not ok:
             self._add_system_message(f"git stash error: {out}")
             return
@@ -169,12 +162,12 @@ class GitCommandsMixin:
             return
         self._add_system_message(f"```\n{out}\n```")
 
-    def _git_blame(self, args: str) -> None:
+    async def _git_blame(self, args: str) -> None:
         """Quick blame view."""
         if not args.strip():
             self._add_system_message("Usage: /git blame <file>")
             return
-        ok, out = self._run_git("blame", "--date=short", args.strip())
+        ok, out = await self._run_git_async("blame", "--date=short", args.strip())
         if not ok:
             self._add_system_message(f"git blame error: {out}")
             return
@@ -209,22 +202,39 @@ class GitCommandsMixin:
             self._cmd_diff_msgs(text[4:].strip())
             return
 
+        # --- /diff last  (most recent file-edit diff from tool calls) ---
+        if text == "last":
+            last_diff = getattr(self, "_last_file_edit_diff", None)
+            if last_diff is not None:
+                _title, render_diff = last_diff
+                self._add_system_message(render_diff())
+            else:
+                self._add_system_message(
+                    "No file-edit diffs in this session.\n"
+                    "Use /diff HEAD~1 for the last git commit diff."
+                )
+            return
+
+        self._run_background(self._git_diff(text), group="shell")
+
+    async def _git_diff(self, text: str) -> None:
+        """The git-backed forms of /diff (see :meth:`_cmd_diff`)."""
         # Check if we're inside a git repo
-        ok, _ = self._run_git("rev-parse", "--is-inside-work-tree")
-        if not ok:
+        state, _ = await self._git_state.get()
+        if state is None:
             self._add_system_message("Not in a git repository")
             return
 
         # --- /diff (no args) -> unstaged diff, or status summary ---
         if not text:
-            ok, output = self._run_git("diff", "--color=never")
+            ok, output = await self._run_git_async("diff", "--color=never")
             if not ok:
                 self._add_system_message(f"git error: {output}")
                 return
             if not output:
                 # No unstaged diff — show status summary as guidance
-                ok, status = self._run_git("status", "--short")
-                if not ok or not status:
+                status = state.short_status(os.getcwd())
+                if not status:
                     self._add_system_message("No changes detected (working tree clean)")
                     return
                 lines = ["No unstaged changes. Changed files:", ""]
@@ -240,10 +250,12 @@ class GitCommandsMixin:
 
         # --- /diff all ---
         if text == "all":
-            ok, output = self._run_git("diff", "--color=never")
+            ok, output = await self._run_git_async("diff", "--color=never")
             if not ok or not output:
                 # Also check staged changes
-                ok2, staged = self._run_git("diff", "--staged", "--color=never")
+                ok2, staged = await self._run_git_async(
+                    "diff", "--staged", "--color=never"
+                )
                 if staged:
                     output = staged
                 elif not output:
@@ -254,32 +266,19 @@ class GitCommandsMixin:
 
         # --- /diff staged ---
         if text == "staged":
-            ok, output = self._run_git("diff", "--staged", "--color=never")
+            ok, output = await self._run_git_async("diff", "--staged", "--color=never")
             if not ok or not output:
                 self._add_system_message("No staged changes")
                 return
             self._add_system_message(_show_diff_text(output))
             return
 
-        # --- /diff last  (most recent file-edit diff from tool calls) ---
-        if text == "last":
-            last_diff = getattr(self, "_last_file_edit_diff", None)
-            if last_diff is not None:
-                _title, diff_text = last_diff
-                self._add_system_message(diff_text)
-            else:
-                self._add_system_message(
-                    "No file-edit diffs in this session.\n"
-                    "Use /diff HEAD~1 for the last git commit diff."
-                )
-            return
-
         # --- /diff <file1> <file2> (two paths) ---
         if " " in text:
             parts = text.split(None, 1)
             if len(parts) == 2:
                 # --no-index returns exit-code 1 when files differ (normal)
-                _ok, output = self._run_git(
+                _ok, output = await self._run_git_async(
                     "diff",
                     "--no-index",
                     "--color=never",
@@ -296,7 +295,7 @@ class GitCommandsMixin:
 
         # --- /diff HEAD~N or commit-ish ---
         if looks_like_commit_ref(text):
-            ok, output = self._run_git("diff", text, "--color=never")
+            ok, output = await self._run_git_async("diff", text, "--color=never")
             if not ok:
                 self._add_system_message(f"git error: {output}")
                 return
@@ -307,13 +306,15 @@ class GitCommandsMixin:
             return
 
         # --- /diff <file> ---
-        ok, output = self._run_git("diff", "--color=never", "--", text)
+        ok, output = await self._run_git_async("diff", "--color=never", "--", text)
         if not ok:
             self._add_system_message(f"git error: {output}")
             return
         if not output:
             # Try staged changes for this file
-            ok, output = self._run_git("diff", "--staged", "--color=never", "--", text)
+            ok, output = await self._run_git_async(
+                "diff", "--staged", "--color=never", "--", text
+            )
             if not ok or not output:
                 self._add_system_message(f"No changes for '{text}'")
                 return
@@ -10,6 +10,7 @@ import re
 
 from ..log import logger
 from ..platform_info import amplifier_home, amplifier_projects_dir
+from ..session_catalog import SessionCatalog
 from ..constants import (
     SLASH_COMMANDS,
 )
@@ -1005,19 +1006,11 @@ class PersistenceCommandsMixin:
         self._list_bookmarks()
 
     def _find_session_dir(self, session_id: str) -> Path | None:
-        """Find the directory for a session by searching all projects."""
-        sessions_dir = amplifier_projects_dir()
-        if not sessions_dir.exists():
+        """Find the directory for a session via the shared session catalog."""
+        entry = SessionCatalog.for_dir(amplifier_projects_dir()).get(session_id)
+        if entry is None or not entry.session_dir.is_dir():
             return None
-
-        for project_dir in sessions_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-            candidate = project_dir / "sessions" / session_id
-            if candidate.is_dir():
-                return candidate
-
-        return None
+        return entry.session_dir
 
     # ── Session Tags ─────────────────────────────────────────────────────
 
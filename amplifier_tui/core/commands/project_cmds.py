@@ -293,7 +293,18 @@ class ProjectCommandsMixin:
             self._add_system_message("No sessions loaded.")  # type: ignore[attr-defined]
             return
 
-        results = ProjectSearch.search(sessions, query, limit=15)
+        # Runs on the UI thread: with the app's index, query it as it stands
+        # and refresh in the background instead of walking every transcript.
+        index = getattr(self, "_transcript_index", None)
+        if index is not None:
+            index.refresh_in_background()
+        results = ProjectSearch.search(
+            sessions,
+            query,
+            limit=15,
+            index=index,
+            refresh=index is None,
+        )
         formatted = ProjectSearch.format_results(results, query)
         self._add_system_message(formatted)  # type: ignore[attr-defined]
 
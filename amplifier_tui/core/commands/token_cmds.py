@@ -78,25 +78,17 @@ class TokenCommandsMixin:
         asst_w = self._format_count(self._assistant_words)
 
         # --- Character counts & code blocks from _search_messages ---
-        user_chars = 0
-        asst_chars = 0
-        code_blocks = 0
-        system_count = 0
-        for role, content, _widget in self._search_messages:
-            r = role.lower()
-            if r == "user":
-                user_chars += len(content or "")
-            elif r == "assistant":
-                asst_chars += len(content or "")
-                if content:
-                    code_blocks += content.count("```") // 2
-            elif r == "system":
-                system_count += 1
+        messages = self._search_messages
+        user_chars = messages.role_chars["user"]
+        asst_chars = messages.role_chars["assistant"]
+        system_count = messages.role_counts["system"]
+        code_blocks = sum(
+            r.text.count("```") // 2 for r in messages if r.role == "assistant"
+        )
         total_chars = user_chars + asst_chars
 
-        # --- Token estimates (words * 1.3) ---
-        total_words = self._user_words + self._assistant_words
-        est_tokens = int(total_words * 1.3)
+        # --- Token estimate ---
+        est_tokens = messages.role_tokens["user"] + messages.role_tokens["assistant"]
 
         # --- Title ---
         title = getattr(self, "_session_title", "") or ""
@@ -226,9 +218,10 @@ class TokenCommandsMixin:
         out_tok = (getattr(sm, "total_output_tokens", 0) or 0) if sm else 0
         api_total = inp_tok + out_tok
 
-        # Word-based estimates
+        # Tokenizer estimate of the visible conversation
         total_words = self._user_words + self._assistant_words
-        est_tokens = int(total_words * 1.3)
+        role_tokens = self._search_messages.role_tokens
+        est_tokens = role_tokens["user"] + role_tokens["assistant"]
 
         # Context window
         window = self._get_context_window()
@@ -274,12 +267,12 @@ class TokenCommandsMixin:
             lines.append("")
 
         lines += [
-            "  Word-based Estimate",
+            "  Conversation Estimate",
             "  " + "\u2500" * 21,
             f"  User words:        {self._user_words:>10,}",
             f"  Assistant words:   {self._assistant_words:>10,}",
             f"  Total words:       {total_words:>10,}",
-            f"  Est. tokens:       ~{fmt(est_tokens)}  (words \u00d7 1.3)",
+            f"  Est. tokens:       ~{fmt(est_tokens)}",
         ]
 
         self._add_system_message("\n".join(lines))
@@ -385,6 +378,16 @@ class TokenCommandsMixin:
                 "  (no response times recorded yet)",
             ]
 
+        # Streaming UI updates (frontends with a UI event bus)
+        ui_events = getattr(self, "_ui_events", None)
+        if ui_events is not None:
+            lines += ["", f"  UI updates:        {ui_events.stats.summary()}"]
+
+        # Pre-started session pool (when enabled)
+        pool_stats = getattr(self.session_manager, "pool_stats", None)
+        if pool_stats is not None:
+            lines += ["", f"  Session pool:      {pool_stats.summary()}"]
+
         self._add_system_message("\n".join(lines))
 
     def _cmd_info(self) -> None:
@@ -416,9 +419,9 @@ class TokenCommandsMixin:
         output_tokens = getattr(sm, "total_output_tokens", 0) if sm else 0
         context_window = getattr(sm, "context_window", 0) if sm else 0
 
-        # Word-based estimate as fallback
-        total_words = self._user_words + self._assistant_words
-        est_tokens = int(total_words * 1.3)
+        # Tokenizer estimate as fallback
+        role_tokens = self._search_messages.role_tokens
+        est_tokens = role_tokens["user"] + role_tokens["assistant"]
 
         # Model info
         model = (getattr(sm, "model_name", "") if sm else "") or ""
@@ -498,15 +501,11 @@ class TokenCommandsMixin:
         output_tok = sm.total_output_tokens if sm else 0
         api_total = input_tok + output_tok
 
-        # Character-based estimate from visible messages
-        user_chars = sum(len(t) for r, t, _w in self._search_messages if r == "user")
-        asst_chars = sum(
-            len(t) for r, t, _w in self._search_messages if r == "assistant"
-        )
-        sys_chars = sum(len(t) for r, t, _w in self._search_messages if r == "system")
-        est_user = user_chars // 4
-        est_asst = asst_chars // 4
-        est_sys = sys_chars // 4
+        # Tokenizer estimate from visible messages
+        tokens = self._search_messages.role_tokens
+        est_user = tokens["user"]
+        est_asst = tokens["assistant"]
+        est_sys = tokens["system"]
         est_total = est_user + est_asst + est_sys
 
         # Prefer real API tokens when available; fall back to estimate
@@ -520,9 +519,10 @@ class TokenCommandsMixin:
 
         # Message counts
         msg_count = len(self._search_messages)
-        user_msg_count = sum(1 for r, _, _ in self._search_messages if r == "user")
-        asst_msg_count = sum(1 for r, _, _ in self._search_messages if r == "assistant")
-        sys_msg_count = sum(1 for r, _, _ in self._search_messages if r == "system")
+        counts = self._search_messages.role_counts
+        user_msg_count = counts["user"]
+        asst_msg_count = counts["assistant"]
+        sys_msg_count = counts["system"]
 
         fmt = self._format_token_count
         source = "API" if api_total > 0 else "estimated"
@@ -555,7 +555,7 @@ class TokenCommandsMixin:
 
         lines += [
             "",
-            "Breakdown (~4 chars/token):",
+            "Breakdown (estimated):",
             f"  User:        ~{fmt(est_user)} tokens  ({user_msg_count} messages)",
             f"  Assistant:   ~{fmt(est_asst)} tokens  ({asst_msg_count} messages)",
             f"  System:      ~{fmt(est_sys)} tokens  ({sys_msg_count} messages)",
@@ -564,7 +564,7 @@ class TokenCommandsMixin:
             f"  Est. cost:   ~${total_cost:.4f}"
             f" (in ~${input_cost:.4f} + out ~${output_cost:.4f})",
             "",
-            "Note: Token counts are estimates (~4 chars/token).",
+            "Note: Token counts are estimates.",
             "Cost assumes Claude 3.5 Sonnet pricing ($3/1M in, $15/1M out).",
             "Actual usage may vary by model tokenizer. Context also",
             "includes system prompts, tool schemas, and overhead",
@@ -30,11 +30,19 @@ _MAX_LABEL_LEN = 38  # Keep status labels under ~40 chars total
 # _DANGEROUS_PATTERNS is imported from .platform (platform-aware)
 _MAX_RUN_OUTPUT_LINES = 100
 _RUN_TIMEOUT = 30
+_RUN_REFRESH_SECONDS = 0.1  # streamed /run output is redrawn at most this often
+
+# /dashboard scan progress is redrawn at most this often
+_DASHBOARD_REFRESH_SECONDS = 0.2
 
 # Auto-save directory and defaults
 AUTOSAVE_DIR = amplifier_home() / "tui-autosave"
 MAX_AUTOSAVES_PER_TAB = 5
 
+# Session resume: messages shown straight away, then read per history batch
+TRANSCRIPT_TAIL_MESSAGES = 100
+TRANSCRIPT_HISTORY_BATCH = 500
+
 # Canonical list of slash commands – used by both _handle_slash_command and
 # ChatInput tab-completion.  Keep in sync with the handlers dict below.
 SLASH_COMMANDS: tuple[str, ...] = (
@@ -368,6 +376,7 @@ EXTENSION_TO_LANGUAGE: dict[str, str] = {
 }
 
 MAX_TABS = 10  # Maximum number of concurrent tabs
+RESTORE_CONCURRENCY = 3  # Sessions resumed at once by --sessions
 
 MAX_ATTACHMENT_SIZE = 50_000  # 50 KB warning threshold (total)
 
@@ -7,6 +7,8 @@ from typing import Any
 
 import uuid
 
+from .message_store import MessageStore
+
 
 @dataclass
 class ConversationState:
@@ -39,8 +41,8 @@ class ConversationState:
     system_preset_name: str = ""
     active_mode: str | None = None
 
-    # Search index (list of (role, text) tuples - no widget refs)
-    search_messages: list = field(default_factory=list)
+    # Displayed messages as (role, text, widget) records, with running totals
+    search_messages: MessageStore = field(default_factory=MessageStore)
 
     # Statistics
     total_words: int = 0
@@ -8,6 +8,17 @@ Modules
 -------
 git_integration
     Pure-function wrappers around ``git`` CLI commands.
+git_state
+    :class:`GitStateCache` — branch/status/ahead-behind per repository,
+    reloaded when ``.git`` changes.
+tokenizer
+    :class:`TokenCounter` — offline, cached, calibrated token counts.
+autosave_journal
+    :class:`AutosaveJournal` — append-only per-tab auto-save journal.
+ui_events
+    :class:`UiEventBus` — coalescing, per-frame queue of UI updates.
+session_pool
+    :class:`SessionPool` — idle pre-started sessions, refilled in the background.
 export
     Pure-function converters (Markdown, text, JSON, HTML).
 notifications
@@ -40,6 +51,7 @@ from .git_integration import (
     run_git,
     show_diff,
 )
+from .git_state import GitState, GitStateCache
 from .notifications import (
     play_bell,
     send_terminal_notification,
@@ -57,6 +69,7 @@ from .context_profiler import (
     format_profiler_history,
     format_top_consumers,
 )
+from .tokenizer import TokenCounter, count_tokens, count_tokens_many
 from .tool_log import ToolEntry, ToolLog, tool_color, summarize_tool_input
 from .include_helpers import (
     file_preview,
@@ -69,12 +82,18 @@ from .compare_manager import CompareManager, ComparisonResult
 from .replay_engine import ReplayEngine, ReplayMessage, ReplayState
 from .plugin_loader import PluginLoader, LoadedPlugin
 from .dashboard_stats import DashboardStats, DashboardData, SessionRecord
+from .usage_store import UsageStore, UsageTotals
 from .session_scanner import SessionScanner, MonitoredSession, SessionState
 from .session_summarizer import SessionSummarizer, make_anthropic_summarizer
 from .auto_tagger import AutoTagger, AutoTagState, make_anthropic_auto_tagger
 from .project_aggregator import ProjectAggregator, ProjectInfo
 from .project_intelligence import ProjectIntelligence, make_anthropic_ask_fn
 from .project_search import ProjectSearch, SearchResult
+from .transcript_index import IndexMatch, TranscriptIndex
+from .llm_jobs import LLMJobQueue, LLMJobStats
+from .autosave_journal import AutosaveJournal, TabCheckpoint, load_autosave
+from .ui_events import UiEventBus, UiEventStats
+from .session_pool import PoolStats, SessionPool
 
 __all__ = [
     # diff_view
@@ -87,6 +106,8 @@ __all__ = [
     "looks_like_commit_ref",
     "colorize_diff",
     "show_diff",
+    "GitState",
+    "GitStateCache",
     # export
     "html_escape",
     "md_to_html",
@@ -115,6 +136,10 @@ __all__ = [
     "format_profiler_detail",
     "format_profiler_history",
     "format_top_consumers",
+    # tokenizer
+    "TokenCounter",
+    "count_tokens",
+    "count_tokens_many",
     # tool log
     "ToolEntry",
     "ToolLog",
@@ -145,6 +170,8 @@ __all__ = [
     "DashboardStats",
     "DashboardData",
     "SessionRecord",
+    "UsageStore",
+    "UsageTotals",
     # session monitor
     "SessionScanner",
     "MonitoredSession",
@@ -164,4 +191,20 @@ __all__ = [
     # project search
     "ProjectSearch",
     "SearchResult",
+    # transcript index
+    "TranscriptIndex",
+    "IndexMatch",
+    # llm job queue
+    "LLMJobQueue",
+    "LLMJobStats",
+    # auto-save journal
+    "AutosaveJournal",
+    "TabCheckpoint",
+    "load_autosave",
+    # UI event bus
+    "UiEventBus",
+    "UiEventStats",
+    # session pool
+    "SessionPool",
+    "PoolStats",
 ]
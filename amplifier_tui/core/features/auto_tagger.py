@@ -11,6 +11,9 @@ Key design decisions
   tracked and never re-generated for that session.
 * **Throttled** -- at most 3 sessions processed per cycle to avoid
   bursty API costs.
+* **Off the UI thread** -- :meth:`AutoTagger.generate_tags` (the LLM call)
+  is separate from :meth:`AutoTagger.apply_tags` (the store writes) so the
+  TUI can run the former on an :class:`~llm_jobs.LLMJobQueue` worker.
 * **Graceful degradation** -- if no LLM callable is provided, or the call
   fails, the session simply remains untagged.
 """
@@ -35,6 +38,10 @@ logger = logging.getLogger(__name__)
 #: Maximum tags to generate per session.
 _DEFAULT_MAX_TAGS: int = 3
 
+# How many times a session whose LLM job was rejected or failed is re-queued
+# before it is given up on (until its mtime changes).
+_MAX_RETRIES: int = 3
+
 # ---------------------------------------------------------------------------
 # LLM call protocol
 # ---------------------------------------------------------------------------
@@ -78,9 +85,14 @@ class AutoTagState(JsonStore):
     def save(self, data: dict[str, dict]) -> None:
         self.save_raw(data, sort_keys=True)
 
+    def _view(self) -> dict[str, dict]:
+        raw = self.view_raw()
+        return raw if isinstance(raw, dict) else {}
+
     def get_state(self, session_id: str) -> dict | None:
         """Return the auto-tag state for a session, or None."""
-        return self.load().get(session_id)
+        state = self._view().get(session_id)
+        return dict(state) if state is not None else None
 
     def set_state(
         self,
@@ -118,8 +130,8 @@ class AutoTagState(JsonStore):
 
     def get_removed_tags(self, session_id: str) -> list[str]:
         """Tags the user explicitly removed from this session."""
-        state = self.load().get(session_id, {})
-        return state.get("removed_by_user", [])
+        state = self._view().get(session_id, {})
+        return list(state.get("removed_by_user", []))
 
 
 # ---------------------------------------------------------------------------
@@ -222,6 +234,12 @@ class AutoTagger:
         # On slow timer (every 30s) -- processes LLM queue
         tagger.process_pending(max_count=3)
 
+        # ...or off the UI thread: generate_tags() in a worker,
+        # apply_tags() back on the UI thread
+        for pending in tagger.take_pending():
+            jobs.submit(f"tags:{pending.session_id}",
+                        lambda p=pending: tagger.generate_tags(p))
+
     If *tag_fn* is ``None``, the tagger is a no-op.
     """
 
@@ -237,6 +255,7 @@ class AutoTagger:
         self._tag_fn = tag_fn
         self._max_tags = max_tags
         self._pending: list[_PendingSession] = []
+        self._retries: dict[str, int] = {}
 
     @property
     def has_pending(self) -> bool:
@@ -284,7 +303,10 @@ class AutoTagger:
     def process_pending(self, max_count: int = 3) -> int:
         """Process up to *max_count* pending auto-tagging requests.
 
-        Returns the number of sessions successfully tagged.
+        Returns the number of sessions successfully tagged.  This blocks on
+        the LLM call; interactive callers should use :meth:`take_pending` /
+        :meth:`generate_tags` on a background worker and :meth:`apply_tags`
+        on the UI thread instead.
         """
         if not self._tag_fn:
             self._pending.clear()
@@ -293,53 +315,8 @@ class AutoTagger:
         processed = 0
         while self._pending and processed < max_count:
             session = self._pending.pop(0)
-
-            excerpt = read_transcript_excerpt(session.session_dir)
-            if excerpt is None:
-                continue
-
-            # Build transcript text from excerpt
-            parts: list[str] = []
-            if excerpt.user_message:
-                parts.append(f"User: {excerpt.user_message[:500]}")
-            if excerpt.assistant_text:
-                parts.append(f"Assistant: {excerpt.assistant_text[:1000]}")
-            transcript_text = "\n".join(parts)
-            if not transcript_text.strip():
-                continue
-
-            # Get existing tag vocabulary
-            all_tags_vocab = list(self._tag_store.all_tags().keys())
-
-            # Get user-removed tags for this session
-            removed = self._state_store.get_removed_tags(session.session_id)
-
-            prompt = _build_tag_prompt(
-                transcript_text=transcript_text,
-                project_name=session.project,
-                tag_vocabulary=all_tags_vocab,
-                max_tags=self._max_tags,
-            )
-
             try:
-                raw_response = self._tag_fn(prompt)
-                tags = _clean_tags(raw_response, self._max_tags)
-
-                # Filter out user-removed tags
-                tags = [t for t in tags if t not in removed]
-
-                # Add tags to store
-                for tag in tags:
-                    self._tag_store.add_tag(session.session_id, tag)
-
-                # Record in state
-                self._state_store.set_state(
-                    session.session_id,
-                    mtime=session.mtime,
-                    tags_generated=tags,
-                )
-                processed += 1
-                logger.debug("Auto-tagged %s with %s", session.session_id[:8], tags)
+                tags = self.generate_tags(session)
             except Exception:
                 logger.debug(
                     "Auto-tagging failed for %s",
@@ -347,9 +324,97 @@ class AutoTagger:
                     exc_info=True,
                 )
                 continue
+            if tags is None:
+                continue
+            self.apply_tags(session, tags)
+            processed += 1
 
         return processed
 
+    def take_pending(self, max_count: int = 0) -> list[_PendingSession]:
+        """Remove and return up to *max_count* queued sessions (0 = all).
+
+        Sessions tagged since they were queued are skipped.
+        """
+        if not self._tag_fn:
+            self._pending.clear()
+            return []
+        taken: list[_PendingSession] = []
+        while self._pending and (not max_count or len(taken) < max_count):
+            session = self._pending.pop(0)
+            if self.needs_tagging(session.session_id, session.mtime):
+                taken.append(session)
+        return taken
+
+    def requeue(self, session: _PendingSession, *, retry: bool = True) -> bool:
+        """Put back a session taken by :meth:`take_pending` whose job was
+        rejected, failed or timed out.
+
+        A failed or timed-out job counts as a *retry*; a job that was never
+        run (rejected as a duplicate) passes ``retry=False`` and keeps its
+        budget.  Returns ``False`` once the session has used up its retries.
+        """
+        if retry:
+            retries = self._retries.get(session.session_id, 0)
+            if retries >= _MAX_RETRIES:
+                self._retries.pop(session.session_id, None)
+                return False
+            self._retries[session.session_id] = retries + 1
+        if not any(p.session_id == session.session_id for p in self._pending):
+            self._pending.append(session)
+        return True
+
+    def generate_tags(self, session: _PendingSession) -> list[str] | None:
+        """Ask the LLM for tags for *session* (without storing them).
+
+        Returns ``None`` when the transcript has nothing to tag.  LLM errors
+        propagate.  Only reads the stores, so it is safe to call from a
+        worker thread.
+        """
+        if self._tag_fn is None:
+            return None
+        excerpt = read_transcript_excerpt(session.session_dir)
+        if excerpt is None:
+            return None
+
+        # Build transcript text from excerpt
+        parts: list[str] = []
+        if excerpt.user_message:
+            parts.append(f"User: {excerpt.user_message[:500]}")
+        if excerpt.assistant_text:
+            parts.append(f"Assistant: {excerpt.assistant_text[:1000]}")
+        transcript_text = "\n".join(parts)
+        if not transcript_text.strip():
+            return None
+
+        # Get existing tag vocabulary
+        all_tags_vocab = list(self._tag_store.all_tags().keys())
+
+        # Get user-removed tags for this session
+        removed = self._state_store.get_removed_tags(session.session_id)
+
+        prompt = _build_tag_prompt(
+            transcript_text=transcript_text,
+            project_name=session.project,
+            tag_vocabulary=all_tags_vocab,
+            max_tags=self._max_tags,
+        )
+        tags = _clean_tags(self._tag_fn(prompt), self._max_tags)
+        # Filter out user-removed tags
+        return [t for t in tags if t not in removed]
+
+    def apply_tags(self, session: _PendingSession, tags: list[str]) -> None:
+        """Store generated *tags* and record that *session* was auto-tagged."""
+        self._retries.pop(session.session_id, None)
+        for tag in tags:
+            self._tag_store.add_tag(session.session_id, tag)
+        self._state_store.set_state(
+            session.session_id,
+            mtime=session.mtime,
+            tags_generated=tags,
+        )
+        logger.debug("Auto-tagged %s with %s", session.session_id[:8], tags)
+
     def record_user_removal(self, session_id: str, tag: str) -> None:
         """Notify the auto-tagger that a user removed a tag."""
         self._state_store.record_user_removal(session_id, tag)
@@ -363,6 +428,7 @@ class AutoTagger:
 def make_anthropic_auto_tagger(
     model: str = "claude-haiku-4-20250506",
     max_tokens: int = 50,
+    timeout: float = 20.0,
 ) -> TagFn | None:
     """Create a :class:`TagFn` using the ``anthropic`` SDK.
 
@@ -375,7 +441,7 @@ def make_anthropic_auto_tagger(
         return None
 
     try:
-        client = anthropic.Anthropic()
+        client = anthropic.Anthropic(timeout=timeout, max_retries=1)
     except anthropic.AuthenticationError:
         logger.debug("No valid Anthropic API key; auto-tagging disabled")
         return None
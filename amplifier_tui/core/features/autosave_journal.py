@@ -0,0 +1,395 @@
+"""Append-only auto-save journal with background compaction.
+
+Auto-save used to serialize every tab's whole conversation with
+``json.dumps(..., indent=2)`` into a new file every interval, then glob and
+sort the directory to rotate old files -- all on the UI thread.  Long
+conversations made that a visible hitch every few minutes and rewrote
+megabytes that had not changed.
+
+:class:`AutosaveJournal` keeps, per tab, a *generation*: a snapshot file
+``autosave-<tab>-<ts>.json`` (same layout as the old auto-save files) and
+a sibling journal ``autosave-<tab>-<ts>.jsonl``.  Each checkpoint only
+compares the tab's message records by identity with the ones already
+saved and hands the difference to a writer thread, which appends it to
+the journal as one line per message.  Edited or removed messages become a
+``{"truncate": n}`` line followed by the new tail, so the journal stays
+append-only.  Once a journal has more than *compact_after* lines the
+writer folds it into a fresh snapshot (a new generation) and deletes the
+generations beyond *keep*.
+
+:func:`load_autosave` replays a snapshot plus its journal;
+:func:`list_autosaves` and :func:`autosave_mtime` account for the journal
+being newer than its snapshot.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..log import logger
+
+#: Journal lines written before the writer compacts into a new snapshot.
+COMPACT_AFTER: int = 500
+
+#: Name of the multi-tab layout file next to the auto-saves.
+WORKSPACE_FILE = "workspace-state.json"
+
+
+@dataclass
+class TabCheckpoint:
+    """What :meth:`AutosaveJournal.checkpoint` needs to know about a tab."""
+
+    tab_id: str
+    name: str
+    messages: Sequence[Any]  # (role, text, widget) records, e.g. a MessageStore
+    session_id: str = ""
+    title: str = ""
+
+
+@dataclass
+class _TabWrite:
+    tab_id: str
+    header: dict[str, str]
+    messages: list[tuple[str, str]]
+    truncate: int | None = None  # drop saved messages from this index first
+    fresh: bool = False  # *messages* is the whole conversation
+
+
+@dataclass
+class _Job:
+    writes: list[_TabWrite]
+    layout: list[tuple[str, str]]  # (tab_id, name) in tab order
+    active_tab_index: int
+    tab_counter: int
+
+
+@dataclass
+class _Generation:
+    snapshot: Path
+    header: dict[str, str]
+    messages: list[tuple[str, str]]
+    lines: int = 0
+
+    @property
+    def journal(self) -> Path:
+        return self.snapshot.with_suffix(".jsonl")
+
+
+@dataclass
+class _Writer:
+    cond: threading.Condition = field(default_factory=threading.Condition)
+    jobs: deque[_Job] = field(default_factory=deque)
+    busy: bool = False
+    thread: threading.Thread | None = None
+
+
+class AutosaveJournal:
+    """Incremental auto-save of every tab into *directory*.
+
+    With *background* false (tests, CLI tools) checkpoints are written
+    before :meth:`checkpoint` returns.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        keep: int = 5,
+        compact_after: int = COMPACT_AFTER,
+        background: bool = True,
+    ) -> None:
+        self.directory = directory
+        self.keep = keep
+        self.compact_after = compact_after
+        self._background = background
+        # UI side: the records each tab had at its last checkpoint.
+        self._saved: dict[str, list[Any]] = {}
+        # Writer side: the generation each tab is appending to.
+        self._generations: dict[str, _Generation] = {}
+        self._failed: set[str] = set()
+        self._failed_lock = threading.Lock()
+        self._writer = _Writer()
+
+    # -- UI thread ------------------------------------------------------
+
+    def checkpoint(
+        self,
+        tabs: Sequence[TabCheckpoint],
+        *,
+        active_tab_index: int = 0,
+        tab_counter: int = 0,
+    ) -> None:
+        """Queue the messages each tab gained since the last checkpoint.
+
+        Costs one identity comparison per message; serialization and file
+        I/O happen on the writer thread.
+        """
+        with self._failed_lock:
+            failed, self._failed = self._failed, set()
+        writes: list[_TabWrite] = []
+        for tab in tabs:
+            records = tab.messages
+            saved = None if tab.tab_id in failed else self._saved.get(tab.tab_id)
+            if not records:
+                self._saved.pop(tab.tab_id, None)
+                continue
+            header = {
+                "session_id": tab.session_id,
+                "session_title": tab.title,
+                "tab_name": tab.name,
+            }
+            if saved is None:
+                self._saved[tab.tab_id] = list(records)
+                writes.append(
+                    _TabWrite(tab.tab_id, header, _pairs(records), fresh=True)
+                )
+                continue
+            keep = _common_prefix(saved, records)
+            tail = records[keep:]
+            writes.append(
+                _TabWrite(
+                    tab.tab_id,
+                    header,
+                    _pairs(tail),
+                    truncate=keep if keep < len(saved) else None,
+                )
+            )
+            del saved[keep:]
+            saved.extend(tail)
+        live = {tab.tab_id for tab in tabs}
+        for tab_id in [t for t in self._saved if t not in live]:
+            del self._saved[tab_id]
+        self._submit(
+            _Job(
+                writes,
+                [(tab.tab_id, tab.name) for tab in tabs],
+                active_tab_index,
+                tab_counter,
+            )
+        )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued checkpoint is on disk (e.g. on quit)."""
+        w = self._writer
+        with w.cond:
+            return w.cond.wait_for(lambda: not w.jobs and not w.busy, timeout)
+
+    def _submit(self, job: _Job) -> None:
+        if not self._background:
+            self._write(job)
+            return
+        w = self._writer
+        with w.cond:
+            w.jobs.append(job)
+            if w.thread is None:
+                w.thread = threading.Thread(
+                    target=self._run, name="autosave-writer", daemon=True
+                )
+                w.thread.start()
+            w.cond.notify_all()
+
+    # -- writer thread --------------------------------------------------
+
+    def _run(self) -> None:
+        w = self._writer
+        while True:
+            with w.cond:
+                w.cond.wait_for(lambda: bool(w.jobs))
+                job = w.jobs.popleft()
+                w.busy = True
+            try:
+                self._write(job)
+            except Exception:  # noqa: BLE001 - never let the writer die
+                logger.debug("auto-save writer failed", exc_info=True)
+            finally:
+                with w.cond:
+                    w.busy = False
+                    w.cond.notify_all()
+
+    def _write(self, job: _Job) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            logger.debug("auto-save directory unavailable", exc_info=True)
+            return
+        for write in job.writes:
+            try:
+                self._write_tab(write)
+            except (OSError, ValueError):
+                logger.debug("auto-save of %s failed", write.tab_id, exc_info=True)
+                self._generations.pop(write.tab_id, None)
+                with self._failed_lock:
+                    self._failed.add(write.tab_id)
+        written = {write.tab_id for write in job.writes}
+        for tab_id in [t for t in self._generations if t not in written]:
+            del self._generations[tab_id]  # tab closed or emptied
+        tabs_info = []
+        for tab_id, name in job.layout:
+            gen = self._generations.get(tab_id)
+            tabs_info.append(
+                {
+                    "tab_id": tab_id,
+                    "name": name,
+                    "autosave_file": gen.snapshot.name if gen else None,
+                }
+            )
+        workspace = {
+            "saved_at": datetime.now().isoformat(),
+            "active_tab_index": job.active_tab_index,
+            "tab_counter": job.tab_counter,
+            "tabs": tabs_info,
+        }
+        try:
+            _write_atomic(self.directory / WORKSPACE_FILE, workspace)
+        except OSError:
+            logger.debug("failed to write workspace state", exc_info=True)
+
+    def _write_tab(self, write: _TabWrite) -> None:
+        gen = self._generations.get(write.tab_id)
+        if write.fresh:
+            self._new_generation(write.tab_id, write.header, write.messages)
+            return
+        if gen is None:  # an earlier write failed; the next checkpoint is fresh
+            raise ValueError(f"no auto-save generation for {write.tab_id}")
+        lines: list[str] = []
+        if write.header != gen.header:
+            gen.header = write.header
+            lines.append(_line({"header": write.header}))
+        if write.truncate is not None:
+            del gen.messages[write.truncate :]
+            lines.append(_line({"truncate": write.truncate}))
+        gen.messages.extend(write.messages)
+        lines.extend(_line({"role": r, "content": c}) for r, c in write.messages)
+        if not lines:
+            return
+        if gen.lines + len(lines) > self.compact_after:
+            self._new_generation(write.tab_id, gen.header, gen.messages)
+            return
+        with gen.journal.open("a", encoding="utf-8") as f:
+            f.write("".join(lines))
+        gen.lines += len(lines)
+
+    def _new_generation(
+        self, tab_id: str, header: dict[str, str], messages: list[tuple[str, str]]
+    ) -> None:
+        ts = int(time.time())
+        while (self.directory / f"autosave-{tab_id}-{ts}.json").exists():
+            ts += 1
+        snapshot = self.directory / f"autosave-{tab_id}-{ts}.json"
+        _write_atomic(
+            snapshot,
+            {
+                **header,
+                "tab_id": tab_id,
+                "saved_at": datetime.now().isoformat(),
+                "message_count": len(messages),
+                "messages": [{"role": r, "content": c} for r, c in messages],
+            },
+        )
+        self._generations[tab_id] = _Generation(snapshot, header, list(messages))
+        self._rotate(tab_id)
+
+    def _rotate(self, tab_id: str) -> None:
+        """Delete all but the newest *keep* generations of *tab_id*."""
+        try:
+            snapshots = sorted(
+                self.directory.glob(f"autosave-{tab_id}-*.json"),
+                key=lambda p: p.stat().st_mtime,
+            )
+            for old in snapshots[: max(0, len(snapshots) - self.keep)]:
+                old.unlink(missing_ok=True)
+                old.with_suffix(".jsonl").unlink(missing_ok=True)
+        except OSError:
+            logger.debug("failed to rotate autosaves", exc_info=True)
+
+
+def load_autosave(path: Path) -> dict[str, Any]:
+    """Read snapshot *path* and replay its journal.
+
+    Raises :class:`OSError` or :class:`json.JSONDecodeError` when the
+    snapshot is unreadable.  A torn last journal line (crash mid-write) is
+    ignored.
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    messages = data.get("messages", [])
+    try:
+        with path.with_suffix(".jsonl").open(encoding="utf-8") as f:
+            for raw in f:
+                try:
+                    entry = json.loads(raw)
+                except json.JSONDecodeError:
+                    break
+                if "role" in entry:
+                    messages.append(
+                        {"role": entry["role"], "content": entry.get("content", "")}
+                    )
+                elif "truncate" in entry:
+                    del messages[int(entry["truncate"]) :]
+                elif isinstance(entry.get("header"), dict):
+                    data.update(entry["header"])
+    except FileNotFoundError:
+        pass
+    data["messages"] = messages
+    data["message_count"] = len(messages)
+    return data
+
+
+def autosave_mtime(path: Path) -> float:
+    """Last time auto-save *path* (snapshot or journal) was written."""
+    mtime = path.stat().st_mtime
+    try:
+        return max(mtime, path.with_suffix(".jsonl").stat().st_mtime)
+    except OSError:
+        return mtime
+
+
+def list_autosaves(directory: Path) -> list[Path]:
+    """Auto-save snapshots in *directory*, most recently written first."""
+    stamped = []
+    for path in directory.glob("autosave-*.json"):
+        try:
+            stamped.append((autosave_mtime(path), path))
+        except OSError:
+            continue
+    stamped.sort(key=lambda item: item[0], reverse=True)
+    return [path for _mtime, path in stamped]
+
+
+def _pairs(records: Sequence[Any]) -> list[tuple[str, str]]:
+    return [(r[0], r[1] or "") for r in records]
+
+
+def _common_prefix(saved: list[Any], records: Sequence[Any]) -> int:
+    """Number of leading *records* that are the very objects in *saved*."""
+    for i, (old, new) in enumerate(zip(saved, records)):
+        if old is not new:
+            return i
+    return min(len(saved), len(records))
+
+
+def _line(entry: dict[str, Any]) -> str:
+    return json.dumps(entry, ensure_ascii=False) + "\n"
+
+
+def _write_atomic(path: Path, data: dict[str, Any]) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -13,6 +13,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+from .tokenizer import count_tokens, count_tokens_many
+
 # Type alias for the message tuples used throughout the TUI.
 # Each entry is (role, content, widget_or_none).
 MessageTuple = tuple[str, str, Any]
@@ -22,14 +24,12 @@ _SPARK_CHARS = "▁▂▃▄▅▆▇█"
 
 
 def estimate_tokens(text: str) -> int:
-    """Estimate token count from text using ~4 chars per token heuristic.
+    """Estimate the token count of *text* (see :mod:`.tokenizer`).
 
-    This is intentionally simple — no tiktoken dependency required.
+    Offline and cached — no tiktoken dependency required.
     Returns at least 1 for any non-empty string.
     """
-    if not text:
-        return 0
-    return max(1, len(text) // 4)
+    return count_tokens(text) if text else 0
 
 
 # ---------------------------------------------------------------------------
@@ -156,11 +156,22 @@ def analyze_messages(
     - tool, tool_result, tool_use → tool_result_tokens
     - everything else (except meta) → injected_context_tokens
     """
+    from ..message_store import MessageStore
+
     breakdown = ContextBreakdown(total_capacity=total_capacity)
 
-    for role, content, _widget in messages:
+    if isinstance(messages, MessageStore):
+        # Per-category totals are kept up to date by the store.
+        totals = messages.category_tokens
+        breakdown.system_tokens = totals["system"]
+        breakdown.conversation_tokens = totals["conversation"]
+        breakdown.tool_result_tokens = totals["tool"]
+        breakdown.injected_context_tokens = totals["injected"]
+        return breakdown
+
+    counts = count_tokens_many([content or "" for _role, content, _w in messages])
+    for (role, _content, _widget), tok in zip(messages, counts):
         cat = _classify_role(role)
-        tok = estimate_tokens(content or "")
 
         if cat == "system":
             breakdown.system_tokens += tok
@@ -180,12 +191,14 @@ def analyze_messages_detail(
 ) -> list[MessageInfo]:
     """Return per-message token info for the detail view."""
     result: list[MessageInfo] = []
-    for i, (role, content, _widget) in enumerate(messages):
+    for i, entry in enumerate(messages):
+        role, content, _widget = entry
         cat = _classify_role(role)
         if cat == "meta":
             continue
         text = content or ""
-        tok = estimate_tokens(text)
+        # MessageStore records carry their count already.
+        tok = getattr(entry, "tokens", None) or estimate_tokens(text)
         # Build a preview: first ~80 chars, single-line
         preview = text.replace("\n", " ").strip()
         if len(preview) > 80:
@@ -2,15 +2,41 @@
 
 Aggregates data from Amplifier session files and generates
 text-based visualizations using Unicode block/braille characters.
+
+Each parsed session file is kept as a rollup (its :class:`SessionRecord`
+plus the file's mtime and size) and, for :meth:`DashboardStats.persistent`,
+saved to ``~/.amplifier/tui-dashboard-cache.json``.  A rescan walks the
+tree once, re-parses only files whose stamp changed, and adds or subtracts
+those records from the running totals (heatmap, daily tokens, counters,
+active days) instead of re-aggregating everything.
+
+Per-turn usage (tokens per model, project and week, rolling windows) comes
+from the columnar :class:`~.usage_store.UsageStore` in :attr:`usage`, fed
+incrementally from each session's ``events.jsonl``.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
 from collections import Counter
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
+
+from ..log import logger
+from ..platform_info import amplifier_tui_file
+from .usage_store import UsageStore, rolling_sum
+
+#: Bump when the persisted rollup layout changes; older caches are discarded.
+_CACHE_VERSION: int = 1
+
+#: File names holding per-session metadata.
+_SESSION_FILES = frozenset({"session-info.json", "metadata.json"})
 
 
 @dataclass
@@ -55,15 +81,45 @@ class DashboardData:
     computed_at: datetime | None = None
 
 
+@dataclass
+class _Rollup:
+    """A session file's stamp and the record parsed from it (None = invalid)."""
+
+    stamp: tuple[int, int]  # (mtime_ns, size)
+    record: SessionRecord | None
+
+
 class DashboardStats:
     """Aggregates session data and generates visualizations."""
 
     DEFAULT_SESSION_DIR = Path.home() / ".amplifier" / "projects"
 
-    def __init__(self, session_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        session_dir: Path | None = None,
+        cache_path: Path | None = None,
+        usage_dir: Path | None = None,
+    ) -> None:
         self._session_dir = session_dir or self.DEFAULT_SESSION_DIR
+        self._cache_path = cache_path  # None: rollups live in memory only
+        self.usage = UsageStore(usage_dir)
         self._data: DashboardData = DashboardData()
         self._cached: bool = False
+        self._lock = threading.Lock()
+        self._rollups: dict[str, _Rollup] = {}
+        self._day_sessions: Counter[str] = Counter()
+        self._loaded = False
+        self.last_parsed = 0  # files re-parsed by the last scan
+
+    @classmethod
+    def persistent(cls) -> DashboardStats:
+        """Stats for the real session directory, with rollups and usage
+        columns kept under ``~/.amplifier``.
+        """
+        return cls(
+            cache_path=amplifier_tui_file("tui-dashboard-cache.json"),
+            usage_dir=amplifier_tui_file("tui-usage"),
+        )
 
     @property
     def data(self) -> DashboardData:
@@ -73,35 +129,134 @@ class DashboardStats:
     def is_cached(self) -> bool:
         return self._cached
 
-    def scan_sessions(self) -> int:
-        """Scan session directories and aggregate statistics.
+    def scan_sessions(self, progress: Callable[[int, int], None] | None = None) -> int:
+        """Scan session directories and update the aggregate statistics.
+
+        Only files whose mtime or size changed since the last scan (or the
+        persisted rollups) are re-parsed.  Safe to run in a worker thread:
+        the new :class:`DashboardData` replaces the old one when done.
+        *progress* is called with ``(checked, total)`` files.
 
         Returns the number of sessions found.
         """
-        sessions: list[SessionRecord] = []
-
-        if self._session_dir.exists():
-            # Look for session-info.json files
-            for info_file in self._session_dir.rglob("session-info.json"):
-                record = self._parse_session_info(info_file)
-                if record:
-                    sessions.append(record)
-
-            # Also look for metadata.json (Amplifier's actual format)
-            for info_file in self._session_dir.rglob("metadata.json"):
-                record = self._parse_session_info(info_file)
-                if record:
-                    sessions.append(record)
-
-        self._aggregate(sessions)
-        self._cached = True
-        return len(sessions)
+        with self._lock:
+            if not self._loaded:
+                self._load_cache()
+            data = _copy_data(self._data)
+            days = Counter(self._day_sessions)
+            files = self._find_session_files()
+            parsed = 0
+            seen: set[str] = set()
+            for done, path in enumerate(files, 1):
+                key = str(path)
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue  # vanished since the walk; dropped below
+                seen.add(key)
+                stamp = (st.st_mtime_ns, st.st_size)
+                old = self._rollups.get(key)
+                if old is None or old.stamp != stamp:
+                    record = self._parse_session_info(path)
+                    parsed += 1
+                    if old is not None and old.record is not None:
+                        self._apply(data, days, old.record, -1)
+                    if record is not None:
+                        self._apply(data, days, record, 1)
+                    self._rollups[key] = _Rollup(stamp, record)
+                if progress is not None:
+                    progress(done, len(files))
+            for key in set(self._rollups) - seen:
+                gone = self._rollups.pop(key)
+                parsed += 1
+                if gone.record is not None:
+                    self._apply(data, days, gone.record, -1)
+
+            sessions = [r.record for r in self._rollups.values() if r.record]
+            self._finish(data, days, sessions)
+            self.last_parsed = parsed
+            if parsed:
+                self._save_cache()
+            return len(sessions)
+
+    def scan_usage(self, progress: Callable[[int, int], None] | None = None) -> int:
+        """Ingest new per-turn usage events; return how many were added."""
+        return self.usage.sync_sessions(self._session_dir, progress)
 
     def load_from_records(self, records: list[SessionRecord]) -> None:
         """Load from pre-built records (useful for testing)."""
         self._aggregate(records)
         self._cached = True
 
+    def _find_session_files(self) -> list[Path]:
+        """Every session metadata file under the session directory (one walk)."""
+        found: list[Path] = []
+        if not self._session_dir.exists():
+            return found
+        for dirpath, _dirnames, filenames in os.walk(self._session_dir):
+            for name in filenames:
+                if name in _SESSION_FILES:
+                    found.append(Path(dirpath) / name)
+        found.sort()
+        return found
+
+    # -- rollup cache ---------------------------------------------------------
+
+    def _load_cache(self) -> None:
+        self._loaded = True
+        if self._cache_path is None:
+            return
+        try:
+            raw = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError):
+            logger.debug("Ignoring unreadable dashboard cache", exc_info=True)
+            return
+        if (
+            not isinstance(raw, dict)
+            or raw.get("version") != _CACHE_VERSION
+            or raw.get("session_dir") != str(self._session_dir)
+        ):
+            return
+        try:
+            rollups = {
+                key: _Rollup(
+                    (int(entry[0]), int(entry[1])),
+                    _record_from_dict(entry[2]) if entry[2] else None,
+                )
+                for key, entry in raw.get("files", {}).items()
+            }
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            logger.debug("Discarding malformed dashboard cache", exc_info=True)
+            return
+        self._rollups = rollups
+        sessions = [r.record for r in rollups.values() if r.record]
+        self._aggregate(sessions)
+
+    def _save_cache(self) -> None:
+        if self._cache_path is None:
+            return
+        data = {
+            "version": _CACHE_VERSION,
+            "session_dir": str(self._session_dir),
+            "files": {
+                key: [
+                    r.stamp[0],
+                    r.stamp[1],
+                    _record_to_dict(r.record) if r.record else None,
+                ]
+                for key, r in self._rollups.items()
+            },
+        }
+        tmp = self._cache_path.with_suffix(".tmp")
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self._cache_path)
+        except OSError:
+            logger.debug("Failed to save dashboard cache", exc_info=True)
+
     def _parse_session_info(self, path: Path) -> SessionRecord | None:
         """Parse a session-info.json or metadata.json file into a SessionRecord."""
         try:
@@ -168,59 +323,73 @@ class DashboardStats:
         return record
 
     def _aggregate(self, sessions: list[SessionRecord]) -> None:
-        """Aggregate session records into dashboard data."""
+        """Aggregate session records into dashboard data from scratch."""
         data = DashboardData()
-        data.sessions = sessions
-        data.total_sessions = len(sessions)
-        data.computed_at = datetime.now()
-
-        active_dates: set[str] = set()
-
+        days: Counter[str] = Counter()
         for s in sessions:
-            data.total_tokens += s.token_count
-            data.total_duration_seconds += s.duration_seconds
-
-            # Activity grid (hour x weekday)
-            if s.started_at:
-                hour = s.started_at.hour
-                weekday = s.started_at.weekday()  # 0=Mon, 6=Sun
-                key = (hour, weekday)
-                data.activity_grid[key] = data.activity_grid.get(key, 0) + 1
-
-                date_str = s.started_at.strftime("%Y-%m-%d")
-                active_dates.add(date_str)
-
-                # Daily tokens
+            self._apply(data, days, s, 1)
+        self._finish(data, days, sessions)
+
+    @staticmethod
+    def _apply(
+        data: DashboardData, days: Counter[str], s: SessionRecord, sign: int
+    ) -> None:
+        """Add (``sign=1``) or remove (``sign=-1``) one session's contribution."""
+        data.total_tokens += sign * s.token_count
+        data.total_duration_seconds += sign * s.duration_seconds
+
+        # Activity grid (hour x weekday)
+        if s.started_at:
+            hour = s.started_at.hour
+            weekday = s.started_at.weekday()  # 0=Mon, 6=Sun
+            _bump(data.activity_grid, (hour, weekday), sign)
+
+            date_str = s.started_at.strftime("%Y-%m-%d")
+            _bump(days, date_str, sign)
+
+            # Daily tokens (kept for every active day, even at zero tokens)
+            if date_str in days:
                 data.daily_tokens[date_str] = (
-                    data.daily_tokens.get(date_str, 0) + s.token_count
+                    data.daily_tokens.get(date_str, 0) + sign * s.token_count
                 )
+            else:
+                data.daily_tokens.pop(date_str, None)
+
+        # Commands
+        for cmd in s.commands_used:
+            _bump(data.command_counts, cmd, sign)
 
-            # Commands
-            for cmd in s.commands_used:
-                data.command_counts[cmd] += 1
+        # Models
+        if s.model:
+            _bump(data.model_counts, s.model, sign)
 
-            # Models
-            if s.model:
-                data.model_counts[s.model] += 1
+        # Projects
+        if s.project:
+            _bump(data.project_counts, s.project, sign)
 
-            # Projects
-            if s.project:
-                data.project_counts[s.project] += 1
+    def _finish(
+        self, data: DashboardData, days: Counter[str], sessions: list[SessionRecord]
+    ) -> None:
+        """Derive averages and streaks, then publish *data*."""
+        data.sessions = sessions
+        data.total_sessions = len(sessions)
+        data.computed_at = datetime.now()
 
         # Average duration
-        if data.total_sessions > 0:
-            data.avg_duration_seconds = (
-                data.total_duration_seconds / data.total_sessions
-            )
+        data.avg_duration_seconds = (
+            data.total_duration_seconds / data.total_sessions
+            if data.total_sessions > 0
+            else 0
+        )
 
         # Streak calculation
-        if active_dates:
-            sorted_dates = sorted(active_dates)
-            data.streak_days, data.longest_streak = self._calculate_streaks(
-                sorted_dates
-            )
+        data.streak_days, data.longest_streak = (
+            self._calculate_streaks(sorted(days)) if days else (0, 0)
+        )
 
+        self._day_sessions = days
         self._data = data
+        self._cached = True
 
     def _calculate_streaks(self, sorted_dates: list[str]) -> tuple[int, int]:
         """Calculate current and longest streaks from sorted date strings.
@@ -361,6 +530,63 @@ class DashboardStats:
 
         return "\n".join(lines)
 
+    def format_usage(self, days: int = 30, now: float | None = None) -> str:
+        """Format per-turn usage of the last *days* days from :attr:`usage`."""
+        end = time.time() if now is None else now
+        start = end - days * 86400
+        overall = self.usage.totals(start, end).get("")
+        if overall is None:
+            return f"[dim]No usage events in the last {days} days.[/dim]"
+
+        lines = [
+            f"[bold]Usage — last {days} days[/bold]",
+            "",
+            f"  LLM turns:         {overall.turns:,}",
+            f"  Tool calls:        {overall.tool_calls:,}",
+            f"  Input tokens:      {overall.input_tokens:,}",
+            f"  Output tokens:     {overall.output_tokens:,}",
+        ]
+        sections = ["\n".join(lines)]
+
+        for by, title in (
+            ("model", "Tokens by Model"),
+            ("project", "Tokens by Project"),
+        ):
+            tokens = Counter(
+                {
+                    key or "(unknown)": t.tokens
+                    for key, t in self.usage.totals(start, end, by=by).items()
+                    if t.tokens
+                }
+            )
+            sections.append(self.format_bar_chart(tokens, title, max_bars=5))
+        tools = Counter(
+            {
+                key: t.tool_calls
+                for key, t in self.usage.totals(start, end, by="tool").items()
+                if key
+            }
+        )
+        if tools:
+            sections.append(self.format_bar_chart(tools, "Top Tools", max_bars=5))
+
+        # Daily buckets with a 7-day rolling sum, or weekly for long ranges.
+        daily = days <= 62
+        bucket = 86400 if daily else 7 * 86400
+        values = self.usage.series(start, end, bucket).get("", [])
+        trend = [
+            f"[bold]Tokens per {'day' if daily else 'week'}[/bold]",
+            "",
+            f"  {_sparkline(values)}",
+        ]
+        if daily:
+            trend.append(
+                f"  {_sparkline(rolling_sum(values, 7))}  [dim]7-day sum[/dim]"
+            )
+        trend.append(f"  [dim]Peak: {max(values, default=0):,} tokens[/dim]")
+        sections.append("\n".join(trend))
+        return "\n\n".join(sections)
+
     def format_summary(self) -> str:
         """Format summary statistics."""
         data = self._data
@@ -516,6 +742,60 @@ class DashboardStats:
         return "\n".join(html_parts)
 
     def clear(self) -> None:
-        """Clear cached data."""
-        self._data = DashboardData()
-        self._cached = False
+        """Clear cached data, including the persisted rollups."""
+        with self._lock:
+            self._data = DashboardData()
+            self._cached = False
+            self._rollups = {}
+            self._day_sessions = Counter()
+            self._loaded = True
+            self.usage.clear()
+            if self._cache_path is not None:
+                try:
+                    self._cache_path.unlink(missing_ok=True)
+                except OSError:
+                    logger.debug("Failed to remove dashboard cache", exc_info=True)
+
+
+def _sparkline(values: list[int]) -> str:
+    sparks = "▁▂▃▄▅▆▇█"
+    peak = max(values, default=0) or 1
+    return "".join(sparks[min(7, int(v / peak * 7))] for v in values)
+
+
+def _bump(counts: dict[Any, int], key: Any, delta: int) -> None:
+    """Add *delta* to ``counts[key]``, dropping the key when it reaches zero."""
+    value = counts.get(key, 0) + delta
+    if value > 0:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+
+def _copy_data(data: DashboardData) -> DashboardData:
+    """Copy of *data* whose totals can be updated without touching *data*."""
+    return replace(
+        data,
+        activity_grid=dict(data.activity_grid),
+        command_counts=Counter(data.command_counts),
+        model_counts=Counter(data.model_counts),
+        project_counts=Counter(data.project_counts),
+        daily_tokens=dict(data.daily_tokens),
+    )
+
+
+def _record_to_dict(record: SessionRecord) -> dict[str, Any]:
+    raw = asdict(record)
+    for key in ("started_at", "ended_at"):
+        if raw[key] is not None:
+            raw[key] = raw[key].isoformat()
+    return raw
+
+
+def _record_from_dict(raw: dict[str, Any]) -> SessionRecord:
+    record = SessionRecord(**raw)
+    for key in ("started_at", "ended_at"):
+        value = getattr(record, key)
+        if value is not None:
+            setattr(record, key, datetime.fromisoformat(value))
+    return record
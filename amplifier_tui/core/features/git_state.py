@@ -0,0 +1,263 @@
+"""Cached repository state for the git commands.
+
+``/git``, ``/git status``, ``/diff``, ``/include git`` and ``/commit`` all
+need the same few facts: the current branch, the porcelain status,
+ahead/behind counts and the last commit.  Each used to spawn its own
+``git branch``, ``git status``, ``rev-list`` and ``log`` processes, and on
+a large repository every ``git status`` costs hundreds of milliseconds.
+
+:class:`GitStateCache` keeps one :class:`GitState` per repository root,
+loaded with two concurrent processes (``status --porcelain --branch``
+carries the branch and ahead/behind in its header).  A cached state is
+reused until one of the files git rewrites when refs or the index change
+(``HEAD``, ``index``, ``packed-refs``, the branch and upstream ref files,
+the HEAD reflog) gets a new mtime, or until it is older than *max_age* --
+edits to the working tree itself leave ``.git`` untouched.  Concurrent
+requests for one repository share a single refresh, and :meth:`prefetch`
+refreshes in the background so the next command finds a warm entry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..log import logger
+from .process_runner import run_git_async
+
+#: Seconds a cached state is trusted when nothing under ``.git`` changed.
+GIT_STATE_TTL: float = 2.0
+
+_AHEAD_RE = re.compile(r"ahead (\d+)")
+_BEHIND_RE = re.compile(r"behind (\d+)")
+
+
+@dataclass(frozen=True)
+class GitState:
+    """Snapshot of one repository."""
+
+    root: str
+    branch: str  # "" on a detached HEAD
+    upstream: str = ""  # e.g. "origin/main"
+    ahead: int = 0
+    behind: int = 0
+    header: str = ""  # porcelain "## ..." line, as ``git status -sb`` shows it
+    status: tuple[str, ...] = ()  # porcelain v1 lines
+    last_commit: str = ""  # "%h %s (%cr)"
+
+    @property
+    def staged(self) -> int:
+        return sum(1 for ln in self.status if ln[0] not in (" ", "?"))
+
+    @property
+    def modified(self) -> int:
+        return sum(1 for ln in self.status if len(ln) > 1 and ln[1] == "M")
+
+    @property
+    def untracked(self) -> int:
+        return sum(1 for ln in self.status if ln.startswith("??"))
+
+    @property
+    def clean(self) -> bool:
+        return not self.status
+
+    def short_status(self, cwd: str | None = None) -> str:
+        """``git status --short`` output as run in *cwd*.
+
+        Porcelain paths are relative to the repository root; ``--short``
+        shows them relative to the directory git runs in, so they are
+        rewritten for *cwd* (default: the root).
+        """
+        if cwd is None:
+            return "\n".join(self.status)
+        base = os.path.realpath(cwd)
+        return "\n".join(_relative_line(ln, self.root, base) for ln in self.status)
+
+
+@dataclass
+class _Entry:
+    state: GitState
+    stamp: tuple[int, ...]
+    loaded: float = field(default_factory=time.monotonic)
+
+
+@dataclass(frozen=True)
+class _Repo:
+    root: Path
+    git_dir: Path
+    common_dir: Path  # differs from git_dir in linked worktrees
+
+
+class GitStateCache:
+    """:class:`GitState` per repository root, refreshed on change."""
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, _Entry] = {}
+        self._inflight: dict[Path, asyncio.Task] = {}
+
+    async def get(
+        self, cwd: str | None = None, *, max_age: float = GIT_STATE_TTL
+    ) -> tuple[GitState | None, str]:
+        """Return *(state, error)* for the repository containing *cwd*.
+
+        *state* is ``None`` outside a repository or when git fails, with
+        *error* saying why.  ``max_age=0`` always reloads.
+        """
+        repo = find_repo(cwd or os.getcwd())
+        if repo is None:
+            return None, "Not a git repository"
+        entry = self._entries.get(repo.root)
+        if (
+            entry is not None
+            and time.monotonic() - entry.loaded < max_age
+            and entry.stamp == _stamp(repo, entry.state.upstream)
+        ):
+            return entry.state, ""
+        task = self._inflight.get(repo.root)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(repo))
+            self._inflight[repo.root] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(repo.root, None))
+        # Shielded: cancelling one caller must not cancel a shared refresh.
+        return await asyncio.shield(task)
+
+    async def prefetch(self, cwd: str | None = None) -> None:
+        """Reload the state for *cwd*, discarding it (run in the background)."""
+        state, error = await self.get(cwd, max_age=0)
+        if state is None:
+            logger.debug("Git state prefetch: %s", error)
+
+    def invalidate(self, cwd: str | None = None) -> None:
+        """Drop the cached state for *cwd*'s repository (all when ``None``)."""
+        if cwd is None:
+            self._entries.clear()
+            return
+        repo = find_repo(cwd)
+        if repo is not None:
+            self._entries.pop(repo.root, None)
+
+    async def _refresh(self, repo: _Repo) -> tuple[GitState | None, str]:
+        # Stamp before running git so a change made meanwhile is not missed;
+        # --no-optional-locks keeps status from rewriting the index itself.
+        old = self._entries.get(repo.root)
+        stamp = _stamp(repo, old.state.upstream if old else "")
+        cwd = str(repo.root)
+        (ok, status), (log_ok, last_commit) = await asyncio.gather(
+            run_git_async(
+                "--no-optional-locks", "status", "--porcelain", "--branch", cwd=cwd
+            ),
+            run_git_async("log", "-1", "--format=%h %s (%cr)", cwd=cwd),
+        )
+        if not ok:
+            self._entries.pop(repo.root, None)
+            return None, status
+        state = _parse_status(cwd, status, last_commit if log_ok else "")
+        if old is None or state.upstream != old.state.upstream:
+            stamp = _stamp(repo, state.upstream)
+        self._entries[repo.root] = _Entry(state, stamp)
+        return state, ""
+
+
+def find_repo(cwd: str | Path) -> _Repo | None:
+    """Locate the work tree and git directories containing *cwd*."""
+    path = Path(cwd).resolve()
+    for root in (path, *path.parents):
+        dot_git = root / ".git"
+        if dot_git.is_dir():
+            return _Repo(root, dot_git, dot_git)
+        if dot_git.is_file():  # linked worktree or submodule: "gitdir: <path>"
+            try:
+                text = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if not text.startswith("gitdir:"):
+                return None
+            git_dir = (root / text[len("gitdir:") :].strip()).resolve()
+            common = git_dir
+            try:
+                rel = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+                common = (git_dir / rel).resolve()
+            except OSError:
+                pass
+            return _Repo(root, git_dir, common)
+    return None
+
+
+def _stamp(repo: _Repo, upstream: str) -> tuple[int, ...]:
+    """mtimes of the files git rewrites when HEAD, the index or refs move."""
+    paths = [
+        repo.git_dir / "HEAD",
+        repo.git_dir / "index",
+        repo.git_dir / "logs" / "HEAD",
+        repo.common_dir / "packed-refs",
+    ]
+    try:
+        head = (repo.git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        head = ""
+    if head.startswith("ref: "):
+        paths.append(repo.common_dir / head[5:])
+    if upstream:
+        paths.append(repo.common_dir / "refs" / "remotes" / upstream)
+    stamp = []
+    for path in paths:
+        try:
+            stamp.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(0)
+    return tuple(stamp)
+
+
+def _parse_status(root: str, output: str, last_commit: str) -> GitState:
+    """Build a :class:`GitState` from ``git status --porcelain --branch``."""
+    lines = [ln for ln in output.splitlines() if ln.strip()]
+    header = lines.pop(0) if lines and lines[0].startswith("## ") else ""
+    head = header[3:]
+    branch = upstream = ""
+    ahead = behind = 0
+    for prefix in ("No commits yet on ", "Initial commit on "):
+        if head.startswith(prefix):
+            branch = head[len(prefix) :]
+            break
+    else:
+        if not head.startswith("HEAD (no branch)"):
+            head, _, info = head.partition(" [")
+            branch, _, upstream = head.partition("...")
+            if m := _AHEAD_RE.search(info):
+                ahead = int(m.group(1))
+            if m := _BEHIND_RE.search(info):
+                behind = int(m.group(1))
+    return GitState(
+        root=root,
+        branch=branch,
+        upstream=upstream,
+        ahead=ahead,
+        behind=behind,
+        header=header,
+        status=tuple(lines),
+        last_commit=last_commit.strip(),
+    )
+
+
+def _relative_line(line: str, root: str, cwd: str) -> str:
+    """Rewrite the path(s) of one porcelain line relative to *cwd*."""
+    code, paths = line[:3], line[3:]
+    parts = paths.split(" -> ") if code[0] in "RC" else [paths]
+    return code + " -> ".join(_relative_path(p, root, cwd) for p in parts)
+
+
+def _relative_path(path: str, root: str, cwd: str) -> str:
+    quoted = len(path) > 1 and path[0] == path[-1] == '"'
+    inner = path[1:-1] if quoted else path
+    try:
+        rel = os.path.relpath(os.path.join(root, inner), cwd)
+    except ValueError:  # another drive on Windows
+        return path
+    rel = rel.replace(os.sep, "/")
+    if inner.endswith("/"):  # untracked directory
+        rel += "/"
+    return f'"{rel}"' if quoted else rel
@@ -6,10 +6,20 @@ and returns a value.  No ``self`` references, no widget access.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import subprocess
 from pathlib import Path
 
+from .process_runner import run_process
+
+#: Timeout for each git process run by these helpers (seconds).
+_GIT_TIMEOUT: float = 5.0
+
+#: ``git diff --stat`` ranges shown by :func:`get_git_status_and_diff`.
+_RECENT_DIFF = ("git", "diff", "--stat", "HEAD~3..HEAD")
+_CURRENT_DIFF = ("git", "diff", "--stat")
+
 
 def get_directory_tree(
     root: str | Path, max_depth: int = 4, max_entries: int = 200
@@ -30,7 +40,7 @@ def get_directory_tree(
             capture_output=True,
             text=True,
             cwd=str(root),
-            timeout=5,
+            timeout=_GIT_TIMEOUT,
         )
         if result.returncode == 0 and result.stdout.strip():
             files = sorted(result.stdout.strip().split("\n"))
@@ -38,7 +48,28 @@ def get_directory_tree(
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
 
-    # Fallback: walk filesystem
+    return _walk_tree(root, max_depth, max_entries)
+
+
+async def get_directory_tree_async(
+    root: str | Path, max_depth: int = 4, max_entries: int = 200
+) -> str:
+    """:func:`get_directory_tree` without blocking the event loop."""
+    root = Path(root)
+    try:
+        result = await run_process(
+            ["git", "ls-files"], cwd=str(root), timeout=_GIT_TIMEOUT
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            files = sorted(result.stdout.strip().split("\n"))
+            return _build_tree(root.name, files, max_entries)
+    except OSError:
+        pass
+    return await asyncio.to_thread(_walk_tree, root, max_depth, max_entries)
+
+
+def _walk_tree(root: Path, max_depth: int, max_entries: int) -> str:
+    """Tree of *root* from a filesystem walk (no git repository)."""
     EXCLUDE = {
         ".git",
         "__pycache__",
@@ -119,64 +150,81 @@ def _render_tree(tree: dict, lines: list[str], prefix: str) -> None:
 
 def get_git_status_and_diff(cwd: str | None = None) -> str:
     """Get git status + recent diff as a formatted string."""
-    parts: list[str] = []
 
-    # Git status
-    try:
-        result = subprocess.run(
-            ["git", "status", "--short"],
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            status = result.stdout.strip()
-            if status:
-                parts.append("Git Status:")
-                parts.append(status)
-            else:
-                parts.append("Git Status: clean (no changes)")
-        else:
-            parts.append("Not a git repository")
-            return "\n".join(parts)
-        parts.append("")
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        parts.append("Git status unavailable")
-        return "\n".join(parts)
+    def git(argv: tuple[str, ...]) -> tuple[int | None, str]:
+        try:
+            result = subprocess.run(
+                list(argv),
+                capture_output=True,
+                text=True,
+                cwd=cwd,
+                timeout=_GIT_TIMEOUT,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None, ""
+        return result.returncode, result.stdout
+
+    status = git(("git", "status", "--short"))
+    if status[0] != 0:
+        return _format_git_info(status, None, None)
+    return _format_git_info(status, git(_RECENT_DIFF), git(_CURRENT_DIFF))
+
+
+async def get_git_status_and_diff_async(
+    cwd: str | None = None, *, status: str | None = None
+) -> str:
+    """:func:`get_git_status_and_diff`, running the git queries concurrently.
+
+    Pass *status* (``git status --short`` output, e.g. from a
+    :class:`~.git_state.GitStateCache`) to skip that query.
+    """
+
+    async def git(argv: tuple[str, ...]) -> tuple[int | None, str]:
+        try:
+            result = await run_process(argv, cwd=cwd, timeout=_GIT_TIMEOUT)
+        except OSError:
+            return None, ""
+        return result.returncode, result.stdout
+
+    async def git_status() -> tuple[int | None, str]:
+        if status is not None:
+            return 0, status
+        return await git(("git", "status", "--short"))
+
+    status_result, recent, current = await asyncio.gather(
+        git_status(), git(_RECENT_DIFF), git(_CURRENT_DIFF)
+    )
+    return _format_git_info(status_result, recent, current)
+
+
+def _format_git_info(
+    status: tuple[int | None, str],
+    recent: tuple[int | None, str] | None,
+    current: tuple[int | None, str] | None,
+) -> str:
+    """Format ``(returncode, stdout)`` results; ``None`` returncode = unavailable."""
+    code, out = status
+    if code is None:
+        return "Git status unavailable"
+    if code != 0:
+        return "Not a git repository"
+
+    out = out.strip()
+    parts = ["Git Status:", out] if out else ["Git Status: clean (no changes)"]
+    parts.append("")
 
     # Recent diff (last 3 commits)
-    try:
-        result = subprocess.run(
-            ["git", "diff", "--stat", "HEAD~3..HEAD"],
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            timeout=5,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            parts.append("Recent changes (last 3 commits):")
-            parts.append(result.stdout.strip())
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+    if recent is not None and recent[0] == 0 and recent[1].strip():
+        parts.append("Recent changes (last 3 commits):")
+        parts.append(recent[1].strip())
 
     # Current diff if any
-    try:
-        result = subprocess.run(
-            ["git", "diff", "--stat"],
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            timeout=5,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            parts.append("")
-            parts.append("Uncommitted changes:")
-            parts.append(result.stdout.strip())
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+    if current is not None and current[0] == 0 and current[1].strip():
+        parts.append("")
+        parts.append("Uncommitted changes:")
+        parts.append(current[1].strip())
 
-    return "\n".join(parts) if parts else "Not a git repository"
+    return "\n".join(parts)
 
 
 def file_preview(path: str | Path) -> str:
@@ -0,0 +1,280 @@
+"""Background queue for slow LLM calls (monitor summaries, auto-tags).
+
+The LLM callables used by :class:`~session_summarizer.SessionSummarizer`
+and :class:`~auto_tagger.AutoTagger` are plain blocking functions (the
+``anthropic`` SDK client).  Running them from a UI timer freezes the UI for
+the duration of the HTTP request, so callers hand them to an
+:class:`LLMJobQueue` instead and get the result back through a callback.
+
+Key design decisions
+--------------------
+* **Bounded concurrency** -- a fixed number of daemon worker threads
+  (default 2) so a burst of sessions never turns into a burst of API calls.
+  Daemon threads never hold up interpreter exit on a hung request.
+* **Deduplication by key** -- a job whose key is already queued or running
+  is dropped.  Callers use ``"<kind>:<session_id>"`` keys so repeated scans
+  do not pile up duplicate requests for the same session.
+* **Per-job timeout** -- a job still queued when its deadline passes is
+  dropped without being run and reported as a timeout.  A blocking call
+  cannot be interrupted from the outside, so once running the LLM
+  factories' client-side timeout frees a hung worker; a call that fails
+  after running for the whole deadline counts as a timeout.  A result
+  that arrives is always delivered.
+* **Callbacks run on the worker thread** -- the UI layer posts a message
+  from the callback and applies the result on its own thread.
+* **Observable** -- :meth:`LLMJobQueue.stats` reports queue depth and
+  latency for the monitor panel.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Default number of concurrent LLM calls.
+_DEFAULT_MAX_WORKERS: int = 2
+
+#: Default per-job deadline in seconds.
+_DEFAULT_TIMEOUT: float = 30.0
+
+#: Smoothing factor for the moving latency averages.
+_EWMA_ALPHA: float = 0.3
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+#: ``on_done(key, result, error)`` -- *error* is ``None`` on success,
+#: ``"timeout"`` for jobs that expired or timed out, or the exception text
+#: on failure.
+DoneCallback = Callable[[str, Any, str | None], None]
+
+
+@dataclass
+class _Job:
+    key: str
+    fn: Callable[[], Any]
+    on_done: DoneCallback | None
+    timeout: float
+    submitted: float = field(default_factory=time.monotonic)
+
+
+@dataclass(frozen=True)
+class LLMJobStats:
+    """Snapshot of queue activity."""
+
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    avg_wait: float = 0.0  # seconds spent queued (moving average)
+    avg_latency: float = 0.0  # seconds spent in the LLM call (moving average)
+
+    @property
+    def depth(self) -> int:
+        """Jobs not yet finished (queued + running)."""
+        return self.queued + self.running
+
+    def summary(self) -> str:
+        """One-line description for status displays."""
+        parts = [f"{self.queued} queued", f"{self.running} running"]
+        if self.completed or self.failed or self.timed_out:
+            parts.append(f"avg {self.avg_latency:.1f}s")
+        if self.failed or self.timed_out:
+            parts.append(f"{self.failed + self.timed_out} failed")
+        return ", ".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+class LLMJobQueue:
+    """Run blocking LLM calls on a small pool of background threads.
+
+    Usage::
+
+        jobs = LLMJobQueue(max_workers=2)
+        jobs.submit(
+            f"summary:{sid}",
+            lambda: summarizer.generate_summary(session),
+            on_done=lambda key, result, error: app.post_message(...),
+        )
+    """
+
+    def __init__(
+        self,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        default_timeout: float = _DEFAULT_TIMEOUT,
+    ) -> None:
+        self._max_workers = max(1, max_workers)
+        self._default_timeout = default_timeout
+        self._cond = threading.Condition()
+        self._queue: deque[_Job] = deque()
+        self._active: set[str] = set()  # keys queued or running
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._avg_wait = 0.0
+        self._avg_latency = 0.0
+        self._latency_samples = 0
+        self._threads: list[threading.Thread] = []
+        self._closed = False
+
+    # -- submission -----------------------------------------------------------
+
+    def submit(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        *,
+        on_done: DoneCallback | None = None,
+        timeout: float | None = None,
+    ) -> bool:
+        """Queue *fn* under *key*.  Returns ``False`` if *key* is already active."""
+        with self._cond:
+            if self._closed or key in self._active:
+                return False
+            self._active.add(key)
+            self._queue.append(
+                _Job(
+                    key=key,
+                    fn=fn,
+                    on_done=on_done,
+                    timeout=self._default_timeout if timeout is None else timeout,
+                )
+            )
+            if len(self._threads) < self._max_workers:
+                self._start_worker()
+            self._cond.notify()
+        return True
+
+    def is_active(self, key: str) -> bool:
+        """Whether a job for *key* is queued or running."""
+        with self._cond:
+            return key in self._active
+
+    def stats(self) -> LLMJobStats:
+        with self._cond:
+            return LLMJobStats(
+                queued=len(self._queue),
+                running=self._running,
+                completed=self._completed,
+                failed=self._failed,
+                timed_out=self._timed_out,
+                avg_wait=self._avg_wait,
+                avg_latency=self._avg_latency,
+            )
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until no jobs are queued or running.  Returns ``False`` on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._active:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def shutdown(self) -> None:
+        """Drop queued jobs and stop accepting new ones.
+
+        Calls already in flight finish in the background; their callbacks
+        still run.
+        """
+        with self._cond:
+            self._closed = True
+            for job in self._queue:
+                self._active.discard(job.key)
+            self._queue.clear()
+            self._cond.notify_all()
+
+    # -- workers --------------------------------------------------------------
+
+    def _start_worker(self) -> None:
+        t = threading.Thread(
+            target=self._worker,
+            name=f"llm-job-{len(self._threads)}",
+            daemon=True,
+        )
+        self._threads.append(t)
+        t.start()
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                job = self._queue.popleft()
+                self._running += 1
+            self._run(job)
+
+    def _run(self, job: _Job) -> None:
+        started = time.monotonic()
+        result: Any = None
+        error: str | None = None
+        ran = started - job.submitted <= job.timeout
+        if not ran:
+            logger.debug(
+                "LLM job %s expired after %.0fs in the queue", job.key, job.timeout
+            )
+            error = "timeout"
+        else:
+            try:
+                result = job.fn()
+            except Exception as exc:
+                logger.debug("LLM job %s failed", job.key, exc_info=True)
+                error = str(exc) or type(exc).__name__
+        finished = time.monotonic()
+        if error is not None and ran and finished - started >= job.timeout:
+            error = "timeout"  # the client-side timeout fired
+
+        with self._cond:
+            self._running -= 1
+            if error is None:
+                self._completed += 1
+            elif error == "timeout":
+                self._timed_out += 1
+            else:
+                self._failed += 1
+            wait = started - job.submitted
+            latency = finished - started
+            if self._completed + self._failed + self._timed_out == 1:
+                self._avg_wait = wait
+            else:
+                self._avg_wait += _EWMA_ALPHA * (wait - self._avg_wait)
+            if ran:
+                if self._latency_samples == 0:
+                    self._avg_latency = latency
+                else:
+                    self._avg_latency += _EWMA_ALPHA * (latency - self._avg_latency)
+                self._latency_samples += 1
+
+        try:
+            if job.on_done is not None:
+                job.on_done(job.key, result, error)
+        except Exception:
+            logger.debug("LLM job callback failed for %s", job.key, exc_info=True)
+        finally:
+            # Release the key only after the callback so a caller that
+            # re-checks state in the callback cannot race a duplicate job.
+            with self._cond:
+                self._active.discard(job.key)
+                self._cond.notify_all()
@@ -0,0 +1,167 @@
+"""Asyncio subprocess runner for shell and git commands.
+
+``/run``, ``/git``, ``/diff`` and the ``/include`` helpers used to call
+:func:`subprocess.run` on the UI thread, freezing the interface for up to
+the command's timeout.  The coroutines here run the child process on the
+event loop instead:
+
+* output is read in chunks as it arrives and can be streamed to a callback;
+* the timeout kills the process and returns whatever it printed so far;
+* cancelling the awaiting task (e.g. Escape) kills the process -- its whole
+  process group on POSIX, so ``sh -c 'a | b'`` pipelines die too;
+* independent git queries can be awaited concurrently with
+  :func:`asyncio.gather`.
+
+Like :mod:`git_integration`, this module is stateless: no ``self``
+references, no widget access.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import os
+import signal
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from ..log import logger
+
+#: Bytes read from a pipe per chunk.
+_CHUNK_BYTES: int = 65536
+
+#: Default timeout for git queries (seconds), as in :func:`run_git`.
+GIT_TIMEOUT: float = 10.0
+
+
+@dataclass
+class ProcessResult:
+    """Outcome of :func:`run_process`."""
+
+    returncode: int | None  # None when the process was killed on timeout
+    stdout: str
+    stderr: str
+    timed_out: bool = False
+
+
+async def run_process(
+    cmd: str | Sequence[str],
+    *,
+    shell: bool = False,
+    cwd: str | None = None,
+    timeout: float | None = None,
+    on_stdout: Callable[[str], None] | None = None,
+) -> ProcessResult:
+    """Run *cmd* without blocking the event loop.
+
+    *cmd* is a shell string when *shell* is true, else an argv sequence.
+    *on_stdout* receives decoded stdout text as it arrives.  Raises
+    :class:`OSError` (e.g. :class:`FileNotFoundError`) if the process
+    cannot be started.
+    """
+    posix = os.name == "posix"
+    if shell:
+        proc = await asyncio.create_subprocess_shell(
+            cmd,  # type: ignore[arg-type]
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            start_new_session=posix,
+        )
+    else:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            start_new_session=posix,
+        )
+
+    stdout: list[str] = []
+    stderr: list[str] = []
+    assert proc.stdout is not None and proc.stderr is not None
+    io = asyncio.gather(
+        _pump(proc.stdout, stdout, on_stdout),
+        _pump(proc.stderr, stderr, None),
+        proc.wait(),
+    )
+    io.add_done_callback(_retrieve)  # a cancelled gather would log a warning
+    timed_out = False
+    try:
+        await asyncio.wait_for(io, timeout)
+    except TimeoutError:
+        timed_out = True
+        await _kill(proc)
+    except BaseException:  # cancelled: don't leave the child running
+        io.cancel()
+        await asyncio.shield(_kill(proc))
+        raise
+
+    return ProcessResult(
+        returncode=None if timed_out else proc.returncode,
+        stdout="".join(stdout),
+        stderr="".join(stderr),
+        timed_out=timed_out,
+    )
+
+
+async def run_git_async(
+    *args: str, cwd: str | None = None, timeout: float = GIT_TIMEOUT
+) -> tuple[bool, str]:
+    """Async :func:`~git_integration.run_git`: *(success, output)*."""
+    try:
+        result = await run_process(
+            ["git", *args], cwd=cwd or os.getcwd(), timeout=timeout
+        )
+    except FileNotFoundError:
+        return False, "git not found"
+    except OSError as exc:
+        logger.debug("Git command failed: %s", args, exc_info=True)
+        return False, str(exc)
+    if result.timed_out:
+        return False, "git command timed out"
+    return (
+        result.returncode == 0,
+        result.stdout.strip() or result.stderr.strip(),
+    )
+
+
+async def _pump(
+    stream: asyncio.StreamReader,
+    sink: list[str],
+    on_text: Callable[[str], None] | None,
+) -> None:
+    """Decode *stream* into *sink* (and *on_text*) until EOF."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        chunk = await stream.read(_CHUNK_BYTES)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            sink.append(text)
+            if on_text is not None:
+                on_text(text)
+        if not chunk:
+            return
+
+
+def _retrieve(fut: asyncio.Future) -> None:
+    if not fut.cancelled():
+        fut.exception()
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill *proc* (and its process group on POSIX) and reap it."""
+    if proc.returncode is None:
+        try:
+            if os.name == "posix":
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+    try:
+        await proc.wait()
+    except Exception:  # noqa: BLE001
+        logger.debug("Failed to reap killed process", exc_info=True)
@@ -7,11 +7,12 @@ the delays this engine calculates.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
+from .._json import DECODE_ERRORS, loads
+
 
 class ReplayState(Enum):
     IDLE = "idle"
@@ -135,8 +136,8 @@ class ReplayEngine:
                 continue
 
             try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
+                data = loads(line)
+            except DECODE_ERRORS:
                 continue
 
             role = data.get("role", "")
@@ -0,0 +1,214 @@
+"""Pool of pre-started sessions, refilled in the background.
+
+Starting a session is slow: the bridge creates it and loads the bundle,
+then the providers listed in ``settings.yaml`` are mounted.  The first
+message of every new tab and every ``/new`` waited for all of that before
+its first token.
+
+:class:`SessionPool` keeps up to *size* idle sessions per working
+directory, started one at a time by a daemon thread with its own event
+loop.  :meth:`~SessionPool.take` never waits: it hands out an idle session
+(a hit) or returns ``None`` (a miss, the caller starts one itself), and
+either way asks the thread to top that directory up again.  Each idle
+session remembers the *stamp* (e.g. the settings file mtime) it was
+started under; sessions started under an older stamp are ended instead of
+handed out.  :attr:`~SessionPool.stats` counts hits and misses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..log import logger
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of pool activity."""
+
+    size: int = 0  # idle sessions kept per directory
+    idle: int = 0
+    hits: int = 0
+    misses: int = 0
+    started: int = 0
+    failed: int = 0
+    avg_start: float = 0.0  # seconds to start one session (moving average)
+
+    def summary(self) -> str:
+        """One-line description for status displays."""
+        taken = self.hits + self.misses
+        rate = f" ({100 * self.hits / taken:.0f}% hit)" if taken else ""
+        text = f"{self.hits} hits, {self.misses} misses{rate}, {self.idle} idle"
+        if self.started:
+            text += f", start avg {self.avg_start:.1f}s"
+        if self.failed:
+            text += f", {self.failed} failed"
+        return text
+
+
+class SessionPool:
+    """Idle sessions per working directory, started ahead of time.
+
+    *start(cwd)* and *end(session)* are coroutines run on the pool's own
+    thread.  *stamp()* is read when a session is started and again when it
+    is taken; a session whose stamp no longer matches is ended.
+    """
+
+    def __init__(
+        self,
+        start: Callable[[Path], Awaitable[Any]],
+        end: Callable[[Any], Awaitable[None]],
+        *,
+        size: int = 1,
+        stamp: Callable[[], Hashable] = lambda: None,
+    ) -> None:
+        self.size = max(1, size)
+        self._start = start
+        self._end = end
+        self._stamp = stamp
+        self._cond = threading.Condition()
+        self._idle: dict[str, list[tuple[Hashable, Any]]] = {}
+        self._wanted: dict[str, None] = {}  # directories to keep topped up
+        self._stale: list[Any] = []
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._hits = 0
+        self._misses = 0
+        self._started = 0
+        self._failed = 0
+        self._avg_start = 0.0
+
+    # -- callers (any thread) -------------------------------------------------
+
+    def prewarm(self, cwd: Path) -> None:
+        """Start filling the pool for *cwd*."""
+        with self._cond:
+            if self._closed:
+                return
+            self._wanted[os.path.abspath(cwd)] = None
+            self._ensure_thread()
+            self._cond.notify()
+
+    def take(self, cwd: Path) -> Any | None:
+        """Return an idle session for *cwd*, or ``None`` if none is ready."""
+        key = os.path.abspath(cwd)
+        stamp = self._stamp()
+        with self._cond:
+            if self._closed:
+                return None
+            entries = self._idle.get(key, [])
+            session = None
+            while entries and session is None:
+                entry_stamp, candidate = entries.pop(0)
+                if entry_stamp == stamp:
+                    session = candidate
+                else:
+                    self._stale.append(candidate)
+            if session is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            self._wanted[key] = None
+            self._ensure_thread()
+            self._cond.notify()
+        return session
+
+    def close(self, timeout: float | None = None) -> None:
+        """End idle sessions and stop the thread (waits up to *timeout*)."""
+        with self._cond:
+            self._closed = True
+            thread = self._thread
+            self._cond.notify()
+        if thread is not None:
+            thread.join(timeout)
+
+    @property
+    def stats(self) -> PoolStats:
+        with self._cond:
+            return PoolStats(
+                size=self.size,
+                idle=sum(len(entries) for entries in self._idle.values()),
+                hits=self._hits,
+                misses=self._misses,
+                started=self._started,
+                failed=self._failed,
+                avg_start=self._avg_start,
+            )
+
+    # -- pool thread ----------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="session-pool", daemon=True
+            )
+            self._thread.start()
+
+    def _short(self) -> str | None:
+        for key in self._wanted:
+            if len(self._idle.get(key, ())) < self.size:
+                return key
+        return None
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                with self._cond:
+                    while not (self._closed or self._stale or self._short()):
+                        self._cond.wait()
+                    if self._closed:
+                        leftover = self._stale + [
+                            session
+                            for entries in self._idle.values()
+                            for _, session in entries
+                        ]
+                        self._stale.clear()
+                        self._idle.clear()
+                        break
+                    stale = self._stale[:]
+                    self._stale.clear()
+                    key = self._short()
+                for session in stale:
+                    self._end_quietly(loop, session)
+                if key is not None:
+                    self._fill(loop, key)
+            for session in leftover:
+                self._end_quietly(loop, session)
+        finally:
+            loop.close()
+
+    def _fill(self, loop: asyncio.AbstractEventLoop, key: str) -> None:
+        stamp = self._stamp()
+        start = time.monotonic()
+        try:
+            session = loop.run_until_complete(self._start(Path(key)))
+        except Exception:  # noqa: BLE001 - retried on the next take()
+            logger.debug("Failed to pre-start a session in %s", key, exc_info=True)
+            with self._cond:
+                self._failed += 1
+                self._wanted.pop(key, None)
+            return
+        elapsed = time.monotonic() - start
+        with self._cond:
+            self._started += 1
+            self._avg_start = (
+                elapsed if self._started == 1 else 0.7 * self._avg_start + 0.3 * elapsed
+            )
+            if not self._closed:
+                self._idle.setdefault(key, []).append((stamp, session))
+                return
+        self._end_quietly(loop, session)
+
+    def _end_quietly(self, loop: asyncio.AbstractEventLoop, session: Any) -> None:
+        try:
+            loop.run_until_complete(self._end(session))
+        except Exception:  # noqa: BLE001
+            logger.debug("Failed to end a pooled session", exc_info=True)
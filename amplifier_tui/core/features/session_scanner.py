@@ -20,16 +20,36 @@ The last event in ``events.jsonl`` tells us what the session is doing:
 
 A session whose directory hasn't been modified for > ``STALE_THRESHOLD``
 seconds is downgraded to STALE regardless of last event.
+
+Change tracking
+---------------
+The scanner keeps a table of per-session inputs (directory mtime, parsed
+``metadata.json``, the tail of ``events.jsonl``) between scans and only
+re-reads a file whose ``(mtime, size)`` moved.  With ``watch=True`` a
+:class:`SessionWatcher` (``watchfiles``, when installed) reports which
+session directories changed, so a scan with no changes does no I/O at all
+and the monitor can refresh every :data:`WATCH_REFRESH_SECONDS`.  Without
+it the scanner polls: one ``stat`` per session for ranking plus a few for
+each shown session, every :data:`POLL_REFRESH_SECONDS`.
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
+from .._json import DECODE_ERRORS, loads
+from ..log import logger
+from ..session_catalog import CatalogEntry, SessionCatalog
+
+try:
+    import watchfiles  # type: ignore[import-not-found]
+except ImportError:
+    watchfiles = None
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -45,6 +65,15 @@ _TAIL_BYTES: int = 8192
 #: Maximum characters kept for the activity summary string.
 _SUMMARY_MAX_CHARS: int = 120
 
+#: Monitor refresh interval when change notifications are available.
+WATCH_REFRESH_SECONDS: float = 0.25
+
+#: Monitor refresh interval when the scanner has to poll.
+POLL_REFRESH_SECONDS: float = 2.0
+
+#: Notification batching of the watcher thread (milliseconds).
+_WATCH_DEBOUNCE_MS: int = 50
+
 #: Events that indicate the session is actively working.
 _RUNNING_EVENTS: frozenset[str] = frozenset(
     {
@@ -141,8 +170,8 @@ def _parse_last_events(lines: list[str], max_events: int = 10) -> list[dict]:
         if not line:
             continue
         try:
-            events.append(json.loads(line))
-        except (json.JSONDecodeError, ValueError):
+            events.append(loads(line))
+        except DECODE_ERRORS:
             continue
         if len(events) >= max_events:
             break
@@ -244,6 +273,24 @@ def _read_metadata(session_dir: Path) -> dict:
     return {}
 
 
+def _file_sig(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` of *path*, or ``None`` if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _metadata_sig(session_dir: Path) -> tuple[str, tuple[int, int]] | None:
+    """Signature of the metadata file :func:`_read_metadata` would read."""
+    for name in ("metadata.json", "session-info.json"):
+        sig = _file_sig(session_dir / name)
+        if sig is not None:
+            return name, sig
+    return None
+
+
 def _parse_timestamp(raw: str) -> datetime | None:
     """Parse an ISO-8601 timestamp, tolerating Z suffix."""
     if not raw:
@@ -271,6 +318,110 @@ def _project_label(meta: dict, project_dir_name: str) -> tuple[str, str]:
     return label, decoded
 
 
+# ---------------------------------------------------------------------------
+# Change tracking
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _SessionRecord:
+    """Cached inputs for one session directory (see "Change tracking")."""
+
+    mtime: float = 0.0  # session directory mtime (recency ranking)
+    meta_sig: tuple[str, tuple[int, int]] | None = None
+    meta: dict = field(default_factory=dict)
+    events_sig: tuple[int, int] | None = None
+    events: list[dict] = field(default_factory=list)
+    has_transcript: bool = False
+    validated: bool = False  # files checked since the last change
+
+
+class SessionWatcher:
+    """Record which session directories change, from filesystem events.
+
+    Runs :func:`watchfiles.watch` over the projects directory on a daemon
+    thread.  :meth:`drain` returns the session directories touched since the
+    previous call, or ``None`` when the directory structure itself changed
+    (or the watcher just started) and the caller should revalidate
+    everything.  If ``watchfiles`` is not installed, or watching fails (for
+    example when the inotify watch limit is reached), :attr:`active` is
+    ``False`` and callers fall back to polling.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._changed: set[Path] = set()
+        self._structure_changed = True
+        self._thread: threading.Thread | None = None
+        self._active = False
+
+    @staticmethod
+    def available() -> bool:
+        return watchfiles is not None
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def start(self) -> bool:
+        """Start watching; return whether notifications are available."""
+        if self._thread is not None:
+            return self._active
+        if watchfiles is None or not self._root.is_dir():
+            return False
+        self._active = True
+        self._thread = threading.Thread(
+            target=self._run, name="session-watcher", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._active = False
+
+    def drain(self) -> set[Path] | None:
+        with self._lock:
+            if self._structure_changed:
+                self._structure_changed = False
+                self._changed.clear()
+                return None
+            changed, self._changed = self._changed, set()
+        return changed
+
+    def _run(self) -> None:
+        try:
+            for changes in watchfiles.watch(
+                self._root,
+                stop_event=self._stop,
+                debounce=_WATCH_DEBOUNCE_MS,
+                step=_WATCH_DEBOUNCE_MS,
+                raise_interrupt=False,
+            ):
+                self._record(path for _change, path in changes)
+        except Exception:  # noqa: BLE001
+            logger.debug(
+                "Session watcher stopped; falling back to polling", exc_info=True
+            )
+        finally:
+            self._active = False
+
+    def _record(self, paths) -> None:
+        with self._lock:
+            for raw in paths:
+                try:
+                    parts = Path(raw).relative_to(self._root).parts
+                except ValueError:
+                    continue
+                # <project>/sessions/<session>/<file>
+                if len(parts) >= 4 and parts[1] == "sessions":
+                    self._changed.add(self._root / parts[0] / "sessions" / parts[2])
+                else:
+                    self._structure_changed = True
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -285,8 +436,14 @@ class SessionScanner:
         sessions = scanner.scan()       # list of MonitoredSession
         sessions = scanner.scan(limit=10)
 
-    The scanner is stateless -- each :meth:`scan` call reads the filesystem
-    fresh.  The caller (e.g. a Textual timer) decides the refresh cadence.
+    Directory listings come from the shared
+    :class:`~amplifier_tui.core.session_catalog.SessionCatalog`; per-session
+    inputs are cached between scans and re-read only when they change (see
+    "Change tracking" above).  With ``watch=True`` changes are taken from a
+    :class:`SessionWatcher` when one can run; :attr:`refresh_interval` tells
+    the caller (e.g. a Textual timer) which cadence that affords.  The
+    watcher starts with the first :meth:`scan`; :meth:`close` stops it until
+    the next one.
     """
 
     DEFAULT_SESSION_DIR = Path.home() / ".amplifier" / "projects"
@@ -295,9 +452,33 @@ class SessionScanner:
         self,
         session_dir: Path | None = None,
         stale_threshold: int = STALE_THRESHOLD_SECONDS,
+        *,
+        watch: bool = False,
     ) -> None:
         self._session_dir = session_dir or self.DEFAULT_SESSION_DIR
         self._stale_threshold = stale_threshold
+        self._records: dict[Path, _SessionRecord] = {}
+        self._entries: list[CatalogEntry] = []
+        self._watch = watch and SessionWatcher.available()
+        self._watcher: SessionWatcher | None = None
+
+    @property
+    def watching(self) -> bool:
+        """True while filesystem notifications drive the scans."""
+        return self._watcher is not None and self._watcher.active
+
+    @property
+    def refresh_interval(self) -> float:
+        """Seconds between scans that keep the view current at low cost."""
+        if self.watching or (self._watch and self._watcher is None):
+            return WATCH_REFRESH_SECONDS
+        return POLL_REFRESH_SECONDS
+
+    def close(self) -> None:
+        """Stop the watcher thread, if any."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
 
     def scan(self, limit: int = 10) -> list[MonitoredSession]:
         """Return up to *limit* sessions sorted by most-recently-active first.
@@ -308,46 +489,76 @@ class SessionScanner:
         if not self._session_dir.exists():
             return []
 
-        candidates: list[tuple[float, Path, str]] = []
-        # project_dir_name is used for label fallback.
-        now = datetime.now().timestamp()
-
-        for project_dir in self._session_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-            sessions_subdir = project_dir / "sessions"
-            if not sessions_subdir.exists():
-                continue
+        if self._watch and self._watcher is None:
+            self._watcher = SessionWatcher(self._session_dir)
+            self._watcher.start()
 
-            for session_dir in sessions_subdir.iterdir():
-                if not session_dir.is_dir():
-                    continue
-                # Skip sub-sessions.
-                if "_" in session_dir.name:
-                    continue
-                # Must have either events or transcript to be interesting.
-                events_path = session_dir / "events.jsonl"
-                transcript_path = session_dir / "transcript.jsonl"
-                if not events_path.exists() and not transcript_path.exists():
-                    continue
+        now = datetime.now().timestamp()
+        # ``None`` means "anything may have changed": always when polling,
+        # and after the watcher starts or sees a project-level change.
+        changed = self._watcher.drain() if self.watching else None
+        if changed is None:
+            # The catalog only re-lists project/session directories whose
+            # mtime changed, so steady-state scans skip the directory walk.
+            self._entries = SessionCatalog.for_dir(self._session_dir).entries()
+            known = {entry.session_dir for entry in self._entries}
+            for stale_dir in self._records.keys() - known:
+                del self._records[stale_dir]
 
+        candidates: list[tuple[float, Path, str]] = []
+        for entry in self._entries:
+            sdir = entry.session_dir
+            record = self._records.get(sdir)
+            if record is None or changed is None or sdir in changed:
+                # Ranking needs the session-directory mtime, which the
+                # catalog does not track.
                 try:
-                    mtime = session_dir.stat().st_mtime
+                    mtime = sdir.stat().st_mtime
                 except OSError:
+                    self._records.pop(sdir, None)
                     continue
-
-                candidates.append((mtime, session_dir, project_dir.name))
+                if record is None:
+                    record = self._records[sdir] = _SessionRecord()
+                record.mtime = mtime
+                record.validated = False
+            candidates.append((record.mtime, sdir, entry.project_dir_name))
 
         # Sort by mtime descending, take top N.
         candidates.sort(key=lambda t: t[0], reverse=True)
-        candidates = candidates[:limit]
 
         results: list[MonitoredSession] = []
         for mtime, sdir, proj_dir_name in candidates:
+            if len(results) >= limit:
+                break
+            record = self._records[sdir]
+            if not record.validated:
+                self._refresh_record(sdir, record)
+            # Must have either events or transcript to be interesting.
+            if record.events_sig is None and not record.has_transcript:
+                continue
             results.append(self._scan_one(sdir, proj_dir_name, mtime, now))
 
         return results
 
+    @staticmethod
+    def _refresh_record(session_dir: Path, record: _SessionRecord) -> None:
+        """Re-read the metadata and events tail if their files changed."""
+        meta_sig = _metadata_sig(session_dir)
+        if meta_sig != record.meta_sig:
+            record.meta = _read_metadata(session_dir) if meta_sig else {}
+            record.meta_sig = meta_sig
+
+        events_path = session_dir / "events.jsonl"
+        events_sig = _file_sig(events_path)
+        if events_sig != record.events_sig:
+            record.events = (
+                _parse_last_events(_tail_lines(events_path)) if events_sig else []
+            )
+            record.events_sig = events_sig
+
+        record.has_transcript = (session_dir / "transcript.jsonl").exists()
+        record.validated = True
+
     def _scan_one(
         self,
         session_dir: Path,
@@ -356,7 +567,11 @@ class SessionScanner:
         now: float,
     ) -> MonitoredSession:
         """Build a MonitoredSession from a single session directory."""
-        meta = _read_metadata(session_dir)
+        record = self._records.get(session_dir)
+        if record is None or not record.validated:
+            record = _SessionRecord(mtime=mtime)
+            self._refresh_record(session_dir, record)
+        meta = record.meta
         session_id = meta.get("session_id", session_dir.name)
         model = meta.get("model", "")
         turn_count = meta.get("turn_count", 0) or 0
@@ -366,9 +581,7 @@ class SessionScanner:
         project_label, project_path = _project_label(meta, project_dir_name)
 
         # Determine state from events.
-        events_path = session_dir / "events.jsonl"
-        tail = _tail_lines(events_path)
-        events = _parse_last_events(tail)
+        events = record.events
 
         seconds_since_activity = now - mtime
         is_stale = seconds_since_activity > self._stale_threshold
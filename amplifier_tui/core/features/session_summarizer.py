@@ -11,9 +11,11 @@ Key design decisions
   status line.  The result is cached until the session's mtime changes.
 * **Non-blocking** -- :meth:`SessionSummarizer.scan` always returns
   immediately with the best available text (cached LLM summary or raw
-  truncated text).  Pending summaries are processed separately via
-  :meth:`process_pending`, which the caller can run on a slower timer or
-  in a background task.
+  truncated text).  Pending summaries are processed separately, either
+  inline via :meth:`process_pending` or split into
+  :meth:`take_pending` / :meth:`generate_summary` (worker thread) /
+  :meth:`apply_summary` (UI thread) for use with an
+  :class:`~llm_jobs.LLMJobQueue`.
 * **Provider-agnostic** -- the summarizer accepts a plain callable
   ``(str) -> str`` for the LLM call.  The TUI wires in whatever provider
   the user has configured.  A default implementation using the ``anthropic``
@@ -24,12 +26,12 @@ Key design decisions
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Protocol
 
+from .._json import DECODE_ERRORS, loads
 from .session_scanner import (
     MonitoredSession,
     SessionScanner,
@@ -53,6 +55,10 @@ _MAX_PROMPT_CHARS: int = 2000
 #: Maximum characters for the returned status line.
 _MAX_STATUS_CHARS: int = 60
 
+# How many times a session whose LLM job was rejected or failed is re-queued
+# before it is left with the raw scanner text (until its mtime changes).
+_MAX_RETRIES: int = 3
+
 # ---------------------------------------------------------------------------
 # LLM call protocol
 # ---------------------------------------------------------------------------
@@ -94,8 +100,8 @@ def read_transcript_excerpt(session_dir: Path) -> TranscriptExcerpt | None:
         if not line:
             continue
         try:
-            messages.append(json.loads(line))
-        except (json.JSONDecodeError, ValueError):
+            messages.append(loads(line))
+        except DECODE_ERRORS:
             continue
 
     if not messages:
@@ -239,6 +245,11 @@ class SessionSummarizer:
         # On slow timer (every 10-30s) -- processes LLM queue
         summarizer.process_pending(max_count=3)
 
+        # ...or off the UI thread, via an LLMJobQueue
+        for session in summarizer.take_pending():
+            jobs.submit(f"summary:{session.session_id}",
+                        lambda s=session: summarizer.generate_summary(s))
+
     If *summarize_fn* is ``None``, the summarizer acts as a transparent
     pass-through: sessions are returned with the scanner's raw activity text.
     """
@@ -257,6 +268,7 @@ class SessionSummarizer:
         self._summarize_fn = summarize_fn
         self._cache: dict[str, _CachedSummary] = {}
         self._pending: list[MonitoredSession] = []
+        self._retries: dict[str, int] = {}
 
     @property
     def has_pending(self) -> bool:
@@ -307,6 +319,10 @@ class SessionSummarizer:
         Returns the number of summaries successfully generated.  Failed
         summaries are silently dropped (the raw text remains in the UI
         until the next state transition triggers a retry).
+
+        This blocks on the LLM call; interactive callers should use
+        :meth:`take_pending` / :meth:`generate_summary` on a background
+        worker and :meth:`apply_summary` on the UI thread instead.
         """
         if not self._summarize_fn:
             self._pending.clear()
@@ -315,24 +331,8 @@ class SessionSummarizer:
         processed = 0
         while self._pending and processed < max_count:
             session = self._pending.pop(0)
-
-            if session.session_dir is None:
-                continue
-
-            excerpt = read_transcript_excerpt(session.session_dir)
-            if excerpt is None:
-                continue
-
-            prompt = build_summary_prompt(excerpt, session.state)
-
             try:
-                raw_summary = self._summarize_fn(prompt)
-                summary = self._clean_summary(raw_summary)
-                self._cache[session.session_id] = _CachedSummary(
-                    summary=summary,
-                    mtime=session.last_active.timestamp(),
-                )
-                processed += 1
+                summary = self.generate_summary(session)
             except Exception:
                 logger.debug(
                     "Summary generation failed for %s",
@@ -340,9 +340,72 @@ class SessionSummarizer:
                     exc_info=True,
                 )
                 continue
+            if summary is None:
+                continue
+            self.apply_summary(session, summary)
+            processed += 1
 
         return processed
 
+    def take_pending(self, max_count: int = 0) -> list[MonitoredSession]:
+        """Remove and return up to *max_count* queued sessions (0 = all).
+
+        Sessions whose summary was cached since they were queued are
+        skipped.
+        """
+        if not self._summarize_fn:
+            self._pending.clear()
+            return []
+        taken: list[MonitoredSession] = []
+        while self._pending and (not max_count or len(taken) < max_count):
+            session = self._pending.pop(0)
+            cached = self._cache.get(session.session_id)
+            if cached and cached.mtime == session.last_active.timestamp():
+                continue
+            taken.append(session)
+        return taken
+
+    def requeue(self, session: MonitoredSession, *, retry: bool = True) -> bool:
+        """Put back a session taken by :meth:`take_pending` whose job was
+        rejected, failed or timed out.
+
+        A failed or timed-out job counts as a *retry*; a job that was never
+        run (rejected as a duplicate) passes ``retry=False`` and keeps its
+        budget.  Returns ``False`` once the session has used up its retries.
+        """
+        if retry:
+            retries = self._retries.get(session.session_id, 0)
+            if retries >= _MAX_RETRIES:
+                self._retries.pop(session.session_id, None)
+                return False
+            self._retries[session.session_id] = retries + 1
+        if not self._is_pending(session.session_id):
+            self._pending.append(session)
+        return True
+
+    def generate_summary(self, session: MonitoredSession) -> str | None:
+        """Run the LLM for *session* and return a cleaned status line.
+
+        Returns ``None`` when there is nothing to summarize.  LLM errors
+        propagate.  Does not touch the cache, so it is safe to call from a
+        worker thread.
+        """
+        if self._summarize_fn is None or session.session_dir is None:
+            return None
+        excerpt = read_transcript_excerpt(session.session_dir)
+        if excerpt is None:
+            return None
+        prompt = build_summary_prompt(excerpt, session.state)
+        return self._clean_summary(self._summarize_fn(prompt))
+
+    def apply_summary(self, session: MonitoredSession, summary: str) -> None:
+        """Cache *summary* for *session* at its current mtime."""
+        self._retries.pop(session.session_id, None)
+        self._cache[session.session_id] = _CachedSummary(
+            summary=summary,
+            mtime=session.last_active.timestamp(),
+        )
+
     def invalidate(self, session_id: str) -> None:
         """Remove a cached summary, forcing re-generation on next scan."""
         self._cache.pop(session_id, None)
@@ -351,6 +414,7 @@ class SessionSummarizer:
         """Remove all cached summaries."""
         self._cache.clear()
         self._pending.clear()
+        self._retries.clear()
 
     # -- Internal -----------------------------------------------------------
 
@@ -378,6 +442,7 @@ class SessionSummarizer:
 def make_anthropic_summarizer(
     model: str = "claude-haiku-4-20250506",
     max_tokens: int = 50,
+    timeout: float = 20.0,
 ) -> SummarizeFn | None:
     """Create a :class:`SummarizeFn` using the ``anthropic`` SDK.
 
@@ -391,7 +456,8 @@ def make_anthropic_summarizer(
         return None
 
     try:
-        client = anthropic.Anthropic()  # reads ANTHROPIC_API_KEY from env
+        # reads ANTHROPIC_API_KEY from env
+        client = anthropic.Anthropic(timeout=timeout, max_retries=1)
     except anthropic.AuthenticationError:
         logger.debug("No valid Anthropic API key; LLM summaries disabled")
         return None
@@ -0,0 +1,618 @@
+"""Persistent full-text index over session transcripts.
+
+Every cross-session search surface (the sidebar ``>`` search, ``/search``,
+``/sessions search`` and ``/project search``) used to re-open and
+json-parse every ``transcript.jsonl`` under ``~/.amplifier/projects`` on
+every query.  This module keeps a single SQLite database under
+``~/.amplifier`` that all of them query instead.
+
+Key design decisions
+--------------------
+* **FTS5 trigram index** -- the ``trigram`` tokenizer gives us
+  case-insensitive *substring* matching, which is exactly the semantics the
+  old brute-force scanners had.  Queries shorter than three characters (or
+  SQLite builds without FTS5) fall back to a plain ``instr`` scan over the
+  same table, which still avoids any JSON parsing.
+* **Incremental by byte offset** -- for each transcript we remember
+  ``(mtime, size, offset)`` where *offset* is the end of the last complete
+  line indexed.  Appended turns are read from that offset only; a file that
+  shrank or was rewritten in place is re-indexed from scratch.
+* **Connection per call** -- searches run from worker threads, so each
+  public method opens its own short-lived connection.  Writers are
+  serialised with a lock; WAL mode lets readers proceed concurrently.
+* **Refresh off the query path** -- a refresh stats every transcript and
+  ``metadata.json``, so interactive callers query with ``refresh=False``
+  and keep the index current with :meth:`TranscriptIndex.refresh_in_background`,
+  which runs at most once per :data:`REFRESH_INTERVAL`.
+
+This module has **no UI dependencies**.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from .._json import DECODE_ERRORS, loads
+from ..platform_info import amplifier_projects_dir, amplifier_tui_file
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Bump when the on-disk schema changes; older databases are rebuilt.
+_SCHEMA_VERSION: int = 1
+
+#: Roles whose text content is indexed (tool calls/results are skipped).
+_INDEXED_ROLES: frozenset[str] = frozenset({"user", "assistant"})
+
+#: Minimum query length the trigram tokenizer can serve from the index.
+_MIN_FTS_QUERY: int = 3
+
+#: Seconds a refresh stays current for throttled (``max_age``) refreshes.
+REFRESH_INTERVAL: float = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id  TEXT PRIMARY KEY,
+    project_dir TEXT NOT NULL,
+    transcript  TEXT NOT NULL,
+    mtime       REAL NOT NULL DEFAULT 0,
+    size        INTEGER NOT NULL DEFAULT 0,
+    offset      INTEGER NOT NULL DEFAULT 0,
+    meta_mtime  REAL NOT NULL DEFAULT 0,
+    name        TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT ''
+)
+"""
+
+_FTS_TABLE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS messages USING fts5("
+    "session_id UNINDEXED, role UNINDEXED, text, tokenize='trigram')"
+)
+
+_PLAIN_TABLE = (
+    "CREATE TABLE IF NOT EXISTS messages (session_id TEXT, role TEXT, text TEXT)"
+)
+
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class IndexMatch:
+    """All hits for one session, aggregated from the index."""
+
+    session_id: str
+    project_dir: str  # encoded directory name under ~/.amplifier/projects
+    mtime: float  # transcript mtime at index time
+    name: str = ""
+    description: str = ""
+    match_count: int = 0
+    first_role: str = ""
+    first_text: str = ""
+    last_role: str = ""
+    last_text: str = ""
+    meta_match: str = ""  # name/description field that matched, if any
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def extract_text(content: object) -> str:
+    """Return the plain text of a transcript ``content`` field.
+
+    Assistant messages may store content as a list of typed blocks rather
+    than a simple string; only ``text`` blocks are kept.
+    """
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "text":
+                parts.append(block.get("text", ""))
+        return " ".join(parts)
+    return ""
+
+
+def count_matches(text_lower: str, query_lower: str) -> tuple[int, int]:
+    """Return ``(count, first_index)`` of *query_lower* in *text_lower*.
+
+    Overlapping occurrences are counted, matching the original scanners.
+    ``first_index`` is ``-1`` when there is no match.
+    """
+    count = 0
+    first = text_lower.find(query_lower)
+    idx = first
+    while idx != -1:
+        count += 1
+        idx = text_lower.find(query_lower, idx + 1)
+    return count, first
+
+
+def make_snippet(
+    text: str,
+    query: str,
+    *,
+    before: int = 40,
+    after: int = 40,
+    ellipsis: bool = True,
+) -> str:
+    """Return a single-line excerpt of *text* around the first *query* hit."""
+    idx = text.lower().find(query.lower())
+    if idx < 0:
+        return text.replace("\n", " ")[: before + after]
+    start = max(0, idx - before)
+    end = min(len(text), idx + len(query) + after)
+    snippet = text[start:end].replace("\n", " ")
+    if not ellipsis:
+        return snippet
+    if start > 0:
+        snippet = "..." + snippet
+    if end < len(text):
+        snippet = snippet + "..."
+    return snippet
+
+
+def _parse_lines(raw: bytes) -> Iterator[tuple[str, str]]:
+    """Yield ``(role, text)`` for indexable messages in a block of JSONL."""
+    for line in raw.split(b"\n"):
+        if not line.strip():
+            continue
+        try:
+            msg = loads(line)
+        except DECODE_ERRORS:
+            continue
+        if not isinstance(msg, dict):
+            continue
+        role = msg.get("role", "")
+        if role not in _INDEXED_ROLES:
+            continue
+        text = extract_text(msg.get("content", ""))
+        if text:
+            yield role, text
+
+
+def _ends_line_at(path: Path, offset: int) -> bool:
+    """Return True if the byte before *offset* is still a newline.
+
+    A cheap sanity check that the prefix we already indexed was not
+    rewritten before the file grew.
+    """
+    if offset == 0:
+        return True
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(offset - 1)
+            return fh.read(1) == b"\n"
+    except OSError:
+        return False
+
+
+def _read_metadata(session_dir: Path) -> tuple[str, str]:
+    """Return ``(name, description)`` from a session's ``metadata.json``."""
+    try:
+        meta = json.loads((session_dir / "metadata.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return "", ""
+    if not isinstance(meta, dict):
+        return "", ""
+    return meta.get("name", "") or "", meta.get("description", "") or ""
+
+
+def _iter_transcripts(projects_dir: Path) -> Iterator[tuple[str, Path, Path]]:
+    """Yield ``(project_dir_name, session_dir, transcript)`` for root sessions."""
+    if not projects_dir.exists():
+        return
+    for project_dir in projects_dir.iterdir():
+        if not project_dir.is_dir():
+            continue
+        sessions_subdir = project_dir / "sessions"
+        if not sessions_subdir.is_dir():
+            continue
+        for session_dir in sessions_subdir.iterdir():
+            # Skip sub-sessions (agent delegations have _ in the ID).
+            if "_" in session_dir.name or not session_dir.is_dir():
+                continue
+            transcript = session_dir / "transcript.jsonl"
+            if transcript.exists():
+                yield project_dir.name, session_dir, transcript
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+class TranscriptIndex:
+    """Incremental SQLite full-text index of session transcripts.
+
+    Usage::
+
+        index = TranscriptIndex()
+        index.refresh()                 # cheap when nothing changed
+        for m in index.search("filter bug"):
+            print(m.session_id, m.match_count)
+
+    :meth:`search` refreshes the index first by default, so callers can
+    treat it as a drop-in replacement for a filesystem scan.  Interactive
+    callers pass ``refresh=False`` and rely on :meth:`refresh_in_background`.
+    """
+
+    DEFAULT_DB_PATH = amplifier_tui_file("tui-transcript-index.db")
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        projects_dir: Path | None = None,
+    ) -> None:
+        self._db_path = db_path or self.DEFAULT_DB_PATH
+        self._projects_dir = projects_dir or amplifier_projects_dir()
+        self._write_lock = threading.Lock()
+        self._fts: bool | None = None  # resolved on first connect
+        self._refreshed_at: float | None = None  # monotonic, last full refresh
+        self._refresh_thread: threading.Thread | None = None
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    @property
+    def ready(self) -> bool:
+        """True once a refresh has completed in this process."""
+        return self._refreshed_at is not None
+
+    @property
+    def uses_fts(self) -> bool:
+        """True when the SQLite build supports the FTS5 trigram tokenizer."""
+        if self._fts is None:
+            with self._connect():
+                pass
+        return bool(self._fts)
+
+    # -- connection management ---------------------------------------------
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=10.0)
+        try:
+            if self._fts is None:
+                self._init_schema(conn)
+            yield conn
+        finally:
+            conn.close()
+
+    def _init_schema(self, conn: sqlite3.Connection) -> None:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != _SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS messages")
+            conn.execute("DROP TABLE IF EXISTS sessions")
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.DatabaseError:
+            logger.debug("WAL mode unavailable for %s", self._db_path, exc_info=True)
+        conn.execute(_SCHEMA)
+        existing = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'messages'"
+        ).fetchone()
+        if existing is not None:
+            self._fts = "fts5" in (existing[0] or "").lower()
+        else:
+            try:
+                conn.execute(_FTS_TABLE)
+                self._fts = True
+            except sqlite3.OperationalError:
+                logger.debug("FTS5 trigram unavailable; using plain table")
+                conn.execute(_PLAIN_TABLE)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS messages_session "
+                    "ON messages(session_id)"
+                )
+                self._fts = False
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        conn.commit()
+
+    # -- indexing -------------------------------------------------------------
+
+    def refresh(self, max_age: float = 0.0) -> int:
+        """Bring the index up to date with the transcripts on disk.
+
+        Returns the number of sessions whose transcript was (re)read.
+        Unchanged transcripts cost a single ``stat`` each.  With *max_age*,
+        the refresh is skipped (returning 0) if the last one finished less
+        than *max_age* seconds ago.
+        """
+        if self._is_fresh(max_age):
+            return 0
+        with self._write_lock, self._connect() as conn:
+            if self._is_fresh(max_age):
+                return 0  # another thread refreshed while we waited
+            known = {
+                row[0]: row[1:]
+                for row in conn.execute(
+                    "SELECT session_id, mtime, size, offset, meta_mtime FROM sessions"
+                )
+            }
+            seen: set[str] = set()
+            updated = 0
+            for project_name, session_dir, transcript in _iter_transcripts(
+                self._projects_dir
+            ):
+                sid = session_dir.name
+                seen.add(sid)
+                try:
+                    st = transcript.stat()
+                except OSError:
+                    continue
+                if self._index_session(
+                    conn, sid, project_name, session_dir, transcript, st, known.get(sid)
+                ):
+                    updated += 1
+
+            stale = [sid for sid in known if sid not in seen]
+            for sid in stale:
+                self._drop_session(conn, sid)
+            conn.commit()
+            self._refreshed_at = time.monotonic()
+        if updated or stale:
+            logger.debug(
+                "transcript index: %d updated, %d removed", updated, len(stale)
+            )
+        return updated
+
+    def refresh_in_background(self, max_age: float = REFRESH_INTERVAL) -> bool:
+        """Start a throttled :meth:`refresh` on a daemon thread.
+
+        Returns False without doing anything if the index is younger than
+        *max_age* or a background refresh is already running.
+        """
+        if self._is_fresh(max_age):
+            return False
+        thread = self._refresh_thread
+        if thread is not None and thread.is_alive():
+            return False
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_quietly,
+            args=(max_age,),
+            name="transcript-index-refresh",
+            daemon=True,
+        )
+        self._refresh_thread.start()
+        return True
+
+    def _refresh_quietly(self, max_age: float) -> None:
+        try:
+            self.refresh(max_age)
+        except (OSError, sqlite3.Error):
+            logger.warning("transcript index refresh failed", exc_info=True)
+
+    def _is_fresh(self, max_age: float) -> bool:
+        refreshed = self._refreshed_at
+        return (
+            max_age > 0
+            and refreshed is not None
+            and time.monotonic() - refreshed < max_age
+        )
+
+    def _index_session(
+        self,
+        conn: sqlite3.Connection,
+        sid: str,
+        project_name: str,
+        session_dir: Path,
+        transcript: Path,
+        st: os.stat_result,
+        known: tuple[float, int, int, float] | None,
+    ) -> bool:
+        """Index new content of one transcript; return True if it was read."""
+        mtime, size = st.st_mtime, st.st_size
+        meta_path = session_dir / "metadata.json"
+        try:
+            meta_mtime = meta_path.stat().st_mtime
+        except OSError:
+            meta_mtime = 0.0
+
+        offset = 0
+        if known is not None:
+            old_mtime, old_size, old_offset, old_meta_mtime = known
+            if meta_mtime != old_meta_mtime:
+                name, desc = _read_metadata(session_dir)
+                conn.execute(
+                    "UPDATE sessions SET meta_mtime = ?, name = ?, description = ? "
+                    "WHERE session_id = ?",
+                    (meta_mtime, name, desc, sid),
+                )
+            if mtime == old_mtime and size == old_size:
+                return False
+            if size > old_size and _ends_line_at(transcript, old_offset):
+                offset = old_offset  # appended turns only
+            else:
+                # Shrunk or rewritten in place -- start over.
+                conn.execute("DELETE FROM messages WHERE session_id = ?", (sid,))
+        else:
+            name, desc = _read_metadata(session_dir)
+            conn.execute(
+                "INSERT INTO sessions (session_id, project_dir, transcript, "
+                "meta_mtime, name, description) VALUES (?, ?, ?, ?, ?, ?)",
+                (sid, project_name, str(transcript), meta_mtime, name, desc),
+            )
+
+        try:
+            with open(transcript, "rb") as fh:
+                fh.seek(offset)
+                raw = fh.read()
+        except OSError:
+            logger.debug("Failed to read %s", transcript, exc_info=True)
+            return False
+
+        # Only consume complete lines; a partially written tail line is
+        # picked up on the next refresh once its newline lands.
+        end = raw.rfind(b"\n") + 1
+        conn.executemany(
+            "INSERT INTO messages (session_id, role, text) VALUES (?, ?, ?)",
+            ((sid, role, text) for role, text in _parse_lines(raw[:end])),
+        )
+        conn.execute(
+            "UPDATE sessions SET project_dir = ?, transcript = ?, mtime = ?, "
+            "size = ?, offset = ? WHERE session_id = ?",
+            (project_name, str(transcript), mtime, size, offset + end, sid),
+        )
+        return True
+
+    @staticmethod
+    def _drop_session(conn: sqlite3.Connection, sid: str) -> None:
+        conn.execute("DELETE FROM messages WHERE session_id = ?", (sid,))
+        conn.execute("DELETE FROM sessions WHERE session_id = ?", (sid,))
+
+    def forget(self, session_id: str) -> None:
+        """Remove a session from the index (e.g. after it is deleted)."""
+        with self._write_lock, self._connect() as conn:
+            self._drop_session(conn, session_id)
+            conn.commit()
+
+    # -- querying -------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        *,
+        session_ids: Iterable[str] | None = None,
+        include_metadata: bool = True,
+        refresh: bool = True,
+        limit: int = 0,
+    ) -> list[IndexMatch]:
+        """Return per-session matches for *query*, most recent first.
+
+        Parameters
+        ----------
+        query:
+            Case-insensitive substring to look for in user/assistant text.
+        session_ids:
+            If given, restrict results to these sessions.
+        include_metadata:
+            Also match against the session's metadata name/description.
+        refresh:
+            Run :meth:`refresh` first so the results reflect the disk.
+        limit:
+            Maximum sessions to return (0 = unlimited).
+        """
+        query_lower = query.strip().lower()
+        if not query_lower:
+            return []
+        if refresh:
+            self.refresh()
+
+        wanted = set(session_ids) if session_ids is not None else None
+        with self._connect() as conn:
+            sessions = {
+                row[0]: row
+                for row in conn.execute(
+                    "SELECT session_id, project_dir, mtime, name, description "
+                    "FROM sessions"
+                )
+            }
+            if self._fts and len(query_lower) >= _MIN_FTS_QUERY:
+                phrase = '"' + query_lower.replace('"', '""') + '"'
+                rows = conn.execute(
+                    "SELECT session_id, role, text FROM messages "
+                    "WHERE messages MATCH ? ORDER BY rowid",
+                    (phrase,),
+                )
+            else:
+                rows = conn.execute(
+                    "SELECT session_id, role, text FROM messages "
+                    "WHERE instr(lower(text), ?) > 0 ORDER BY rowid",
+                    (query_lower,),
+                )
+
+            matches: dict[str, IndexMatch] = {}
+            for sid, role, text in rows:
+                if wanted is not None and sid not in wanted:
+                    continue
+                info = sessions.get(sid)
+                if info is None:
+                    continue
+                # The index narrows candidates; Python confirms the exact
+                # substring semantics (Unicode case folding included).
+                count, _ = count_matches(text.lower(), query_lower)
+                if not count:
+                    continue
+                m = matches.get(sid)
+                if m is None:
+                    m = matches[sid] = IndexMatch(
+                        session_id=sid,
+                        project_dir=info[1],
+                        mtime=info[2],
+                        name=info[3],
+                        description=info[4],
+                        first_role=role,
+                        first_text=text,
+                    )
+                m.match_count += count
+                m.last_role = role
+                m.last_text = text
+
+        if include_metadata:
+            for sid, project_dir, mtime, name, desc in sessions.values():
+                if wanted is not None and sid not in wanted:
+                    continue
+                field_hit = next(
+                    (f for f in (name, desc) if f and query_lower in f.lower()), ""
+                )
+                if not field_hit:
+                    continue
+                m = matches.get(sid)
+                if m is None:
+                    m = matches[sid] = IndexMatch(
+                        session_id=sid,
+                        project_dir=project_dir,
+                        mtime=mtime,
+                        name=name,
+                        description=desc,
+                        match_count=1,
+                    )
+                m.meta_match = field_hit
+
+        results = sorted(matches.values(), key=lambda m: m.mtime, reverse=True)
+        return results[:limit] if limit else results
+
+    def sessions(self) -> list[IndexMatch]:
+        """Return every indexed session (``match_count`` is 0), newest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT session_id, project_dir, mtime, name, description "
+                "FROM sessions ORDER BY mtime DESC"
+            ).fetchall()
+        return [
+            IndexMatch(
+                session_id=sid,
+                project_dir=project_dir,
+                mtime=mtime,
+                name=name,
+                description=desc,
+            )
+            for sid, project_dir, mtime, name, desc in rows
+        ]
+
+    def stats(self) -> dict[str, int]:
+        """Return ``{"sessions": n, "messages": n}`` for diagnostics."""
+        with self._connect() as conn:
+            n_sessions = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+            n_messages = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+        return {"sessions": n_sessions, "messages": n_messages}
@@ -0,0 +1,175 @@
+"""Coalescing queue for UI updates posted from streaming threads.
+
+Streaming callbacks run on the session's worker thread.  Each UI update
+they made was a separate ``call_from_thread``, which blocks the worker
+until the event loop has run it: a tool start cost four round trips (todo
+panel, agent tree, processing indicator, status bar), a tool end three
+more, a usage update two.  Tool-dense agent runs were throttled by UI
+latency.
+
+:class:`UiEventBus` lets the worker :meth:`~UiEventBus.post` updates
+without waiting.  They are queued per conversation and applied in order
+by :meth:`~UiEventBus.drain` on the main thread, at most once per *frame*.
+Updates posted with a *key* (status text, processing indicator, token
+display) replace a pending update with the same key, so only the latest
+one runs.  The bus asks for a drain through the injected *wake* callback
+once per batch; :attr:`~UiEventBus.stats` reports how long drains take.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from ..log import logger
+
+#: Minimum seconds between two drains (one frame at 60 fps).
+FRAME_SECONDS: float = 1 / 60
+
+
+@dataclass(frozen=True)
+class UiEventStats:
+    """Snapshot of bus activity."""
+
+    posted: int = 0
+    coalesced: int = 0  # updates replaced by a newer one with the same key
+    drains: int = 0
+    last_drain_ms: float = 0.0
+    avg_drain_ms: float = 0.0  # moving average
+    max_drain_ms: float = 0.0
+
+    def summary(self) -> str:
+        """One-line description for status displays."""
+        if not self.drains:
+            return "no UI updates yet"
+        return (
+            f"{self.posted} updates in {self.drains} frames "
+            f"({self.coalesced} merged), drain avg {self.avg_drain_ms:.1f} ms, "
+            f"max {self.max_drain_ms:.1f} ms"
+        )
+
+
+class _Event:
+    __slots__ = ("args", "callback", "kwargs", "live")
+
+    def __init__(
+        self, callback: Callable[..., Any], args: tuple, kwargs: dict[str, Any]
+    ) -> None:
+        self.callback = callback
+        self.args = args
+        self.kwargs = kwargs
+        self.live = True
+
+
+class UiEventBus:
+    """Per-conversation queue of UI updates, drained on the main thread.
+
+    *wake* is called (from any thread) when the first update of a batch is
+    posted; it must arrange for :meth:`drain` to run on the main thread.
+    """
+
+    def __init__(
+        self, wake: Callable[[], None], *, frame: float = FRAME_SECONDS
+    ) -> None:
+        self.frame = frame
+        self._wake = wake
+        self._lock = threading.Lock()
+        self._queues: dict[str, list[_Event]] = {}
+        self._keyed: dict[tuple[str, str], _Event] = {}
+        self._woken = False
+        self._last_drain = 0.0
+        self._posted = 0
+        self._coalesced = 0
+        self._drains = 0
+        self._last_ms = 0.0
+        self._avg_ms = 0.0
+        self._max_ms = 0.0
+
+    def post(
+        self,
+        conversation_id: str,
+        callback: Callable[..., Any],
+        /,
+        *args: Any,
+        key: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Queue ``callback(*args, **kwargs)`` for the next drain.
+
+        With *key*, a pending update of *conversation_id* with the same key
+        is dropped and this one is queued after everything posted so far.
+        """
+        event = _Event(callback, args, kwargs)
+        with self._lock:
+            if key is not None:
+                old = self._keyed.get((conversation_id, key))
+                if old is not None and old.live:
+                    old.live = False
+                    self._coalesced += 1
+                self._keyed[(conversation_id, key)] = event
+            self._queues.setdefault(conversation_id, []).append(event)
+            self._posted += 1
+            wake = not self._woken
+            self._woken = True
+        if wake:
+            self._wake()
+
+    def delay(self) -> float:
+        """Seconds until the next drain is due (0 = now)."""
+        return max(0.0, self._last_drain + self.frame - time.monotonic())
+
+    def pending(self) -> bool:
+        with self._lock:
+            return any(self._queues.values())
+
+    def drain(self) -> int:
+        """Run every queued update (main thread); return how many ran."""
+        start = time.monotonic()
+        with self._lock:
+            queues, self._queues = self._queues, {}
+            self._keyed.clear()
+            self._woken = False
+        ran = 0
+        for events in queues.values():
+            for event in events:
+                if not event.live:
+                    continue
+                try:
+                    event.callback(*event.args, **event.kwargs)
+                except Exception:  # noqa: BLE001 - one bad update must not stall the rest
+                    logger.debug("UI update %r failed", event.callback, exc_info=True)
+                ran += 1
+        end = time.monotonic()
+        self._last_drain = end
+        if ran:
+            ms = (end - start) * 1000
+            with self._lock:
+                self._drains += 1
+                self._last_ms = ms
+                self._avg_ms = (
+                    ms if self._drains == 1 else 0.9 * self._avg_ms + 0.1 * ms
+                )
+                self._max_ms = max(self._max_ms, ms)
+        return ran
+
+    def discard(self, conversation_id: str) -> None:
+        """Drop the pending updates of *conversation_id* (e.g. tab closed)."""
+        with self._lock:
+            self._queues.pop(conversation_id, None)
+            for key in [k for k in self._keyed if k[0] == conversation_id]:
+                del self._keyed[key]
+
+    @property
+    def stats(self) -> UiEventStats:
+        with self._lock:
+            return UiEventStats(
+                posted=self._posted,
+                coalesced=self._coalesced,
+                drains=self._drains,
+                last_drain_ms=self._last_ms,
+                avg_drain_ms=self._avg_ms,
+                max_drain_ms=self._max_ms,
+            )
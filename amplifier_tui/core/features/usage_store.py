@@ -0,0 +1,496 @@
+"""Columnar store of per-turn usage events for dashboard analytics.
+
+:class:`~.dashboard_stats.DashboardData` holds one record per session, so
+questions such as "tokens per project per week over the last six months"
+cannot be answered without re-reading every session.  :class:`UsageStore`
+keeps one row per ``llm:response`` (input/output tokens, model) and per
+``tool:pre`` (tool name) in parallel :mod:`array` columns:
+
+====== ======== ==========================================
+column typecode  value
+====== ======== ==========================================
+ts     ``d``    event time (epoch seconds)
+session ``I``   string-table index
+project ``I``   string-table index
+model  ``I``    string-table index
+input  ``I``    input tokens (0 for tool rows)
+output ``I``    output tokens (0 for tool rows)
+tool   ``I``    string-table index (0 = an LLM turn)
+====== ======== ==========================================
+
+On disk each column is a raw native-endian file (``<name>.col``) that can
+be mmapped or loaded with :meth:`array.frombytes`.  Next to the columns
+are an append-only string table and a small ``meta.json`` holding the
+committed row count and, per ``events.jsonl``, the byte offset already
+ingested and the last model seen (tool rows take it).  :meth:`UsageStore.sync_sessions` therefore reads only the bytes
+appended since the last sync.  Range queries bisect the time column, so
+they touch only the rows in the window.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .._json import DECODE_ERRORS, loads
+from ..log import logger
+from ..platform_info import reconstruct_project_path
+
+#: Bump when the on-disk layout changes; older stores are rebuilt.
+_STORE_VERSION: int = 1
+
+#: Column name -> :mod:`array` typecode.
+_COLUMNS: dict[str, str] = {
+    "ts": "d",
+    "session": "I",
+    "project": "I",
+    "model": "I",
+    "input": "I",
+    "output": "I",
+    "tool": "I",
+}
+
+#: Columns that :meth:`UsageStore.totals` and :meth:`UsageStore.series` group by.
+GROUP_COLUMNS: tuple[str, ...] = ("session", "project", "model", "tool")
+
+#: Only lines containing one of these are JSON-decoded during ingestion.
+_EVENT_MARKERS: tuple[bytes, ...] = (b'"llm:response"', b'"tool:pre"')
+
+#: Bytes read from an events file per chunk.
+_READ_BYTES: int = 1 << 20
+
+
+@dataclass
+class UsageTotals:
+    """Sums over a set of usage rows."""
+
+    turns: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    tool_calls: int = 0
+
+    @property
+    def tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+class UsageStore:
+    """Append-only usage columns with time-range queries.
+
+    *path* is the directory holding the column files; ``None`` keeps the
+    store in memory.  Instances are thread-safe.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path
+        self._lock = threading.RLock()
+        self._reset()
+        self._loaded = path is None
+
+    def _reset(self) -> None:
+        self._cols = {name: array(code) for name, code in _COLUMNS.items()}
+        self._strings: list[str] = [""]
+        self._string_ids: dict[str, int] = {"": 0}
+        self._offsets: dict[str, int] = {}
+        self._models: dict[str, str] = {}  # last model seen, per events file
+        self._order: array | None = None  # row ids by time, once out of order
+        self._sorted = True
+        self._max_ts = -math.inf
+        self._flushed_rows = 0
+        self._flushed_strings = 1
+        self._strings_size = 0  # committed bytes of strings.jsonl
+        self._dirty = False
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._cols["ts"])
+
+    # -- writing ----------------------------------------------------------
+
+    def append(
+        self,
+        ts: float,
+        *,
+        session: str,
+        project: str = "",
+        model: str = "",
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        tool: str = "",
+    ) -> None:
+        """Add one row (call :meth:`flush` to persist it)."""
+        with self._lock:
+            self._ensure_loaded()
+            self._append(ts, session, project, model, input_tokens, output_tokens, tool)
+
+    def _append(
+        self,
+        ts: float,
+        session: str,
+        project: str,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        tool: str,
+    ) -> None:
+        cols = self._cols
+        row = len(cols["ts"])
+        if ts >= self._max_ts:
+            self._max_ts = ts
+            if self._order is not None:
+                self._order.append(row)
+        else:
+            self._sorted = False
+            self._order = None
+        cols["ts"].append(ts)
+        cols["session"].append(self._intern(session))
+        cols["project"].append(self._intern(project))
+        cols["model"].append(self._intern(model))
+        cols["input"].append(max(0, input_tokens))
+        cols["output"].append(max(0, output_tokens))
+        cols["tool"].append(self._intern(tool))
+        self._dirty = True
+
+    def _intern(self, value: str) -> int:
+        index = self._string_ids.get(value)
+        if index is None:
+            index = self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+        return index
+
+    def ingest_events(self, path: Path, *, session: str, project: str) -> int:
+        """Add the usage rows appended to *path* (``events.jsonl``) since the
+        last call; return how many were added.
+
+        A trailing line without its newline is left for the next call.
+        """
+        key = str(path)
+        with self._lock:
+            self._ensure_loaded()
+            offset = self._offsets.get(key, 0)
+            try:
+                size = path.stat().st_size
+            except OSError:
+                return 0
+            if size == offset:
+                return 0
+            if size < offset:
+                # Rewritten: its earlier rows are already stored.
+                logger.debug("Events file shrank, skipping: %s", path)
+                self._offsets[key] = size
+                self._dirty = True
+                return 0
+            added = 0
+            model = self._models.get(key, "")
+            try:
+                with open(path, "rb") as fh:
+                    fh.seek(offset)
+                    pending = b""
+                    while chunk := fh.read(_READ_BYTES):
+                        data = pending + chunk
+                        cut = data.rfind(b"\n") + 1
+                        pending = data[cut:]
+                        for line in data[:cut].split(b"\n"):
+                            if not any(m in line for m in _EVENT_MARKERS):
+                                continue
+                            try:
+                                event = loads(line)
+                            except DECODE_ERRORS:
+                                continue
+                            if isinstance(event, dict):
+                                row, model = _usage_row(event, model)
+                                if row is not None:
+                                    self._append(row[0], session, project, *row[1:])
+                                    added += 1
+                        offset += cut
+            except OSError:
+                logger.debug("Failed to read %s", path, exc_info=True)
+            self._offsets[key] = offset
+            if model:
+                self._models[key] = model
+            self._dirty = True
+            return added
+
+    def sync_sessions(
+        self,
+        projects_dir: Path,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> int:
+        """Ingest new events from every ``<project>/sessions/<id>/events.jsonl``
+        under *projects_dir*, then :meth:`flush`; return the rows added.
+
+        *progress* is called with ``(checked, total)`` files.
+        """
+        paths = sorted(projects_dir.glob("*/sessions/*/events.jsonl"))
+        added = 0
+        for done, path in enumerate(paths, 1):
+            added += self.ingest_events(
+                path,
+                session=path.parent.name,
+                project=_project_name(path.parents[2].name),
+            )
+            if progress is not None:
+                progress(done, len(paths))
+        self.flush()
+        return added
+
+    # -- persistence ------------------------------------------------------
+
+    def flush(self) -> None:
+        """Append unsaved rows and strings to disk and commit them."""
+        with self._lock:
+            if self._path is None or not self._dirty:
+                return
+            rows = len(self._cols["ts"])
+            try:
+                self._path.mkdir(parents=True, exist_ok=True)
+                # Truncating first drops whatever a failed flush left behind.
+                for name, col in self._cols.items():
+                    with open(self._path / f"{name}.col", "ab") as fh:
+                        fh.truncate(self._flushed_rows * col.itemsize)
+                        fh.write(col[self._flushed_rows :].tobytes())
+                with open(self._path / "strings.jsonl", "ab") as fh:
+                    fh.truncate(self._strings_size)
+                    fh.writelines(
+                        json.dumps(value).encode() + b"\n"
+                        for value in self._strings[self._flushed_strings :]
+                    )
+                    strings_size = fh.tell()
+                # Columns first, then the row count that commits them.
+                meta = {
+                    "version": _STORE_VERSION,
+                    "byteorder": sys.byteorder,
+                    "rows": rows,
+                    "strings": len(self._strings),
+                    "offsets": self._offsets,
+                    "models": self._models,
+                }
+                tmp = self._path / "meta.tmp"
+                tmp.write_text(json.dumps(meta, separators=(",", ":")), "utf-8")
+                os.replace(tmp, self._path / "meta.json")
+            except OSError:
+                logger.debug("Failed to save usage store", exc_info=True)
+                return
+            self._flushed_rows = rows
+            self._flushed_strings = len(self._strings)
+            self._strings_size = strings_size
+            self._dirty = False
+
+    def clear(self) -> None:
+        """Drop every row and ingestion offset, on disk too."""
+        with self._lock:
+            self._reset()
+            self._loaded = True
+            if self._path is not None:
+                self._remove_files()
+
+    def _remove_files(self) -> None:
+        assert self._path is not None
+        for name in (*(f"{c}.col" for c in _COLUMNS), "strings.jsonl", "meta.json"):
+            try:
+                (self._path / name).unlink(missing_ok=True)
+            except OSError:
+                logger.debug("Failed to remove %s", name, exc_info=True)
+
+    def _ensure_loaded(self) -> None:
+        # Caller holds the lock.
+        if self._loaded:
+            return
+        self._loaded = True
+        assert self._path is not None
+        try:
+            meta = json.loads((self._path / "meta.json").read_text("utf-8"))
+        except FileNotFoundError:
+            self._remove_files()  # uncommitted leftovers
+            return
+        except (OSError, json.JSONDecodeError):
+            logger.debug("Discarding unreadable usage store", exc_info=True)
+            self._remove_files()
+            return
+        try:
+            if (
+                meta.get("version") != _STORE_VERSION
+                or meta.get("byteorder") != sys.byteorder
+            ):
+                raise ValueError("incompatible usage store")
+            self._load_columns(int(meta["rows"]), int(meta["strings"]))
+            self._offsets = {str(k): int(v) for k, v in meta["offsets"].items()}
+            self._models = {str(k): str(v) for k, v in meta.get("models", {}).items()}
+        except (AttributeError, KeyError, OSError, TypeError, ValueError):
+            logger.debug("Rebuilding usage store", exc_info=True)
+            self._reset()
+            self._remove_files()
+
+    def _load_columns(self, rows: int, strings: int) -> None:
+        assert self._path is not None
+        # Index 0 is always "" and is not stored.
+        with open(self._path / "strings.jsonl", "rb") as fh:
+            lines = [line for _, line in zip(range(strings - 1), fh)]
+        table = ["", *(json.loads(line) for line in lines)]
+        if len(table) != strings:
+            raise ValueError("truncated string table")
+        for name, col in self._cols.items():
+            path = self._path / f"{name}.col"
+            size = rows * col.itemsize
+            with open(path, "rb") as fh:
+                col.frombytes(fh.read(size))
+            if len(col) != rows:
+                raise ValueError(f"truncated column {name}")
+        if any(max(self._cols[name], default=0) >= strings for name in GROUP_COLUMNS):
+            raise ValueError("string index out of range")
+        self._strings = table
+        self._string_ids = {value: i for i, value in enumerate(table)}
+        ts = self._cols["ts"]
+        self._sorted = all(ts[i] <= ts[i + 1] for i in range(rows - 1))
+        self._max_ts = max(ts, default=-math.inf)
+        self._flushed_rows = rows
+        self._flushed_strings = strings
+        self._strings_size = sum(map(len, lines))
+
+    # -- queries ----------------------------------------------------------
+
+    def _rows(self, start: float | None, end: float | None) -> Sequence[int]:
+        """Row ids with ``start <= ts < end``, in time order."""
+        ts = self._cols["ts"]
+        if self._sorted:
+            lo = 0 if start is None else bisect_left(ts, start)
+            hi = len(ts) if end is None else bisect_left(ts, end)
+            return range(lo, hi)
+        if self._order is None:
+            self._order = array("I", sorted(range(len(ts)), key=ts.__getitem__))
+        order = self._order
+        lo = 0 if start is None else bisect_left(order, start, key=ts.__getitem__)
+        hi = len(order) if end is None else bisect_left(order, end, key=ts.__getitem__)
+        return order[lo:hi]
+
+    def totals(
+        self,
+        start: float | None = None,
+        end: float | None = None,
+        *,
+        by: str | None = None,
+    ) -> dict[str, UsageTotals]:
+        """:class:`UsageTotals` of the rows in ``[start, end)``, keyed by the
+        *by* column's value (a single ``""`` key when *by* is ``None``).
+        """
+        with self._lock:
+            self._ensure_loaded()
+            keys = self._group_column(by)
+            cols = self._cols
+            inp, out, tool = cols["input"], cols["output"], cols["tool"]
+            result: dict[int, UsageTotals] = {}
+            for i in self._rows(start, end):
+                k = keys[i] if keys is not None else 0
+                totals = result.get(k)
+                if totals is None:
+                    totals = result[k] = UsageTotals()
+                if tool[i]:
+                    totals.tool_calls += 1
+                else:
+                    totals.turns += 1
+                    totals.input_tokens += inp[i]
+                    totals.output_tokens += out[i]
+            return {self._strings[k]: v for k, v in result.items()}
+
+    def series(
+        self,
+        start: float,
+        end: float,
+        bucket_seconds: float,
+        *,
+        by: str | None = None,
+    ) -> dict[str, list[int]]:
+        """Tokens per *bucket_seconds* bucket of ``[start, end)``, keyed like
+        :meth:`totals`.
+        """
+        buckets = max(1, math.ceil((end - start) / bucket_seconds))
+        with self._lock:
+            self._ensure_loaded()
+            keys = self._group_column(by)
+            cols = self._cols
+            ts, inp, out = cols["ts"], cols["input"], cols["output"]
+            result: dict[int, list[int]] = {}
+            for i in self._rows(start, end):
+                k = keys[i] if keys is not None else 0
+                values = result.get(k)
+                if values is None:
+                    values = result[k] = [0] * buckets
+                values[int((ts[i] - start) // bucket_seconds)] += inp[i] + out[i]
+            return {self._strings[k]: v for k, v in result.items()}
+
+    def _group_column(self, by: str | None) -> array | None:
+        if by is None:
+            return None
+        if by not in GROUP_COLUMNS:
+            raise ValueError(f"cannot group usage by {by!r}")
+        return self._cols[by]
+
+
+def rolling_sum(values: Sequence[int], width: int) -> list[int]:
+    """Trailing sums of *width* consecutive *values* (shorter at the start)."""
+    result: list[int] = []
+    total = 0
+    for i, value in enumerate(values):
+        total += value
+        if i >= width:
+            total -= values[i - width]
+        result.append(total)
+    return result
+
+
+def _usage_row(
+    event: dict[str, Any], model: str
+) -> tuple[tuple[float, str, int, int, str] | None, str]:
+    """``((ts, model, input, output, tool) | None, model)`` for one event.
+
+    *model* is the session's last seen model, given to tool rows.
+    """
+    ts = _event_time(event.get("ts") or event.get("timestamp"))
+    data = event.get("data") or {}
+    if ts is None or not isinstance(data, dict):
+        return None, model
+    name = event.get("event")
+    if name == "llm:response":
+        usage = data.get("usage") or {}
+        model = data.get("model") or model
+        try:
+            inp = int(usage.get("input", 0) or 0)
+            out = int(usage.get("output", 0) or 0)
+        except (AttributeError, TypeError, ValueError):
+            return None, model
+        return (ts, model, inp, out, ""), model
+    if name == "tool:pre":
+        return (ts, model, 0, 0, str(data.get("tool_name") or "unknown")), model
+    return None, model
+
+
+def _event_time(value: Any) -> float | None:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _project_name(project_dir_name: str) -> str:
+    """Short project label for an encoded ``projects/`` directory name."""
+    try:
+        return Path(reconstruct_project_path(project_dir_name)).name or (
+            project_dir_name
+        )
+    except (ValueError, IndexError):
+        return project_dir_name
@@ -0,0 +1,308 @@
+"""Per-conversation message store with precomputed derived fields.
+
+Every displayed message is also kept in the conversation's search list,
+which the find bar, ``/search here``, ``/grep``, the status-bar token
+estimate, ``/context`` and ``/stats`` read.  As a bare list of
+``(role, text, widget)`` tuples, each of those re-lowercased, re-split or
+re-summed the whole conversation on every call -- the find bar once per
+keystroke.
+
+:class:`MessageStore` keeps a :class:`MessageRecord` per message with its
+lower-cased text, word count, token estimate and context category computed
+once, plus running totals (tokens per category, tokens, characters and
+counts per role, topic-word frequencies) that are adjusted as messages are added,
+replaced or removed.  Records still unpack and index like the tuples they
+replace, so ``for role, text, widget in store`` keeps working.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Iterator, MutableSequence
+from typing import Any, overload
+
+from .features.context_profiler import _classify_role, estimate_tokens
+from .features.tokenizer import count_tokens_many
+
+#: Words ignored by :meth:`MessageStore.top_words`.
+_STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "to",
+        "of",
+        "in",
+        "for",
+        "on",
+        "with",
+        "at",
+        "by",
+        "from",
+        "it",
+        "this",
+        "that",
+        "and",
+        "or",
+        "but",
+        "not",
+        "no",
+        "i",
+        "you",
+        "we",
+        "they",
+        "he",
+        "she",
+        "my",
+        "your",
+        "do",
+        "does",
+        "did",
+        "have",
+        "has",
+        "had",
+        "will",
+        "would",
+        "can",
+        "could",
+        "should",
+        "if",
+        "as",
+        "so",
+        "up",
+        "out",
+        "just",
+        "also",
+        "very",
+        "all",
+        "any",
+        "some",
+        "me",
+        "its",
+        "than",
+        "then",
+        "into",
+        "about",
+        "more",
+        "when",
+        "what",
+        "how",
+        "which",
+        "there",
+        "their",
+        "them",
+        "these",
+        "those",
+        "other",
+        "each",
+        "here",
+        "where",
+        "being",
+        "both",
+        "same",
+        "own",
+        "such",
+    }
+)
+
+_WORD_STRIP = ".,!?:;\"'()[]{}#`*_-/\\"
+
+#: Roles whose words count towards :meth:`MessageStore.top_words`.
+_TOPIC_ROLES = frozenset({"user", "assistant"})
+
+
+def topic_words(text: str) -> list[str]:
+    """Meaningful lower-cased words of *text* (no stop words, letters only)."""
+    words: list[str] = []
+    for word in text.lower().split():
+        word = word.strip(_WORD_STRIP)
+        if len(word) > 2 and word not in _STOP_WORDS and word.isalpha():
+            words.append(word)
+    return words
+
+
+class MessageRecord:
+    """One message plus the fields derived from its text.
+
+    Unpacks and indexes like a ``(role, text, widget)`` tuple.
+    """
+
+    __slots__ = ("category", "lower", "role", "text", "tokens", "widget", "words")
+
+    def __init__(
+        self, role: str, text: str, widget: Any = None, tokens: int | None = None
+    ) -> None:
+        text = text or ""
+        self.role = role
+        self.text = text
+        self.widget = widget
+        self.lower = text.lower()
+        self.words = len(text.split())
+        self.tokens = estimate_tokens(text) if tokens is None else tokens
+        self.category = _classify_role(role)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter((self.role, self.text, self.widget))
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, index: int) -> Any:
+        return (self.role, self.text, self.widget)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (MessageRecord, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"MessageRecord({self.role!r}, {self.text[:30]!r}, {self.widget!r})"
+
+
+class MessageStore(MutableSequence):
+    """Ordered :class:`MessageRecord` list with running totals.
+
+    Accepts ``(role, text, widget)`` tuples wherever a record is expected.
+    Totals are updated on every insert, replacement and deletion, so reading
+    them is O(1).
+    """
+
+    def __init__(self, entries: Iterable[Any] = ()) -> None:
+        self._records: list[MessageRecord] = []
+        self.total_tokens = 0
+        self.category_tokens: Counter[str] = Counter()
+        self.role_chars: Counter[str] = Counter()
+        self.role_tokens: Counter[str] = Counter()
+        self.role_counts: Counter[str] = Counter()
+        self._topic_words: Counter[str] = Counter()
+        self.extend(entries)
+
+    # -- MutableSequence ------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @overload
+    def __getitem__(self, index: int) -> MessageRecord: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[MessageRecord]: ...
+    def __getitem__(self, index: int | slice) -> Any:
+        return self._records[index]
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            new = [_as_record(v) for v in value]
+            old = self._records[index]
+        else:
+            new = [_as_record(value)]
+            old = [self._records[index]]
+        self._records[index] = new if isinstance(index, slice) else new[0]
+        for record in old:
+            self._count(record, -1)
+        for record in new:
+            self._count(record, 1)
+
+    def __delitem__(self, index: int | slice) -> None:
+        old = self._records[index]
+        del self._records[index]
+        for record in old if isinstance(index, slice) else [old]:
+            self._count(record, -1)
+
+    def insert(self, index: int, value: Any) -> None:
+        record = _as_record(value)
+        self._records.insert(index, record)
+        self._count(record, 1)
+
+    def __iter__(self) -> Iterator[MessageRecord]:
+        return iter(self._records)
+
+    def __reversed__(self) -> Iterator[MessageRecord]:
+        return reversed(self._records)
+
+    def __repr__(self) -> str:
+        return f"MessageStore({len(self._records)} messages)"
+
+    # -- Fast paths -----------------------------------------------------
+
+    def append(self, value: Any) -> None:
+        record = _as_record(value)
+        self._records.append(record)
+        self._count(record, 1)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        # Count tokens for the whole batch at once (e.g. a loaded transcript).
+        entries = [v if isinstance(v, MessageRecord) else tuple(v) for v in values]
+        pending = [e for e in entries if not isinstance(e, MessageRecord)]
+        counts = iter(count_tokens_many([text or "" for _r, text, _w in pending]))
+        for entry in entries:
+            if not isinstance(entry, MessageRecord):
+                role, text, widget = entry
+                entry = MessageRecord(role, text, widget, next(counts))
+            self.append(entry)
+
+    def clear(self) -> None:
+        self._records.clear()
+        self.total_tokens = 0
+        self.category_tokens.clear()
+        self.role_chars.clear()
+        self.role_tokens.clear()
+        self.role_counts.clear()
+        self._topic_words.clear()
+
+    def set_widget(self, index: int, widget: Any) -> None:
+        """Point entry *index* at *widget* (derived fields are unchanged)."""
+        self._records[index].widget = widget
+
+    def replace_text(self, widget: Any, text: str) -> bool:
+        """Replace the text of the newest entry shown by *widget*."""
+        for i in range(len(self._records) - 1, -1, -1):
+            record = self._records[i]
+            if record.widget is widget:
+                self[i] = MessageRecord(record.role, text, widget)
+                return True
+        return False
+
+    def find(self, query: str, *, case_sensitive: bool = False) -> list[int]:
+        """Indices of the entries containing *query*."""
+        if case_sensitive:
+            return [i for i, r in enumerate(self._records) if query in r.text]
+        q = query.lower()
+        return [i for i, r in enumerate(self._records) if q in r.lower]
+
+    def top_words(self, n: int = 10) -> list[tuple[str, int]]:
+        """The *n* most frequent topic words of user and assistant messages."""
+        return self._topic_words.most_common(n)
+
+    def _count(self, record: MessageRecord, sign: int) -> None:
+        self.total_tokens += sign * record.tokens
+        self.category_tokens[record.category] += sign * record.tokens
+        self.role_chars[record.role] += sign * len(record.text)
+        self.role_tokens[record.role] += sign * record.tokens
+        self.role_counts[record.role] += sign
+        if record.role in _TOPIC_ROLES and record.text:
+            words = Counter(topic_words(record.text))
+            if sign > 0:
+                self._topic_words.update(words)
+            else:
+                topic = self._topic_words
+                for word, count in words.items():
+                    left = topic[word] - count
+                    if left > 0:
+                        topic[word] = left
+                    else:
+                        del topic[word]
+
+
+def _as_record(value: Any) -> MessageRecord:
+    if isinstance(value, MessageRecord):
+        return value
+    role, text, widget = value
+    return MessageRecord(role, text, widget)
@@ -1,15 +1,90 @@
-"""Base JSON persistence store."""
+"""Base JSON persistence store.
+
+Key design decisions
+--------------------
+* **In-memory copy** -- each store keeps its parsed file contents and only
+  re-reads the file when its ``(mtime_ns, size, inode)`` signature changes,
+  so another process (a second TUI, the web server) writing the file is
+  still picked up.  Accessors cost one ``stat`` instead of read + parse.
+* **Copy on load** -- ``load_raw()`` hands out a deep copy because callers
+  mutate the result before passing it back to ``save_raw()``.  Read-only
+  hot paths use ``view_raw()`` to skip the copy.
+* **Write-behind** -- once :meth:`JsonStore.enable_write_behind` has been
+  called (the TUI does this at startup), ``save_raw()`` only updates the
+  in-memory copy and marks the store dirty; a single background thread
+  coalesces bursts of mutations into one write per store.  Without it,
+  writes are synchronous (CLI tools, tests).
+* **Atomic writes** -- every flush writes a temp file in the same directory
+  and ``os.replace``-s it over the target, so readers never see a
+  half-written file.  :meth:`JsonStore.flush_all` runs synchronously on
+  quit (and from ``atexit`` as a safety net).
+"""
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
+import os
+import tempfile
+import threading
+import time
 from pathlib import Path
 
 from ..log import logger
 
+#: Seconds a dirty store waits for further mutations before it is flushed.
+WRITE_BEHIND_DELAY: float = 0.5
+
+
+class _Flusher:
+    """Background thread that writes dirty stores after a short delay."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self._cond = threading.Condition()
+        self._dirty: dict[int, tuple[float, JsonStore]] = {}
+        self._thread = threading.Thread(
+            target=self._run, name="jsonstore-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def schedule(self, store: JsonStore) -> None:
+        with self._cond:
+            # Keep the first deadline so a steady stream of writes still
+            # reaches disk at least every ``delay`` seconds.
+            self._dirty.setdefault(id(store), (time.monotonic() + self.delay, store))
+            self._cond.notify()
+
+    def flush_all(self) -> None:
+        with self._cond:
+            stores = [store for _, store in self._dirty.values()]
+            self._dirty.clear()
+        for store in stores:
+            store._flush_quietly()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._dirty:
+                    self._cond.wait()
+                now = time.monotonic()
+                due = [k for k, (deadline, _) in self._dirty.items() if deadline <= now]
+                if not due:
+                    next_deadline = min(d for d, _ in self._dirty.values())
+                    self._cond.wait(next_deadline - now)
+                    continue
+                stores = [self._dirty.pop(k)[1] for k in due]
+            for store in stores:
+                store._flush_quietly()
+
+
+_flusher: _Flusher | None = None
+_flusher_lock = threading.Lock()
+
 
 class JsonStore:
-    """Simple JSON file store with atomic write.
+    """JSON file store with an mtime-validated in-memory copy and atomic writes.
 
     Subclasses override ``_default()`` to provide the empty-state value
     (``{}`` for dicts, ``[]`` for lists).
@@ -17,25 +92,119 @@ class JsonStore:
 
     def __init__(self, path: Path) -> None:
         self.path = path
+        self._lock = threading.RLock()
+        self._cache: dict | list | None = None
+        self._cache_sig: tuple[int, int, int] | None = None
+        self._pending_sort_keys: bool | None = None  # not None => unflushed
+
+    # -- write-behind control -------------------------------------------------
+
+    @staticmethod
+    def enable_write_behind(delay: float = WRITE_BEHIND_DELAY) -> None:
+        """Defer and coalesce writes on a background thread (process-wide)."""
+        global _flusher
+        with _flusher_lock:
+            if _flusher is None:
+                _flusher = _Flusher(delay)
+                atexit.register(JsonStore.flush_all)
+
+    @staticmethod
+    def flush_all() -> None:
+        """Synchronously write every store with unflushed changes."""
+        if _flusher is not None:
+            _flusher.flush_all()
 
     # -- core I/O -------------------------------------------------------------
 
-    def load_raw(self) -> dict | list:
-        """Read and parse the JSON file, returning ``_default()`` on any error."""
+    def _signature(self) -> tuple[int, int, int] | None:
         try:
-            if self.path.exists():
-                return json.loads(self.path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            logger.debug("failed to load JSON store from %s", self.path, exc_info=True)
-        return self._default()
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _cached(self) -> dict | list | None:
+        """Return the shared parsed data, or ``None`` if missing/unreadable."""
+        with self._lock:
+            if self._pending_sort_keys is not None:
+                return self._cache
+            sig = self._signature()
+            if sig is None:
+                self._cache, self._cache_sig = None, None
+                return None
+            if sig != self._cache_sig:
+                try:
+                    self._cache = json.loads(self.path.read_text(encoding="utf-8"))
+                except (OSError, json.JSONDecodeError):
+                    logger.debug(
+                        "failed to load JSON store from %s", self.path, exc_info=True
+                    )
+                    self._cache = None
+                self._cache_sig = sig
+            return self._cache
+
+    def exists(self) -> bool:
+        """Return whether the store has data (on disk or pending a flush)."""
+        with self._lock:
+            return self._pending_sort_keys is not None or self.path.exists()
+
+    def view_raw(self) -> dict | list:
+        """Return the cached data without copying.  Callers must not mutate it."""
+        data = self._cached()
+        return self._default() if data is None else data
+
+    def load_raw(self) -> dict | list:
+        """Return a private copy of the data, or ``_default()`` on any error."""
+        data = self._cached()
+        return self._default() if data is None else copy.deepcopy(data)
 
     def save_raw(self, data: dict | list, *, sort_keys: bool = False) -> None:
-        """Write *data* as pretty-printed JSON, creating parents as needed."""
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False, sort_keys=sort_keys),
-            encoding="utf-8",
-        )
+        """Replace the stored data with *data* and persist it.
+
+        With write-behind enabled the file is written shortly afterwards on
+        the flusher thread; otherwise it is written before returning.
+        """
+        with self._lock:
+            self._cache = copy.deepcopy(data)
+            self._pending_sort_keys = sort_keys
+        if _flusher is not None:
+            _flusher.schedule(self)
+        else:
+            self.flush()
+
+    def flush(self) -> None:
+        """Atomically write pending changes to disk (no-op if clean)."""
+        with self._lock:
+            if self._pending_sort_keys is None:
+                return
+            text = json.dumps(
+                self._cache,
+                indent=2,
+                ensure_ascii=False,
+                sort_keys=self._pending_sort_keys,
+            )
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(tmp, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+            self._pending_sort_keys = None
+            self._cache_sig = self._signature()
+
+    def _flush_quietly(self) -> None:
+        try:
+            self.flush()
+        except OSError:
+            logger.warning("failed to write JSON store %s", self.path, exc_info=True)
 
     # -- override point -------------------------------------------------------
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from ._base import JsonStore
@@ -30,9 +29,11 @@ class NoteStore(JsonStore):
         """Persist *notes* for *session_id*, pruning to 50 sessions max."""
         sid = session_id or "default"
         try:
-            all_notes: dict[str, list[dict]] = {}
-            if self.path.exists():
-                all_notes = json.loads(self.path.read_text(encoding="utf-8"))
+            # Start from the in-memory copy: with write-behind the file on
+            # disk may not have caught up with earlier saves yet.
+            all_notes = self.load_raw()
+            if not isinstance(all_notes, dict):
+                all_notes = {}
             if notes:
                 all_notes[sid] = notes
             elif sid in all_notes:
@@ -43,5 +44,5 @@ class NoteStore(JsonStore):
                 for k in keys[:-50]:
                     del all_notes[k]
             self.save_raw(all_notes)
-        except (OSError, json.JSONDecodeError):
+        except OSError:
             logger.debug("failed to save notes for session %s", sid, exc_info=True)
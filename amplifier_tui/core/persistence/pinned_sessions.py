@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from ._base import JsonStore
@@ -21,13 +20,9 @@ class PinnedSessionStore(JsonStore):
     def load(self) -> set[str]:
         """Load pinned session IDs from disk."""
         try:
-            if self.path.exists():
-                data = json.loads(self.path.read_text(encoding="utf-8"))
-                return set(data)
-        except (OSError, json.JSONDecodeError):
-            logger.debug(
-                "failed to load pinned sessions from %s", self.path, exc_info=True
-            )
+            return set(self.view_raw())
+        except TypeError:
+            logger.debug("malformed pinned sessions in %s", self.path, exc_info=True)
         return set()
 
     def save(self, session_ids: set[str]) -> None:
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from ._base import JsonStore
@@ -30,9 +29,11 @@ class MessagePinStore(JsonStore):
         """Persist *pins* for *session_id*, pruning to 50 sessions max."""
         sid = session_id or "default"
         try:
-            all_pins: dict[str, list[dict]] = {}
-            if self.path.exists():
-                all_pins = json.loads(self.path.read_text(encoding="utf-8"))
+            # Start from the in-memory copy: with write-behind the file on
+            # disk may not have caught up with earlier saves yet.
+            all_pins = self.load_raw()
+            if not isinstance(all_pins, dict):
+                all_pins = {}
             if pins:
                 all_pins[sid] = pins
             elif sid in all_pins:
@@ -43,5 +44,5 @@ class MessagePinStore(JsonStore):
                 for k in keys[:-50]:
                     del all_pins[k]
             self.save_raw(all_pins)
-        except (OSError, json.JSONDecodeError):
+        except OSError:
             logger.debug("failed to save pins for session %s", sid, exc_info=True)
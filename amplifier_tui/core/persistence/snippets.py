@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 
@@ -62,8 +61,8 @@ class SnippetStore(JsonStore):
     def load(self) -> dict[str, dict[str, str]]:
         """Load snippets, migrating old format and seeding defaults on first run."""
         try:
-            if self.path.exists():
-                raw = json.loads(self.path.read_text(encoding="utf-8"))
+            if self._cached() is not None:  # present and parseable
+                raw = self.load_raw()
                 migrated = self._migrate(raw)
                 if migrated is not raw:
                     # Re-persist in the new format
@@ -30,9 +30,13 @@ class TagStore(JsonStore):
         """Persist session tags to disk."""
         self.save_raw(data, sort_keys=True)
 
+    def _view(self) -> dict[str, list[str]]:
+        raw = self.view_raw()
+        return raw if isinstance(raw, dict) else {}
+
     def get_tags(self, session_id: str) -> list[str]:
         """Return the tags for *session_id* (empty list if none)."""
-        return self.load().get(session_id, [])
+        return list(self._view().get(session_id, []))
 
     def add_tag(self, session_id: str, tag: str) -> bool:
         """Add *tag* to *session_id*. Return ``False`` if already present."""
@@ -63,7 +67,7 @@ class TagStore(JsonStore):
 
     def all_tags(self) -> dict[str, int]:
         """Return ``{tag: count}`` across all sessions, sorted by count desc."""
-        data = self.load()
+        data = self._view()
         counter: Counter[str] = Counter()
         for tags in data.values():
             counter.update(tags)
@@ -72,5 +76,5 @@ class TagStore(JsonStore):
     def sessions_with_tag(self, tag: str) -> list[str]:
         """Return session IDs that have *tag*."""
         tag = self._normalize(tag)
-        data = self.load()
+        data = self._view()
         return [sid for sid, tags in data.items() if tag in tags]
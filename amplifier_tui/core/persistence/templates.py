@@ -41,7 +41,7 @@ class TemplateStore(JsonStore):
     def load(self) -> dict[str, str]:
         """Load templates, seeding defaults on first run."""
         try:
-            if self.path.exists():
+            if self.exists():
                 return self.load_raw()  # type: ignore[return-value]
         except OSError:
             logger.debug("failed to load templates from %s", self.path, exc_info=True)
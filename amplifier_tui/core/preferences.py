@@ -360,6 +360,7 @@ autosave:
 
 environment:
   workspace: ""                   # root directory for your projects (e.g. ~/dev/ANext)
+  session_pool: 0                 # idle sessions kept started so new tabs open instantly (0 = off)
 
 # Custom themes: define your own color themes here.
 # Each key becomes a theme name usable with /theme <name>.
@@ -449,6 +450,7 @@ class EnvironmentPreferences:
     """Environment paths and configuration."""
 
     workspace: str = ""  # Root directory for projects (e.g. ~/dev/ANext)
+    session_pool: int = 0  # Idle pre-started sessions per directory (0 = off)
 
 
 @dataclass
@@ -620,6 +622,10 @@ def load_preferences(path: Path | None = None) -> Preferences:
                 edata = data["environment"]
                 if "workspace" in edata:
                     prefs.environment.workspace = str(edata["workspace"] or "")
+                if "session_pool" in edata:
+                    prefs.environment.session_pool = max(
+                        0, min(4, int(edata["session_pool"] or 0))
+                    )
             # Load user-defined custom themes into the module-level dicts
             if isinstance(data.get("custom_themes"), dict):
                 _load_custom_themes(data["custom_themes"])
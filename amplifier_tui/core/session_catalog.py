@@ -0,0 +1,430 @@
+"""Cached catalog of Amplifier sessions on disk.
+
+Listing sessions, resolving a session ID (or prefix) to its directory, and
+locating a transcript all used to walk every project and session directory
+under ``~/.amplifier/projects`` and json-load every ``metadata.json``.  The
+:class:`SessionCatalog` keeps that information in memory, persists it to
+``~/.amplifier/tui-session-catalog.json`` between runs, and revalidates it
+cheaply.
+
+Revalidation tiers
+------------------
+1. ``projects/`` mtime -- re-list project directories only when one was
+   added or removed.
+2. ``<project>/sessions/`` mtime -- re-list a project's sessions only when
+   a session directory was added or removed there.
+3. ``transcript.jsonl`` / ``metadata.json`` mtimes (listing only) -- two
+   ``stat`` calls per root session; the transcript mtime gives the recency
+   ordering and ``metadata.json`` is re-read only when its own mtime moved
+   (a rename does not touch the transcript).
+
+ID and prefix lookups need tiers 1–2 only, so they cost O(projects) stats
+plus the re-listing of directories that actually changed.
+
+Directory mtimes that are younger than :data:`_RACY_WINDOW_SECONDS` at
+scan time are not trusted (a second change within the same timestamp tick
+would go unnoticed), so such directories are re-listed next time.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, ClassVar
+
+from .log import logger
+from .platform_info import (
+    amplifier_home,
+    amplifier_tui_file,
+    reconstruct_project_path,
+)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Bump when the persisted layout changes; older caches are discarded.
+_CACHE_VERSION: int = 2
+
+#: Directory mtimes this recent are treated as "unknown" (see module doc).
+_RACY_WINDOW_SECONDS: float = 2.0
+
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class CatalogEntry:
+    """One session directory known to the catalog."""
+
+    session_id: str
+    session_dir: Path
+    project_dir_name: str  # encoded directory name under projects/
+    mtime: float = 0.0  # transcript mtime (0 = not yet validated / missing)
+    meta_mtime: float = 0.0  # metadata.json mtime when name/description were read
+    name: str = ""
+    description: str = ""
+
+    @property
+    def is_root(self) -> bool:
+        """Sub-sessions (agent delegations) have ``_`` in their ID."""
+        return "_" not in self.session_id
+
+    @property
+    def transcript_path(self) -> Path:
+        return self.session_dir / "transcript.jsonl"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the dict shape produced by ``SessionManager.list_all_sessions``."""
+        project_path, project_label = _project_label(self.project_dir_name)
+        return {
+            "session_id": self.session_id,
+            "project": project_label,
+            "project_path": project_path,
+            "mtime": self.mtime,
+            "date_str": datetime.fromtimestamp(self.mtime).strftime("%m/%d %H:%M"),
+            "name": self.name,
+            "description": self.description,
+        }
+
+
+@dataclass
+class _ProjectState:
+    """Cached listing of one ``<project>/sessions`` directory."""
+
+    mtime: float = 0.0
+    sessions: dict[str, CatalogEntry] | None = None
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _project_label(raw_name: str) -> tuple[str, str]:
+    """Return ``(project_path, project_label)`` for an encoded directory name."""
+    try:
+        project_path = reconstruct_project_path(raw_name)
+        return project_path, Path(project_path).name
+    except (ValueError, IndexError):
+        logger.debug("Failed to parse project path from %s", raw_name, exc_info=True)
+        return raw_name, raw_name[:20]
+
+
+def _stat_mtime(path: Path) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _trusted(mtime: float, now: float) -> float:
+    """Return *mtime*, or 0.0 if it is too recent to rely on."""
+    return mtime if now - mtime > _RACY_WINDOW_SECONDS else 0.0
+
+
+def _read_metadata(session_dir: Path) -> tuple[str, str]:
+    """Return ``(name, description)`` from ``metadata.json``."""
+    metadata_path = session_dir / "metadata.json"
+    try:
+        with open(metadata_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        return "", ""
+    except (OSError, json.JSONDecodeError):
+        logger.debug("Failed to read session metadata %s", metadata_path, exc_info=True)
+        return "", ""
+    if not isinstance(meta, dict):
+        return "", ""
+    return meta.get("name", "") or "", meta.get("description", "") or ""
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+class SessionCatalog:
+    """Persistent, incrementally revalidated index of session directories.
+
+    Usage::
+
+        catalog = SessionCatalog.for_dir(amplifier_projects_dir())
+        recent = catalog.list_sessions(limit=50)   # list[CatalogEntry]
+        matches = catalog.match_prefix("7de3")     # exact ID or prefix
+
+    Instances are thread-safe; :meth:`for_dir` returns one shared instance
+    per projects directory so every caller benefits from the same cache.
+    """
+
+    _instances: ClassVar[dict[Path, SessionCatalog]] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, projects_dir: Path, cache_path: Path | None = None) -> None:
+        self._projects_dir = projects_dir
+        self._cache_path = cache_path
+        self._lock = threading.RLock()
+        self._projects_mtime: float = 0.0
+        self._projects: dict[str, _ProjectState] = {}
+        self._dirty = False
+        self._loaded = False
+
+    @classmethod
+    def for_dir(cls, projects_dir: Path) -> SessionCatalog:
+        """Return the shared catalog for *projects_dir*.
+
+        Only the real ``~/.amplifier/projects`` catalog is persisted to disk;
+        catalogs for other directories (tests, tools) live in memory.
+        """
+        with cls._instances_lock:
+            catalog = cls._instances.get(projects_dir)
+            if catalog is None:
+                cache_path = None
+                if projects_dir == amplifier_home() / "projects":
+                    cache_path = amplifier_tui_file("tui-session-catalog.json")
+                catalog = cls._instances[projects_dir] = cls(projects_dir, cache_path)
+            return catalog
+
+    @property
+    def projects_dir(self) -> Path:
+        return self._projects_dir
+
+    # -- persistence ----------------------------------------------------------
+
+    def _load_cache(self) -> None:
+        self._loaded = True
+        if self._cache_path is None:
+            return
+        try:
+            raw = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError):
+            logger.debug("Ignoring unreadable session catalog", exc_info=True)
+            return
+        if not isinstance(raw, dict) or raw.get("version") != _CACHE_VERSION:
+            return
+        try:
+            self._projects_mtime = float(raw.get("projects_mtime", 0.0))
+            for pname, pdata in raw.get("projects", {}).items():
+                sessions_dir = self._projects_dir / pname / "sessions"
+                self._projects[pname] = _ProjectState(
+                    mtime=float(pdata.get("mtime", 0.0)),
+                    sessions={
+                        sid: CatalogEntry(
+                            session_id=sid,
+                            session_dir=sessions_dir / sid,
+                            project_dir_name=pname,
+                            mtime=float(s[0]),
+                            name=s[1],
+                            description=s[2],
+                            meta_mtime=float(s[3]),
+                        )
+                        for sid, s in pdata.get("sessions", {}).items()
+                    },
+                )
+        except (AttributeError, IndexError, TypeError, ValueError):
+            logger.debug("Discarding malformed session catalog", exc_info=True)
+            self._projects_mtime = 0.0
+            self._projects = {}
+
+    def save(self) -> None:
+        """Write the catalog to its cache file if anything changed."""
+        with self._lock:
+            if self._cache_path is None or not self._dirty:
+                return
+            data = {
+                "version": _CACHE_VERSION,
+                "projects_mtime": self._projects_mtime,
+                "projects": {
+                    pname: {
+                        "mtime": state.mtime,
+                        "sessions": {
+                            sid: [e.mtime, e.name, e.description, e.meta_mtime]
+                            for sid, e in (state.sessions or {}).items()
+                        },
+                    }
+                    for pname, state in self._projects.items()
+                },
+            }
+            tmp = self._cache_path.with_suffix(".tmp")
+            try:
+                self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(
+                    json.dumps(data, separators=(",", ":")), encoding="utf-8"
+                )
+                os.replace(tmp, self._cache_path)
+                self._dirty = False
+            except OSError:
+                logger.debug("Failed to save session catalog", exc_info=True)
+
+    def invalidate(self) -> None:
+        """Forget all cached directory state (next call re-lists everything)."""
+        with self._lock:
+            self._projects_mtime = 0.0
+            for state in self._projects.values():
+                state.mtime = 0.0
+            self._dirty = True
+
+    # -- revalidation (tiers 1 & 2) -------------------------------------------
+
+    def _revalidate_dirs(self) -> None:
+        """Re-list project and session directories whose mtime changed."""
+        if not self._loaded:
+            self._load_cache()
+
+        now = time.time()
+        projects_mtime = _stat_mtime(self._projects_dir)
+        if projects_mtime is None:
+            if self._projects:
+                self._projects = {}
+                self._dirty = True
+            return
+
+        if projects_mtime != self._projects_mtime:
+            try:
+                names = {
+                    e.name
+                    for e in os.scandir(self._projects_dir)
+                    if e.is_dir(follow_symlinks=True)
+                }
+            except OSError:
+                names = set(self._projects)
+            for gone in set(self._projects) - names:
+                del self._projects[gone]
+            for pname in names:
+                self._projects.setdefault(pname, _ProjectState())
+            self._projects_mtime = _trusted(projects_mtime, now)
+            self._dirty = True
+
+        for pname, state in list(self._projects.items()):
+            sessions_dir = self._projects_dir / pname / "sessions"
+            mtime = _stat_mtime(sessions_dir)
+            if mtime is None:
+                if state.sessions:
+                    state.sessions = {}
+                    self._dirty = True
+                state.mtime = 0.0
+                continue
+            if state.sessions is not None and mtime == state.mtime:
+                continue
+            self._relist_project(pname, state, sessions_dir)
+            state.mtime = _trusted(mtime, now)
+            self._dirty = True
+
+    def _relist_project(
+        self, pname: str, state: _ProjectState, sessions_dir: Path
+    ) -> None:
+        old = state.sessions or {}
+        fresh: dict[str, CatalogEntry] = {}
+        try:
+            for e in os.scandir(sessions_dir):
+                if not e.is_dir(follow_symlinks=True):
+                    continue
+                fresh[e.name] = old.get(e.name) or CatalogEntry(
+                    session_id=e.name,
+                    session_dir=sessions_dir / e.name,
+                    project_dir_name=pname,
+                )
+        except OSError:
+            logger.debug("Failed to list %s", sessions_dir, exc_info=True)
+            fresh = dict(old)
+        state.sessions = fresh
+
+    def _iter_entries(self) -> list[CatalogEntry]:
+        return [
+            entry
+            for state in self._projects.values()
+            for entry in (state.sessions or {}).values()
+        ]
+
+    # -- queries --------------------------------------------------------------
+
+    def entries(self, *, roots_only: bool = True) -> list[CatalogEntry]:
+        """Return catalogued sessions without checking transcript mtimes."""
+        with self._lock:
+            self._revalidate_dirs()
+            result = self._iter_entries()
+            self.save()
+        if roots_only:
+            result = [e for e in result if e.is_root]
+        return result
+
+    def list_sessions(self, limit: int = 50) -> list[CatalogEntry]:
+        """Return up to *limit* root sessions with a transcript, newest first.
+
+        Each root session costs a ``stat`` of its transcript and of its
+        ``metadata.json``; metadata is re-read only when the latter changed.
+        """
+        with self._lock:
+            self._revalidate_dirs()
+            live = [
+                entry
+                for entry in self._iter_entries()
+                if entry.is_root and self.refresh_entry(entry)
+            ]
+            self.save()
+
+        live.sort(key=lambda e: e.mtime, reverse=True)
+        return live[:limit] if limit else live
+
+    def refresh_entry(self, entry: CatalogEntry) -> bool:
+        """Re-stat *entry*'s transcript; return False if it has none.
+
+        ``metadata.json`` is re-read only when its own mtime moved, so a
+        rename shows up without waiting for the next turn.
+        """
+        mtime = _stat_mtime(entry.transcript_path)
+        with self._lock:
+            if mtime is None:
+                if entry.mtime:
+                    entry.mtime = 0.0
+                    self._dirty = True
+                return False
+            if mtime != entry.mtime:
+                entry.mtime = mtime
+                self._dirty = True
+        meta_mtime = _stat_mtime(entry.session_dir / "metadata.json") or 0.0
+        with self._lock:
+            if meta_mtime != entry.meta_mtime:
+                entry.meta_mtime = meta_mtime
+                entry.name, entry.description = _read_metadata(entry.session_dir)
+                self._dirty = True
+        return True
+
+    def get(self, session_id: str) -> CatalogEntry | None:
+        """Return the entry for an exact *session_id* (root or sub-session)."""
+        with self._lock:
+            self._revalidate_dirs()
+            self.save()
+            for state in self._projects.values():
+                entry = (state.sessions or {}).get(session_id)
+                if entry is not None:
+                    return entry
+        return None
+
+    def match_prefix(self, prefix: str) -> list[CatalogEntry]:
+        """Return entries whose ID equals or starts with *prefix*.
+
+        An exact match, if any, is returned alone.
+        """
+        exact = self.get(prefix)
+        if exact is not None:
+            return [exact]
+        with self._lock:
+            return [e for e in self._iter_entries() if e.session_id.startswith(prefix)]
+
+    def find_transcript(self, session_id: str) -> Path | None:
+        """Locate ``transcript.jsonl`` for an exact ID or ID prefix."""
+        for entry in self.match_prefix(session_id):
+            transcript = entry.transcript_path
+            if transcript.exists():
+                return transcript
+        return None
@@ -10,22 +10,37 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
 import uuid
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from .features.session_pool import PoolStats, SessionPool
+from .features.tokenizer import token_counter
 from .log import logger
-from .platform_info import (
-    amplifier_projects_dir,
-    reconstruct_project_path,
-)
+from .platform_info import amplifier_projects_dir
+from .session_catalog import SessionCatalog
 
 if TYPE_CHECKING:
     from amplifier_core import AmplifierSession
 
+_SETTINGS_PATH = Path("~/.amplifier/settings.yaml")
+
+# Parsed settings.yaml, keyed by the file's (mtime_ns, size).
+_settings_cache: tuple[tuple[int, int], dict[str, Any]] | None = None
+_settings_lock = threading.Lock()
+
+
+def _settings_stamp() -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` of ``settings.yaml``, or *None* if missing."""
+    try:
+        st = _SETTINGS_PATH.expanduser().stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 @dataclass
 class SessionHandle:
@@ -48,6 +63,10 @@ class SessionHandle:
     # subsequent delta/end events (which may lack the field) inherit it.
     _active_block_types: dict[int, str] = field(default_factory=dict)
 
+    # Text of the blocks completed since the last llm:response, used to
+    # calibrate the token estimate against the reported output tokens.
+    _response_text: list[str] = field(default_factory=list)
+
     # --- Per-session streaming callbacks ---
     on_content_block_start: Callable[[str, int], None] | None = None
     on_content_block_delta: Callable[[str, str], None] | None = None
@@ -70,6 +89,7 @@ class SessionHandle:
         self.total_output_tokens = 0
         self.model_name = ""
         self.context_window = 0
+        self._response_text.clear()
 
     def _on_stream(self, event: str, data: dict[str, Any]) -> None:
         """Dispatch bridge streaming events to THIS handle's callbacks.
@@ -107,6 +127,11 @@ class SessionHandle:
             )
             # Clean up tracking state.
             self._active_block_types.pop(block_index, None)
+            if block.get("input"):  # tool_use: its arguments are output too
+                self._response_text.append(json.dumps(block["input"]))
+            self._response_text.append(
+                block.get("thinking", "") or block.get("text", "")
+            )
             if block_type in ("thinking", "reasoning") and self.on_content_block_end:
                 text = block.get("thinking", "") or block.get("text", "")
                 self.on_content_block_end("thinking", text)
@@ -138,6 +163,12 @@ class SessionHandle:
             if usage:
                 self.total_input_tokens += usage.get("input", 0)
                 self.total_output_tokens += usage.get("output", 0)
+                if self._response_text:
+                    token_counter.calibrate(
+                        token_counter.raw_count("".join(self._response_text)),
+                        usage.get("output", 0),
+                    )
+            self._response_text.clear()
             model = data.get("model", "")
             if model and not self.model_name:
                 self.model_name = model
@@ -155,8 +186,10 @@ class SessionManager:
 
     def __init__(self) -> None:
         self._bridge: Any | None = None
+        self._bridge_lock = threading.Lock()
         self._handles: dict[str, SessionHandle] = {}
         self._default_conversation_id: str | None = None
+        self._pool: SessionPool | None = None
 
     # ------------------------------------------------------------------
     # Registry API
@@ -343,11 +376,12 @@ class SessionManager:
 
     def _get_bridge(self) -> Any:
         """Lazily create the LocalBridge singleton."""
-        if self._bridge is None:
-            from amplifier_distro.bridge import LocalBridge
+        with self._bridge_lock:  # the session pool starts sessions concurrently
+            if self._bridge is None:
+                from amplifier_distro.bridge import LocalBridge
 
-            self._bridge = LocalBridge()
-        return self._bridge
+                self._bridge = LocalBridge()
+            return self._bridge
 
     # ------------------------------------------------------------------
     # Settings helpers
@@ -355,17 +389,28 @@ class SessionManager:
 
     @staticmethod
     def _read_settings() -> dict[str, Any]:
-        """Read ``~/.amplifier/settings.yaml``, returning ``{}`` if missing."""
-        settings_path = Path("~/.amplifier/settings.yaml").expanduser()
-        if not settings_path.exists():
+        """Read ``~/.amplifier/settings.yaml``, returning ``{}`` if missing.
+
+        The parsed file is cached until its mtime or size changes; callers
+        must not modify the returned dict.
+        """
+        global _settings_cache
+        stamp = _settings_stamp()
+        if stamp is None:
             return {}
+        with _settings_lock:
+            if _settings_cache is not None and _settings_cache[0] == stamp:
+                return _settings_cache[1]
         try:
             import yaml  # noqa: PLC0415 – deferred import
 
-            return yaml.safe_load(settings_path.read_text()) or {}
+            settings = yaml.safe_load(_SETTINGS_PATH.expanduser().read_text()) or {}
         except Exception:  # noqa: BLE001
             logger.debug("Failed to read settings.yaml", exc_info=True)
             return {}
+        with _settings_lock:
+            _settings_cache = (stamp, settings)
+        return settings
 
     @staticmethod
     def _expand_env_vars(value: Any) -> Any:
@@ -452,10 +497,10 @@ class SessionManager:
         """Start a new Amplifier session, returning its SessionHandle.
 
         If conversation_id is None, an ID is auto-generated and this handle
-        becomes the default (backward compat).
+        becomes the default (backward compat).  With a session pool
+        enabled, an idle pre-started session for *cwd* is used if one is
+        ready.
         """
-        from amplifier_distro.bridge import BridgeConfig  # noqa: PLC0415
-
         auto_generated = conversation_id is None
         if auto_generated:
             conversation_id = str(uuid.uuid4())
@@ -463,7 +508,29 @@ class SessionManager:
         if cwd is None:
             cwd = Path.cwd()
 
-        handle = SessionHandle(conversation_id=conversation_id)
+        handle = self._pool.take(cwd) if self._pool else None
+        if handle is None:
+            handle = await self._create_handle(cwd)
+        handle.conversation_id = conversation_id
+
+        if model_override:
+            self._switch_model_on_handle(handle, model_override)
+
+        handle.reset_usage()
+        self._extract_model_info_on_handle(handle)
+
+        self._handles[conversation_id] = handle
+
+        if auto_generated:
+            self._default_conversation_id = conversation_id
+
+        return handle
+
+    async def _create_handle(self, cwd: Path) -> SessionHandle:
+        """Create a bridge session in *cwd*, not yet bound to a conversation."""
+        from amplifier_distro.bridge import BridgeConfig  # noqa: PLC0415
+
+        handle = SessionHandle()
 
         bridge = self._get_bridge()
         config = BridgeConfig(
@@ -479,19 +546,37 @@ class SessionManager:
 
         # Mount providers from settings.yaml if the bundle didn't include any
         await self._mount_providers_from_settings(handle.session)
+        return handle
 
-        if model_override:
-            self._switch_model_on_handle(handle, model_override)
+    # ------------------------------------------------------------------
+    # Session pool
+    # ------------------------------------------------------------------
 
-        handle.reset_usage()
-        self._extract_model_info_on_handle(handle)
+    def enable_pool(self, size: int, cwd: Path | None = None) -> None:
+        """Keep *size* idle sessions ready per directory (0 turns it off).
 
-        self._handles[conversation_id] = handle
+        The pool starts filling for *cwd* (default: the current directory)
+        right away, and for any other directory once a session is started
+        there.  Pooled sessions started before ``settings.yaml`` changed
+        are discarded.
+        """
+        self.close_pool(timeout=0)
+        if size > 0:
+            self._pool = SessionPool(
+                self._create_handle, self._end_handle, size=size, stamp=_settings_stamp
+            )
+            self._pool.prewarm(cwd or Path.cwd())
 
-        if auto_generated:
-            self._default_conversation_id = conversation_id
+    def close_pool(self, timeout: float | None = None) -> None:
+        """End the idle pooled sessions (waits up to *timeout* seconds)."""
+        if self._pool is not None:
+            self._pool.close(timeout)
+            self._pool = None
 
-        return handle
+    @property
+    def pool_stats(self) -> PoolStats | None:
+        """Session pool statistics, or *None* when no pool is enabled."""
+        return self._pool.stats if self._pool else None
 
     async def resume_session(
         self,
@@ -556,6 +641,16 @@ class SessionManager:
                 self._default_conversation_id = None
             return
 
+        await self._end_handle(handle)
+
+        handle.session = None
+        handle._bridge_handle = None
+        self._handles.pop(cid, None)
+        if self._default_conversation_id == cid:
+            self._default_conversation_id = None
+
+    async def _end_handle(self, handle: SessionHandle) -> None:
+        """End *handle*'s bridge session, logging instead of raising."""
         try:
             if handle._bridge_handle:
                 bridge = self._get_bridge()
@@ -577,12 +672,6 @@ class SessionManager:
         except Exception:  # noqa: BLE001
             logger.debug("Failed to end session via bridge", exc_info=True)
 
-        handle.session = None
-        handle._bridge_handle = None
-        self._handles.pop(cid, None)
-        if self._default_conversation_id == cid:
-            self._default_conversation_id = None
-
     async def send_message(
         self,
         message: str,
@@ -610,71 +699,11 @@ class SessionManager:
             session_id, project, project_path, mtime, date_str, name, description
         Sorted by mtime descending (most recent first).
         Only includes root sessions (skips sub-sessions with _ in ID).
+        Served from the shared :class:`SessionCatalog`, so only directories
+        that changed since the last call are re-listed.
         """
-        sessions_dir = amplifier_projects_dir()
-        if not sessions_dir.exists():
-            return []
-
-        results: list[dict[str, Any]] = []
-        for project_dir in sessions_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-            sessions_subdir = project_dir / "sessions"
-            if not sessions_subdir.exists():
-                continue
-
-            # Reconstruct the original path from the directory name
-            raw_name = project_dir.name
-            try:
-                project_path = reconstruct_project_path(raw_name)
-                project_label = Path(project_path).name
-            except (ValueError, IndexError):
-                logger.debug(
-                    "Failed to parse project path from %s", raw_name, exc_info=True
-                )
-                project_path = raw_name
-                project_label = raw_name[:20]
-
-            for session_dir in sessions_subdir.iterdir():
-                if not session_dir.is_dir():
-                    continue
-                # Skip sub-sessions (they have _ in the session ID)
-                if "_" in session_dir.name:
-                    continue
-                transcript_path = session_dir / "transcript.jsonl"
-                if not transcript_path.exists():
-                    continue
-
-                # Use transcript mtime for accurate "last activity" sorting.
-                mtime = transcript_path.stat().st_mtime
-                info: dict[str, Any] = {
-                    "session_id": session_dir.name,
-                    "project": project_label,
-                    "project_path": project_path,
-                    "mtime": mtime,
-                    "date_str": datetime.fromtimestamp(mtime).strftime("%m/%d %H:%M"),
-                    "name": "",
-                    "description": "",
-                }
-
-                # Read metadata for name and description
-                metadata_path = session_dir / "metadata.json"
-                if metadata_path.exists():
-                    try:
-                        with open(metadata_path, encoding="utf-8") as f:
-                            meta = json.load(f)
-                            info["name"] = meta.get("name", "")
-                            info["description"] = meta.get("description", "")
-                    except (OSError, json.JSONDecodeError):
-                        logger.debug(
-                            "Failed to read session metadata %s",
-                            metadata_path,
-                            exc_info=True,
-                        )
-                results.append(info)
-
-        results.sort(key=lambda x: x["mtime"], reverse=True)
-        return results[:limit]
+        catalog = SessionCatalog.for_dir(amplifier_projects_dir())
+        return [entry.as_dict() for entry in catalog.list_sessions(limit=limit)]
 
     def _find_most_recent_session(self) -> str:
         """Return the session_id of the most recently modified session.
@@ -690,26 +719,9 @@ class SessionManager:
     def get_session_transcript_path(session_id: str) -> Path | None:
         """Locate the ``transcript.jsonl`` file for *session_id*.
 
-        Scans all project directories under ``~/.amplifier/projects/``.
+        Looks the ID up in the shared :class:`SessionCatalog`.
         Supports prefix matching (e.g. first 8 chars of a UUID).
         """
-        projects_dir = amplifier_projects_dir()
-        if not projects_dir.exists():
-            return None
-
-        for project_dir in projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-            sessions_subdir = project_dir / "sessions"
-            if not sessions_subdir.exists():
-                continue
-            for session_dir in sessions_subdir.iterdir():
-                if not session_dir.is_dir():
-                    continue
-                if session_dir.name == session_id or session_dir.name.startswith(
-                    session_id
-                ):
-                    transcript = session_dir / "transcript.jsonl"
-                    if transcript.exists():
-                        return transcript
-        return None
+        return SessionCatalog.for_dir(amplifier_projects_dir()).find_transcript(
+            session_id
+        )
@@ -2,21 +2,79 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Iterator
+
+from ._json import DECODE_ERRORS, loads
+
+#: Bytes read per step when scanning a transcript backwards.
+_CHUNK_BYTES = 64 * 1024
+
+
+def _parts_text(content: Any) -> str:
+    """Flatten a message ``content`` value (string or list of parts) to text."""
+    if isinstance(content, list):
+        return "\n".join(
+            p.get("text", "")
+            for p in content
+            if isinstance(p, dict) and p.get("type") == "text"
+        )
+    return str(content)
 
 
-@dataclass
 class DisplayBlock:
-    """A renderable block from a transcript message."""
+    """A renderable block from a transcript message.
+
+    ``tool_input`` is the decoded transcript value itself (never copied or
+    re-serialized here).  Tool results keep their raw ``content`` value and
+    are flattened to text the first time :attr:`content` is read, so a
+    replay only pays for the (often huge) results it actually renders.
+    """
+
+    __slots__ = ("_content", "kind", "tool_id", "tool_input", "tool_name")
 
-    kind: str  # "text", "thinking", "tool_use", "tool_result", "user"
-    content: str = ""
-    tool_name: str = ""
-    tool_input: dict = field(default_factory=dict)
-    tool_id: str = ""
+    def __init__(
+        self,
+        kind: str,  # "text", "thinking", "tool_use", "tool_result", "user"
+        content: Any = "",
+        tool_name: str = "",
+        tool_input: dict | None = None,
+        tool_id: str = "",
+    ) -> None:
+        self.kind = kind
+        self._content = content
+        self.tool_name = tool_name
+        self.tool_input = tool_input if tool_input is not None else {}
+        self.tool_id = tool_id
+
+    @property
+    def content(self) -> str:
+        content = self._content
+        if not isinstance(content, str):
+            content = self._content = _parts_text(content)
+        return content
+
+    @property
+    def materialized(self) -> bool:
+        """Whether :attr:`content` has been flattened to text yet."""
+        return isinstance(self._content, str)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DisplayBlock):
+            return NotImplemented
+        return (
+            self.kind == other.kind
+            and self.content == other.content
+            and self.tool_name == other.tool_name
+            and self.tool_input == other.tool_input
+            and self.tool_id == other.tool_id
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"DisplayBlock(kind={self.kind!r}, tool_name={self.tool_name!r}, "
+            f"tool_id={self.tool_id!r})"
+        )
 
 
 def load_transcript(transcript_path: Path) -> Iterator[dict]:
@@ -29,10 +87,80 @@ def load_transcript(transcript_path: Path) -> Iterator[dict]:
             if not line.strip():
                 continue
             try:
-                msg = json.loads(line)
+                msg = loads(line)
+            except DECODE_ERRORS:
+                continue
+            if isinstance(msg, dict):
                 yield msg
-            except json.JSONDecodeError:
+
+
+class TranscriptTailReader:
+    """Read a transcript.jsonl backwards, newest messages first.
+
+    Like ``session_scanner._tail_lines`` it seeks from the end of the file
+    instead of reading it whole, so resuming a long session can show the
+    last turns immediately and load older history in batches.
+
+    The end offset is fixed when the reader is created: messages appended
+    later (by the resumed session itself) are never returned.
+    """
+
+    def __init__(self, transcript_path: Path, chunk_size: int = _CHUNK_BYTES) -> None:
+        self._path = transcript_path
+        self._chunk_size = max(1, chunk_size)
+        try:
+            self._pos = transcript_path.stat().st_size
+        except OSError:
+            self._pos = 0
+        self._carry = b""  # partial first line of the last chunk read
+        self._pending: list[bytes] = []  # complete lines not yet returned
+
+    @property
+    def exhausted(self) -> bool:
+        """True once every message before the end offset has been returned."""
+        return self._pos == 0 and not self._carry and not self._pending
+
+    def read_older(self, max_messages: int) -> list[dict]:
+        """Return up to *max_messages* messages preceding those already read.
+
+        Messages are returned in file (oldest-first) order.  Malformed lines
+        are skipped, as in :func:`load_transcript`.
+        """
+        lines = self._pending
+        if len(lines) < max_messages and self._pos > 0:
+            try:
+                with open(self._path, "rb") as fh:
+                    while len(lines) < max_messages and self._pos > 0:
+                        start = max(0, self._pos - self._chunk_size)
+                        fh.seek(start)
+                        data = fh.read(self._pos - start) + self._carry
+                        self._pos = start
+                        parts = data.split(b"\n")
+                        if start > 0:
+                            self._carry = parts.pop(0)
+                        else:
+                            self._carry = b""
+                        lines = [p for p in parts if p.strip()] + lines
+            except OSError:
+                self._pos = 0
+                self._carry = b""
+
+        count = max(0, max_messages)
+        if count >= len(lines):
+            batch, self._pending = lines, []
+        else:
+            split = len(lines) - count
+            batch, self._pending = lines[split:], lines[:split]
+
+        messages: list[dict] = []
+        for line in batch:
+            try:
+                msg = loads(line)
+            except DECODE_ERRORS:
                 continue
+            if isinstance(msg, dict):
+                messages.append(msg)
+        return messages
 
 
 def parse_message_blocks(msg: dict) -> list[DisplayBlock]:
@@ -85,33 +213,22 @@ def parse_message_blocks(msg: dict) -> list[DisplayBlock]:
                     )
 
                 elif btype == "tool_result":
-                    # Tool results come as separate messages but may be inline
-                    result_content = block.get("content", "")
-                    if isinstance(result_content, list):
-                        parts = [
-                            p.get("text", "")
-                            for p in result_content
-                            if p.get("type") == "text"
-                        ]
-                        result_content = "\n".join(parts)
+                    # Tool results come as separate messages but may be inline;
+                    # their text is flattened lazily (see DisplayBlock).
                     blocks.append(
                         DisplayBlock(
                             kind="tool_result",
-                            content=str(result_content),
+                            content=block.get("content", ""),
                             tool_id=block.get("tool_use_id", ""),
                         )
                     )
 
     elif role == "tool":
         # Tool result messages (separate from assistant)
-        content = msg.get("content", "")
-        if isinstance(content, list):
-            parts = [p.get("text", "") for p in content if p.get("type") == "text"]
-            content = "\n".join(parts)
         blocks.append(
             DisplayBlock(
                 kind="tool_result",
-                content=str(content),
+                content=msg.get("content", ""),
                 tool_id=msg.get("tool_use_id", ""),
             )
         )
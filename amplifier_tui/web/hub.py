@@ -0,0 +1,170 @@
+"""Process-wide hub of web conversations shared by WebSocket clients.
+
+Each WebSocket used to get a ``WebApp`` of its own: a new
+``SessionManager``, every plugin loaded again, preferences and a dozen
+JSON stores re-read, and the Amplifier session ended on disconnect.  A
+reload lost the conversation and a second browser tab could not see it.
+
+:class:`SessionHub` owns the conversations instead.  A client attaches to
+one by id (``/ws?conversation=<id>``) or gets a new one; every attached
+client receives the conversation's events, fanned out from the single
+producer (the turn's streaming thread) through a bounded per-client queue.
+A slow client therefore never stalls the stream or the other clients: one
+that falls :data:`CLIENT_QUEUE_SIZE` events behind is disconnected and can
+reattach.  A conversation nobody is attached to is kept for
+*idle_timeout* seconds, then its session is ended.  Preferences, plugins
+and stores are loaded once per process and shared by all conversations
+(see :class:`~amplifier_tui.web.web_app.WebResources`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from .stream_protocol import STREAM_MODE_DELTA, STREAM_MODE_FULL
+
+if TYPE_CHECKING:
+    from .web_app import WebApp
+
+logger = logging.getLogger(__name__)
+
+#: Events a client may fall behind by before it is disconnected.
+CLIENT_QUEUE_SIZE: int = 1000
+
+#: Seconds a conversation without clients is kept before its session ends.
+IDLE_TIMEOUT: float = 15 * 60.0
+
+
+class WebClient:
+    """One attached WebSocket: its stream mode and outgoing event queue.
+
+    :meth:`send` and :meth:`close` must be called on the event loop;
+    :meth:`run` is the task that writes the queue to the socket.
+    """
+
+    def __init__(self, websocket: Any, *, queue_size: int = CLIENT_QUEUE_SIZE) -> None:
+        self.websocket = websocket
+        self.stream_mode = STREAM_MODE_FULL
+        self.dropped = False  # fell too far behind
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(
+            max(1, queue_size)
+        )
+
+    def set_stream_mode(self, mode: str) -> None:
+        """Select the streaming wire format requested by the client."""
+        if mode in (STREAM_MODE_FULL, STREAM_MODE_DELTA):
+            self.stream_mode = mode
+        else:
+            logger.debug("Unknown stream mode %r; keeping %s", mode, self.stream_mode)
+
+    def send(self, event: dict[str, Any]) -> None:
+        """Queue *event*; disconnect the client if its queue is full."""
+        if self.dropped:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.info("Web client fell %d events behind", self._queue.maxsize)
+            self.dropped = True
+            self.close()
+
+    def close(self) -> None:
+        """Stop :meth:`run` once the events already queued are written."""
+        if self._queue.full():  # dropped: what is queued is no use any more
+            while not self._queue.empty():
+                self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def run(self) -> None:
+        """Write queued events to the socket until closed."""
+        while True:
+            event = await self._queue.get()
+            if event is None:
+                break
+            try:
+                await self.websocket.send_json(event)
+            except Exception:
+                logger.debug("WebSocket send failed", exc_info=True)
+                return
+        if self.dropped:
+            try:
+                await self.websocket.close(code=1013)  # try again later
+            except Exception:
+                logger.debug("WebSocket close failed", exc_info=True)
+
+
+class SessionHub:
+    """Conversations by id, shared by every client attached to them.
+
+    *factory* creates the :class:`WebApp` for a new conversation.  All
+    methods run on the server's event loop.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], WebApp],
+        *,
+        idle_timeout: float = IDLE_TIMEOUT,
+    ) -> None:
+        self._factory = factory
+        self._idle_timeout = idle_timeout
+        self._apps: dict[str, WebApp] = {}
+        self._expiry: dict[str, asyncio.Task] = {}
+
+    def attach(
+        self, websocket: Any, conversation_id: str = ""
+    ) -> tuple[WebApp, WebClient, bool]:
+        """Attach *websocket* to a conversation.
+
+        Returns the conversation's app, the new client and whether the
+        conversation was created (an unknown or expired id gets a new one).
+        """
+        app = self._apps.get(conversation_id) if conversation_id else None
+        created = app is None
+        if app is None:
+            app = self._factory()
+            self._apps[app.conversation_id] = app
+        expiry = self._expiry.pop(app.conversation_id, None)
+        if expiry is not None:
+            expiry.cancel()
+        client = WebClient(websocket)
+        app.attach(client)
+        return app, client, created
+
+    def detach(self, app: WebApp, client: WebClient) -> None:
+        """Detach *client*; start the idle timer if it was the last one."""
+        app.detach(client)
+        client.close()
+        cid = app.conversation_id
+        if not app.clients and cid in self._apps and cid not in self._expiry:
+            self._expiry[cid] = asyncio.create_task(self._expire(cid))
+
+    async def _expire(self, conversation_id: str) -> None:
+        app = self._apps[conversation_id]
+        await asyncio.sleep(self._idle_timeout)
+        while app.busy:  # let a running turn finish first
+            await asyncio.sleep(1.0)
+        del self._expiry[conversation_id]
+        del self._apps[conversation_id]
+        await app.shutdown()
+
+    async def close(self) -> None:
+        """End every conversation (server shutdown)."""
+        for task in self._expiry.values():
+            task.cancel()
+        self._expiry.clear()
+        apps = list(self._apps.values())
+        self._apps.clear()
+        for app in apps:
+            await app.shutdown()
+
+    def stats(self) -> dict[str, int]:
+        """Counts for ``/api/hub``."""
+        return {
+            "conversations": len(self._apps),
+            "clients": sum(app.clients for app in self._apps.values()),
+            "idle": len(self._expiry),
+        }
@@ -1,8 +1,16 @@
-"""FastAPI server for the Amplifier web frontend."""
+"""FastAPI server for the Amplifier web frontend.
+
+WebSocket clients attach to conversations held by a process-wide
+:class:`~amplifier_tui.web.hub.SessionHub`; see that module.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
@@ -11,7 +19,8 @@ from fastapi.staticfiles import StaticFiles
 
 from amplifier_tui.core.session_manager import SessionManager
 
-from .web_app import WebApp
+from .hub import IDLE_TIMEOUT, SessionHub
+from .web_app import WebApp, WebResources
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +29,23 @@ _TEMPLATES = _HERE / "templates"
 _STATIC = _HERE / "static"
 
 
-def create_app(resume_session_id: str | None = None) -> FastAPI:
-    """Create and configure the FastAPI application."""
-    app = FastAPI(title="Amplifier Web")
+def create_app(
+    resume_session_id: str | None = None, *, idle_timeout: float = IDLE_TIMEOUT
+) -> FastAPI:
+    """Create and configure the FastAPI application.
+
+    Conversations outlive their WebSockets; one without clients is ended
+    after *idle_timeout* seconds.
+    """
+    hub = SessionHub(partial(WebApp, WebResources.load()), idle_timeout=idle_timeout)
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        yield
+        await hub.close()
+
+    app = FastAPI(title="Amplifier Web", lifespan=lifespan)
+    app.state.hub = hub
 
     # Serve static files (app.js, style.css)
     app.mount("/static", StaticFiles(directory=str(_STATIC)), name="static")
@@ -69,22 +92,34 @@ def create_app(resume_session_id: str | None = None) -> FastAPI:
             )
         return {"sessions": sessions}
 
+    @app.get("/api/hub")
+    async def hub_stats() -> dict:
+        """Conversations and attached clients held by the session hub."""
+        return hub.stats()
+
     @app.websocket("/ws")
     async def websocket_endpoint(ws: WebSocket) -> None:
-        """Bidirectional WebSocket for chat."""
+        """Bidirectional WebSocket for chat.
+
+        ``?conversation=<id>`` attaches to an existing conversation; without
+        it (or for an expired id) a new one is created.
+        """
         await ws.accept()
-        web_app = WebApp(ws)
+        web_app, client, created = hub.attach(
+            ws, ws.query_params.get("conversation", "")
+        )
+        writer = asyncio.create_task(client.run())
 
         try:
-            await web_app.initialize()
-
-            # If resuming a session, do it now
-            if resume_session_id:
+            # A new conversation resumes the requested session
+            if created and resume_session_id:
                 try:
                     sid = resume_session_id
                     if sid == "__most_recent__":
                         sid = web_app.session_manager._find_most_recent_session()
-                    await web_app.session_manager.resume_session(sid)
+                    await web_app.session_manager.resume_session(
+                        sid, conversation_id=web_app.conversation_id
+                    )
                     web_app._amplifier_ready = True
                     web_app._send_event(
                         {
@@ -100,19 +135,26 @@ def create_app(resume_session_id: str | None = None) -> FastAPI:
                     web_app._show_error(f"Failed to resume session: {exc}")
 
             # Message loop
-            while True:
+            while not client.dropped:
                 data = await ws.receive_json()
                 msg_type = data.get("type", "")
 
                 if msg_type == "message":
-                    text = data.get("text", "")
-                    await web_app.handle_message(text)
+                    # Run the turn in the background so stream_resync and
+                    # ping are answered while it streams; WebApp serializes
+                    # turns itself.
+                    web_app.submit(data.get("text", ""))
                 elif msg_type == "switch_session":
                     session_id = data.get("id", "")
                     if session_id:
                         await web_app.switch_to_session(session_id)
+                elif msg_type == "hello":
+                    client.set_stream_mode(data.get("stream_mode", ""))
+                    web_app.resync_stream(client)  # attached mid-block
+                elif msg_type == "stream_resync":
+                    web_app.resync_stream(client)
                 elif msg_type == "ping":
-                    await ws.send_json({"type": "pong"})
+                    client.send({"type": "pong"})
                 else:
                     logger.debug("Unknown WebSocket message type: %s", msg_type)
 
@@ -121,6 +163,7 @@ def create_app(resume_session_id: str | None = None) -> FastAPI:
         except Exception:
             logger.exception("WebSocket error")
         finally:
-            await web_app.shutdown()
+            hub.detach(web_app, client)
+            writer.cancel()
 
     return app
@@ -41,20 +41,28 @@
   // ---------------------------------------------------------------------------
   let ws = null;
   let currentStreamEl = null;   // element receiving streaming deltas
+  let currentStream   = null;   // StreamRenderer for currentStreamEl
   let reconnectDelay  = 1000;
+  // Conversation to (re)attach to; kept in the URL so a reload, another
+  // tab or another device opened on the same link joins it.
+  let conversationId  = new URLSearchParams(location.hash.slice(1)).get("c") || "";
 
   // ---------------------------------------------------------------------------
   // WebSocket lifecycle
   // ---------------------------------------------------------------------------
   function connect() {
     const proto = location.protocol === "https:" ? "wss:" : "ws:";
-    ws = new WebSocket(proto + "//" + location.host + "/ws");
+    var query = conversationId ? "?conversation=" + encodeURIComponent(conversationId) : "";
+    ws = new WebSocket(proto + "//" + location.host + "/ws" + query);
 
     ws.onopen = function () {
       statusEl.textContent = "Connected";
       statusEl.classList.remove("status-error");
       statusEl.classList.add("status-ok");
       reconnectDelay = 1000;
+      // Ask for append-only stream chunks (server falls back to full text
+      // for clients that never say hello).
+      ws.send(JSON.stringify({ type: "hello", stream_mode: "delta" }));
     };
 
     ws.onclose = function () {
@@ -94,6 +102,14 @@
   function handleEvent(ev) {
     switch (ev.type) {
       case "connected":
+        // The server replays the conversation's recent messages next
+        messagesEl.innerHTML = "";
+        if (ev.conversation_id && ev.conversation_id !== conversationId) {
+          conversationId = ev.conversation_id;
+          history.replaceState(null, "", "#c=" + encodeURIComponent(conversationId));
+        }
+        onConnected(ev);
+        break;
       case "session_started":
       case "session_resumed":
         onConnected(ev);
@@ -125,6 +141,12 @@
       case "stream_delta":
         onStreamDelta(ev);
         break;
+      case "stream_append":
+        onStreamAppend(ev);
+        break;
+      case "stream_resync":
+        onStreamResync(ev);
+        break;
       case "stream_end":
         onStreamEnd(ev);
         break;
@@ -244,8 +266,127 @@
   }
 
   // ---------------------------------------------------------------------------
-  // Streaming
+  // Incremental streaming
+  //
+  // Delta mode: the server sends "stream_append" chunks numbered by "seq"
+  // (from 1 per block).  Every few chunks carry "crc", the CRC-32 of the
+  // UTF-8 block text so far; we keep a running CRC and compare.  On a gap or
+  // mismatch we stop applying chunks and send "stream_resync"; the server
+  // answers with the full text.  Full mode ("stream_delta") still works and
+  // goes through the same renderer.
+  //
+  // StreamRenderer splits the text at blank lines outside fenced code.
+  // Everything before the last such boundary is rendered once and never
+  // touched again; only the trailing open block is re-rendered, at most
+  // once per animation frame.  "stream_end" renders the final text in one
+  // pass so cross-block constructs (loose lists, link refs) come out right.
   // ---------------------------------------------------------------------------
+  var CRC_TABLE = (function () {
+    var table = new Array(256);
+    for (var n = 0; n < 256; n++) {
+      var c = n;
+      for (var k = 0; k < 8; k++) {
+        c = (c & 1) ? (0xEDB88320 ^ (c >>> 1)) : (c >>> 1);
+      }
+      table[n] = c >>> 0;
+    }
+    return table;
+  })();
+  var utf8Encoder = new TextEncoder();
+
+  function crc32(str, crc) {
+    var bytes = utf8Encoder.encode(str);
+    var c = (crc ^ 0xFFFFFFFF) >>> 0;
+    for (var i = 0; i < bytes.length; i++) {
+      c = CRC_TABLE[(c ^ bytes[i]) & 0xFF] ^ (c >>> 8);
+    }
+    return (c ^ 0xFFFFFFFF) >>> 0;
+  }
+
+  // Index just past the last blank line (outside a code fence) in
+  // text[from:], or `from` if the trailing block is still open.
+  function stableBoundary(text, from) {
+    var boundary = from;
+    var fence = null;
+    var pos = from;
+    while (pos < text.length) {
+      var nl = text.indexOf("\n", pos);
+      if (nl === -1) break;  // last line is incomplete
+      var line = text.slice(pos, nl);
+      var m = /^ {0,3}(`{3,}|~{3,})/.exec(line);
+      if (m) {
+        if (fence === null) fence = m[1];
+        else if (m[1].charAt(0) === fence.charAt(0) && m[1].length >= fence.length
+                 && line.trim() === m[1]) fence = null;
+      } else if (fence === null && line.trim() === "") {
+        boundary = nl + 1;
+      }
+      pos = nl + 1;
+    }
+    return boundary;
+  }
+
+  function StreamRenderer(bodyEl) {
+    this.el = bodyEl;
+    this.reset("");
+  }
+
+  StreamRenderer.prototype.reset = function (text) {
+    this.el.innerHTML = "";
+    this.tailEl = document.createElement("div");
+    this.el.appendChild(this.tailEl);
+    this.text = "";
+    this.stableEnd = 0;
+    this.seq = 0;
+    this.crc = 0;
+    this.desynced = false;
+    this.setText(text);
+  };
+
+  // Full-text update (full mode, or resync).
+  StreamRenderer.prototype.setText = function (text) {
+    if (text.indexOf(this.text) !== 0 || text.length < this.stableEnd) {
+      this.el.innerHTML = "";
+      this.el.appendChild(this.tailEl);
+      this.stableEnd = 0;
+    }
+    this.text = text;
+    this.schedule();
+  };
+
+  StreamRenderer.prototype.append = function (chunk) {
+    this.text += chunk;
+    this.schedule();
+  };
+
+  StreamRenderer.prototype.schedule = function () {
+    if (this.pending) return;
+    this.pending = true;
+    var self = this;
+    requestAnimationFrame(function () {
+      self.pending = false;
+      self.render();
+    });
+  };
+
+  StreamRenderer.prototype.close = function () {
+    this.closed = true;
+  };
+
+  StreamRenderer.prototype.render = function () {
+    if (this.closed) return;
+    var boundary = stableBoundary(this.text, this.stableEnd);
+    if (boundary > this.stableEnd) {
+      var block = document.createElement("div");
+      block.className = "stream-block";
+      block.innerHTML = renderMarkdown(this.text.slice(this.stableEnd, boundary));
+      this.el.insertBefore(block, this.tailEl);
+      this.stableEnd = boundary;
+    }
+    this.tailEl.innerHTML = renderMarkdown(this.text.slice(this.stableEnd));
+    scrollToBottom();
+  };
+
   function onStreamStart(ev) {
     var el = document.createElement("div");
     var blockClass = ev.block_type === "thinking" ? "message-thinking" : "message-assistant";
@@ -262,6 +403,7 @@
 
     messagesEl.appendChild(el);
     currentStreamEl = body;
+    currentStream = new StreamRenderer(body);
     scrollToBottom();
   }
 
@@ -270,15 +412,49 @@
       // Late join — create the element
       onStreamStart(ev);
     }
-    currentStreamEl.innerHTML = renderMarkdown(ev.text);
-    scrollToBottom();
+    currentStream.setText(ev.text);
+  }
+
+  function onStreamAppend(ev) {
+    if (!currentStreamEl) {
+      onStreamStart(ev);
+      // Joined mid-block: we cannot know the earlier chunks.
+      currentStream.seq = ev.seq - 1;
+      currentStream.desynced = ev.seq !== 1;
+      if (currentStream.desynced) sendRaw({ type: "stream_resync" });
+    }
+    var s = currentStream;
+    if (s.desynced) return;  // waiting for stream_resync
+    if (ev.seq !== s.seq + 1) {
+      s.desynced = true;
+      sendRaw({ type: "stream_resync" });
+      return;
+    }
+    s.seq = ev.seq;
+    s.crc = crc32(ev.text, s.crc);
+    s.append(ev.text);
+    if (ev.crc !== undefined && ev.crc !== s.crc) {
+      s.desynced = true;
+      sendRaw({ type: "stream_resync" });
+    }
+  }
+
+  function onStreamResync(ev) {
+    if (!currentStreamEl) onStreamStart(ev);
+    var s = currentStream;
+    s.setText(ev.text);
+    s.seq = ev.seq;
+    s.crc = ev.crc;
+    s.desynced = false;
   }
 
   function onStreamEnd(ev) {
     if (currentStreamEl) {
+      currentStream.close();
       currentStreamEl.classList.remove("streaming");
       currentStreamEl.innerHTML = renderMarkdown(ev.text);
       currentStreamEl = null;
+      currentStream = null;
     } else {
       // No streaming element existed — render as complete message
       var role = ev.block_type === "thinking" ? "thinking" : "assistant";
@@ -0,0 +1,106 @@
+"""Streaming wire protocol for the web frontend.
+
+``SharedAppBase`` reports streaming progress as the *accumulated* text of
+the current block (throttled to one callback per 50 ms).  Forwarding that
+verbatim (``stream_delta`` events, the original "full" mode) makes
+bandwidth and client-side markdown work quadratic in the response length.
+
+In "delta" mode :class:`StreamEncoder` turns each accumulated snapshot into
+an append-only chunk instead::
+
+    {"type": "stream_append", "seq": 7, "text": "...new text..."}
+    {"type": "stream_append", "seq": 8, "text": "...", "crc": 2834412331}
+
+* ``seq`` starts at 1 for every block and increases by one per chunk, so
+  the client can detect a dropped or reordered chunk.
+* Every :data:`CHECKSUM_INTERVAL` chunks, ``crc`` carries the CRC-32 of the
+  UTF-8 encoding of the whole block text so far.  The client keeps a
+  running CRC over the chunks it applied and compares.
+* On a gap or mismatch the client sends ``{"type": "stream_resync"}`` and
+  the server answers with :meth:`StreamEncoder.resync_event` -- a
+  ``stream_resync`` event carrying the full text, its ``seq`` and ``crc``.
+  The same event is sent unprompted if a snapshot is ever not an extension
+  of the text already sent.
+
+Clients opt in by sending ``{"type": "hello", "stream_mode": "delta"}``;
+anything else keeps the full-text ``stream_delta`` events as a fallback.
+"""
+
+from __future__ import annotations
+
+import threading
+import zlib
+from typing import Any
+
+#: Protocol modes a client can request.
+STREAM_MODE_FULL = "full"
+STREAM_MODE_DELTA = "delta"
+
+#: Attach a checksum to every Nth chunk.
+CHECKSUM_INTERVAL: int = 8
+
+
+class StreamEncoder:
+    """Convert accumulated-text snapshots into sequence-numbered chunks.
+
+    One encoder is reused across blocks; call :meth:`start` at every block
+    start.  Methods are thread-safe: snapshots arrive on the streaming
+    thread while resync requests arrive on the event loop.
+    """
+
+    def __init__(self, checksum_interval: int = CHECKSUM_INTERVAL) -> None:
+        self._checksum_interval = max(1, checksum_interval)
+        self._lock = threading.Lock()
+        self._block_type = ""
+        self._text = ""
+        self._seq = 0
+        self._crc = 0
+
+    def start(self, block_type: str) -> None:
+        """Reset state for a new block."""
+        with self._lock:
+            self._block_type = block_type
+            self._text = ""
+            self._seq = 0
+            self._crc = 0
+
+    def encode(self, accumulated_text: str) -> dict[str, Any] | None:
+        """Return the event for a new snapshot, or ``None`` if nothing changed."""
+        with self._lock:
+            sent = self._text
+            if accumulated_text == sent:
+                return None
+            if not accumulated_text.startswith(sent):
+                # Not append-only (should not happen) -- resend everything.
+                self._text = accumulated_text
+                self._seq += 1
+                self._crc = zlib.crc32(accumulated_text.encode("utf-8"))
+                return self._resync_locked()
+
+            chunk = accumulated_text[len(sent) :]
+            self._text = accumulated_text
+            self._seq += 1
+            self._crc = zlib.crc32(chunk.encode("utf-8"), self._crc)
+            event: dict[str, Any] = {
+                "type": "stream_append",
+                "block_type": self._block_type,
+                "seq": self._seq,
+                "text": chunk,
+            }
+            if self._seq % self._checksum_interval == 0:
+                event["crc"] = self._crc
+            return event
+
+    def resync_event(self) -> dict[str, Any]:
+        """Return a ``stream_resync`` event with the full text of the block."""
+        with self._lock:
+            return self._resync_locked()
+
+    def _resync_locked(self) -> dict[str, Any]:
+        return {
+            "type": "stream_resync",
+            "block_type": self._block_type,
+            "seq": self._seq,
+            "text": self._text,
+            "crc": self._crc,
+        }
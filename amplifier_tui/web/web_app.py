@@ -5,8 +5,10 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from amplifier_tui.core.app_base import SharedAppBase
 from amplifier_tui.core.commands import (
@@ -44,16 +46,49 @@ from amplifier_tui.core.persistence import (
     TagStore,
     TemplateStore,
 )
-from amplifier_tui.core.preferences import load_preferences
+from amplifier_tui.core.preferences import Preferences, load_preferences
 from amplifier_tui.core.conversation import ConversationState
+from amplifier_tui.core.message_store import MessageStore
 from amplifier_tui.core.session_manager import SessionManager
 
+from .stream_protocol import STREAM_MODE_DELTA, STREAM_MODE_FULL, StreamEncoder
+
+if TYPE_CHECKING:
+    from amplifier_tui.core.features.dashboard_stats import DashboardStats
+    from amplifier_tui.core.features.plugin_loader import PluginLoader
+
+    from .hub import WebClient
+
 logger = logging.getLogger(__name__)
 
 # Shared Amplifier home directory for persistence stores
 _amp_home = Path.home() / ".amplifier"
 _amp_home.mkdir(parents=True, exist_ok=True)
 
+#: Recent message events replayed to a client attaching to a conversation.
+BACKLOG_EVENTS: int = 500
+
+_BACKLOG_TYPES = frozenset(
+    {
+        "user_message",
+        "assistant_message",
+        "system_message",
+        "error",
+        "stream_end",
+        "tool_start",
+        "tool_end",
+    }
+)
+
+
+def _log_turn_result(task: asyncio.Task) -> None:
+    """Done-callback for detached turn tasks: surface their exceptions."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("Web turn failed", exc_info=exc)
+
 
 # ------------------------------------------------------------------
 # Minimal FileWatcher stub (web doesn't do filesystem polling)
@@ -74,6 +109,69 @@ class _WebFileWatcher:
         pass
 
 
+# ------------------------------------------------------------------
+# Process-wide resources
+# ------------------------------------------------------------------
+@dataclass
+class WebResources:
+    """Preferences, plugins and stores shared by every conversation.
+
+    Loaded once per server process rather than once per WebSocket; sharing
+    one store object per file also keeps conversations from overwriting
+    each other's writes.
+    """
+
+    prefs: Preferences
+    history: PromptHistory
+    plugin_loader: PluginLoader
+    dashboard_stats: DashboardStats
+    alias_store: AliasStore
+    bookmark_store: BookmarkStore
+    draft_store: DraftStore
+    note_store: NoteStore
+    pin_store: MessagePinStore
+    pinned_session_store: PinnedSessionStore
+    ref_store: RefStore
+    session_name_store: SessionNameStore
+    snippet_store: SnippetStore
+    template_store: TemplateStore
+    tag_store: TagStore
+    clipboard_store: ClipboardStore
+
+    @classmethod
+    def load(cls) -> WebResources:
+        from amplifier_tui.core.features.dashboard_stats import DashboardStats
+        from amplifier_tui.core.features.plugin_loader import PluginLoader
+
+        plugin_loader = PluginLoader()
+        plugin_loader.load_all()
+        return cls(
+            prefs=load_preferences(),
+            history=PromptHistory(),
+            plugin_loader=plugin_loader,
+            dashboard_stats=DashboardStats.persistent(),
+            alias_store=AliasStore(_amp_home / "tui-aliases.json"),
+            bookmark_store=BookmarkStore(_amp_home / "tui-bookmarks.json"),
+            draft_store=DraftStore(
+                _amp_home / "tui-drafts.json", _amp_home / "tui-draft.txt"
+            ),
+            note_store=NoteStore(_amp_home / "tui-notes.json"),
+            pin_store=MessagePinStore(_amp_home / "tui-pins.json"),
+            pinned_session_store=PinnedSessionStore(
+                _amp_home / "tui-pinned-sessions.json"
+            ),
+            ref_store=RefStore(_amp_home / "tui-refs.json"),
+            session_name_store=SessionNameStore(
+                _amp_home / "tui-session-names.json",
+                _amp_home / "tui-session-titles.json",
+            ),
+            snippet_store=SnippetStore(_amp_home / "tui-snippets.json"),
+            template_store=TemplateStore(_amp_home / "tui-templates.json"),
+            tag_store=TagStore(_amp_home / "tui-session-tags.json"),
+            clipboard_store=ClipboardStore(_amp_home / "tui-clipboard-ring.json"),
+        )
+
+
 # ------------------------------------------------------------------
 # WebApp
 # ------------------------------------------------------------------
@@ -98,15 +196,31 @@ class WebApp(
     ToolCommandsMixin,
     WatchCommandsMixin,
 ):
-    """Web frontend app inheriting shared backend + all command mixins."""
+    """One web conversation, shared by every client attached to it.
 
-    def __init__(self, websocket: Any) -> None:
+    Owned by the server's :class:`~amplifier_tui.web.hub.SessionHub`; it
+    outlives the WebSockets that attach to it.
+    """
+
+    def __init__(self, resources: WebResources | None = None) -> None:
         super().__init__()
-        self._ws = websocket
+        res = resources or WebResources.load()
         self._loop: asyncio.AbstractEventLoop | None = None
         self.session_manager = SessionManager()
         self._conversation = ConversationState()
 
+        # Attached clients and the recent messages replayed to new ones
+        self._clients: list[WebClient] = []
+        self._backlog: deque[dict[str, Any]] = deque(maxlen=BACKLOG_EVENTS)
+
+        # Every block is encoded for "delta" clients and sent as full text
+        # to the others
+        self._stream_encoder = StreamEncoder()
+        self._streaming = False
+        # Serializes handle_message() calls (submit() runs them as tasks)
+        self._turn_lock = asyncio.Lock()
+        self._turns: set[asyncio.Task] = set()
+
         # ==============================================================
         # Category 1: Data Attributes
         # ==============================================================
@@ -166,31 +280,24 @@ class WebApp(
         # Session list data
         self._session_list_data: list[dict[str, Any]] = []
 
-        # Search messages (list of tuples: role, text, widget_or_none)
-        self._search_messages: list[Any] = []
+        # Search messages: (role, text, widget_or_none) records with totals
+        self._search_messages = MessageStore()
 
         # ==============================================================
-        # Category 2: Persistence Stores
+        # Category 2: Persistence Stores (shared across conversations)
         # ==============================================================
-        self._alias_store = AliasStore(_amp_home / "tui-aliases.json")
-        self._bookmark_store = BookmarkStore(_amp_home / "tui-bookmarks.json")
-        self._draft_store = DraftStore(
-            _amp_home / "tui-drafts.json", _amp_home / "tui-draft.txt"
-        )
-        self._note_store = NoteStore(_amp_home / "tui-notes.json")
-        self._pin_store = MessagePinStore(_amp_home / "tui-pins.json")
-        self._pinned_session_store = PinnedSessionStore(
-            _amp_home / "tui-pinned-sessions.json"
-        )
-        self._ref_store = RefStore(_amp_home / "tui-refs.json")
-        self._session_name_store = SessionNameStore(
-            _amp_home / "tui-session-names.json",
-            _amp_home / "tui-session-titles.json",
-        )
-        self._snippet_store = SnippetStore(_amp_home / "tui-snippets.json")
-        self._template_store = TemplateStore(_amp_home / "tui-templates.json")
-        self._tag_store = TagStore(_amp_home / "tui-session-tags.json")
-        self._clipboard_store = ClipboardStore(_amp_home / "tui-clipboard-ring.json")
+        self._alias_store = res.alias_store
+        self._bookmark_store = res.bookmark_store
+        self._draft_store = res.draft_store
+        self._note_store = res.note_store
+        self._pin_store = res.pin_store
+        self._pinned_session_store = res.pinned_session_store
+        self._ref_store = res.ref_store
+        self._session_name_store = res.session_name_store
+        self._snippet_store = res.snippet_store
+        self._template_store = res.template_store
+        self._tag_store = res.tag_store
+        self._clipboard_store = res.clipboard_store
 
         # ==============================================================
         # Category 3: Feature Objects
@@ -199,8 +306,6 @@ class WebApp(
         from amplifier_tui.core.features.branch_manager import BranchManager
         from amplifier_tui.core.features.compare_manager import CompareManager
         from amplifier_tui.core.features.context_profiler import ContextHistory
-        from amplifier_tui.core.features.dashboard_stats import DashboardStats
-        from amplifier_tui.core.features.plugin_loader import PluginLoader
         from amplifier_tui.core.features.recipe_tracker import RecipeTracker
         from amplifier_tui.core.features.replay_engine import ReplayEngine
         from amplifier_tui.core.features.tool_log import ToolLog
@@ -211,14 +316,13 @@ class WebApp(
         self._branch_manager = BranchManager()
         self._compare_manager = CompareManager()
         self._replay_engine = ReplayEngine()
-        self._plugin_loader = PluginLoader()
-        self._plugin_loader.load_all()
-        self._dashboard_stats = DashboardStats()
+        self._plugin_loader = res.plugin_loader
+        self._dashboard_stats = res.dashboard_stats
         self._context_history = ContextHistory()
 
         # Preferences and prompt history
-        self._prefs = load_preferences()
-        self._history = PromptHistory()
+        self._prefs = res.prefs
+        self._history = res.history
 
         # File watcher stub
         self._file_watcher = _WebFileWatcher()
@@ -228,22 +332,72 @@ class WebApp(
         """Return all conversations (web has exactly one)."""
         return [self._conversation]
 
+    @property
+    def conversation_id(self) -> str:
+        return self._conversation.conversation_id
+
+    @property
+    def clients(self) -> int:
+        """Number of attached clients."""
+        return len(self._clients)
+
+    @property
+    def busy(self) -> bool:
+        """Whether a turn or session switch is running."""
+        return self._turn_lock.locked()
+
     # ------------------------------------------------------------------
-    # Thread-safe WebSocket send
+    # Clients and thread-safe fan-out
     # ------------------------------------------------------------------
 
-    def _send_event(self, event: dict[str, Any]) -> None:
-        """Thread-safe WebSocket send.  Can be called from background threads."""
+    def attach(self, client: WebClient) -> None:
+        """Attach *client* and bring it up to date (event loop)."""
+        self._loop = asyncio.get_running_loop()
+        self._clients.append(client)
+        client.send(
+            {
+                "type": "connected",
+                "status": "ready",
+                "conversation_id": self.conversation_id,
+                "clients": len(self._clients),
+            }
+        )
+        sm = self.session_manager
+        if sm.session:
+            client.send(
+                {
+                    "type": "session_resumed",
+                    "session_id": sm.session_id or "",
+                    "model": sm.model_name or "",
+                }
+            )
+        for event in self._backlog:
+            client.send(event)
+        if self._conversation.is_processing:
+            client.send({"type": "processing_start", "label": "Thinking"})
+
+    def detach(self, client: WebClient) -> None:
+        if client in self._clients:
+            self._clients.remove(client)
+
+    def _send_event(self, event: dict[str, Any], *, mode: str = "") -> None:
+        """Send *event* to every attached client, or those in stream *mode*.
+
+        Thread-safe: called from the streaming thread as well as the loop.
+        """
         if self._loop is None:
             return
-        asyncio.run_coroutine_threadsafe(self._ws_send_json(event), self._loop)
-
-    async def _ws_send_json(self, event: dict[str, Any]) -> None:
-        """Actually send JSON over WebSocket (must run on event loop)."""
-        try:
-            await self._ws.send_json(event)
-        except Exception:
-            logger.debug("WebSocket send failed", exc_info=True)
+        self._loop.call_soon_threadsafe(self._fan_out, event, mode)
+
+    def _fan_out(self, event: dict[str, Any], mode: str) -> None:
+        if not mode:
+            if event["type"] in _BACKLOG_TYPES:
+                self._backlog.append(event)
+            elif event["type"] == "clear":
+                self._backlog.clear()
+        for client in self._clients:
+            if not mode or client.stream_mode == mode:
+                client.send(event)
 
     # ------------------------------------------------------------------
     # Abstract display methods (SharedAppBase)
@@ -285,17 +439,27 @@ class WebApp(
     # ------------------------------------------------------------------
 
     def _on_stream_block_start(self, conversation_id: str, block_type: str) -> None:
-        self._send_event({"type": "stream_start", "block_type": block_type})
+        self._stream_encoder.start(block_type)
+        self._streaming = True
+        for mode in (STREAM_MODE_FULL, STREAM_MODE_DELTA):
+            self._send_event(
+                {"type": "stream_start", "block_type": block_type, "mode": mode},
+                mode=mode,
+            )
 
     def _on_stream_block_delta(
         self, conversation_id: str, block_type: str, accumulated_text: str
     ) -> None:
+        event = self._stream_encoder.encode(accumulated_text)
+        if event is not None:
+            self._send_event(event, mode=STREAM_MODE_DELTA)
         self._send_event(
             {
                 "type": "stream_delta",
                 "block_type": block_type,
                 "text": accumulated_text,
-            }
+            },
+            mode=STREAM_MODE_FULL,
         )
 
     def _on_stream_block_end(
@@ -305,6 +469,7 @@ class WebApp(
         final_text: str,
         had_block_start: bool,
     ) -> None:
+        self._streaming = False
         self._send_event(
             {
                 "type": "stream_end",
@@ -861,20 +1026,10 @@ class WebApp(
             context_window = self._get_context_window()
             total = input_tokens + output_tokens
 
-            # Fall back to character-based estimate when API counters are zero
+            # Fall back to the tokenizer estimate when API counters are zero
             if total == 0:
-                user_chars = sum(
-                    len(content)
-                    for role, content, _ in self._search_messages
-                    if role == "user"
-                )
-                assistant_chars = sum(
-                    len(content)
-                    for role, content, _ in self._search_messages
-                    if role == "assistant"
-                )
-                input_tokens = user_chars // 4
-                output_tokens = assistant_chars // 4
+                input_tokens = self._search_messages.role_tokens["user"]
+                output_tokens = self._search_messages.role_tokens["assistant"]
                 total = input_tokens + output_tokens
 
             usage_pct = (total / context_window * 100) if context_window > 0 else 0
@@ -957,53 +1112,27 @@ class WebApp(
         if text.strip():
             super()._cmd_git(text)  # type: ignore[misc]
             return
-        try:
-            ok, branch = self._run_git("branch", "--show-current")
-            if not ok:
-                self._add_system_message(f"Not a git repo or git error: {branch}")
-                return
-            branch = branch.strip() or "(detached HEAD)"
-
-            # Status summary
-            _, status_out = self._run_git("status", "--porcelain")
-            lines = [ln for ln in status_out.splitlines() if ln.strip()]
-            staged = sum(1 for ln in lines if ln[0] not in (" ", "?"))
-            modified = sum(1 for ln in lines if len(ln) > 1 and ln[1] == "M")
-            untracked = sum(1 for ln in lines if ln.startswith("??"))
-
-            # Ahead / behind
-            ahead, behind = 0, 0
-            ab_ok, ab_out = self._run_git(
-                "rev-list",
-                "--left-right",
-                "--count",
-                "HEAD...@{upstream}",
-            )
-            if ab_ok and ab_out.strip():
-                ab_parts = ab_out.strip().split()
-                if len(ab_parts) == 2:
-                    ahead, behind = int(ab_parts[0]), int(ab_parts[1])
-
-            # Last commit
-            _, last_commit = self._run_git("log", "-1", "--format=%h %s (%cr)")
-
-            clean = not (staged or modified or untracked)
+        self._run_background(self._web_git_overview(), group="shell")
 
-            self._send_event(
-                {
-                    "type": "git_status",
-                    "branch": branch,
-                    "staged": staged,
-                    "modified": modified,
-                    "untracked": untracked,
-                    "ahead": ahead,
-                    "behind": behind,
-                    "clean": clean,
-                    "last_commit": last_commit.strip(),
-                }
-            )
-        except Exception:
-            super()._cmd_git(text)  # type: ignore[misc]
+    async def _web_git_overview(self) -> None:
+        """Send the ``git_status`` event from the cached repository state."""
+        state, error = await self._git_state.get()
+        if state is None:
+            self._add_system_message(f"Not a git repo or git error: {error}")
+            return
+        self._send_event(
+            {
+                "type": "git_status",
+                "branch": state.branch or "(detached HEAD)",
+                "staged": state.staged,
+                "modified": state.modified,
+                "untracked": state.untracked,
+                "ahead": state.ahead,
+                "behind": state.behind,
+                "clean": not (state.staged or state.modified or state.untracked),
+                "last_commit": state.last_commit,
+            }
+        )
 
     def _cmd_dashboard(self, args: str = "") -> None:
         """Web-enhanced dashboard – sends a structured ``dashboard`` event."""
@@ -1011,12 +1140,24 @@ class WebApp(
         if args.strip():
             super()._cmd_dashboard(args)  # type: ignore[misc]
             return
+        if not self._dashboard_stats.is_cached:
+            self._run_background(self._scan_web_dashboard(), group="dashboard")
+            return
+        self._send_dashboard_event()
+
+    async def _scan_web_dashboard(self) -> None:
+        """Scan session files off the event loop, then send the dashboard."""
         try:
-            ds = self._dashboard_stats
-            if not ds.is_cached:
-                ds.scan_sessions()
+            await asyncio.to_thread(self._dashboard_stats.scan_sessions)
+        except Exception as e:
+            logger.debug("Dashboard scan failed", exc_info=True)
+            self._add_system_message(f"Dashboard scan failed: {e}")
+            return
+        self._send_dashboard_event()
 
-            data = ds.data
+    def _send_dashboard_event(self) -> None:
+        try:
+            data = self._dashboard_stats.data
 
             # Top models and projects
             top_models = data.model_counts.most_common(3)
@@ -1042,7 +1183,7 @@ class WebApp(
                 }
             )
         except Exception:
-            super()._cmd_dashboard(args)  # type: ignore[misc]
+            self._add_system_message(self._dashboard_stats.format_dashboard())
 
     # ------------------------------------------------------------------
     # Command routing
@@ -1249,7 +1390,20 @@ class WebApp(
         self._add_system_message("Starting new session... Send a message to begin.")
 
     async def switch_to_session(self, session_id: str) -> None:
-        """Switch to an existing session by ID."""
+        """Switch to an existing session by ID.
+
+        Refused while a turn is streaming: ending the session under a
+        running turn would leave it writing into the new one.
+        """
+        if self._turn_lock.locked():
+            self._show_error(
+                "Wait for the current response to finish before switching sessions."
+            )
+            return
+        async with self._turn_lock:
+            await self._switch_to_session(session_id)
+
+    async def _switch_to_session(self, session_id: str) -> None:
         try:
             if self.session_manager and self.session_manager.session:
                 await self.session_manager.end_session(
@@ -1276,7 +1430,11 @@ class WebApp(
     # ------------------------------------------------------------------
 
     async def handle_message(self, text: str) -> None:
-        """Handle a user message (chat or command)."""
+        """Handle a user message (chat or command), one at a time."""
+        async with self._turn_lock:
+            await self._handle_message(text)
+
+    async def _handle_message(self, text: str) -> None:
         text = text.strip()
         if not text:
             return
@@ -1319,17 +1477,30 @@ class WebApp(
         finally:
             self._finish_processing()
 
-    async def initialize(self) -> None:
-        """Initialize the app (called once when WebSocket connects)."""
-        self._loop = asyncio.get_event_loop()
-        self._send_event({"type": "connected", "status": "ready"})
+    def submit(self, text: str) -> None:
+        """Run a message as a turn in the background (event loop).
+
+        Turns belong to the conversation, not to the client that sent
+        them, and keep running if it disconnects.
+        """
+        turn = asyncio.create_task(self.handle_message(text))
+        self._turns.add(turn)
+        turn.add_done_callback(self._turns.discard)
+        turn.add_done_callback(_log_turn_result)
+
+    def resync_stream(self, client: WebClient) -> None:
+        """Send *client* the full text of the block being streamed."""
+        if self._streaming and client.stream_mode == STREAM_MODE_DELTA:
+            client.send(self._stream_encoder.resync_event())
 
     async def shutdown(self) -> None:
-        """Clean up when WebSocket disconnects."""
+        """End the conversation's session (idle expiry or server shutdown)."""
+        for turn in list(self._turns):
+            turn.cancel()
         if self.session_manager and self.session_manager.session:
             try:
                 await self.session_manager.end_session(
                     conversation_id=self._conversation.conversation_id
                 )
             except Exception:
-                logger.debug("Error ending session on disconnect", exc_info=True)
+                logger.debug("Error ending session on shutdown", exc_info=True)
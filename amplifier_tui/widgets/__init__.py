@@ -12,29 +12,44 @@ from .indicators import (
     SystemMessage,
 )
 from .messages import (
+    ASSISTANT_MESSAGE_TYPES,
     AssistantMessage,
+    LazyCollapsible,
     MessageMeta,
+    StreamedAssistantMessage,
     ThinkingBlock,
     ThinkingStatic,
     UserMessage,
+    assistant_markdown_theme,
 )
 from .panels import PinnedPanel, PinnedPanelHeader, PinnedPanelItem
 from .todo_panel import TodoPanel
 from .agent_tree_panel import AgentTreePanel
 from .project_panel import ProjectPanel
 from .screens import HistorySearchScreen, ShortcutOverlay
+from .session_tree import (
+    SessionTreeEntry,
+    SessionTreeGroup,
+    SessionTreeIndex,
+    make_session_tree_entry,
+)
+from .streaming_markdown import StreamingMarkdown, ThemedRenderable
+from .virtual_chat import ChatRecord, VirtualTranscript
 from .tabs import TabBar, TabButton
 
 __all__ = [
+    "ASSISTANT_MESSAGE_TYPES",
     "AmplifierCommandProvider",
     "AssistantMessage",
     "Attachment",
     "ChatInput",
+    "ChatRecord",
     "ErrorMessage",
     "FindBar",
     "FoldToggle",
     "HistorySearchBar",
     "HistorySearchScreen",
+    "LazyCollapsible",
     "MessageMeta",
     "NoteMessage",
     "AgentTreePanel",
@@ -43,14 +58,23 @@ __all__ = [
     "PinnedPanelHeader",
     "PinnedPanelItem",
     "ProcessingIndicator",
+    "SessionTreeEntry",
+    "SessionTreeGroup",
+    "SessionTreeIndex",
     "ShortcutOverlay",
+    "StreamedAssistantMessage",
+    "StreamingMarkdown",
     "SuggestionBar",
     "SystemMessage",
     "TabBar",
     "TabButton",
     "TabState",
+    "ThemedRenderable",
     "ThinkingBlock",
     "ThinkingStatic",
     "TodoPanel",
     "UserMessage",
+    "VirtualTranscript",
+    "assistant_markdown_theme",
+    "make_session_tree_entry",
 ]
@@ -10,6 +10,7 @@ from textual.widgets import TextArea
 from textual.css.query import NoMatches
 
 from ..constants import SLASH_COMMANDS, SYSTEM_PRESETS
+from ..core.features.tokenizer import count_tokens
 from ..log import logger
 from .bars import SuggestionBar
 
@@ -518,7 +519,7 @@ class ChatInput(TextArea):
         words = len(text.split())
         chars = len(text)
         if chars > 500:
-            est_tokens = int(words * 1.3)
+            est_tokens = count_tokens(text)
             self.border_subtitle = f"{words}w {chars}c ~{est_tokens}tok"
         else:
             self.border_subtitle = f"{words}w {chars}c"
@@ -10,6 +10,8 @@ from textual.widgets import Static
 
 from amplifier_tui.core.conversation import ConversationState
 
+from .streaming_markdown import StreamingMarkdown
+
 
 @dataclass
 class TabState:
@@ -33,8 +35,10 @@ class TabState:
     stream_widget: Static | None = None  # active streaming RichLog/Static widget
     stream_container: Any | None = None  # Collapsible container for thinking blocks
     stream_block_type: str = ""  # current block type being streamed ("text"/"thinking")
+    stream_markdown: StreamingMarkdown | None = None  # cached blocks of a text stream
     processing_label: str = ""  # "Thinking", "Reading file", etc.
     status_activity_label: str = ""  # status bar activity text
+    restore_label: str = ""  # --sessions restore progress ("queued", "loading")
 
 
 @dataclass
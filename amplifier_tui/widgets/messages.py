@@ -2,7 +2,50 @@
 
 from __future__ import annotations
 
-from textual.widgets import Markdown, Static
+from collections.abc import Callable
+
+from rich.console import RenderableType
+from rich.theme import Theme
+from textual.app import App
+from textual.color import Color
+from textual.widgets import Collapsible, Markdown, Static
+
+from .streaming_markdown import ThemedRenderable
+
+_markdown_themes: dict[str, Theme] = {}
+
+
+def assistant_markdown_theme(app: App) -> Theme:
+    """Rich markdown styles equivalent to the ``AssistantMessage`` rules in
+    styles.tcss, resolved against *app*'s current Textual theme."""
+    key = repr(app.current_theme)
+    theme = _markdown_themes.get(key)
+    if theme is None:
+        variables = app.get_css_variables()
+        secondary = variables["secondary"]
+        panel = variables["panel"]
+        muted = (
+            Color.parse(variables["background"])
+            + Color.parse(variables["foreground-muted"])
+        ).hex
+        theme = Theme(
+            {
+                "markdown.h1": f"bold {secondary}",
+                "markdown.h1.border": secondary,
+                "markdown.h2": f"bold {secondary}",
+                "markdown.h3": "bold",
+                "markdown.h4": "bold italic",
+                "markdown.code": "#c0b0e0 on #1c1c2e",
+                "markdown.block_quote": muted,
+                "markdown.item.bullet": "bold",
+                "markdown.item.number": "bold",
+                "markdown.table.border": panel,
+                "markdown.table.header": "bold",
+                "markdown.hr": panel,
+            }
+        )
+        _markdown_themes[key] = theme
+    return theme
 
 
 class UserMessage(Static):
@@ -25,12 +68,68 @@ class AssistantMessage(Markdown):
         super().__init__(content, classes="chat-message assistant-message")
 
 
+class StreamedAssistantMessage(Static):
+    """An assistant message finalized from a live stream.
+
+    Displays the block renders cached by
+    :class:`~amplifier_tui.widgets.streaming_markdown.StreamingMarkdown`
+    instead of re-parsing the whole response into a :class:`Markdown`
+    widget when the stream ends, styled by :func:`assistant_markdown_theme`.
+    """
+
+    def __init__(self, renderable: RenderableType) -> None:
+        super().__init__(renderable, classes="chat-message assistant-message")
+
+    def render(self) -> RenderableType:  # type: ignore[override]
+        return ThemedRenderable(self.content, assistant_markdown_theme(self.app))
+
+
+#: Widget types that hold an assistant response.
+ASSISTANT_MESSAGE_TYPES = (AssistantMessage, StreamedAssistantMessage)
+
+
 class ThinkingBlock(Static):
     """A dimmed thinking/reasoning block."""
 
     pass
 
 
+class LazyCollapsible(Collapsible):
+    """A collapsed block whose body is built the first time it is expanded.
+
+    Tool results, file-edit diffs and thinking text are mounted collapsed and
+    mostly never opened, so only the title is computed up front; *render*
+    runs once, on first expand, and fills the inner :attr:`body` Static.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[], str],
+        *,
+        title: str,
+        body_classes: str,
+        classes: str | None = None,
+    ) -> None:
+        self.body = Static("", classes=body_classes)
+        self._render_body: Callable[[], str] | None = render
+        super().__init__(self.body, title=title, collapsed=True, classes=classes)
+
+    @property
+    def body_rendered(self) -> bool:
+        return self._render_body is None
+
+    def render_body(self) -> None:
+        """Build the body now (no-op once it has been built)."""
+        render, self._render_body = self._render_body, None
+        if render is not None:
+            self.body.update(render())
+
+    def _watch_collapsed(self, collapsed: bool) -> None:
+        if not collapsed:
+            self.render_body()
+        super()._watch_collapsed(collapsed)
+
+
 class MessageMeta(Static):
     """Subtle metadata line below messages (timestamp, tokens, response time)."""
 
@@ -0,0 +1,188 @@
+"""Filterable model of the session sidebar tree.
+
+The sidebar used to rebuild the whole :class:`~textual.widgets.Tree` on
+every keystroke in ``#session-filter``.  It re-read the name, title and
+tag stores each time and recounted every project group with a nested
+scan.  With thousands of sessions typing lagged badly.
+
+:class:`SessionTreeIndex` is built once per session-list load.  Each
+session becomes a :class:`SessionTreeEntry` holding its node label, its
+detail line and a lower-cased search key (label, id, project, tags).
+Filtering is diff-based.  Nodes for entries that stop matching are
+removed, entries that start matching again are inserted back in order,
+and group counts are relabelled.  Nodes that stay visible are never
+touched.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
+
+#: Seconds of typing quiet before the sidebar filter is applied.
+FILTER_DEBOUNCE_SECONDS: float = 0.12
+
+
+@dataclass
+class SessionTreeEntry:
+    """One session row: its labels and precomputed search keys."""
+
+    session_id: str
+    label: str  # node label (Rich markup)
+    detail: str  # child leaf ("id: ...  #tags")
+    search_key: str  # lower-cased label, id, project and tags
+    tag_key: str  # lower-cased tags, for ``#tag`` queries
+    node: TreeNode | None = None
+
+    def matches(self, query: str) -> bool:
+        """Match a lower-cased, stripped *query* (``#x`` = tags only)."""
+        if not query:
+            return True
+        if query.startswith("#"):
+            return query[1:] in self.tag_key
+        return query in self.search_key
+
+
+@dataclass
+class SessionTreeGroup:
+    """A run of entries under one group node.
+
+    Groups sharing a ``key`` (e.g. one project split across date-sorted
+    runs) share their count.  ``title`` is shown as ``title (count)``
+    unless ``counted`` is false.
+    """
+
+    key: str
+    title: str
+    counted: bool = True
+    entries: list[SessionTreeEntry] = field(default_factory=list)
+    node: TreeNode | None = None
+    shown_count: int = -1
+
+    def label(self, count: int) -> str:
+        return f"{self.title} [dim]({count})[/dim]" if self.counted else self.title
+
+
+def make_session_tree_entry(
+    session_id: str, label: str, search_label: str, project: str, tags: list[str]
+) -> SessionTreeEntry:
+    """Build an entry; *search_label* is the label text without tag markup."""
+    tag_info = f"  {' '.join(f'#{t}' for t in tags)}" if tags else ""
+    tag_key = "\0".join(tags).lower()
+    return SessionTreeEntry(
+        session_id=session_id,
+        label=label,
+        detail=f"id: {session_id[:12]}...{tag_info}",
+        search_key="\0".join((search_label, session_id, project, *tags)).lower(),
+        tag_key=tag_key,
+    )
+
+
+class SessionTreeIndex:
+    """Groups of session entries mirrored into a :class:`Tree`."""
+
+    def __init__(self, groups: list[SessionTreeGroup] | None = None) -> None:
+        self.groups = groups or []
+        self._tree: Tree | None = None
+        self._empty_node: TreeNode | None = None
+
+    def __len__(self) -> int:
+        return sum(len(g.entries) for g in self.groups)
+
+    def detach(self) -> None:
+        """Forget the tree's nodes (call after something else cleared it)."""
+        self._tree = None
+        self._empty_node = None
+        for group in self.groups:
+            self._forget(group)
+
+    def apply(self, tree: Tree[Any], query: str) -> int:
+        """Show the entries matching *query* in *tree*; return their count.
+
+        The first call (or the first after :meth:`detach`) clears *tree*;
+        later calls only add and remove the nodes whose visibility changed.
+        """
+        if self._tree is not tree:
+            self.detach()
+            tree.clear()
+            tree.show_root = False
+            self._tree = tree
+        q = query.lower().strip()
+
+        visible = [
+            [entry for entry in group.entries if entry.matches(q)]
+            for group in self.groups
+        ]
+        counts: Counter[str] = Counter()
+        for group, shown in zip(self.groups, visible):
+            counts[group.key] += len(shown)
+        matched = sum(counts.values())
+
+        if self._empty_node is not None and matched:
+            self._empty_node.remove()
+            self._empty_node = None
+
+        prev_group: TreeNode | None = None
+        for group, shown in zip(self.groups, visible):
+            if not shown:
+                if group.node is not None:
+                    group.node.remove()
+                    self._forget(group)
+                continue
+            count = counts[group.key]
+            if group.node is None:
+                group.node = _insert(
+                    tree.root, group.label(count), None, prev_group, expand=True
+                )
+            elif group.shown_count != count and group.counted:
+                group.node.set_label(group.label(count))
+            group.shown_count = count
+            self._sync_entries(group, shown)
+            prev_group = group.node
+
+        if q and not matched and self._empty_node is None:
+            self._empty_node = tree.root.add_leaf("No matching sessions")
+        return matched
+
+    @staticmethod
+    def _sync_entries(group: SessionTreeGroup, shown: list[SessionTreeEntry]) -> None:
+        assert group.node is not None
+        keep = {id(entry) for entry in shown}
+        prev: TreeNode | None = None
+        for entry in group.entries:
+            if id(entry) not in keep:
+                if entry.node is not None:
+                    entry.node.remove()
+                    entry.node = None
+                continue
+            if entry.node is None:
+                entry.node = _insert(group.node, entry.label, entry.session_id, prev)
+                entry.node.add_leaf(entry.detail)
+            prev = entry.node
+
+    @staticmethod
+    def _forget(group: SessionTreeGroup) -> None:
+        group.node = None
+        group.shown_count = -1
+        for entry in group.entries:
+            entry.node = None
+
+
+def _insert(
+    parent: TreeNode,
+    label: str,
+    data: Any,
+    after: TreeNode | None,
+    *,
+    expand: bool = False,
+) -> TreeNode:
+    """Add a child of *parent* right after *after* (first when ``None``)."""
+    if after is not None:
+        return parent.add(label, data, after=after, expand=expand)
+    if parent.children:
+        return parent.add(label, data, before=parent.children[0], expand=expand)
+    return parent.add(label, data, expand=expand)
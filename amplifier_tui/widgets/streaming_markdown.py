@@ -0,0 +1,264 @@
+"""Incremental markdown rendering for streaming assistant output.
+
+Re-rendering the whole accumulated response through Rich ``Markdown`` on
+every delta (every ~50 ms) makes a long answer cost O(n) per tick and
+O(n^2) overall; long code-heavy responses visibly stutter.
+
+:class:`StreamingMarkdown` splits the text into *finalized* blocks and an
+open *tail*.  Finalized blocks never change again (the stream is
+append-only), so each one is parsed once and its rendered lines are cached
+per width.  Only the tail is parsed on each delta.
+
+Key design decisions
+--------------------
+* **Conservative block boundaries** -- a block ends at a blank line (or a
+  closing code fence) *and* only once the next non-blank line has arrived
+  and does not continue it.  Indented lines and further list items keep a
+  list together, so loose lists and nested code are never split.
+* **Fence aware** -- blank lines inside ````` / ``~~~`` fences are not
+  boundaries; an unterminated fence stays in the tail.
+* **Line cache per width** -- a finalized block renders to a list of
+  segment lines once per ``max_width``; the widget re-renders on resize
+  without re-parsing.
+* **Reused on finalize** -- :meth:`StreamingMarkdown.finish` turns the
+  tail into blocks too, and the finished renderable is handed to the final
+  message widget so nothing is parsed twice.
+* **Styled like AssistantMessage** -- blocks parse with
+  :class:`AssistantMarkdown` (framed code fences) and are rendered under a
+  Rich :class:`~rich.theme.Theme` that mirrors the ``AssistantMessage``
+  rules in ``styles.tcss`` (see :class:`ThemedRenderable`).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import ClassVar
+
+from rich import box
+from rich.console import Console, ConsoleOptions, Group, RenderableType, RenderResult
+from rich.markdown import CodeBlock, Markdown, MarkdownElement
+from rich.panel import Panel
+from rich.segment import Segment
+from rich.syntax import Syntax
+from rich.theme import Theme
+
+#: Cursor appended to the tail while the block is still streaming.
+STREAM_CURSOR = " ▍"
+
+# Literal colours of ``AssistantMessage MarkdownFence`` in styles.tcss.
+_FENCE_BACKGROUND = "#0c0c18"
+_FENCE_BORDER = "#2a2a3e"
+
+#: Theme styles that depend on the Textual theme; used to key line caches.
+_THEMED_STYLES = ("markdown.h1", "markdown.block_quote", "markdown.hr")
+
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_LIST_RE = re.compile(r"^ {0,3}(?:[-+*]|\d{1,9}[.)])(?:\s|$)")
+
+
+def split_blocks(text: str) -> tuple[list[str], str]:
+    """Split *text* into finalized markdown blocks and the open tail.
+
+    Finalized blocks keep their trailing blank lines, so
+    ``"".join(blocks) + tail == text`` always holds.
+    """
+    blocks: list[str] = []
+    start = 0  # offset of the current block
+    pos = 0  # offset of the current line
+    fence: str | None = None  # opening fence marker while inside a fence
+    boundary = False  # a blank line / closing fence ended the last content
+    block_is_list = False  # the current block contains a list item
+
+    for line in text.splitlines(keepends=True):
+        if not line.endswith("\n"):
+            break  # partial last line -- always tail
+        stripped = line.strip()
+
+        if fence is not None:
+            if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                fence = None
+                boundary = True
+            pos += len(line)
+            continue
+
+        if not stripped:
+            if pos > start:
+                boundary = True
+            pos += len(line)
+            continue
+
+        if boundary:
+            continues = line[0] in " \t" or (block_is_list and _LIST_RE.match(line))
+            if not continues:
+                blocks.append(text[start:pos])
+                start = pos
+            boundary = False
+        if pos == start:
+            block_is_list = False
+        if _LIST_RE.match(line):
+            block_is_list = True
+
+        m = _FENCE_RE.match(line)
+        if m:
+            fence = m.group(1)
+        pos += len(line)
+
+    return blocks, text[start:]
+
+
+class _FencedCodeBlock(CodeBlock):
+    """A code block framed like ``AssistantMessage MarkdownFence``."""
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        syntax = Syntax(
+            str(self.text).rstrip(),
+            self.lexer_name,
+            theme=self.theme,
+            word_wrap=True,
+            padding=(1, 2),
+            background_color=_FENCE_BACKGROUND,
+        )
+        yield Panel(syntax, box=box.SQUARE, border_style=_FENCE_BORDER, padding=0)
+
+
+class AssistantMarkdown(Markdown):
+    """Rich ``Markdown`` with code fences framed as in assistant messages."""
+
+    elements: ClassVar[dict[str, type[MarkdownElement]]] = {
+        **Markdown.elements,
+        "fence": _FencedCodeBlock,
+        "code_block": _FencedCodeBlock,
+    }
+
+
+class ThemedRenderable:
+    """Render *renderable* with *theme* pushed onto the console.
+
+    Textual renders widgets with the app console, whose theme knows
+    nothing about the TCSS rules that style the :class:`Markdown` widget;
+    this carries the equivalent Rich styles along with the content.
+    """
+
+    def __init__(self, renderable: RenderableType, theme: Theme) -> None:
+        self.renderable = renderable
+        self.theme = theme
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        console.push_theme(self.theme)
+        try:
+            lines = console.render_lines(self.renderable, options, pad=False)
+        finally:
+            console.pop_theme()
+        new_line = Segment.line()
+        for line in lines:
+            yield from line
+            yield new_line
+
+
+class _Block:
+    """A markdown block whose rendered lines are cached per width and theme.
+
+    Rich separates top-level elements with a blank line unless the previous
+    element is a rule or the next one (a list, quote or table) already
+    starts with one.  *gap* says whether the preceding block asks for the
+    separator, so a sequence of blocks renders exactly like a single
+    ``Markdown`` of the whole text.
+    """
+
+    __slots__ = ("_lines", "_markdown", "gap", "new_line", "source")
+
+    def __init__(self, source: str, *, gap: bool = False) -> None:
+        self.source = source
+        self.gap = gap
+        self._markdown = AssistantMarkdown(source.strip("\n"))
+        top_level = [tok for tok in self._markdown.parsed if tok.level == 0]
+        self.new_line = bool(top_level) and getattr(
+            AssistantMarkdown.elements.get(top_level[-1].type), "new_line", True
+        )
+        self._lines: dict[tuple, list[list[Segment]]] = {}
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        # A theme switch changes these styles, so they are part of the key.
+        key = (options.max_width, *map(console.get_style, _THEMED_STYLES))
+        lines = self._lines.get(key)
+        if lines is None:
+            lines = console.render_lines(self._markdown, options, pad=False)
+            self._lines[key] = lines
+        new_line = Segment.line()
+        if self.gap and lines and any(seg.text for seg in lines[0]):
+            yield new_line
+        for line in lines:
+            yield from line
+            yield new_line
+
+
+class StreamingMarkdown:
+    """Accumulated markdown text rendered incrementally.
+
+    Usage::
+
+        stream = StreamingMarkdown()
+        stream.update(accumulated_text)      # on every delta
+        widget.update(stream.renderable())
+        ...
+        final = stream.finish(full_text)     # on block end
+    """
+
+    def __init__(self) -> None:
+        self._blocks: list[_Block] = []
+        self._consumed = 0  # length of text covered by self._blocks
+        self._text = ""
+        self._tail = ""
+        self._finished = False
+
+    @property
+    def block_count(self) -> int:
+        """Number of finalized (cached) blocks."""
+        return len(self._blocks)
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def reset(self) -> None:
+        self._blocks.clear()
+        self._consumed = 0
+        self._text = ""
+        self._tail = ""
+        self._finished = False
+
+    def update(self, text: str) -> None:
+        """Advance to the accumulated *text*; only the open tail is re-split."""
+        if not text.startswith(self._text[: self._consumed]):
+            self.reset()  # not an extension (should not happen) -- start over
+        self._text = text
+        new_blocks, self._tail = split_blocks(text[self._consumed :])
+        for source in new_blocks:
+            self._blocks.append(_Block(source, gap=self._gap()))
+            self._consumed += len(source)
+
+    def finish(self, text: str | None = None) -> Group:
+        """Finalize the remaining tail and return the complete renderable."""
+        if text is not None:
+            self.update(text)
+        if self._tail.strip():
+            self._blocks.append(_Block(self._tail, gap=self._gap()))
+            self._consumed += len(self._tail)
+        self._tail = ""
+        self._finished = True
+        return self.renderable()
+
+    def renderable(self) -> Group:
+        """Return a renderable of the cached blocks plus the freshly parsed tail."""
+        if self._finished:
+            return Group(*self._blocks)
+        return Group(*self._blocks, _Block(self._tail + STREAM_CURSOR, gap=self._gap()))
+
+    def _gap(self) -> bool:
+        return bool(self._blocks) and self._blocks[-1].new_line
@@ -31,6 +31,8 @@ class TabBar(Horizontal):
         self.remove_children()
         for i, tab in enumerate(tabs):
             label = tab.custom_name or tab.name
+            if tab.restore_label:
+                label = f"{label} \u00b7 {tab.restore_label}"
             # Mark split panes in tab bar
             if split_left is not None and i == split_left:
                 label = f"\u25e7 {label}"
@@ -9,17 +9,28 @@ Changes from upstream:
 - Simplified to "system" colors only (no Textual color detection)
 - Added Terminal.Stopped message for command termination
 - Feature-flag guard via TERMINAL_AVAILABLE sentinel
+- Incremental rendering: only rows in pyte's ``screen.dirty`` set (plus the
+  old and new cursor rows) are rebuilt, unchanged rows reuse their cached
+  ``Text``; output bursts are coalesced into at most ``max_fps`` frames;
+  styles are memoized per pyte attribute tuple
+- Lossless PTY reader: output goes through a bounded chunk queue with an
+  incremental UTF-8 decoder, and the reader pauses while the queue is full
+- Scrollback via pyte ``HistoryScreen`` (mouse wheel pages through it when
+  the program is not tracking the mouse)
 """
 
 from __future__ import annotations
 
 import asyncio
+import codecs
 import os
 import re
 import signal
 import shlex
 import struct
+import time
 from asyncio import Task
+from functools import lru_cache
 
 try:
     import fcntl
@@ -42,7 +53,7 @@ from textual.message import Message
 from textual.widget import Widget
 
 
-class _TerminalPyteScreen(pyte.Screen if TERMINAL_AVAILABLE else object):
+class _TerminalPyteScreen(pyte.HistoryScreen if TERMINAL_AVAILABLE else object):
     """Overrides pyte.Screen to handle TERM=xterm edge cases."""
 
     def set_margins(self, *args, **kwargs):
@@ -61,6 +72,18 @@ class _TerminalDisplay:
             yield line
 
 
+#: Default cap on screen redraws per second; output in between is coalesced.
+TERMINAL_MAX_FPS: float = 30.0
+
+#: Default number of scrolled-off lines kept for scrollback.
+TERMINAL_SCROLLBACK: int = 1000
+
+#: Bytes read from the PTY per callback.
+_READ_BYTES: int = 65536
+
+#: Decoded chunks queued for the widget before the PTY reader pauses.
+_QUEUE_CHUNKS: int = 64
+
 _RE_ANSI_SEQUENCE = re.compile(r"(\x1b\[\??[\d;]*[a-zA-Z])")
 _DECSET_PREFIX = "\x1b[?"
 
@@ -114,9 +137,12 @@ class Terminal(Widget, can_focus=True):
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
+        max_fps: float = TERMINAL_MAX_FPS,
+        scrollback: int = TERMINAL_SCROLLBACK,
     ) -> None:
         shell = command or os.environ.get("SHELL", "/bin/bash")
         self.command = shell
+        self.max_fps = max_fps
 
         self.ncol = 80
         self.nrow = 24
@@ -127,9 +153,14 @@ class Terminal(Widget, can_focus=True):
         self._recv_queue: asyncio.Queue | None = None
         self._recv_task: Task | None = None
 
-        self._screen = _TerminalPyteScreen(self.ncol, self.nrow)
+        self._screen = _TerminalPyteScreen(self.ncol, self.nrow, history=scrollback)
         self._stream = pyte.Stream(self._screen)
         self._display: _TerminalDisplay = _TerminalDisplay([Text()])
+        # Rendered rows, rebuilt only when pyte marks them dirty
+        self._lines: list[Text] = []
+        self._cursor_row: int | None = None
+        self._last_render = 0.0
+        self._render_handle: asyncio.TimerHandle | None = None
 
         super().__init__(name=name, id=id, classes=classes)
 
@@ -148,6 +179,10 @@ class Terminal(Widget, can_focus=True):
         if self._emulator is None:
             return
         self._display = _TerminalDisplay([Text()])
+        self._lines = []
+        if self._render_handle is not None:
+            self._render_handle.cancel()
+            self._render_handle = None
         if self._recv_task is not None:
             self._recv_task.cancel()
         self._emulator.stop()
@@ -191,13 +226,21 @@ class Terminal(Widget, can_focus=True):
             await self._send_queue.put(["click", event.x, event.y, event.button])
 
     async def on_mouse_scroll_down(self, event: events.MouseScrollDown) -> None:
-        if self._emulator is None or not self.mouse_tracking:
+        if self._emulator is None:
+            return
+        if not self.mouse_tracking:
+            self._screen.next_page()
+            self._render_screen()
             return
         if self._send_queue is not None:
             await self._send_queue.put(["scroll", "down", event.x, event.y])
 
     async def on_mouse_scroll_up(self, event: events.MouseScrollUp) -> None:
-        if self._emulator is None or not self.mouse_tracking:
+        if self._emulator is None:
+            return
+        if not self.mouse_tracking:
+            self._screen.prev_page()
+            self._render_screen()
             return
         if self._send_queue is not None:
             await self._send_queue.put(["scroll", "up", event.x, event.y])
@@ -206,100 +249,149 @@ class Terminal(Widget, can_focus=True):
         """Receive loop: reads PTY output and renders to screen buffer."""
         try:
             while True:
-                if self._recv_queue is None:
+                queue = self._recv_queue
+                if queue is None:
                     break
-                message = await self._recv_queue.get()
-                cmd = message[0]
-
-                if cmd == "setup":
-                    if self._send_queue is not None:
-                        await self._send_queue.put(["set_size", self.nrow, self.ncol])
-
-                elif cmd == "stdout":
-                    chars = message[1]
-                    # Track mouse mode changes
-                    for sep_match in re.finditer(_RE_ANSI_SEQUENCE, chars):
-                        seq = sep_match.group(0)
-                        if seq.startswith(_DECSET_PREFIX):
-                            params = seq.removeprefix(_DECSET_PREFIX).split(";")
-                            if "1000h" in params:
-                                self.mouse_tracking = True
-                            if "1000l" in params:
-                                self.mouse_tracking = False
-
-                    try:
-                        self._stream.feed(chars)
-                    except TypeError as error:
-                        log.warning("could not feed:", error)
-
-                    self._render_screen()
-
-                elif cmd == "disconnect":
-                    self.stop()
-                    self.post_message(self.Stopped(self))
+                # Take everything already queued and draw it in one frame
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                fed = False
+                for message in batch:
+                    cmd = message[0]
+                    if cmd == "setup":
+                        if self._send_queue is not None:
+                            await self._send_queue.put(
+                                ["set_size", self.nrow, self.ncol]
+                            )
+                    elif cmd == "stdout":
+                        self._feed(message[1])
+                        fed = True
+                    elif cmd == "disconnect":
+                        self.stop()
+                        self.post_message(self.Stopped(self))
+                        return
+
+                if fed:
+                    self._schedule_render()
+                if self._emulator is not None:
+                    self._emulator.resume_reading()
 
         except asyncio.CancelledError:
             pass
 
+    def _feed(self, chars: str) -> None:
+        """Feed PTY output to pyte, tracking mouse mode changes."""
+        if _DECSET_PREFIX in chars:
+            for sep_match in re.finditer(_RE_ANSI_SEQUENCE, chars):
+                seq = sep_match.group(0)
+                if seq.startswith(_DECSET_PREFIX):
+                    params = seq.removeprefix(_DECSET_PREFIX).split(";")
+                    if "1000h" in params:
+                        self.mouse_tracking = True
+                    if "1000l" in params:
+                        self.mouse_tracking = False
+
+        try:
+            self._stream.feed(chars)
+        except TypeError as error:
+            log.warning("could not feed:", error)
+
+    def _schedule_render(self) -> None:
+        """Render now, or at the next frame if one was drawn too recently."""
+        if self._render_handle is not None:
+            return  # a frame is already due; it will pick up this output
+        frame = 1.0 / self.max_fps if self.max_fps > 0 else 0.0
+        delay = self._last_render + frame - time.monotonic()
+        if delay <= 0:
+            self._render_screen()
+            return
+        loop = asyncio.get_running_loop()
+        self._render_handle = loop.call_later(delay, self._render_screen)
+
     def _render_screen(self) -> None:
         """Render the pyte screen buffer into Rich Text lines."""
-        lines: list[Text] = []
-        for y in range(self._screen.lines):
-            line_text = Text()
-            line = self._screen.buffer[y]
-            style_change_pos: int = 0
-
-            for x in range(self._screen.columns):
-                char: Char = line[x]
-                line_text.append(char.data)
-
-                if x > 0:
-                    last_char: Char = line[x - 1]
-                    if (
-                        not self._char_style_eq(char, last_char)
-                        or x == self._screen.columns - 1
-                    ):
-                        style = self._char_to_style(last_char)
-                        if style:
-                            line_text.stylize(style, style_change_pos, x + 1)
-                        style_change_pos = x
-
-                if self._screen.cursor.x == x and self._screen.cursor.y == y:
-                    line_text.stylize("reverse", x, x + 1)
-
-            lines.append(line_text)
-
-        self._display = _TerminalDisplay(lines)
+        self._render_handle = None
+        self._last_render = time.monotonic()
+        self._update_lines()
+        self._display = _TerminalDisplay(self._lines)
         self.refresh()
 
-    @staticmethod
-    def _char_to_style(char: Char) -> Style | None:
-        """Convert a pyte Char to a Rich Style."""
-        fg = _fix_color(char.fg)
-        bg = _fix_color(char.bg)
-        try:
-            return Style(
-                color=fg if fg != "default" else None,
-                bgcolor=bg if bg != "default" else None,
-                bold=char.bold,
-            )
-        except ColorParseError as error:
-            log.warning("color parse error:", error)
-            return None
+    def _update_lines(self) -> list[Text]:
+        """Rebuild the rows pyte marked dirty and the cursor rows."""
+        screen = self._screen
+        dirty = screen.dirty
+        if len(self._lines) != screen.lines:
+            self._lines = [Text()] * screen.lines
+            dirty.update(range(screen.lines))
+        cursor = screen.cursor
+        # Hidden while scrolled back (or by the program, DECTCEM).
+        cursor_row = None if cursor.hidden else cursor.y
+        # The cursor's old row loses its highlight; its row may have only
+        # moved the cursor along it, which pyte does not mark dirty.
+        if self._cursor_row is not None:
+            dirty.add(self._cursor_row)
+        if cursor_row is not None:
+            dirty.add(cursor_row)
+        self._cursor_row = cursor_row
+        for y in dirty:
+            if 0 <= y < screen.lines:
+                self._lines[y] = self._render_line(
+                    y, cursor.x if y == cursor_row else None
+                )
+        dirty.clear()
+        return self._lines
+
+    def _render_line(self, y: int, cursor_x: int | None) -> Text:
+        """Build the Rich Text for screen row *y* from runs of equal style."""
+        line = self._screen.buffer[y]
+        columns = self._screen.columns
+        text = Text()
+        run: list[str] = []
+        run_key: tuple | None = None
+        for x in range(columns):
+            char: Char = line[x]
+            key = char[1:]  # fg, bg, bold, italics, underscore, ... blink
+            if key != run_key:
+                if run:
+                    text.append("".join(run), _style_for(run_key))
+                    run = []
+                run_key = key
+            run.append(char.data)
+        if run:
+            text.append("".join(run), _style_for(run_key))
+        if cursor_x is not None and 0 <= cursor_x < columns:
+            text.stylize("reverse", cursor_x, cursor_x + 1)
+        return text
 
     @staticmethod
-    def _char_style_eq(a: Char, b: Char) -> bool:
-        """Compare two pyte Chars for style equality."""
-        return (
-            a.fg == b.fg
-            and a.bg == b.bg
-            and a.bold == b.bold
-            and a.italics == b.italics
-            and a.underscore == b.underscore
-            and a.strikethrough == b.strikethrough
-            and a.reverse == b.reverse
-            and a.blink == b.blink
+    def _char_to_style(char: Char) -> Style | None:
+        """Convert a pyte Char to a Rich Style (memoized per attribute set)."""
+        return _style_for(tuple(char[1:]))
+
+
+@lru_cache(maxsize=1024)
+def _style_for(key: tuple) -> Style | None:
+    """Rich Style for a pyte attribute tuple (``Char`` minus ``data``)."""
+    fg, bg, bold, italics, underscore, strikethrough, reverse, blink = key
+    fg = _fix_color(fg)
+    bg = _fix_color(bg)
+    try:
+        style = Style(
+            color=fg if fg != "default" else None,
+            bgcolor=bg if bg != "default" else None,
+            bold=bold or None,
+            italic=italics or None,
+            underline=underscore or None,
+            strike=strikethrough or None,
+            reverse=reverse or None,
+            blink=blink or None,
         )
+    except ColorParseError as error:
+        log.warning("color parse error:", error)
+        return None
+    return style or None
 
 
 def _fix_color(color: str) -> str:
@@ -316,37 +408,37 @@ def _fix_color(color: str) -> str:
 class _TerminalEmulator:
     """PTY subprocess manager."""
 
-    def __init__(self, command: str) -> None:
+    def __init__(self, command: str, *, queue_chunks: int = _QUEUE_CHUNKS) -> None:
         self.ncol = 80
         self.nrow = 24
-        self.data_or_disconnect: str | None = None
         self.run_task: asyncio.Task | None = None
-        self.send_task: asyncio.Task | None = None
+        self.disconnect_task: asyncio.Task | None = None
 
         self.fd = self._open_pty(command)
         self.p_out = os.fdopen(self.fd, "w+b", 0)
         self.recv_queue: asyncio.Queue = asyncio.Queue()
-        self.send_queue: asyncio.Queue = asyncio.Queue()
-        self.event = asyncio.Event()
+        # Bounded: when the widget falls behind, reading pauses (the child
+        # then blocks on a full PTY) instead of output piling up or being lost.
+        self.send_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_chunks)
+        # Multibyte characters may straddle reads.
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._reading = False
+        self._eof = False
         self.pid: int  # set in _open_pty
 
     def start(self) -> None:
         self.run_task = asyncio.create_task(self._run())
-        self.send_task = asyncio.create_task(self._send_data())
 
     def stop(self) -> None:
         # 1. Remove the fd reader FIRST (prevents callbacks on dead fd)
-        try:
-            loop = asyncio.get_running_loop()
-            loop.remove_reader(self.p_out)
-        except Exception:
-            pass
+        self._eof = True
+        self._pause_reading()
 
         # 2. Cancel async tasks
         if self.run_task:
             self.run_task.cancel()
-        if self.send_task:
-            self.send_task.cancel()
+        if self.disconnect_task:
+            self.disconnect_task.cancel()
 
         # 3. Close the PTY fd
         try:
@@ -379,22 +471,53 @@ class _TerminalEmulator:
             os.execvpe(argv[0], argv, env)
         return fd
 
-    async def _run(self) -> None:
-        loop = asyncio.get_running_loop()
+    def resume_reading(self) -> None:
+        """Restart a paused reader once the widget has drained the queue."""
+        if not self._reading and not self._eof and self.send_queue.empty():
+            self._start_reading()
+
+    def _start_reading(self) -> None:
+        try:
+            asyncio.get_running_loop().add_reader(self.p_out, self._on_output)
+            self._reading = True
+        except (OSError, ValueError):  # PTY already closed
+            log.warning("could not watch PTY")
+
+    def _pause_reading(self) -> None:
+        if not self._reading:
+            return
+        self._reading = False
+        try:
+            asyncio.get_running_loop().remove_reader(self.p_out)
+        except (OSError, ValueError, RuntimeError):
+            pass
 
-        def on_output():
-            try:
-                self.data_or_disconnect = self.p_out.read(65536).decode()
-                self.event.set()
-            except UnicodeDecodeError as error:
-                log.warning("decode error:", error)
-            except Exception:
-                loop.remove_reader(self.p_out)
-                self.data_or_disconnect = None
-                self.event.set()
-
-        loop.add_reader(self.p_out, on_output)
+    def _on_output(self) -> None:
+        """Reader callback: queue one decoded chunk; pause when full."""
+        try:
+            data = self.p_out.read(_READ_BYTES)
+        except OSError:  # EIO once the child has exited
+            data = b""
+        if data:
+            text = self._decoder.decode(data)
+            if text:
+                self.send_queue.put_nowait(["stdout", text])
+            if self.send_queue.full():
+                self._pause_reading()
+            return
+        # EOF: flush a trailing partial character, then report the exit.
+        self._eof = True
+        self._pause_reading()
+        text = self._decoder.decode(b"", final=True)
+        if text:
+            self.send_queue.put_nowait(["stdout", text])
+        self.disconnect_task = asyncio.ensure_future(
+            self.send_queue.put(["disconnect", 1])
+        )
+
+    async def _run(self) -> None:
         await self.send_queue.put(["setup", {}])
+        self._start_reading()
         try:
             while True:
                 msg = await self.recv_queue.get()
@@ -418,15 +541,3 @@ class _TerminalEmulator:
                         self.p_out.write(f"\x1b[<65;{x};{y}M".encode())
         except asyncio.CancelledError:
             pass
-
-    async def _send_data(self) -> None:
-        try:
-            while True:
-                await self.event.wait()
-                self.event.clear()
-                if self.data_or_disconnect is not None:
-                    await self.send_queue.put(["stdout", self.data_or_disconnect])
-                else:
-                    await self.send_queue.put(["disconnect", 1])
-        except asyncio.CancelledError:
-            pass
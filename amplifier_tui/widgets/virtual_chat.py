@@ -0,0 +1,443 @@
+"""Virtualized transcript view for replayed sessions.
+
+Replaying a long session used to mount one widget per message, thinking
+block, tool call and timestamp -- thousands of widgets for a 2,000-turn
+session, seconds to open and hundreds of MB of memory.
+
+:class:`VirtualTranscript` keeps a lightweight :class:`ChatRecord` per
+block and only mounts widgets for the part of the transcript near the
+viewport.
+
+Key design decisions
+--------------------
+* **Pages, not rows** -- records are grouped into fixed-size pages.  An
+  unrealized page is an empty container whose height is pinned to its last
+  measured height (or an estimate before it was ever shown), so the
+  scrollbar keeps its full range and releasing a page never moves content.
+* **Window with hysteresis** -- pages within one viewport of the visible
+  area are realized; pages are only released once they are
+  :data:`RELEASE_SCREENS` viewports away, so small scrolls do not churn.
+* **Anchored realization** -- realizing a page above the viewport replaces
+  an estimate with the real height; the scroll offset is shifted by the
+  difference so visible content stays put.
+* **State lives in records** -- the primary widget's CSS classes are saved
+  in :attr:`ChatRecord.classes` on release so ``build`` can restore UI
+  state such as folding; state kept elsewhere (bookmarks, pins, find
+  matches) is re-derived in the ``on_realize`` callback.
+* **On-demand realization** -- :meth:`VirtualTranscript.realize` mounts the
+  page holding a given record so jumps (bookmarks, find, pins) can scroll
+  to a real widget.
+* **Frame budget** -- at most :data:`REALIZE_PAGES_PER_FRAME` pages are
+  mounted per refresh, nearest to the viewport first; the rest follow on
+  the next refresh so a long jump never stalls a frame.
+* **Growing history** -- :meth:`VirtualTranscript.add_history` holds older
+  records outside the view; :data:`HISTORY_BATCH` of them are prepended as
+  released pages (anchored) whenever the view nears the top.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from textual.containers import Vertical
+from textual.widget import Widget
+
+#: Records per page.
+PAGE_SIZE: int = 25
+
+#: Realize pages within this many viewport heights of the visible area.
+BUFFER_SCREENS: float = 1.0
+
+#: Release realized pages further than this many viewport heights away.
+RELEASE_SCREENS: float = 3.0
+
+#: Pages mounted per refresh by the windowing pass.
+REALIZE_PAGES_PER_FRAME: int = 2
+
+#: Held history records moved into the view per step as it nears the top.
+HISTORY_BATCH: int = 200
+
+#: Estimated heights (in lines) of the collapsed / one-line record kinds.
+_FIXED_HEIGHTS: dict[str, int] = {"meta": 1, "thinking": 3, "tool": 3}
+
+
+@dataclass(eq=False)
+class ChatRecord:
+    """One replayed chat block, mounted or not.
+
+    *kind* is ``"user"``, ``"assistant"``, ``"thinking"``, ``"tool"`` or
+    ``"meta"``; *data* carries kind-specific fields (tool name/input/result,
+    timestamp).  *search_index* points into the app's ``_search_messages``
+    and *msg_index* is the assistant message index used by bookmarks.
+    """
+
+    kind: str
+    content: str = ""
+    search_index: int | None = None
+    msg_index: int | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+    classes: set[str] | None = None  # saved CSS classes while released
+    widgets: list[Widget] = field(default_factory=list)  # mounted widgets
+
+    @property
+    def widget(self) -> Widget | None:
+        """The primary widget while mounted (first of :attr:`widgets`)."""
+        return self.widgets[0] if self.widgets else None
+
+
+def estimate_height(record: ChatRecord, width: int) -> int:
+    """Rough rendered height of *record* at *width* columns."""
+    fixed = _FIXED_HEIGHTS.get(record.kind)
+    if fixed is not None:
+        return fixed
+    cols = max(width - 6, 20)  # border + padding
+    lines = sum(max(1, -(-len(line) // cols)) for line in record.content.split("\n"))
+    if record.classes is not None and "folded" in record.classes:
+        lines = min(lines, 5) + 1  # max-height plus the fold toggle
+    margin = 3 if record.kind == "user" else 1
+    return lines + margin
+
+
+class TranscriptPage(Vertical):
+    """A fixed slice of records; empty with a pinned height while released."""
+
+    DEFAULT_CSS = """
+    TranscriptPage {
+        height: auto;
+    }
+    """
+
+    def __init__(self, records: list[ChatRecord]) -> None:
+        super().__init__()
+        self.records = records
+        self.realized = False
+        self.measured: tuple[int, int] | None = None  # (width, height)
+
+
+class VirtualTranscript(Vertical):
+    """Mounts only the replayed records near the viewport of its scroll parent.
+
+    *build* turns a record into its widgets (primary widget first).
+    *on_realize* / *on_release* are called per record after its widgets are
+    created / before they are dropped.
+
+    ``history_pending`` is a flag for the owner: set it while older records
+    are still being loaded and the indices of the current ones are provisional.
+    """
+
+    DEFAULT_CSS = """
+    VirtualTranscript {
+        height: auto;
+    }
+    """
+
+    def __init__(
+        self,
+        records: Iterable[ChatRecord],
+        build: Callable[[ChatRecord], list[Widget]],
+        *,
+        on_realize: Callable[[ChatRecord], None] | None = None,
+        on_release: Callable[[ChatRecord], None] | None = None,
+        page_size: int = PAGE_SIZE,
+    ) -> None:
+        super().__init__(classes="virtual-transcript")
+        self._page_size = max(1, page_size)
+        self._pages = self._paginate(list(records))
+        self._build = build
+        self._on_realize = on_realize
+        self._on_release = on_release
+        self._history: list[ChatRecord] = []  # held, not yet paged
+        self.history_pending = False
+        self._update_pending = False
+        self._shift_pending = False  # prepended pages not yet compensated
+        self._target: TranscriptPage | None = None  # realized for a jump
+
+    # -- public API -----------------------------------------------------------
+
+    @property
+    def records(self) -> Iterator[ChatRecord]:
+        yield from self._history
+        for page in self._pages:
+            yield from page.records
+
+    @property
+    def realized_pages(self) -> int:
+        return sum(1 for page in self._pages if page.realized)
+
+    def mounted_widgets(self) -> Iterator[Widget]:
+        """Widgets of all currently realized records, in order."""
+        for page in self._pages:
+            if page.realized:
+                for record in page.records:
+                    yield from record.widgets
+
+    def find(self, predicate: Callable[[ChatRecord], bool]) -> ChatRecord | None:
+        for record in self.records:
+            if predicate(record):
+                return record
+        return None
+
+    def realize(self, record: ChatRecord) -> Widget | None:
+        """Mount the page holding *record* and return its primary widget.
+
+        The page is kept mounted until the viewport reaches it, so the
+        caller can scroll to the widget.
+        """
+        if record in self._history:
+            # Bring the held history from this record onwards into the view.
+            start = self._history.index(record)
+            held, self._history = self._history[start:], self._history[:start]
+            self.prepend(held)
+        for page in self._pages:
+            if record in page.records:
+                if not page.realized:
+                    self._realize_page(page, anchor=False)
+                self._target = page
+                return record.widget
+        return None
+
+    def set_released_class(self, name: str, enabled: bool) -> None:
+        """Add or remove class *name* on every record that is not mounted."""
+        released = [page.records for page in self._pages if not page.realized]
+        for records in [self._history, *released]:
+            for record in records:
+                classes = set() if record.classes is None else record.classes
+                if enabled:
+                    classes.add(name)
+                else:
+                    classes.discard(name)
+                record.classes = classes
+
+    def add_history(self, records: Iterable[ChatRecord]) -> None:
+        """Hold older *records* (oldest first) before the first one.
+
+        They join the view :data:`HISTORY_BATCH` at a time as it nears the
+        top, so a long history costs nothing until it is scrolled to.
+        """
+        self._history[:0] = list(records)
+        if self.is_attached:
+            self._schedule_update()
+
+    def prepend(self, records: Iterable[ChatRecord]) -> None:
+        """Insert older *records* before the first one.
+
+        The new pages start released with estimated heights; the scroll
+        offset is shifted by their height so the visible content stays put.
+        """
+        pages = self._paginate(list(records))
+        if not pages:
+            return
+        width = self._width()
+        added = 0
+        for page in pages:
+            height = self._page_height(page, width)
+            page.styles.height = height
+            added += height
+        first = self._pages[0] if self._pages else None
+        self._pages[:0] = pages
+        if not self.is_attached:
+            return
+        if first is not None:
+            self.mount_all(pages, before=first)
+        else:
+            self.mount_all(pages)
+        self._shift_pending = True
+        self.call_after_refresh(self._shift_view, added)
+
+    def discard(self, search_indices: set[int]) -> None:
+        """Drop records whose ``search_index`` is in *search_indices*.
+
+        Later records are re-indexed as if the matching ``_search_messages``
+        entries had been deleted (used by undo).
+        """
+        if not search_indices:
+            return
+        removed = sorted(search_indices)
+
+        def keep(records: list[ChatRecord]) -> list[ChatRecord]:
+            kept: list[ChatRecord] = []
+            for record in records:
+                idx = record.search_index
+                if idx is not None and idx in search_indices:
+                    for widget in record.widgets:
+                        if widget.is_attached:
+                            widget.remove()
+                    record.widgets = []
+                    continue
+                if idx is not None:
+                    record.search_index = idx - sum(1 for r in removed if r < idx)
+                kept.append(record)
+            return kept
+
+        self._history = keep(self._history)
+        for page in self._pages:
+            page.records = keep(page.records)
+
+    # -- lifecycle ------------------------------------------------------------
+
+    def compose(self):
+        yield from self._pages
+
+    def on_mount(self) -> None:
+        viewport = self._viewport_height()
+        width = self._width()
+        for page in self._pages:
+            page.styles.height = self._page_height(page, width)
+        # Realize enough of the end (where the view starts) to fill the screen.
+        filled = 0
+        for page in reversed(self._pages):
+            if filled >= viewport * (1 + BUFFER_SCREENS):
+                break
+            filled += self._page_height(page, width)
+            self._realize_page(page, anchor=False)
+        if self.parent is not None:
+            self.watch(self.parent, "scroll_y", self._on_parent_scroll, init=False)
+        self.call_after_refresh(self._settle)
+
+    def on_resize(self) -> None:
+        # Heights measured at another width no longer apply to released pages.
+        width = self._width()
+        for page in self._pages:
+            if not page.realized:
+                page.styles.height = self._page_height(page, width)
+        self._schedule_update()
+
+    def _settle(self) -> None:
+        # Replay opens at the bottom; pages realized in on_mount only have
+        # their real heights after this refresh.
+        parent = self.parent
+        if isinstance(parent, Widget):
+            parent.scroll_end(animate=False)
+            parent.call_after_refresh(parent.scroll_end, animate=False)
+        self._schedule_update()
+
+    def _on_parent_scroll(self, _old: float, _new: float) -> None:
+        self._schedule_update()
+
+    def _shift_view(self, delta: int) -> None:
+        self._shift_pending = False
+        parent = self.parent
+        if isinstance(parent, Widget) and delta:
+            # Immediate, so the next windowing pass sees the new offset.
+            parent.scroll_to(y=parent.scroll_y + delta, animate=False, immediate=True)
+        self._schedule_update()
+
+    # -- windowing ------------------------------------------------------------
+
+    def _schedule_update(self) -> None:
+        if not self._update_pending:
+            self._update_pending = True
+            self.call_after_refresh(self._update_window)
+
+    def _update_window(self) -> None:
+        self._update_pending = False
+        parent = self.parent
+        if not isinstance(parent, Widget) or not self.is_attached:
+            return
+        viewport = self._viewport_height()
+        top = parent.scroll_y - self.virtual_region.y
+        near = (top - viewport * BUFFER_SCREENS, top + viewport * (1 + BUFFER_SCREENS))
+        far = (top - viewport * RELEASE_SCREENS, top + viewport * (1 + RELEASE_SCREENS))
+        wanted: list[tuple[int, TranscriptPage, bool]] = []
+        y = 0
+        for page in self._pages:
+            height = page.outer_size.height
+            page_top, page_bottom = y, y + height
+            y = page_bottom
+            if page is self._target:
+                if page_bottom >= top and page_top <= top + viewport:
+                    self._target = None
+            elif page.realized:
+                if page_bottom < far[0] or page_top > far[1]:
+                    self._release_page(page)
+            elif page_bottom >= near[0] and page_top <= near[1]:
+                distance = max(top - page_bottom, page_top - (top + viewport), 0)
+                wanted.append((distance, page, page_bottom <= top))
+        # Nearest pages first; the rest wait for the next refresh.
+        wanted.sort(key=lambda item: item[0])
+        for _distance, page, anchor in wanted[:REALIZE_PAGES_PER_FRAME]:
+            self._realize_page(page, anchor=anchor)
+        if len(wanted) > REALIZE_PAGES_PER_FRAME:
+            self._schedule_update()
+        if self._history and near[0] <= 0 and not self._shift_pending:
+            held = self._history[-HISTORY_BATCH:]
+            del self._history[-HISTORY_BATCH:]
+            self.prepend(held)
+
+    def _realize_page(self, page: TranscriptPage, *, anchor: bool) -> None:
+        widgets: list[Widget] = []
+        for record in page.records:
+            record.widgets = list(self._build(record))
+            widgets.extend(record.widgets)
+        old_height = page.outer_size.height
+        page.realized = True
+        page.styles.height = "auto"
+        if widgets:
+            page.mount_all(widgets)
+        if self._on_realize is not None:
+            for record in page.records:
+                self._on_realize(record)
+        if anchor:
+            self.call_after_refresh(self._anchor, page, old_height)
+
+    def _anchor(self, page: TranscriptPage, old_height: int) -> None:
+        """Keep visible content still after a page above it changed height."""
+        parent = self.parent
+        delta = page.outer_size.height - old_height
+        if not delta or not isinstance(parent, Widget):
+            return
+        # The view may have moved (e.g. an animated jump) since the page was
+        # realized; only compensate if it is still entirely above the view.
+        top = parent.scroll_y - self.virtual_region.y
+        if self._page_top(page) + old_height <= top:
+            parent.scroll_to(y=parent.scroll_y + delta, animate=False)
+
+    def _release_page(self, page: TranscriptPage) -> None:
+        height = page.outer_size.height
+        for record in page.records:
+            widget = record.widget
+            if widget is not None:
+                record.classes = set(widget.classes)
+            if self._on_release is not None:
+                self._on_release(record)
+            record.widgets = []
+        page.measured = (self._width(), height)
+        page.styles.height = height
+        page.realized = False
+        page.remove_children()
+
+    # -- measurements ---------------------------------------------------------
+
+    def _paginate(self, records: list[ChatRecord]) -> list[TranscriptPage]:
+        size = self._page_size
+        return [
+            TranscriptPage(records[i : i + size]) for i in range(0, len(records), size)
+        ]
+
+    def _viewport_height(self) -> int:
+        parent = self.parent
+        height = parent.size.height if isinstance(parent, Widget) else 0
+        return max(height, 10)
+
+    def _width(self) -> int:
+        return self.size.width or self._viewport_width()
+
+    def _viewport_width(self) -> int:
+        parent = self.parent
+        width = parent.size.width if isinstance(parent, Widget) else 0
+        return max(width, 40)
+
+    def _page_top(self, page: TranscriptPage) -> int:
+        y = 0
+        for other in self._pages:
+            if other is page:
+                break
+            y += other.outer_size.height
+        return y
+
+    def _page_height(self, page: TranscriptPage, width: int) -> int:
+        if page.measured is not None and page.measured[0] == width:
+            return page.measured[1]
+        return sum(estimate_height(record, width) for record in page.records)
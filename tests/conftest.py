@@ -5,6 +5,14 @@ from __future__ import annotations
 import pytest
 from pathlib import Path
 
+from amplifier_tui.core.features.tokenizer import token_counter
+
+
+@pytest.fixture(autouse=True)
+def _reset_token_calibration(monkeypatch):
+    """Keep the shared token counter's calibration from leaking across tests."""
+    monkeypatch.setattr(token_counter, "scale", 1.0)
+
 
 @pytest.fixture
 def tmp_dir(tmp_path: Path) -> Path:
@@ -7,6 +7,7 @@ Amplifier backend is stubbed out so no real sessions are created.
 
 from __future__ import annotations
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -225,3 +226,489 @@ class TestNewTab:
             initial_count = len(app._tabs)
             await pilot.press("ctrl+t")
             assert len(app._tabs) == initial_count + 1
+
+
+class TestTranscriptResume:
+    """Resuming shows the transcript tail first, then attaches history."""
+
+    @pytest.mark.asyncio
+    async def test_history_loads_behind_tail(self, app, tmp_path):
+        path = tmp_path / "transcript.jsonl"
+        with open(path, "w", encoding="utf-8") as fh:
+            for i in range(60):
+                fh.write(json.dumps({"role": "user", "content": f"q{i}"}) + "\n")
+                fh.write(json.dumps({"role": "assistant", "content": f"a{i}"}) + "\n")
+        with patch("amplifier_tui.app.TRANSCRIPT_TAIL_MESSAGES", 10):
+            async with app.run_test(size=(120, 40)) as pilot:
+                app._display_transcript(path)
+                assert [text for _, text, _ in app._search_messages[:2]] == [
+                    "q55",
+                    "a55",
+                ]
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                texts = [text for _, text, _ in app._search_messages]
+                assert texts[:2] == ["q0", "a0"]
+                assert texts[-1] == "a59"
+                assert app._user_message_count == 60
+                assert app._assistant_msg_index == 60
+                transcript = app._active_transcript()
+                assert transcript is not None
+                assert not transcript.history_pending
+                last = transcript.find(lambda r: r.search_index == 119)
+                assert last is not None and last.msg_index == 59
+
+
+class TestTranscriptToolResults:
+    """Replayed tool calls carry their (lazily flattened) results."""
+
+    @pytest.mark.asyncio
+    async def test_tool_result_attached_to_tool_record(self, app, tmp_path):
+        path = tmp_path / "transcript.jsonl"
+        messages = [
+            {"role": "user", "content": "list files"},
+            {
+                "role": "assistant",
+                "content": [
+                    {"type": "tool_use", "name": "bash", "id": "t1", "input": {}}
+                ],
+            },
+            {
+                "role": "tool",
+                "tool_use_id": "t1",
+                "content": [{"type": "text", "text": "a.txt"}],
+            },
+        ]
+        path.write_text("".join(json.dumps(m) + "\n" for m in messages))
+        async with app.run_test(size=(120, 40)) as pilot:
+            app._display_transcript(path)
+            await pilot.pause()
+            transcript = app._active_transcript()
+            assert transcript is not None
+            tool = transcript.find(lambda r: r.kind == "tool")
+            assert tool is not None
+            assert tool.data["result"].content == "a.txt"
+
+
+class TestLazyToolBlocks:
+    """Collapsed tool/thinking blocks build their body on first expand."""
+
+    @pytest.mark.asyncio
+    async def test_tool_detail_rendered_on_expand(self, app, monkeypatch):
+        from amplifier_tui.widgets import LazyCollapsible
+
+        calls = []
+        real_dumps = json.dumps
+
+        def counting_dumps(*args, **kwargs):
+            calls.append(args[0])
+            return real_dumps(*args, **kwargs)
+
+        async with app.run_test(size=(120, 40)) as pilot:
+            monkeypatch.setattr(json, "dumps", counting_dumps)
+            app._add_tool_use("bash", {"command": "ls"}, "a.txt")
+            await pilot.pause()
+            block = app.query(LazyCollapsible).last()
+            assert not block.body_rendered
+            assert calls == []
+
+            block.collapsed = False
+            await pilot.pause()
+            assert block.body_rendered
+            assert "a.txt" in str(block.body.content)
+            assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_edit_diff_deferred_and_shared_with_diff_last(self, app, monkeypatch):
+        from amplifier_tui.features import diff_view
+        from amplifier_tui.widgets import LazyCollapsible
+
+        calls = []
+        real = diff_view.format_edit_diff
+
+        def counting(*args):
+            calls.append(args)
+            return real(*args)
+
+        monkeypatch.setattr(diff_view, "format_edit_diff", counting)
+        edit = {
+            "file_path": "src/a.py",
+            "old_string": "x = 1\n",
+            "new_string": "x = 2\n",
+        }
+        async with app.run_test(size=(120, 40)) as pilot:
+            app._add_tool_use("edit_file", edit)
+            await pilot.pause()
+            block = app.query(LazyCollapsible).last()
+            assert "(+1, -1)" in str(block.title)
+            assert calls == []
+
+            block.collapsed = False
+            await pilot.pause()
+            monkeypatch.setattr(app, "_run_git", lambda *a, **kw: (True, ""))
+            app._cmd_diff("last")
+            await pilot.pause()
+            assert len(calls) == 1
+            assert "x = 2" in app._search_messages[-1][1]
+
+    @pytest.mark.asyncio
+    async def test_thinking_text_rendered_on_expand(self, app):
+        from amplifier_tui.widgets import LazyCollapsible
+
+        async with app.run_test(size=(120, 40)) as pilot:
+            app._add_thinking_block("first line\n" + "y" * 1000)
+            await pilot.pause()
+            block = app.query(LazyCollapsible).last()
+            assert "first line" in str(block.title)
+            assert str(block.body.content) == ""
+
+            block.collapsed = False
+            await pilot.pause()
+            body = str(block.body.content)
+            assert body.startswith("first line") and body.endswith("...")
+
+
+class TestSessionSidebarFilter:
+    """Typing in the sidebar filter is debounced and reuses the index."""
+
+    @staticmethod
+    def _sessions(n: int) -> list[dict]:
+        return [
+            {
+                "session_id": f"{i:04d}-aaaa-bbbb",
+                "project": f"~/dev/proj-{i % 3}",
+                "mtime": 1_000_000 - i,
+                "date_str": "01/05 10:00",
+                "name": f"session {i}",
+                "description": "",
+            }
+            for i in range(n)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_filter_is_debounced_and_incremental(self, app, monkeypatch):
+        from textual.widgets import Input, Tree
+
+        async with app.run_test(size=(120, 40)) as pilot:
+            app._populate_session_list(self._sessions(30))
+            tree = app.query_one("#session-tree", Tree)
+            assert sum(len(g.children) for g in tree.root.children) == 30
+
+            loads = []
+            monkeypatch.setattr(
+                app, "_load_session_names", lambda: loads.append(1) or {}
+            )
+            filt = app.query_one("#session-filter", Input)
+            filt.value = "session 1"
+            await pilot.pause()
+            filt.value = "session 12"
+            await pilot.pause()
+            # Still unfiltered inside the debounce window.
+            assert sum(len(g.children) for g in tree.root.children) == 30
+
+            await pilot.pause(0.3)
+            labels = [str(n.label) for g in tree.root.children for n in g.children]
+            assert labels == ["01/05 10:00  session 12"]
+            assert loads == []
+
+
+class TestStreamedAssistantMessage:
+    """A finalized stream keeps assistant styling, bookmarks and copy."""
+
+    _TEXT = "# Title\n\nSee `code` here.\n\n> quoted\n"
+
+    @pytest.mark.asyncio
+    async def test_finalized_stream_is_styled_and_usable(self, app):
+        from textual.color import Color
+
+        from amplifier_tui.widgets import StreamedAssistantMessage
+
+        async with app.run_test(size=(120, 40)) as pilot:
+            app._begin_streaming_block("text")
+            app._update_streaming_content("text", self._TEXT[:20])
+            app._finalize_streaming_block("text", self._TEXT)
+            await pilot.pause()
+
+            widget = app.query_one(StreamedAssistantMessage)
+            assert widget.has_class("assistant-message")
+            console = app.console
+            styles = {
+                seg.text.strip(): seg.style
+                for seg in console.render(widget.render(), console.options)
+                if seg.text.strip() and seg.style
+            }
+            secondary = Color.parse(app.get_css_variables()["secondary"])
+            title = styles["Title"]
+            assert title.bold
+            assert title.color.triplet == secondary.rich_color.triplet
+            assert (
+                styles["code"].bgcolor.triplet
+                == Color.parse("#1c1c2e").rich_color.triplet
+            )
+
+            with (
+                patch.object(app, "_get_session_id", return_value="sid"),
+                patch.object(app, "_save_bookmark"),
+            ):
+                app._bookmark_last_message()
+            assert widget.has_class("bookmarked")
+            assert app._session_bookmarks[-1]["preview"] == "# Title"
+
+            with patch(
+                "amplifier_tui.app._copy_to_clipboard", return_value=True
+            ) as copy:
+                app.action_copy_response()
+            copy.assert_called_once_with(self._TEXT)
+
+
+class TestStreamEventBus:
+    """Stream callbacks queue UI updates instead of blocking the worker."""
+
+    @pytest.mark.asyncio
+    async def test_tool_events_from_thread_are_coalesced(self, app):
+        import threading
+
+        async with app.run_test(size=(120, 40)) as pilot:
+            cid = app._tabs[app._active_tab_index].conversation.conversation_id
+            statuses: list[str] = []
+
+            def stream() -> None:
+                for i in range(5):
+                    app._on_stream_tool_start(cid, "bash", {"command": f"ls {i}"})
+                    app._on_stream_tool_end(cid, "bash", {"command": "ls"}, "ok")
+                app._on_stream_usage_update(cid)
+
+            with patch.object(app, "_update_status", side_effect=statuses.append):
+                worker = threading.Thread(target=stream)
+                worker.start()
+                worker.join(timeout=5)  # never waits on the event loop
+                assert not worker.is_alive()
+                await pilot.pause(0.1)
+
+            assert statuses == ["Thinking..."]
+            assert not app._ui_events.pending()
+            stats = app._ui_events.stats
+            assert stats.coalesced >= 18  # 2 keyed updates x 9 superseded
+            assert stats.drains >= 1
+
+
+class TestMultiSessionRestore:
+    """--sessions resumes sessions concurrently, each into its own tab."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_resume_concurrently(self, app, tmp_path):
+        import asyncio
+
+        from amplifier_tui.core.session_manager import SessionManager
+
+        resumed: list[str] = []
+        running = [0, 0]  # now, peak
+
+        def transcript_path(session_id: str):
+            path = tmp_path / f"{session_id}.jsonl"
+            path.write_text(
+                json.dumps({"role": "user", "content": f"hi {session_id}"}) + "\n"
+            )
+            return path
+
+        async def resume_session(session_id: str, **kwargs):
+            resumed.append(session_id)
+            running[0] += 1
+            running[1] = max(running)
+            await asyncio.sleep(0.05)
+            running[0] -= 1
+            if session_id == "bad00000":
+                raise RuntimeError("gone")
+
+        manager = SessionManager()
+        manager.get_session_transcript_path = transcript_path  # type: ignore[method-assign]
+        manager.resume_session = resume_session  # type: ignore[method-assign]
+        ids = ["aaaa0000", "bbbb0000", "bad00000", "cccc0000", "dddd0000"]
+        async with app.run_test(size=(120, 40)) as pilot:
+            app.session_manager = manager
+            with (
+                patch("amplifier_tui.app.RESTORE_CONCURRENCY", 2),
+                patch.object(app, "_load_session_title_for", lambda sid: sid[:4]),
+                patch.object(app, "_save_session_title", lambda: None),
+            ):
+                app._restore_multi_sessions_worker(ids)
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+
+            assert running == [0, 2]
+            assert resumed[0] == "aaaa0000"  # the active tab goes first
+            assert app._active_tab_index == 0
+            assert [tab.name for tab in app._tabs] == [
+                "aaaa",
+                "bbbb",
+                "bad00000",
+                "cccc",
+                "dddd",
+            ]
+            assert not any(tab.restore_label for tab in app._tabs)
+            assert [text for _, text, _ in app._search_messages] == ["hi aaaa0000"]
+            failed = app._tabs[2].conversation.search_messages
+            assert [role for role, _, _ in failed] == ["user", "system"]
+            restored = app._tabs[1].conversation.search_messages
+            assert [text for _, text, _ in restored] == ["hi bbbb0000"]
+
+    @pytest.mark.asyncio
+    async def test_tab_closed_while_queued_is_skipped(self, app, tmp_path):
+        from amplifier_tui.core.session_manager import SessionManager
+
+        resumed: list[str] = []
+
+        def transcript_path(session_id: str):
+            path = tmp_path / f"{session_id}.jsonl"
+            path.write_text(json.dumps({"role": "user", "content": "hi"}) + "\n")
+            return path
+
+        async def resume_session(session_id: str, **kwargs):
+            resumed.append(session_id)
+            if session_id == "aaaa0000":
+                app.call_from_thread(app._close_tab, 2)
+
+        manager = SessionManager()
+        manager.get_session_transcript_path = transcript_path  # type: ignore[method-assign]
+        manager.resume_session = resume_session  # type: ignore[method-assign]
+        async with app.run_test(size=(120, 40)) as pilot:
+            app.session_manager = manager
+            with patch("amplifier_tui.app.RESTORE_CONCURRENCY", 1):
+                app._restore_multi_sessions_worker(["aaaa0000", "bbbb0000", "cccc0000"])
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+
+            assert resumed == ["aaaa0000", "bbbb0000"]
+            assert len(app._tabs) == 2
+
+    @pytest.mark.asyncio
+    async def test_background_tabs_leave_the_user_alone(self, app, tmp_path):
+        from amplifier_tui.core.session_manager import SessionManager
+        from amplifier_tui.widgets import ChatInput
+
+        def transcript_path(session_id: str):
+            path = tmp_path / f"{session_id}.jsonl"
+            path.write_text(json.dumps({"role": "user", "content": "hi"}) + "\n")
+            return path
+
+        async def resume_session(session_id: str, **kwargs):
+            pass
+
+        manager = SessionManager()
+        manager.get_session_transcript_path = transcript_path  # type: ignore[method-assign]
+        manager.resume_session = resume_session  # type: ignore[method-assign]
+        async with app.run_test(size=(120, 40)) as pilot:
+            app.session_manager = manager
+            tabs = app._open_restore_tabs(["aaaa0000", "bbbb0000", "cccc0000"])
+            await pilot.pause()
+            # Split view as _enter_tab_split leaves it (its DOM moves are
+            # not needed here).
+            app._tab_split_mode = True
+            app._tab_split_left_index, app._tab_split_right_index = 0, 1
+            chat_input = app.query_one("#chat-input", ChatInput)
+            chat_input.insert("half-typed")
+            chat_input.move_cursor((0, 4))
+            chat_view = app._active_chat_view()
+            app.set_focus(chat_view)
+            await pilot.pause()
+
+            tail = app._read_transcript_tail(transcript_path("cccc0000"))
+            app._fill_restored_tab(tabs[2], "cccc0000", tail, None)
+            await pilot.pause()
+
+            assert app._tab_split_mode
+            assert app._active_tab_index == 0
+            assert chat_input.text == "half-typed"
+            assert chat_input.cursor_location == (0, 4)
+            assert app.focused is chat_view
+            conv = tabs[2].conversation
+            assert [text for _, text, _ in conv.search_messages] == ["hi"]
+            assert conv.user_message_count == 1
+
+
+class TestUndo:
+    """Undo removes the newest exchange even when its text repeats."""
+
+    @pytest.mark.asyncio
+    async def test_undo_released_duplicate_exchange(self, app, tmp_path):
+        path = tmp_path / "transcript.jsonl"
+        with open(path, "w", encoding="utf-8") as fh:
+            for _ in range(4):
+                fh.write(json.dumps({"role": "user", "content": "again"}) + "\n")
+                fh.write(json.dumps({"role": "assistant", "content": "same"}) + "\n")
+        async with app.run_test(size=(120, 40)) as pilot:
+            app._display_transcript(path)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            transcript = app._active_transcript()
+            assert transcript is not None
+            # Scrolled away: every row is unmounted, so entries are equal.
+            for page in transcript._pages:
+                if page.realized:
+                    transcript._release_page(page)
+
+            app._execute_undo(1, silent=True)
+
+            replies = [
+                r.msg_index for r in transcript.records if r.msg_index is not None
+            ]
+            assert replies == [0, 1, 2]
+            assert len(app._search_messages) == 6
+
+
+class TestShellCommands:
+    """/run, /git and friends run off the UI thread."""
+
+    @pytest.mark.asyncio
+    async def test_run_streams_and_escape_cancels(self, app):
+        import asyncio
+
+        async with app.run_test(size=(120, 40)) as pilot:
+            app._cmd_run("echo streamed; sleep 30")
+            await pilot.pause()
+            widget = app._search_messages[-1][2]
+            for _ in range(100):
+                await pilot.pause(0.05)
+                if "```\nstreamed\n```" in str(widget.content):
+                    break
+            assert str(widget.content).endswith("(running…)")
+            assert "```\nstreamed\n```" in str(widget.content)
+
+            await pilot.press("escape")
+            await app.workers.wait_for_complete()
+            await asyncio.sleep(0)
+            _, text, _ = app._search_messages[-1]
+            assert "```\nstreamed\n```" in text and text.endswith("[cancelled]")
+            assert app._search_messages[-1][2] is widget
+
+    @pytest.mark.asyncio
+    async def test_git_commands_share_cached_state(self, app, tmp_path, monkeypatch):
+        import subprocess
+
+        from amplifier_tui.core.features import git_state
+
+        subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path)], check=True)
+        (tmp_path / "new.txt").write_text("x")
+        monkeypatch.chdir(tmp_path)
+        calls = []
+        real = git_state.run_git_async
+
+        async def counting(*args, **kwargs):
+            calls.append(args)
+            return await real(*args, **kwargs)
+
+        monkeypatch.setattr(git_state, "run_git_async", counting)
+        async with app.run_test(size=(120, 40)) as pilot:
+            await app.workers.wait_for_complete()
+            calls.clear()
+            app._git_state.invalidate()
+            app._cmd_git("")
+            await app.workers.wait_for_complete()
+            app._cmd_git("status")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            texts = [text for _, text, _ in app._search_messages[-2:]]
+            assert "Branch:[/bold] main" in texts[0]
+            assert "Untracked:[/dim] 1" in texts[0]
+            assert texts[1] == "```\n## No commits yet on main\n?? new.txt\n```"
+            assert len(calls) == 2  # one status + log load for both commands
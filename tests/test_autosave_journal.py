@@ -0,0 +1,128 @@
+"""Tests for the append-only auto-save journal."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from amplifier_tui.core.features.autosave_journal import (
+    WORKSPACE_FILE,
+    AutosaveJournal,
+    TabCheckpoint,
+    list_autosaves,
+    load_autosave,
+)
+from amplifier_tui.core.message_store import MessageStore
+
+
+def _tab(store: MessageStore, tab_id: str = "tab-0", **kw) -> TabCheckpoint:
+    return TabCheckpoint(
+        tab_id=tab_id, name=kw.pop("name", "Main"), messages=store, **kw
+    )
+
+
+def _journal(tmp_path: Path, **kw) -> AutosaveJournal:
+    return AutosaveJournal(tmp_path, background=False, **kw)
+
+
+class TestCheckpoint:
+    def test_first_checkpoint_writes_snapshot(self, tmp_path: Path):
+        store = MessageStore([("user", "hello", None), ("assistant", "hi", None)])
+        _journal(tmp_path).checkpoint([_tab(store, title="Greeting")])
+
+        [snapshot] = list_autosaves(tmp_path)
+        data = load_autosave(snapshot)
+        assert data["session_title"] == "Greeting"
+        assert data["message_count"] == 2
+        assert not snapshot.with_suffix(".jsonl").exists()
+
+    def test_later_checkpoints_only_append(self, tmp_path: Path):
+        store = MessageStore([("user", "hello", None)])
+        journal = _journal(tmp_path)
+        journal.checkpoint([_tab(store)])
+        [snapshot] = list_autosaves(tmp_path)
+        before = snapshot.read_bytes()
+
+        store.append(("assistant", "hi there", None))
+        journal.checkpoint([_tab(store)])
+        journal.checkpoint([_tab(store)])  # nothing new
+
+        assert snapshot.read_bytes() == before
+        lines = snapshot.with_suffix(".jsonl").read_text().splitlines()
+        assert [json.loads(ln) for ln in lines] == [
+            {"role": "assistant", "content": "hi there"}
+        ]
+        assert [m["content"] for m in load_autosave(snapshot)["messages"]] == [
+            "hello",
+            "hi there",
+        ]
+
+    def test_edit_and_delete_are_journaled_as_truncate(self, tmp_path: Path):
+        store = MessageStore([("user", "a", None), ("assistant", "b", None)])
+        journal = _journal(tmp_path)
+        journal.checkpoint([_tab(store)])
+
+        store[1] = ("assistant", "b edited", None)
+        store.append(("user", "c", None))
+        journal.checkpoint([_tab(store, title="Renamed")])
+        del store[2]
+        journal.checkpoint([_tab(store, title="Renamed")])
+
+        [snapshot] = list_autosaves(tmp_path)
+        data = load_autosave(snapshot)
+        assert data["session_title"] == "Renamed"
+        assert [m["content"] for m in data["messages"]] == ["a", "b edited"]
+
+    def test_compaction_starts_new_generation_and_rotates(self, tmp_path: Path):
+        store = MessageStore([("user", "0", None)])
+        journal = _journal(tmp_path, keep=2, compact_after=3)
+        journal.checkpoint([_tab(store)])
+        for i in range(1, 13):
+            store.append(("user", str(i), None))
+            journal.checkpoint([_tab(store)])
+
+        snapshots = list_autosaves(tmp_path)
+        assert len(snapshots) == 2
+        assert len(list(tmp_path.glob("*.jsonl"))) <= 2
+        latest = load_autosave(snapshots[0])
+        assert [m["content"] for m in latest["messages"]] == [str(i) for i in range(13)]
+
+    def test_torn_journal_line_is_ignored(self, tmp_path: Path):
+        store = MessageStore([("user", "a", None)])
+        journal = _journal(tmp_path)
+        journal.checkpoint([_tab(store)])
+        store.append(("assistant", "b", None))
+        journal.checkpoint([_tab(store)])
+        [snapshot] = list_autosaves(tmp_path)
+        with snapshot.with_suffix(".jsonl").open("a") as f:
+            f.write('{"role": "user", "cont')
+
+        assert load_autosave(snapshot)["message_count"] == 2
+
+    def test_workspace_state_references_current_generation(self, tmp_path: Path):
+        first = MessageStore([("user", "a", None)])
+        journal = _journal(tmp_path)
+        journal.checkpoint(
+            [_tab(first), _tab(MessageStore(), "tab-1", name="Empty")],
+            active_tab_index=1,
+            tab_counter=2,
+        )
+
+        ws = json.loads((tmp_path / WORKSPACE_FILE).read_text())
+        assert ws["active_tab_index"] == 1
+        assert ws["tabs"][0]["autosave_file"] == list_autosaves(tmp_path)[0].name
+        assert ws["tabs"][1] == {
+            "tab_id": "tab-1",
+            "name": "Empty",
+            "autosave_file": None,
+        }
+
+    def test_background_writer_flush(self, tmp_path: Path):
+        store = MessageStore([("user", "a", None)])
+        journal = AutosaveJournal(tmp_path)
+        journal.checkpoint([_tab(store)])
+        store.append(("assistant", "b", None))
+        journal.checkpoint([_tab(store)])
+
+        assert journal.flush(timeout=5.0)
+        assert load_autosave(list_autosaves(tmp_path)[0])["message_count"] == 2
@@ -26,6 +26,7 @@ from amplifier_tui.commands import (
     TokenCommandsMixin,
     WatchCommandsMixin,
 )
+from amplifier_tui.core.message_store import MessageStore
 from amplifier_tui.preferences import THEMES
 
 
@@ -71,7 +72,7 @@ class MockApp:
 
     def __init__(self) -> None:
         self._prefs = _MockPrefs()
-        self._search_messages: list[tuple[str, str, object | None]] = []
+        self._search_messages = MessageStore()
         self._last_search_results: list = []
         self._previewing_theme: str | None = None
         self._session_title: str = ""
@@ -83,6 +84,7 @@ class MockApp:
         self._messages: list[str] = []  # captures _add_system_message
         self._classes_added: list[str] = []
         self._classes_removed: list[str] = []
+        self._widget_lookups: list[int] = []
 
         self.theme: str = "textual-dark"
         self._timestamp_timer = None
@@ -116,6 +118,10 @@ class MockApp:
     def _save_refs(self) -> None:
         pass
 
+    def _message_widget(self, index: int) -> object | None:
+        self._widget_lookups.append(index)
+        return self._search_messages[index][2]
+
     def action_new_session(self) -> None:
         self._new_session_called = True
 
@@ -320,19 +326,33 @@ class TestCmdTheme:
 class TestCmdSearchHere:
     def test_search_finds_match(self):
         app = _SearchApp()
-        app._search_messages = [
-            ("user", "Hello world", None),
-            ("assistant", "Goodbye world", None),
-            ("user", "Nothing to see", None),
-        ]
+        app._search_messages = MessageStore(
+            [
+                ("user", "Hello world", None),
+                ("assistant", "Goodbye world", None),
+                ("user", "Nothing to see", None),
+            ]
+        )
         app._search_current_chat("world")
         assert len(app._messages) == 1
         assert "2 matches" in app._messages[0]
         assert "world" in app._messages[0].lower()
 
+    def test_search_scrolls_via_message_widget(self):
+        """The first match is looked up by index so unmounted rows resolve."""
+        app = _SearchApp()
+        app._search_messages = MessageStore(
+            [
+                ("user", "nothing", None),
+                ("assistant", "world", None),
+            ]
+        )
+        app._search_current_chat("world")
+        assert app._widget_lookups == [1]
+
     def test_search_no_match(self):
         app = _SearchApp()
-        app._search_messages = [("user", "Hello", None)]
+        app._search_messages = MessageStore([("user", "Hello", None)])
         app._search_current_chat("zzzzz")
         assert "No matches" in app._messages[0]
 
@@ -343,14 +363,14 @@ class TestCmdSearchHere:
 
     def test_search_case_insensitive(self):
         app = _SearchApp()
-        app._search_messages = [("user", "Python is great", None)]
+        app._search_messages = MessageStore([("user", "Python is great", None)])
         app._search_current_chat("PYTHON")
         assert "1 match" in app._messages[0]
 
     def test_search_dispatch_here(self):
         """'/search here foo' routes to _search_current_chat."""
         app = _SearchApp()
-        app._search_messages = [("user", "foo bar baz", None)]
+        app._search_messages = MessageStore([("user", "foo bar baz", None)])
         app._cmd_search("/search here foo")
         assert len(app._messages) == 1
         assert "1 match" in app._messages[0]
@@ -361,6 +381,20 @@ class TestCmdSearchHere:
         assert "Usage" in app._messages[0]
 
 
+class TestCmdGrep:
+    def test_grep_scrolls_via_message_widget(self):
+        app = _SearchApp()
+        app._search_messages = MessageStore(
+            [
+                ("user", "alpha", None),
+                ("assistant", "beta\nalpha again", None),
+            ]
+        )
+        app._cmd_grep("/grep again")
+        assert "1 match" in app._messages[0]
+        assert app._widget_lookups == [1]
+
+
 # =====================================================================
 # /snippet  --  PersistenceCommandsMixin
 # =====================================================================
@@ -444,10 +478,12 @@ class TestCmdExport:
 
     def test_export_markdown_to_file(self, tmp_path, monkeypatch):
         app = _ExportApp()
-        app._search_messages = [
-            ("user", "Hello", None),
-            ("assistant", "World", None),
-        ]
+        app._search_messages = MessageStore(
+            [
+                ("user", "Hello", None),
+                ("assistant", "World", None),
+            ]
+        )
         out = tmp_path / "test-export.md"
         app._cmd_export(f"/export md {out}")
         assert out.exists()
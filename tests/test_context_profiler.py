@@ -27,7 +27,7 @@ from amplifier_tui.features.context_profiler import (
 
 
 class TestEstimateTokens:
-    """Tests for the chars/4 token estimator."""
+    """Tests for the tokenizer-backed estimator."""
 
     def test_empty_string(self):
         assert estimate_tokens("") == 0
@@ -40,11 +40,12 @@ class TestEstimateTokens:
         assert estimate_tokens("abcd") == 1
 
     def test_typical_sentence(self):
-        text = "Hello, how are you doing today?"  # 30 chars → 7
-        assert estimate_tokens(text) == 30 // 4
+        # Hello / , / how / are / you / doing / today / ?
+        text = "Hello, how are you doing today?"
+        assert estimate_tokens(text) == 8
 
     def test_large_text(self):
-        text = "x" * 4000  # 4000 chars → 1000
+        text = " ".join(["word"] * 1000)
         assert estimate_tokens(text) == 1000
 
     def test_single_char(self):
@@ -591,7 +592,11 @@ class TestFormatTopConsumers:
         result = format_top_consumers(msgs, top_n=5)
         assert "Top 5" in result
         # Should only show 5 ranked items
-        ranked = [l for l in result.split("\n") if l.strip()[:2] in ("1.", "2.", "3.", "4.", "5.")]
+        ranked = [
+            l
+            for l in result.split("\n")
+            if l.strip()[:2] in ("1.", "2.", "3.", "4.", "5.")
+        ]
         assert len(ranked) == 5
 
     def test_shows_percentage(self):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from collections import Counter
 from datetime import datetime, timedelta
@@ -574,6 +575,80 @@ class TestScanSessions:
         count = stats.scan_sessions()
         assert count == 1  # only good one
 
+    def test_rescan_reparses_only_changed_files(self, tmp_path: Path) -> None:
+        a = _write_session_info(
+            tmp_path,
+            "proj",
+            "s1",
+            {"session_id": "s1", "started_at": "2026-01-05T09:00:00", "tokens": 100},
+        )
+        _write_session_info(
+            tmp_path,
+            "proj",
+            "s2",
+            {"session_id": "s2", "started_at": "2026-01-06T09:00:00", "tokens": 200},
+        )
+        stats = DashboardStats(session_dir=tmp_path)
+        progress: list[tuple[int, int]] = []
+        assert stats.scan_sessions(lambda d, t: progress.append((d, t))) == 2
+        assert (stats.last_parsed, progress[-1]) == (2, (2, 2))
+
+        stats.scan_sessions()
+        assert stats.last_parsed == 0
+
+        a.write_text(json.dumps({"session_id": "s1", "tokens": 1000}))
+        assert stats.scan_sessions() == 2
+        assert stats.last_parsed == 1
+        assert stats.data.total_tokens == 1200
+        assert stats.data.daily_tokens == {"2026-01-06": 200}
+        assert stats.data.activity_grid == {(9, 1): 1}
+
+    def test_deleted_session_is_subtracted(self, tmp_path: Path) -> None:
+        path = _write_session_info(
+            tmp_path, "proj", "s1", {"session_id": "s1", "model": "m", "tokens": 5}
+        )
+        stats = DashboardStats(session_dir=tmp_path)
+        stats.scan_sessions()
+        path.unlink()
+        assert stats.scan_sessions() == 0
+        assert stats.data.total_tokens == 0
+        assert not stats.data.model_counts
+
+    def test_rollups_persist_across_instances(self, tmp_path: Path) -> None:
+        sessions, cache = tmp_path / "projects", tmp_path / "cache.json"
+        _write_session_info(
+            sessions,
+            "proj",
+            "s1",
+            {"session_id": "s1", "started_at": "2026-01-05T09:00:00", "tokens": 7},
+        )
+        DashboardStats(session_dir=sessions, cache_path=cache).scan_sessions()
+        assert cache.exists()
+
+        stats = DashboardStats(session_dir=sessions, cache_path=cache)
+        assert stats.scan_sessions() == 1
+        assert stats.last_parsed == 0
+        assert stats.data.total_tokens == 7
+        assert stats.data.sessions[0].started_at == datetime(2026, 1, 5, 9)
+
+        stats.clear()
+        assert not cache.exists()
+
+
+class TestFormatUsage:
+    def test_no_events(self) -> None:
+        assert "No usage events" in DashboardStats().format_usage(7)
+
+    def test_weekly_buckets_for_long_ranges(self) -> None:
+        stats = DashboardStats()
+        now = 1_000 * 86400.0
+        stats.usage.append(now - 1, session="s", project="p", model="m", input_tokens=9)
+        stats.usage.append(now - 90 * 86400, session="s", model="m", tool="bash")
+        report = stats.format_usage(180, now=now)
+        assert "Tokens per week" in report
+        assert "Top Tools" in report
+        assert "7-day sum" not in report
+
 
 # ===========================================================================
 # Formatting — heatmap
@@ -942,3 +1017,71 @@ class TestDashboardCommandsMixin:
 
     def test_cmd_dashboard_is_callable(self) -> None:
         assert callable(getattr(DashboardCommandsMixin, "_cmd_dashboard"))
+
+    def test_scan_runs_in_background_then_shows(self, tmp_path: Path) -> None:
+        class FakeApp(DashboardCommandsMixin):
+            def __init__(self) -> None:
+                self._dashboard_stats = DashboardStats(session_dir=tmp_path)
+                self.messages: list[str] = []
+                self.groups: list[str] = []
+
+            def _run_background(self, coro, *, group: str = "commands") -> None:
+                self.groups.append(group)
+                asyncio.run(coro)
+
+            def _add_system_message(self, text: str) -> None:
+                self.messages.append(text)
+
+            def _replace_system_message(self, message, text: str) -> None:
+                self.messages.append(text)
+
+        _write_session_info(tmp_path, "proj", "s1", {"session_id": "s1"})
+        app = FakeApp()
+        app._cmd_dashboard("summary")
+        assert app.groups == ["dashboard"]
+        assert "Scanned 1 sessions." in app.messages[-2]
+        assert "Summary Statistics" in app.messages[-1]
+
+        app._cmd_dashboard("summary")  # cached: no second scan
+        assert app.groups == ["dashboard"]
+        app._cmd_dashboard("refresh")
+        assert "Rescanned 1 sessions (0 files changed)." in app.messages[-2]
+
+    def test_usage_subcommand(self, tmp_path: Path) -> None:
+        class FakeApp(DashboardCommandsMixin):
+            def __init__(self) -> None:
+                self._dashboard_stats = DashboardStats(session_dir=tmp_path)
+                self.messages: list[str] = []
+
+            def _run_background(self, coro, *, group: str = "commands") -> None:
+                asyncio.run(coro)
+
+            def _add_system_message(self, text: str) -> None:
+                self.messages.append(text)
+
+            def _replace_system_message(self, message, text: str) -> None:
+                self.messages.append(text)
+
+        events = tmp_path / "-home-u-app" / "sessions" / "s1" / "events.jsonl"
+        events.parent.mkdir(parents=True)
+        now = datetime.now().isoformat()
+        events.write_text(
+            json.dumps(
+                {
+                    "ts": now,
+                    "event": "llm:response",
+                    "data": {"model": "sonnet", "usage": {"input": 40, "output": 2}},
+                }
+            )
+            + "\n"
+        )
+        app = FakeApp()
+        app._cmd_dashboard("usage 4w")
+        assert "1 new usage events." in app.messages[-2]
+        report = app.messages[-1]
+        assert "last 28 days" in report
+        assert "Input tokens:      40" in report
+        assert "sonnet" in report and "app" in report
+
+        app._cmd_dashboard("usage soon")
+        assert app.messages[-1].startswith("Usage: /dashboard usage")
@@ -0,0 +1,180 @@
+"""Tests for the cached git repository state."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+
+import pytest
+
+from amplifier_tui.core.features import git_state
+from amplifier_tui.core.features.git_state import (
+    GitStateCache,
+    _parse_status,
+    find_repo,
+)
+
+
+def _git(cwd, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=str(cwd), capture_output=True, check=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-b", "main")
+    _git(tmp_path, "config", "user.email", "test@test.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "a.txt").write_text("a")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "init")
+    return tmp_path
+
+
+@pytest.fixture
+def git_calls(monkeypatch):
+    """Record the git invocations made by the cache."""
+    calls: list[tuple[str, ...]] = []
+    real = git_state.run_git_async
+
+    async def counting(*args, **kwargs):
+        calls.append(args)
+        return await real(*args, **kwargs)
+
+    monkeypatch.setattr(git_state, "run_git_async", counting)
+    return calls
+
+
+# ===========================================================================
+# Parsing
+# ===========================================================================
+
+
+class TestParseStatus:
+    def test_branch_upstream_ahead_behind(self) -> None:
+        state = _parse_status(
+            "/r",
+            "## main...origin/main [ahead 2, behind 1]\n M a.py\n?? new.py",
+            "abc123 fix (2 minutes ago)",
+        )
+        assert (state.branch, state.upstream) == ("main", "origin/main")
+        assert (state.ahead, state.behind) == (2, 1)
+        assert state.status == (" M a.py", "?? new.py")
+        assert (state.staged, state.modified, state.untracked) == (0, 1, 1)
+        assert not state.clean
+        assert state.last_commit == "abc123 fix (2 minutes ago)"
+
+    def test_detached_and_unborn(self) -> None:
+        assert _parse_status("/r", "## HEAD (no branch)", "").branch == ""
+        unborn = _parse_status("/r", "## No commits yet on dev", "")
+        assert unborn.branch == "dev"
+        assert unborn.clean
+
+    def test_gone_upstream(self) -> None:
+        state = _parse_status("/r", "## topic...origin/topic [gone]\nM  x", "")
+        assert (state.branch, state.ahead, state.behind) == ("topic", 0, 0)
+        assert state.staged == 1
+
+
+# ===========================================================================
+# Cache
+# ===========================================================================
+
+
+class TestGitStateCache:
+    @pytest.mark.asyncio
+    async def test_not_a_repo(self, tmp_path) -> None:
+        state, error = await GitStateCache().get(str(tmp_path))
+        assert state is None
+        assert "not a git repository" in error.lower()
+
+    @pytest.mark.asyncio
+    async def test_reads_repo(self, repo) -> None:
+        (repo / "a.txt").write_text("changed")
+        (repo / "b.txt").write_text("new")
+        state, error = await GitStateCache().get(str(repo / "."))
+        assert error == ""
+        assert state.branch == "main"
+        assert state.short_status() == " M a.txt\n?? b.txt"
+        assert state.last_commit.split(" ", 1)[1].startswith("init")
+
+    @pytest.mark.asyncio
+    async def test_short_status_matches_git_in_subdirectory(self, repo) -> None:
+        (repo / "src").mkdir()
+        (repo / "src" / "b.txt").write_text("b")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-m", "src")
+        _git(repo, "mv", "a.txt", "src/c.txt")
+        (repo / "src" / "b.txt").write_text("changed")
+        (repo / "new dir").mkdir()
+        (repo / "new dir" / "x").write_text("x")
+        state, _ = await GitStateCache().get(str(repo))
+        expected = subprocess.run(
+            ["git", "status", "--short"],
+            cwd=str(repo / "src"),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.rstrip("\n")
+        assert state.short_status(str(repo / "src")) == expected
+
+    @pytest.mark.asyncio
+    async def test_reused_until_git_dir_changes(self, repo, git_calls) -> None:
+        cache = GitStateCache()
+        first, _ = await cache.get(str(repo), max_age=60)
+        again, _ = await cache.get(str(repo), max_age=60)
+        assert again is first
+        assert len(git_calls) == 2  # status + log, once
+
+        (repo / "b.txt").write_text("b")
+        _git(repo, "add", "b.txt")  # rewrites .git/index
+        staged, _ = await cache.get(str(repo), max_age=60)
+        assert staged is not first
+        assert staged.staged == 1
+
+        _git(repo, "checkout", "-q", "-b", "topic")  # rewrites .git/HEAD
+        switched, _ = await cache.get(str(repo), max_age=60)
+        assert switched.branch == "topic"
+
+    @pytest.mark.asyncio
+    async def test_max_age_and_invalidate(self, repo, git_calls) -> None:
+        cache = GitStateCache()
+        await cache.get(str(repo))
+        await cache.get(str(repo), max_age=0)
+        assert len(git_calls) == 4
+        cache.invalidate(str(repo))
+        await cache.get(str(repo), max_age=60)
+        assert len(git_calls) == 6
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_one_refresh(self, repo, git_calls) -> None:
+        cache = GitStateCache()
+        results = await asyncio.gather(*(cache.get(str(repo)) for _ in range(5)))
+        assert len({id(state) for state, _ in results}) == 1
+        assert len(git_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_shared_refresh(self, repo) -> None:
+        cache = GitStateCache()
+        first = asyncio.ensure_future(cache.get(str(repo)))
+        second = asyncio.ensure_future(cache.get(str(repo)))
+        await asyncio.sleep(0)
+        first.cancel()
+        state, _ = await second
+        assert state is not None and state.branch == "main"
+
+
+class TestFindRepo:
+    def test_subdirectory(self, repo) -> None:
+        (repo / "src").mkdir()
+        found = find_repo(repo / "src")
+        assert found is not None
+        assert found.root == repo.resolve()
+
+    def test_linked_worktree(self, repo, tmp_path_factory) -> None:
+        other = tmp_path_factory.mktemp("wt") / "checkout"
+        _git(repo, "worktree", "add", "-q", "-b", "wt", str(other))
+        found = find_repo(other)
+        assert found is not None
+        assert found.root == other.resolve()
+        assert found.common_dir == (repo / ".git").resolve()
+        assert (found.git_dir / "HEAD").is_file()
@@ -12,7 +12,9 @@ from amplifier_tui.features.include_helpers import (
     _render_tree,
     file_preview,
     get_directory_tree,
+    get_directory_tree_async,
     get_git_status_and_diff,
+    get_git_status_and_diff_async,
 )
 
 
@@ -313,6 +315,31 @@ class TestGetGitStatusInRepo:
         assert "unavailable" in result.lower()
 
 
+class TestGetGitStatusAsync:
+    @pytest.mark.asyncio
+    async def test_matches_sync_in_dirty_repo(self, tmp_path):
+        for argv in (
+            ["git", "init"],
+            ["git", "config", "user.email", "test@test.com"],
+            ["git", "config", "user.name", "Test"],
+        ):
+            subprocess.run(argv, cwd=str(tmp_path), capture_output=True)
+        (tmp_path / "file.txt").write_text("hello")
+        subprocess.run(["git", "add", "."], cwd=str(tmp_path), capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "init"], cwd=str(tmp_path), capture_output=True
+        )
+        (tmp_path / "file.txt").write_text("changed")
+        expected = get_git_status_and_diff(str(tmp_path))
+        assert await get_git_status_and_diff_async(str(tmp_path)) == expected
+        assert "Git Status:" in expected
+
+    @pytest.mark.asyncio
+    async def test_non_git_directory(self, tmp_path):
+        result = await get_git_status_and_diff_async(str(tmp_path))
+        assert result == get_git_status_and_diff(str(tmp_path))
+
+
 # ===========================================================================
 # get_directory_tree
 # ===========================================================================
@@ -336,6 +363,16 @@ class TestGetDirectoryTree:
         assert "main.py" in result
         assert "README.md" in result
 
+    @pytest.mark.asyncio
+    async def test_async_matches_sync(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("print('hi')")
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "README.md").write_text("# Readme")
+        result = await get_directory_tree_async(tmp_path)
+        assert result == get_directory_tree(tmp_path)
+        assert "main.py" in result
+
 
 class TestGetDirectoryTreeWithExcludes:
     def test_excludes_pycache(self, tmp_path):
@@ -0,0 +1,154 @@
+"""Tests for the background LLM job queue."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+from amplifier_tui.core.features.llm_jobs import LLMJobQueue, LLMJobStats
+
+
+def _collect() -> tuple[list[tuple], Callable]:
+    results: list[tuple] = []
+    lock = threading.Lock()
+
+    def on_done(key, result, error):
+        with lock:
+            results.append((key, result, error))
+
+    return results, on_done
+
+
+class TestLLMJobQueue:
+    def test_runs_job_and_reports_result(self):
+        jobs = LLMJobQueue(max_workers=1)
+        results, on_done = _collect()
+        assert jobs.submit("a", lambda: 42, on_done=on_done)
+        assert jobs.wait_idle(5)
+        assert results == [("a", 42, None)]
+        stats = jobs.stats()
+        assert stats.completed == 1
+        assert stats.depth == 0
+
+    def test_failure_reported(self):
+        jobs = LLMJobQueue(max_workers=1)
+        results, on_done = _collect()
+
+        def boom():
+            raise RuntimeError("rate limited")
+
+        jobs.submit("a", boom, on_done=on_done)
+        assert jobs.wait_idle(5)
+        assert results == [("a", None, "rate limited")]
+        assert jobs.stats().failed == 1
+
+    def test_duplicate_key_dropped_while_active(self):
+        jobs = LLMJobQueue(max_workers=1)
+        release = threading.Event()
+        calls: list[str] = []
+
+        def slow():
+            calls.append("x")
+            release.wait(5)
+
+        assert jobs.submit("summary:s1", slow)
+        assert not jobs.submit("summary:s1", slow)
+        assert jobs.is_active("summary:s1")
+        release.set()
+        assert jobs.wait_idle(5)
+        assert calls == ["x"]
+        # Key is free again once the job finished.
+        assert jobs.submit("summary:s1", lambda: None)
+        assert jobs.wait_idle(5)
+
+    def test_late_result_is_delivered(self):
+        jobs = LLMJobQueue(max_workers=1)
+        results, on_done = _collect()
+        jobs.submit(
+            "a", lambda: time.sleep(0.05) or "late", on_done=on_done, timeout=0.01
+        )
+        assert jobs.wait_idle(5)
+        assert results == [("a", "late", None)]
+        assert jobs.stats().timed_out == 0
+
+    def test_job_expired_in_queue_is_not_run(self):
+        jobs = LLMJobQueue(max_workers=1)
+        results, on_done = _collect()
+        release = threading.Event()
+        ran: list[str] = []
+        jobs.submit("first", lambda: release.wait(5))
+        jobs.submit(
+            "second", lambda: ran.append("second"), on_done=on_done, timeout=0.01
+        )
+        time.sleep(0.05)
+        release.set()
+        assert jobs.wait_idle(5)
+        assert ran == []
+        assert results == [("second", None, "timeout")]
+        assert jobs.stats().timed_out == 1
+
+    def test_failure_after_deadline_is_timeout(self):
+        jobs = LLMJobQueue(max_workers=1)
+        results, on_done = _collect()
+
+        def hung():
+            time.sleep(0.05)
+            raise TimeoutError("Request timed out")
+
+        jobs.submit("a", hung, on_done=on_done, timeout=0.01)
+        assert jobs.wait_idle(5)
+        assert results == [("a", None, "timeout")]
+
+    def test_bounded_concurrency(self):
+        jobs = LLMJobQueue(max_workers=2)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def job():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        for i in range(6):
+            jobs.submit(f"k{i}", job)
+        assert jobs.wait_idle(5)
+        assert peak <= 2
+        assert jobs.stats().completed == 6
+
+    def test_shutdown_drops_queued_jobs(self):
+        jobs = LLMJobQueue(max_workers=1)
+        release = threading.Event()
+        ran: list[str] = []
+        jobs.submit("first", lambda: release.wait(5))
+        jobs.submit("second", lambda: ran.append("second"))
+        jobs.shutdown()
+        assert not jobs.submit("third", lambda: None)
+        release.set()
+        assert jobs.wait_idle(5)
+        assert ran == []
+
+    def test_callback_error_does_not_kill_worker(self):
+        jobs = LLMJobQueue(max_workers=1)
+
+        def bad_callback(key, result, error):
+            raise ValueError("oops")
+
+        jobs.submit("a", lambda: 1, on_done=bad_callback)
+        jobs.submit("b", lambda: 2)
+        assert jobs.wait_idle(5)
+        assert jobs.stats().completed == 2
+
+
+class TestLLMJobStats:
+    def test_summary_idle(self):
+        assert LLMJobStats().summary() == "0 queued, 0 running"
+
+    def test_summary_with_history(self):
+        stats = LLMJobStats(queued=1, completed=3, failed=1, avg_latency=1.25)
+        assert stats.summary() == "1 queued, 0 running, avg 1.2s, 1 failed"
@@ -0,0 +1,92 @@
+"""Tests for the per-conversation message store."""
+
+from __future__ import annotations
+
+from amplifier_tui.core.features.context_profiler import analyze_messages
+from amplifier_tui.core.message_store import MessageRecord, MessageStore
+
+_MESSAGES = [
+    ("user", "Refactor the Parser module", None),
+    ("assistant", "Parser refactored; parser tests pass. ```py\nx\n```", None),
+    ("system", "Saved.", None),
+    ("tool", "x" * 400, None),
+    ("thinking", "hmm", None),
+]
+
+
+class TestMessageRecord:
+    def test_unpacks_like_a_tuple(self) -> None:
+        widget = object()
+        record = MessageRecord("user", "Hello World", widget)
+        role, text, w = record
+        assert (role, text, w) == ("user", "Hello World", widget)
+        assert record[2] is widget
+        assert record == ("user", "Hello World", widget)
+
+    def test_derived_fields(self) -> None:
+        record = MessageRecord("tool", "Some Tool Output here")
+        assert record.lower == "some tool output here"
+        assert record.words == 4
+        assert record.tokens == 4
+        assert record.category == "tool"
+
+
+class TestMessageStore:
+    def test_totals_track_appends_and_deletes(self) -> None:
+        store = MessageStore(_MESSAGES)
+        assert store.total_tokens == sum(r.tokens for r in store)
+        assert store.role_counts["user"] == 1
+        assert store.role_chars["tool"] == 400
+        assert store.category_tokens["tool"] == 80
+
+        del store[3]
+        assert store.category_tokens["tool"] == 0
+        assert store.total_tokens == sum(r.tokens for r in store)
+
+        store.clear()
+        assert (store.total_tokens, len(store), store.top_words()) == (0, 0, [])
+
+    def test_top_words_follow_undo(self) -> None:
+        store = MessageStore(_MESSAGES)
+        assert store.top_words(1) == [("parser", 3)]
+        del store[1]
+        assert store.top_words(1) == [("refactor", 1)]
+        assert "parser" in dict(store.top_words())
+        del store[0]
+        assert store.top_words() == []  # words that reached zero are gone
+
+    def test_find(self) -> None:
+        store = MessageStore(_MESSAGES)
+        assert store.find("PARSER") == [0, 1]
+        assert store.find("Parser", case_sensitive=True) == [0, 1]
+        assert store.find("parser", case_sensitive=True) == [1]
+
+    def test_replace_text_and_set_widget(self) -> None:
+        widget = object()
+        store = MessageStore([("system", "running…", widget)])
+        assert store.replace_text(widget, "done in 3 seconds")
+        assert store[0].text == "done in 3 seconds"
+        assert store.total_tokens == store[0].tokens == 4
+        store.set_widget(0, None)
+        assert store[0].widget is None
+        assert not store.replace_text(widget, "other")
+
+    def test_slice_assignment_prepends(self) -> None:
+        store = MessageStore(_MESSAGES[2:])
+        store[:0] = _MESSAGES[:2]
+        assert [r.role for r in store] == [
+            "user",
+            "assistant",
+            "system",
+            "tool",
+            "thinking",
+        ]
+        assert store.total_tokens == MessageStore(_MESSAGES).total_tokens
+
+    def test_analyze_messages_uses_totals(self) -> None:
+        store = MessageStore(_MESSAGES)
+        fast = analyze_messages(store, total_capacity=1000)
+        slow = analyze_messages(list(_MESSAGES), total_capacity=1000)
+        assert fast == slow
+        assert fast.tool_result_tokens == 80
+        assert store.role_tokens["tool"] == 80
@@ -242,6 +242,37 @@ class TestScannerSummarizerIntegration:
         assert len(sessions) == 3
 
 
+class TestTableRefresh:
+    """The table is only rebuilt when a row's text changed."""
+
+    def _mixin(self, sessions: list[MonitoredSession]):
+        mixin = MonitorCommandsMixin()
+        table = MagicMock()
+        mixin.query_one = MagicMock(return_value=table)  # type: ignore[attr-defined]
+        mixin._refresh_monitor_header = MagicMock()  # type: ignore[assignment]
+        summarizer = MagicMock()
+        summarizer.scan.return_value = sessions
+        mixin._monitor_summarizer = summarizer
+        return mixin, table
+
+    def test_unchanged_rows_not_rebuilt(self) -> None:
+        mixin, table = self._mixin([_make_session(), _make_session("def-456")])
+        mixin._refresh_monitor_table()
+        mixin._refresh_monitor_table()
+        assert table.clear.call_count == 1
+        assert table.add_row.call_count == 2
+
+    def test_changed_row_rebuilds(self) -> None:
+        mixin, table = self._mixin([_make_session()])
+        mixin._refresh_monitor_table()
+        mixin._monitor_summarizer.scan.return_value = [  # type: ignore[union-attr]
+            _make_session(state=SessionState.RUNNING, activity="Running bash")
+        ]
+        mixin._refresh_monitor_table()
+        assert table.clear.call_count == 2
+        assert table.add_row.call_args.kwargs["key"] == "abc-123"
+
+
 # ===========================================================================
 # Constants: /monitor in SLASH_COMMANDS
 # ===========================================================================
@@ -10,6 +10,7 @@ Each store is tested for:
 from __future__ import annotations
 
 import json
+import time
 
 import pytest
 
@@ -30,6 +31,14 @@ from amplifier_tui.persistence import (
 from amplifier_tui.persistence._base import JsonStore
 
 
+@pytest.fixture(autouse=True)
+def _synchronous_writes(monkeypatch):
+    """Run each test with synchronous saves, whatever enabled write-behind."""
+    from amplifier_tui.core.persistence import _base
+
+    monkeypatch.setattr(_base, "_flusher", None)
+
+
 # ---------------------------------------------------------------------------
 # Base JsonStore
 # ---------------------------------------------------------------------------
@@ -70,6 +79,109 @@ class TestJsonStore:
         assert store._default() == {}
 
 
+class TestJsonStoreCache:
+    def test_load_raw_returns_private_copy(self, tmp_path):
+        store = JsonStore(tmp_path / "data.json")
+        store.save_raw({"a": [1]})
+        store.load_raw()["a"].append(2)
+        assert store.load_raw() == {"a": [1]}
+
+    def test_save_raw_copies_input(self, tmp_path):
+        store = JsonStore(tmp_path / "data.json")
+        data = {"a": [1]}
+        store.save_raw(data)
+        data["a"].append(2)
+        assert store.view_raw() == {"a": [1]}
+
+    def test_unchanged_file_not_reparsed(self, tmp_path):
+        store = JsonStore(tmp_path / "data.json")
+        store.save_raw({"a": 1})
+        assert store.view_raw() is store.view_raw()
+
+    def test_external_write_picked_up(self, tmp_path):
+        path = tmp_path / "data.json"
+        store = JsonStore(path)
+        store.save_raw({"a": 1})
+        assert store.load_raw() == {"a": 1}
+        path.write_text(json.dumps({"b": 22}))
+        assert store.load_raw() == {"b": 22}
+
+    def test_deleted_file_returns_default(self, tmp_path):
+        path = tmp_path / "data.json"
+        store = JsonStore(path)
+        store.save_raw({"a": 1})
+        path.unlink()
+        assert store.load_raw() == {}
+
+    def test_no_temp_files_left(self, tmp_path):
+        store = JsonStore(tmp_path / "data.json")
+        store.save_raw({"a": 1})
+        store.save_raw({"a": 2})
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+class TestJsonStoreWriteBehind:
+    @pytest.fixture
+    def flusher(self, monkeypatch):
+        from amplifier_tui.core.persistence import _base
+
+        flusher = _base._Flusher(delay=60)
+        monkeypatch.setattr(_base, "_flusher", flusher)
+        return flusher
+
+    def test_save_deferred_until_flush(self, tmp_path, flusher):
+        path = tmp_path / "data.json"
+        store = JsonStore(path)
+        store.save_raw({"a": 1})
+        store.save_raw({"a": 2})
+        assert not path.exists()
+        assert store.exists()
+        assert store.load_raw() == {"a": 2}
+        JsonStore.flush_all()
+        assert json.loads(path.read_text()) == {"a": 2}
+
+    def test_pending_data_wins_over_disk(self, tmp_path, flusher):
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps({"old": True}))
+        store = JsonStore(path)
+        store.save_raw({"new": True})
+        assert store.load_raw() == {"new": True}
+
+    def test_flushes_after_delay(self, tmp_path, flusher):
+        flusher.delay = 0.01
+        path = tmp_path / "data.json"
+        JsonStore(path).save_raw([1, 2])
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert json.loads(path.read_text()) == [1, 2]
+
+    def test_pin_saves_for_two_sessions_both_kept(self, tmp_path, flusher):
+        path = tmp_path / "pins.json"
+        store = MessagePinStore(path)
+        store.save("a", [{"index": 1}])
+        store.save("b", [{"index": 2}])
+        JsonStore.flush_all()
+        assert json.loads(path.read_text()) == {
+            "a": [{"index": 1}],
+            "b": [{"index": 2}],
+        }
+
+    def test_note_saves_for_two_sessions_both_kept(self, tmp_path, flusher):
+        path = tmp_path / "notes.json"
+        store = NoteStore(path)
+        store.save("a", [{"text": "x"}])
+        store.save("b", [{"text": "y"}])
+        JsonStore.flush_all()
+        assert set(json.loads(path.read_text())) == {"a", "b"}
+
+    def test_template_seed_not_repeated_while_pending(self, tmp_path, flusher):
+        store = TemplateStore(tmp_path / "templates.json")
+        store.load()  # seeds defaults (pending)
+        store.save({"mine": "text"})
+        assert store.load() == {"mine": "text"}
+
+
 # ---------------------------------------------------------------------------
 # AliasStore
 # ---------------------------------------------------------------------------
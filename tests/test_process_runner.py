@@ -0,0 +1,97 @@
+"""Tests for the asyncio subprocess runner."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+from amplifier_tui.core.features.process_runner import run_git_async, run_process
+
+posix_only = pytest.mark.skipif(os.name != "posix", reason="uses sh")
+
+
+class TestRunProcess:
+    @pytest.mark.asyncio
+    async def test_collects_output_and_returncode(self) -> None:
+        result = await run_process(
+            [
+                sys.executable,
+                "-c",
+                "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)",
+            ]
+        )
+        assert result.returncode == 3
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+        assert not result.timed_out
+
+    @posix_only
+    @pytest.mark.asyncio
+    async def test_streams_stdout(self) -> None:
+        chunks: list[str] = []
+        result = await run_process(
+            "echo one; sleep 0.2; echo two", shell=True, on_stdout=chunks.append
+        )
+        assert "".join(chunks) == result.stdout == "one\ntwo\n"
+        assert len(chunks) >= 2
+
+    @pytest.mark.asyncio
+    async def test_split_utf8_is_decoded(self) -> None:
+        code = (
+            "import sys, time; b = 'é'.encode(); "
+            "sys.stdout.buffer.write(b[:1]); sys.stdout.flush(); time.sleep(0.1); "
+            "sys.stdout.buffer.write(b[1:]); sys.stdout.flush()"
+        )
+        result = await run_process([sys.executable, "-c", code])
+        assert result.stdout == "é"
+
+    @posix_only
+    @pytest.mark.asyncio
+    async def test_timeout_kills_and_keeps_partial_output(self) -> None:
+        start = time.monotonic()
+        result = await run_process("echo partial; sleep 30", shell=True, timeout=0.5)
+        assert time.monotonic() - start < 10
+        assert result.timed_out
+        assert result.returncode is None
+        assert result.stdout == "partial\n"
+
+    @posix_only
+    @pytest.mark.asyncio
+    async def test_cancel_kills_process(self, tmp_path) -> None:
+        pid_file = tmp_path / "pid"
+        task = asyncio.create_task(
+            run_process(f"echo $$ > {pid_file}; sleep 30", shell=True)
+        )
+        for _ in range(100):
+            if pid_file.exists() and pid_file.read_text().strip():
+                break
+            await asyncio.sleep(0.02)
+        pid = int(pid_file.read_text())
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    @pytest.mark.asyncio
+    async def test_missing_executable_raises(self) -> None:
+        with pytest.raises(FileNotFoundError):
+            await run_process(["definitely-not-a-real-command-xyz"])
+
+
+class TestRunGitAsync:
+    @pytest.mark.asyncio
+    async def test_version(self) -> None:
+        ok, output = await run_git_async("--version")
+        assert ok
+        assert output.startswith("git version")
+
+    @pytest.mark.asyncio
+    async def test_not_a_repo(self, tmp_path) -> None:
+        ok, output = await run_git_async("status", cwd=str(tmp_path))
+        assert not ok
+        assert "not a git repository" in output.lower()
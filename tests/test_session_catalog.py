@@ -0,0 +1,233 @@
+"""Tests for the cached session catalog."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from amplifier_tui.core.session_catalog import SessionCatalog
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_session(
+    base: Path,
+    project: str,
+    session_id: str,
+    *,
+    mtime: float = 1000.0,
+    meta: dict | None = None,
+    transcript: bool = True,
+) -> Path:
+    session_dir = base / project / "sessions" / session_id
+    session_dir.mkdir(parents=True, exist_ok=True)
+    if meta is not None:
+        (session_dir / "metadata.json").write_text(json.dumps(meta))
+    if transcript:
+        path = session_dir / "transcript.jsonl"
+        path.write_text('{"role": "user", "content": "hi"}\n')
+        os.utime(path, (mtime, mtime))
+    return session_dir
+
+
+def _age_dirs(projects: Path) -> None:
+    """Push directory mtimes outside the racy window so they are trusted."""
+    for path in [projects, *projects.rglob("*")]:
+        if path.is_dir():
+            os.utime(path, (1000, 1000))
+
+
+def _bump(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, (st.st_atime, st.st_mtime + 10))
+
+
+# ---------------------------------------------------------------------------
+# Listing
+# ---------------------------------------------------------------------------
+
+
+class TestListSessions:
+    def test_missing_projects_dir(self, tmp_path):
+        catalog = SessionCatalog(tmp_path / "nope")
+        assert catalog.list_sessions() == []
+
+    def test_newest_first_with_limit(self, tmp_path):
+        _make_session(tmp_path, "-home-me-a", "old", mtime=1000)
+        _make_session(tmp_path, "-home-me-b", "new", mtime=2000)
+        catalog = SessionCatalog(tmp_path)
+        assert [e.session_id for e in catalog.list_sessions()] == ["new", "old"]
+        assert [e.session_id for e in catalog.list_sessions(limit=1)] == ["new"]
+
+    def test_skips_sub_sessions_and_missing_transcripts(self, tmp_path):
+        _make_session(tmp_path, "-p", "root")
+        _make_session(tmp_path, "-p", "root_agent")
+        _make_session(tmp_path, "-p", "empty", transcript=False)
+        catalog = SessionCatalog(tmp_path)
+        assert [e.session_id for e in catalog.list_sessions()] == ["root"]
+
+    def test_as_dict_shape(self, tmp_path):
+        _make_session(tmp_path, "-p", "s1", meta={"name": "Nice", "description": "d"})
+        entry = SessionCatalog(tmp_path).list_sessions()[0]
+        d = entry.as_dict()
+        assert d["session_id"] == "s1"
+        assert d["name"] == "Nice"
+        assert d["description"] == "d"
+        assert d["mtime"] == 1000.0
+        assert set(d) == {
+            "session_id",
+            "project",
+            "project_path",
+            "mtime",
+            "date_str",
+            "name",
+            "description",
+        }
+
+    def test_metadata_reread_when_metadata_changes(self, tmp_path):
+        sdir = _make_session(tmp_path, "-p", "s1", meta={"name": "before"})
+        catalog = SessionCatalog(tmp_path)
+        assert catalog.list_sessions()[0].name == "before"
+        # A rename touches metadata.json only; the transcript is unchanged.
+        meta = sdir / "metadata.json"
+        meta.write_text(json.dumps({"name": "after"}))
+        _bump(meta)
+        assert catalog.list_sessions()[0].name == "after"
+
+    def test_metadata_not_reread_when_unchanged(self, tmp_path):
+        sdir = _make_session(tmp_path, "-p", "s1", meta={"name": "before"})
+        catalog = SessionCatalog(tmp_path)
+        assert catalog.list_sessions()[0].name == "before"
+        meta = sdir / "metadata.json"
+        st = meta.stat()
+        meta.write_text(json.dumps({"name": "after"}))
+        os.utime(meta, ns=(st.st_atime_ns, st.st_mtime_ns))
+        _bump(sdir / "transcript.jsonl")
+        assert catalog.list_sessions()[0].name == "before"
+
+
+# ---------------------------------------------------------------------------
+# Revalidation
+# ---------------------------------------------------------------------------
+
+
+class TestRevalidation:
+    def test_new_session_picked_up(self, tmp_path):
+        _make_session(tmp_path, "-p", "s1")
+        _age_dirs(tmp_path)
+        catalog = SessionCatalog(tmp_path)
+        assert len(catalog.list_sessions()) == 1
+        _make_session(tmp_path, "-p", "s2", mtime=2000)
+        assert [e.session_id for e in catalog.list_sessions()] == ["s2", "s1"]
+
+    def test_new_project_picked_up(self, tmp_path):
+        _make_session(tmp_path, "-a", "s1")
+        _age_dirs(tmp_path)
+        catalog = SessionCatalog(tmp_path)
+        catalog.list_sessions()
+        _make_session(tmp_path, "-b", "s2")
+        assert catalog.get("s2") is not None
+
+    def test_removed_session_dropped(self, tmp_path):
+        sdir = _make_session(tmp_path, "-p", "s1")
+        catalog = SessionCatalog(tmp_path)
+        assert catalog.get("s1") is not None
+        (sdir / "transcript.jsonl").unlink()
+        sdir.rmdir()
+        assert catalog.get("s1") is None
+
+    def test_trusted_dirs_not_relisted(self, tmp_path):
+        _make_session(tmp_path, "-p", "s1")
+        _age_dirs(tmp_path)
+        catalog = SessionCatalog(tmp_path)
+        catalog.entries()
+        # A session dir created without touching the parent mtime is
+        # invisible until invalidate() -- proof the listing was cached.
+        _make_session(tmp_path, "-p", "s2")
+        _age_dirs(tmp_path)
+        assert [e.session_id for e in catalog.entries()] == ["s1"]
+        catalog.invalidate()
+        assert sorted(e.session_id for e in catalog.entries()) == ["s1", "s2"]
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+
+class TestLookup:
+    def test_get_includes_sub_sessions(self, tmp_path):
+        _make_session(tmp_path, "-p", "abc_agent")
+        entry = SessionCatalog(tmp_path).get("abc_agent")
+        assert entry is not None
+        assert not entry.is_root
+
+    def test_match_prefix(self, tmp_path):
+        _make_session(tmp_path, "-p", "abc1")
+        _make_session(tmp_path, "-p", "abc2")
+        catalog = SessionCatalog(tmp_path)
+        assert sorted(e.session_id for e in catalog.match_prefix("abc")) == [
+            "abc1",
+            "abc2",
+        ]
+        assert catalog.match_prefix("zzz") == []
+
+    def test_exact_match_wins(self, tmp_path):
+        _make_session(tmp_path, "-p", "abc")
+        _make_session(tmp_path, "-p", "abcdef")
+        matches = SessionCatalog(tmp_path).match_prefix("abc")
+        assert [e.session_id for e in matches] == ["abc"]
+
+    def test_find_transcript(self, tmp_path):
+        sdir = _make_session(tmp_path, "-p", "abcdef")
+        catalog = SessionCatalog(tmp_path)
+        assert catalog.find_transcript("abc") == sdir / "transcript.jsonl"
+        assert catalog.find_transcript("nope") is None
+
+    def test_for_dir_is_shared(self, tmp_path):
+        assert SessionCatalog.for_dir(tmp_path) is SessionCatalog.for_dir(tmp_path)
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+
+class TestPersistence:
+    def test_round_trip(self, tmp_path):
+        projects = tmp_path / "projects"
+        _make_session(projects, "-p", "s1", meta={"name": "Saved"})
+        _age_dirs(projects)
+        cache = tmp_path / "catalog.json"
+        SessionCatalog(projects, cache).list_sessions()
+        assert cache.exists()
+
+        # Metadata rewritten with the same mtime: the second instance must
+        # serve the persisted name without re-reading it.
+        meta = projects / "-p" / "sessions" / "s1" / "metadata.json"
+        st = meta.stat()
+        meta.write_text(json.dumps({"name": "Changed"}))
+        os.utime(meta, ns=(st.st_atime_ns, st.st_mtime_ns))
+        again = SessionCatalog(projects, cache)
+        assert again.list_sessions()[0].name == "Saved"
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        projects = tmp_path / "projects"
+        _make_session(projects, "-p", "s1")
+        cache = tmp_path / "catalog.json"
+        cache.write_text("{not json")
+        assert [e.session_id for e in SessionCatalog(projects, cache).entries()] == [
+            "s1"
+        ]
+
+    def test_version_mismatch_discarded(self, tmp_path):
+        projects = tmp_path / "projects"
+        _make_session(projects, "-p", "s1")
+        cache = tmp_path / "catalog.json"
+        cache.write_text(json.dumps({"version": -1, "projects": {"x": {}}}))
+        assert [e.session_id for e in SessionCatalog(projects, cache).entries()] == [
+            "s1"
+        ]
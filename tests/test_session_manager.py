@@ -402,6 +402,21 @@ class TestOnStream:
         assert handle.total_input_tokens == 300
         assert handle.total_output_tokens == 150
 
+    def test_llm_response_calibrates_token_estimate(self):
+        from amplifier_tui.core.features.tokenizer import token_counter
+
+        handle = SessionHandle(conversation_id="test")
+        text = " ".join(["word"] * 200)
+        handle._on_stream(
+            "content_block:end", {"block": {"type": "text", "text": text}}
+        )
+        handle._on_stream("llm:response", {"usage": {"input": 10, "output": 300}})
+        assert token_counter.scale == pytest.approx(1.1)
+        assert handle._response_text == []
+        # Usage without streamed text leaves the scale alone.
+        handle._on_stream("llm:response", {"usage": {"input": 10, "output": 300}})
+        assert token_counter.scale == pytest.approx(1.1)
+
     def test_unknown_event_ignored(self):
         handle = SessionHandle(conversation_id="test")
         handle._on_stream("unknown:event", {})  # Should not raise
@@ -474,3 +489,69 @@ class TestEndSession:
         sm = SessionManager()
         await sm.end_session()  # Should not raise
         assert sm.session is None
+
+
+# -- settings.yaml cache & session pool ---------------------------------------
+
+
+class TestReadSettings:
+    """settings.yaml is parsed once per change."""
+
+    def test_cached_until_file_changes(self, tmp_path: Path):
+        settings = tmp_path / "settings.yaml"
+        settings.write_text("bundle:\n  active: foundation\n")
+        with (
+            patch(f"{_CORE_MODULE}._SETTINGS_PATH", settings),
+            patch(f"{_CORE_MODULE}._settings_cache", None),
+            patch("yaml.safe_load", wraps=__import__("yaml").safe_load) as load,
+        ):
+            sm = SessionManager()
+            assert sm._get_bundle_name() == "foundation"
+            assert sm._get_bundle_name() == "foundation"
+            assert load.call_count == 1
+
+            settings.write_text("bundle:\n  active: amplifier-dev\n")
+            assert sm._get_bundle_name() == "amplifier-dev"
+            assert load.call_count == 2
+
+    def test_missing_file(self, tmp_path: Path):
+        with patch(f"{_CORE_MODULE}._SETTINGS_PATH", tmp_path / "missing.yaml"):
+            assert SessionManager._read_settings() == {}
+
+
+class TestSessionPool:
+    """start_new_session takes a pre-started session when one is ready."""
+
+    @pytest.mark.asyncio
+    async def test_pooled_session_is_bound_to_conversation(self, tmp_path: Path):
+        import time
+
+        sm = SessionManager()
+        created: list[SessionHandle] = []
+
+        async def create_handle(cwd: Path) -> SessionHandle:
+            handle = SessionHandle()
+            handle.session = _make_session()
+            handle.session_id = f"s{len(created)}"
+            created.append(handle)
+            return handle
+
+        with patch.object(sm, "_create_handle", side_effect=create_handle):
+            assert sm.pool_stats is None
+            sm.enable_pool(1, cwd=tmp_path)
+            deadline = time.monotonic() + 5
+            while sm.pool_stats.idle < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            handle = await sm.start_new_session(conversation_id="c1", cwd=tmp_path)
+            assert handle is created[0]
+            assert handle.conversation_id == "c1"
+            assert sm.get_handle("c1") is handle
+            assert handle.model_name == "claude-sonnet"
+
+            other = await sm.start_new_session(conversation_id="c2", cwd=tmp_path / "x")
+            assert other.conversation_id == "c2"
+            stats = sm.pool_stats
+            assert (stats.hits, stats.misses) == (1, 1)
+            sm.close_pool(timeout=5)
+        assert sm.pool_stats is None
@@ -0,0 +1,105 @@
+"""Tests for the pre-started session pool."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from amplifier_tui.core.features.session_pool import PoolStats, SessionPool
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class _Sessions:
+    """Fake start/end coroutines that record what they did."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.ended: list[str] = []
+        self.fail = False
+
+    async def start(self, cwd: Path) -> str:
+        if self.fail:
+            raise RuntimeError("bundle failed to load")
+        name = f"{cwd.name}-{len(self.started)}"
+        self.started.append(name)
+        return name
+
+    async def end(self, session: str) -> None:
+        self.ended.append(session)
+
+
+class TestSessionPool:
+    def test_prewarm_then_hit(self, tmp_path):
+        sessions = _Sessions()
+        pool = SessionPool(sessions.start, sessions.end, size=2)
+        pool.prewarm(tmp_path)
+        assert _wait_for(lambda: pool.stats.idle == 2)
+
+        assert pool.take(tmp_path) == f"{tmp_path.name}-0"
+        assert _wait_for(lambda: pool.stats.idle == 2)  # topped up again
+        stats = pool.stats
+        assert (stats.hits, stats.misses, stats.started) == (1, 0, 3)
+        pool.close(timeout=5)
+
+    def test_miss_fills_that_directory(self, tmp_path):
+        sessions = _Sessions()
+        pool = SessionPool(sessions.start, sessions.end)
+        other = tmp_path / "other"
+        assert pool.take(other) is None
+        assert _wait_for(lambda: pool.stats.idle == 1)
+        assert pool.take(other) == "other-0"
+        assert pool.stats.misses == 1
+        pool.close(timeout=5)
+
+    def test_stale_sessions_are_ended(self, tmp_path):
+        sessions = _Sessions()
+        stamp = [1]
+        pool = SessionPool(sessions.start, sessions.end, stamp=lambda: stamp[0])
+        pool.prewarm(tmp_path)
+        assert _wait_for(lambda: pool.stats.idle == 1)
+
+        stamp[0] = 2  # settings changed
+        assert pool.take(tmp_path) is None
+        assert _wait_for(lambda: sessions.ended == [f"{tmp_path.name}-0"])
+        assert _wait_for(lambda: pool.stats.idle == 1)
+        assert pool.take(tmp_path) == f"{tmp_path.name}-1"
+        pool.close(timeout=5)
+
+    def test_failed_start_is_not_retried_until_next_take(self, tmp_path):
+        sessions = _Sessions()
+        sessions.fail = True
+        pool = SessionPool(sessions.start, sessions.end)
+        pool.prewarm(tmp_path)
+        assert _wait_for(lambda: pool.stats.failed == 1)
+        time.sleep(0.05)
+        assert pool.stats.failed == 1
+
+        sessions.fail = False
+        assert pool.take(tmp_path) is None
+        assert _wait_for(lambda: pool.stats.idle == 1)
+        pool.close(timeout=5)
+
+    def test_close_ends_idle_sessions(self, tmp_path):
+        sessions = _Sessions()
+        pool = SessionPool(sessions.start, sessions.end, size=2)
+        pool.prewarm(tmp_path)
+        assert _wait_for(lambda: pool.stats.idle == 2)
+        pool.close(timeout=5)
+        assert sorted(sessions.ended) == sorted(sessions.started)
+        assert pool.take(tmp_path) is None
+
+
+class TestPoolStats:
+    def test_summary(self):
+        assert PoolStats().summary() == "0 hits, 0 misses, 0 idle"
+        stats = PoolStats(hits=3, misses=1, idle=1, started=4, avg_start=2.5)
+        summary = "3 hits, 1 misses (75% hit), 1 idle, start avg 2.5s"
+        assert stats.summary() == summary
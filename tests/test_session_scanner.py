@@ -6,9 +6,13 @@ import json
 import time
 from pathlib import Path
 
+import pytest
+
+import amplifier_tui.core.features.session_scanner as scanner_mod
 from amplifier_tui.features.session_scanner import (
     SessionScanner,
     SessionState,
+    SessionWatcher,
     _detect_state,
     _extract_activity,
     _last_assistant_summary,
@@ -571,6 +575,144 @@ class TestSessionScannerScan:
         assert sessions[0].state is SessionState.UNKNOWN
 
 
+class TestSessionScannerChangeTracking:
+    def _count_tails(self, monkeypatch) -> list[Path]:
+        calls: list[Path] = []
+        real = scanner_mod._tail_lines
+
+        def counting(path: Path, max_bytes: int = scanner_mod._TAIL_BYTES):
+            calls.append(path)
+            return real(path, max_bytes)
+
+        monkeypatch.setattr(scanner_mod, "_tail_lines", counting)
+        return calls
+
+    def test_unchanged_events_not_reread(self, tmp_path: Path, monkeypatch) -> None:
+        _make_session(tmp_path, "proj", "aaaa-1111")
+        calls = self._count_tails(monkeypatch)
+
+        scanner = SessionScanner(session_dir=tmp_path, stale_threshold=999999999)
+        first = scanner.scan()
+        second = scanner.scan()
+        assert len(calls) == 1
+        assert first[0].state == second[0].state
+
+    def test_appended_event_picked_up(self, tmp_path: Path, monkeypatch) -> None:
+        sdir = _make_session(
+            tmp_path,
+            "proj",
+            "aaaa-1111",
+            events=[{"event": "execution:start", "data": {}}],
+        )
+        calls = self._count_tails(monkeypatch)
+        scanner = SessionScanner(session_dir=tmp_path, stale_threshold=999999999)
+        assert scanner.scan()[0].state is SessionState.RUNNING
+
+        with open(sdir / "events.jsonl", "a", encoding="utf-8") as fh:
+            fh.write(json.dumps({"event": "execution:end", "data": {}}) + "\n")
+
+        assert scanner.scan()[0].state is SessionState.IDLE
+        assert len(calls) == 2
+
+    def test_metadata_change_picked_up(self, tmp_path: Path) -> None:
+        sdir = _make_session(tmp_path, "proj", "aaaa-1111")
+        scanner = SessionScanner(session_dir=tmp_path)
+        assert scanner.scan()[0].turn_count == 3
+
+        _write_metadata(sdir, {"session_id": "aaaa-1111", "turn_count": 12})
+        assert scanner.scan()[0].turn_count == 12
+
+    def test_removed_session_dropped(self, tmp_path: Path) -> None:
+        import shutil
+
+        _make_session(tmp_path, "proj", "aaaa-1111")
+        sdir = _make_session(tmp_path, "proj", "bbbb-2222")
+        scanner = SessionScanner(session_dir=tmp_path)
+        assert len(scanner.scan()) == 2
+
+        shutil.rmtree(sdir)
+        assert [s.session_id for s in scanner.scan()] == ["aaaa-1111"]
+
+    def test_watch_mode_only_rereads_changed_sessions(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        a = _make_session(tmp_path, "proj", "aaaa-1111")
+        _make_session(tmp_path, "proj", "bbbb-2222")
+        # Drive the watcher by hand instead of from a thread.
+        monkeypatch.setattr(SessionWatcher, "available", staticmethod(lambda: True))
+        monkeypatch.setattr(
+            SessionWatcher, "start", lambda w: setattr(w, "_active", True)
+        )
+
+        scanner = SessionScanner(session_dir=tmp_path, watch=True)
+        calls = self._count_tails(monkeypatch)
+        assert len(scanner.scan()) == 2
+        watcher = scanner._watcher
+        assert watcher is not None
+        assert len(calls) == 2
+        assert scanner.refresh_interval == scanner_mod.WATCH_REFRESH_SECONDS
+
+        # No notifications: nothing is read.
+        scanner.scan()
+        assert len(calls) == 2
+
+        watcher._record([str(a / "events.jsonl")])
+        _write_events(a, [{"event": "session:end", "data": {}}])
+        scanner.scan()
+        assert calls[2:] == [a / "events.jsonl"]
+
+    def test_poll_interval_without_watcher(self, tmp_path: Path) -> None:
+        scanner = SessionScanner(session_dir=tmp_path)
+        assert not scanner.watching
+        assert scanner.refresh_interval == scanner_mod.POLL_REFRESH_SECONDS
+
+
+class TestSessionWatcher:
+    def test_first_drain_requests_full_scan(self, tmp_path: Path) -> None:
+        watcher = SessionWatcher(tmp_path)
+        assert watcher.drain() is None
+        assert watcher.drain() == set()
+
+    def test_file_changes_map_to_session_dirs(self, tmp_path: Path) -> None:
+        watcher = SessionWatcher(tmp_path)
+        watcher.drain()
+        sdir = tmp_path / "proj" / "sessions" / "aaaa-1111"
+        watcher._record([str(sdir / "events.jsonl"), str(sdir / "metadata.json")])
+        assert watcher.drain() == {sdir}
+
+    def test_structure_change_requests_full_scan(self, tmp_path: Path) -> None:
+        watcher = SessionWatcher(tmp_path)
+        watcher.drain()
+        watcher._record([str(tmp_path / "proj" / "sessions" / "new-session")])
+        assert watcher.drain() is None
+
+    def test_missing_root_is_inactive(self, tmp_path: Path) -> None:
+        watcher = SessionWatcher(tmp_path / "nope")
+        assert watcher.start() is False
+        assert not watcher.active
+
+    def test_live_notifications(self, tmp_path: Path) -> None:
+        if not SessionWatcher.available():
+            pytest.skip("watchfiles not installed")
+        sdir = _make_session(tmp_path, "proj", "aaaa-1111")
+        watcher = SessionWatcher(tmp_path)
+        assert watcher.start()
+        try:
+            watcher.drain()
+            time.sleep(0.2)  # let the watch register
+            with open(sdir / "events.jsonl", "a", encoding="utf-8") as fh:
+                fh.write("{}\n")
+            deadline = time.monotonic() + 5
+            seen: set[Path] = set()
+            while time.monotonic() < deadline and sdir not in seen:
+                changed = watcher.drain()
+                seen |= changed or set()
+                time.sleep(0.05)
+            assert sdir in seen
+        finally:
+            watcher.stop()
+
+
 # ===========================================================================
 # Formatting helpers
 # ===========================================================================
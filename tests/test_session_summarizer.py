@@ -6,6 +6,8 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from amplifier_tui.features.session_scanner import (
     MonitoredSession,
     SessionScanner,
@@ -522,6 +524,89 @@ class TestProcessPending:
         assert processed == 0
 
 
+# ===========================================================================
+# Split API: take_pending / generate_summary / apply_summary
+# ===========================================================================
+
+
+class TestSplitProcessing:
+    def _summarizer(self, tmp_path: Path, fn=_fake_summarize) -> SessionSummarizer:
+        _make_session_dir(
+            tmp_path,
+            "proj",
+            "sess-1",
+            events=[
+                {"event": "session:start", "data": {}},
+                {"event": "execution:end", "data": {}},
+            ],
+            transcript=[
+                {"role": "user", "content": "x"},
+                {"role": "assistant", "content": "y"},
+            ],
+        )
+        scanner = SessionScanner(session_dir=tmp_path, stale_threshold=999999)
+        return SessionSummarizer(scanner, summarize_fn=fn)
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        summarizer = self._summarizer(tmp_path)
+        summarizer.scan()
+        taken = summarizer.take_pending()
+        assert [s.session_id for s in taken] == ["sess-1"]
+        assert not summarizer.has_pending
+
+        summary = summarizer.generate_summary(taken[0])
+        assert summary == "Committed fix, tests passing"
+        # generate_summary does not touch the cache.
+        assert summarizer.scan()[0].activity != summary
+
+        summarizer.take_pending()
+        summarizer.apply_summary(taken[0], summary)
+        assert summarizer.scan()[0].activity == summary
+
+    def test_take_pending_skips_already_cached(self, tmp_path: Path) -> None:
+        summarizer = self._summarizer(tmp_path)
+        summarizer.scan()
+        session = summarizer.take_pending()[0]
+        summarizer.scan()  # re-queued while the job is in flight
+        summarizer.apply_summary(session, "done")
+        assert summarizer.take_pending() == []
+
+    def test_generate_summary_propagates_errors(self, tmp_path: Path) -> None:
+        summarizer = self._summarizer(tmp_path, fn=_failing_summarize)
+        summarizer.scan()
+        session = summarizer.take_pending()[0]
+        with pytest.raises(RuntimeError, match="API down"):
+            summarizer.generate_summary(session)
+
+    def test_requeue_puts_failed_session_back(self, tmp_path: Path) -> None:
+        summarizer = self._summarizer(tmp_path)
+        summarizer.scan()
+        session = summarizer.take_pending()[0]
+        assert summarizer.requeue(session)
+        assert summarizer.requeue(session)  # no duplicate entry
+        assert [s.session_id for s in summarizer.take_pending()] == ["sess-1"]
+
+    def test_requeue_gives_up_after_max_retries(self, tmp_path: Path) -> None:
+        summarizer = self._summarizer(tmp_path)
+        summarizer.scan()
+        session = summarizer.take_pending()[0]
+        results = [summarizer.requeue(session) for _ in range(4)]
+        assert results == [True, True, True, False]
+        summarizer.take_pending()
+        # A successful summary resets the retry budget.
+        summarizer.apply_summary(session, "done")
+        assert summarizer.requeue(session)
+
+    def test_requeue_without_retry_keeps_budget(self, tmp_path: Path) -> None:
+        summarizer = self._summarizer(tmp_path)
+        summarizer.scan()
+        session = summarizer.take_pending()[0]
+        for _ in range(5):  # rejected as a duplicate while a job is in flight
+            assert summarizer.requeue(session, retry=False)
+        results = [summarizer.requeue(session) for _ in range(4)]
+        assert results == [True, True, True, False]
+
+
 # ===========================================================================
 # Cache management
 # ===========================================================================
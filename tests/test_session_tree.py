@@ -0,0 +1,131 @@
+"""Tests for the filterable session sidebar model."""
+
+from __future__ import annotations
+
+import pytest
+from textual.widgets import Tree
+
+from amplifier_tui.widgets.session_tree import (
+    SessionTreeGroup,
+    SessionTreeIndex,
+    make_session_tree_entry,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _entry(sid: str, label: str, project: str = "proj", tags=()):
+    return make_session_tree_entry(sid, label, label, project, list(tags))
+
+
+def _shape(tree: Tree) -> list[tuple[str, list[str]]]:
+    return [
+        (str(group.label), [str(node.label) for node in group.children])
+        for group in tree.root.children
+    ]
+
+
+@pytest.fixture
+def index() -> SessionTreeIndex:
+    return SessionTreeIndex(
+        [
+            SessionTreeGroup(
+                "\0pinned", "Pinned", counted=False, entries=[_entry("p-1", "pinned")]
+            ),
+            SessionTreeGroup(
+                "alpha",
+                "alpha",
+                entries=[
+                    _entry("a-1", "fix parser", "alpha", ["bug"]),
+                    _entry("a-2", "write docs", "alpha"),
+                ],
+            ),
+            SessionTreeGroup("beta", "beta", entries=[_entry("b-1", "deploy", "beta")]),
+            # A second run of the same project shares its count.
+            SessionTreeGroup(
+                "alpha", "alpha", entries=[_entry("a-3", "old fix", "alpha")]
+            ),
+        ]
+    )
+
+
+# ===========================================================================
+# Matching
+# ===========================================================================
+
+
+class TestMatching:
+    def test_matches_label_id_project_and_tags(self) -> None:
+        entry = _entry("abc-123", "Refactor Parser", "~/dev/tui", ["Perf"])
+        for query in ("refactor", "abc-1", "dev/tui", "perf", ""):
+            assert entry.matches(query)
+        assert not entry.matches("zzz")
+
+    def test_hash_query_matches_tags_only(self) -> None:
+        entry = _entry("abc-123", "bug hunt", tags=["perf"])
+        assert entry.matches("#perf")
+        assert not entry.matches("#bug")
+
+    def test_detail_line_lists_tags(self) -> None:
+        entry = _entry("abcdef1234567890", "x", tags=["a", "b"])
+        assert entry.detail == "id: abcdef123456...  #a #b"
+
+
+# ===========================================================================
+# Incremental filtering
+# ===========================================================================
+
+
+class TestApply:
+    def test_initial_build(self, index: SessionTreeIndex) -> None:
+        tree: Tree = Tree("Sessions")
+        assert index.apply(tree, "") == 5
+        assert _shape(tree) == [
+            ("Pinned", ["pinned"]),
+            ("alpha (3)", ["fix parser", "write docs"]),
+            ("beta (1)", ["deploy"]),
+            ("alpha (3)", ["old fix"]),
+        ]
+        assert tree.root.children[1].children[0].data == "a-1"
+
+    def test_filter_keeps_surviving_nodes(self, index: SessionTreeIndex) -> None:
+        tree: Tree = Tree("Sessions")
+        index.apply(tree, "")
+        fix_node = index.groups[1].entries[0].node
+
+        assert index.apply(tree, "fix") == 2
+        assert _shape(tree) == [
+            ("alpha (2)", ["fix parser"]),
+            ("alpha (2)", ["old fix"]),
+        ]
+        assert index.groups[1].entries[0].node is fix_node
+
+    def test_widening_restores_order(self, index: SessionTreeIndex) -> None:
+        tree: Tree = Tree("Sessions")
+        index.apply(tree, "")
+        index.apply(tree, "docs")
+        index.apply(tree, "")
+        assert _shape(tree) == [
+            ("Pinned", ["pinned"]),
+            ("alpha (3)", ["fix parser", "write docs"]),
+            ("beta (1)", ["deploy"]),
+            ("alpha (3)", ["old fix"]),
+        ]
+
+    def test_no_matches_placeholder(self, index: SessionTreeIndex) -> None:
+        tree: Tree = Tree("Sessions")
+        assert index.apply(tree, "nothing here") == 0
+        assert [str(n.label) for n in tree.root.children] == ["No matching sessions"]
+        index.apply(tree, "deploy")
+        assert _shape(tree) == [("beta (1)", ["deploy"])]
+
+    def test_detach_rebuilds(self, index: SessionTreeIndex) -> None:
+        tree: Tree = Tree("Sessions")
+        index.apply(tree, "")
+        tree.clear()
+        tree.root.add_leaf("Searching...")
+        index.detach()
+        assert index.apply(tree, "#bug") == 1
+        assert _shape(tree) == [("alpha (1)", ["fix parser"])]
@@ -0,0 +1,94 @@
+"""Tests for the web frontend's delta streaming protocol."""
+
+from __future__ import annotations
+
+import zlib
+
+from amplifier_tui.web.stream_protocol import StreamEncoder
+
+
+def _replay(events: list[dict]) -> str:
+    """Apply events the way the web client does, verifying seq and crc."""
+    text = ""
+    seq = 0
+    crc = 0
+    for ev in events:
+        if ev["type"] == "stream_resync":
+            text, seq, crc = ev["text"], ev["seq"], ev["crc"]
+            continue
+        assert ev["seq"] == seq + 1
+        seq = ev["seq"]
+        text += ev["text"]
+        crc = zlib.crc32(ev["text"].encode("utf-8"), crc)
+        if "crc" in ev:
+            assert ev["crc"] == crc
+    return text
+
+
+class TestStreamEncoder:
+    def test_appends_only_new_text(self):
+        enc = StreamEncoder()
+        enc.start("text")
+        first = enc.encode("Hello")
+        second = enc.encode("Hello, world")
+        assert first == {
+            "type": "stream_append",
+            "block_type": "text",
+            "seq": 1,
+            "text": "Hello",
+        }
+        assert second["seq"] == 2
+        assert second["text"] == ", world"
+
+    def test_unchanged_snapshot_sends_nothing(self):
+        enc = StreamEncoder()
+        enc.start("text")
+        enc.encode("abc")
+        assert enc.encode("abc") is None
+
+    def test_periodic_checksum_matches_full_text(self):
+        enc = StreamEncoder(checksum_interval=3)
+        enc.start("text")
+        text = ""
+        events = []
+        for word in ["héllo ", "wörld ", "🎉 ", "more ", "text ", "here"]:
+            text += word
+            events.append(enc.encode(text))
+        with_crc = [e for e in events if "crc" in e]
+        assert [e["seq"] for e in with_crc] == [3, 6]
+        assert with_crc[-1]["crc"] == zlib.crc32(text.encode("utf-8"))
+        assert _replay(events) == text
+
+    def test_non_append_snapshot_triggers_resync(self):
+        enc = StreamEncoder()
+        enc.start("text")
+        enc.encode("abc")
+        ev = enc.encode("xyz")
+        assert ev["type"] == "stream_resync"
+        assert ev["text"] == "xyz"
+        assert ev["crc"] == zlib.crc32(b"xyz")
+        # Appends continue from the resynced state.
+        nxt = enc.encode("xyz!")
+        assert nxt["seq"] == ev["seq"] + 1
+        assert _replay([ev, nxt]) == "xyz!"
+
+    def test_resync_event_carries_full_state(self):
+        enc = StreamEncoder()
+        enc.start("thinking")
+        enc.encode("one ")
+        enc.encode("one two")
+        ev = enc.resync_event()
+        assert ev == {
+            "type": "stream_resync",
+            "block_type": "thinking",
+            "seq": 2,
+            "text": "one two",
+            "crc": zlib.crc32(b"one two"),
+        }
+
+    def test_start_resets_sequence(self):
+        enc = StreamEncoder()
+        enc.start("text")
+        enc.encode("abc")
+        enc.start("text")
+        assert enc.encode("new")["seq"] == 1
@@ -0,0 +1,179 @@
+"""Tests for incremental markdown rendering of streamed responses."""
+
+from __future__ import annotations
+
+from rich.console import Console
+from rich.theme import Theme
+
+from amplifier_tui.widgets.streaming_markdown import (
+    STREAM_CURSOR,
+    AssistantMarkdown,
+    StreamingMarkdown,
+    ThemedRenderable,
+    split_blocks,
+)
+
+_SAMPLE = """# Title
+
+Some paragraph
+continues here.
+
+- item one
+- item two
+
+- loose item
+
+```python
+def f():
+
+    return 1
+```
+
+> quote
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+---
+
+## Sub
+text after heading
+
+Final para
+"""
+
+
+def _render(renderable, width: int = 60) -> str:
+    console = Console(width=width, color_system=None)
+    with console.capture() as cap:
+        console.print(renderable)
+    return cap.get()
+
+
+def _stream(text: str, step: int = 5) -> StreamingMarkdown:
+    stream = StreamingMarkdown()
+    for end in range(1, len(text) + 1, step):
+        stream.update(text[:end])
+    return stream
+
+
+# ---------------------------------------------------------------------------
+# Block splitting
+# ---------------------------------------------------------------------------
+
+
+class TestSplitBlocks:
+    def test_round_trips_text(self):
+        blocks, tail = split_blocks(_SAMPLE)
+        assert "".join(blocks) + tail == _SAMPLE
+
+    def test_block_ends_only_when_next_content_starts(self):
+        blocks, tail = split_blocks("para one\n\n")
+        assert blocks == []
+        blocks, tail = split_blocks("para one\n\npara two\n")
+        assert blocks == ["para one\n\n"]
+        assert tail == "para two\n"
+
+    def test_partial_line_stays_in_tail(self):
+        # "- " might still become a list item continuing the first block.
+        assert split_blocks("- one\n\n-") == ([], "- one\n\n-")
+
+    def test_blank_line_inside_fence_is_not_a_boundary(self):
+        text = "```\na\n\nb\n"
+        assert split_blocks(text) == ([], text)
+
+    def test_closing_fence_ends_block(self):
+        blocks, tail = split_blocks("```\ncode\n```\nafter\n")
+        assert blocks == ["```\ncode\n```\n"]
+        assert tail == "after\n"
+
+    def test_loose_list_kept_together(self):
+        text = "- a\n\n- b\n\n  more b\n\nnext\n"
+        blocks, tail = split_blocks(text)
+        assert blocks == ["- a\n\n- b\n\n  more b\n\n"]
+        assert tail == "next\n"
+
+    def test_list_after_paragraph_kept_together(self):
+        text = "Features:\n- a\n  ```\n  x\n  ```\n- b\n\nnext\n"
+        blocks, _ = split_blocks(text)
+        assert blocks == ["Features:\n- a\n  ```\n  x\n  ```\n- b\n\n"]
+
+
+# ---------------------------------------------------------------------------
+# Incremental rendering
+# ---------------------------------------------------------------------------
+
+
+class TestStreamingMarkdown:
+    def test_finished_render_matches_full_render(self):
+        stream = _stream(_SAMPLE)
+        assert _render(stream.finish(_SAMPLE)) == _render(AssistantMarkdown(_SAMPLE))
+
+    def test_render_matches_at_several_widths(self):
+        stream = _stream(_SAMPLE)
+        final = stream.finish(_SAMPLE)
+        for width in (30, 80):
+            assert _render(final, width) == _render(AssistantMarkdown(_SAMPLE), width)
+
+    def test_finalized_blocks_are_reused(self):
+        stream = StreamingMarkdown()
+        stream.update("para one\n\npara two\n\npara\n")
+        first = stream.renderable().renderables[0]
+        assert stream.block_count == 2
+        stream.update("para one\n\npara two\n\npara three\n")
+        assert stream.renderable().renderables[0] is first
+        assert stream.block_count == 2
+
+    def test_cached_lines_per_width(self):
+        stream = StreamingMarkdown()
+        stream.update("para one\n\nnext\n")
+        block = stream.renderable().renderables[0]
+        _render(block, 40)
+        _render(block, 40)
+        _render(block, 60)
+        assert sorted(key[0] for key in block._lines) == [40, 60]
+
+    def test_tail_shows_cursor_until_finished(self):
+        stream = StreamingMarkdown()
+        stream.update("hello")
+        assert STREAM_CURSOR.strip() in _render(stream.renderable())
+        assert STREAM_CURSOR.strip() not in _render(stream.finish())
+
+    def test_non_extension_resets(self):
+        stream = StreamingMarkdown()
+        stream.update("one\n\ntwo\n\nthree\n")
+        stream.update("other\n\ntext\n")
+        assert stream.block_count == 1
+        assert _render(stream.finish()) == _render(AssistantMarkdown("other\n\ntext\n"))
+
+    def test_finish_with_empty_tail(self):
+        stream = StreamingMarkdown()
+        final = stream.finish("")
+        assert _render(final) == _render(AssistantMarkdown(""))
+
+
+class TestAssistantTheme:
+    def test_theme_styles_the_blocks(self):
+        stream = StreamingMarkdown()
+        final = stream.finish("# Head\n\nbody\n")
+        theme = Theme({"markdown.h1": "bold #ff0000"})
+        console = Console(width=40, color_system="truecolor")
+        segments = list(console.render(ThemedRenderable(final, theme)))
+        head = next(seg for seg in segments if "Head" in seg.text)
+        assert head.style.color.triplet == (255, 0, 0)
+
+    def test_theme_switch_rerenders_cached_block(self):
+        stream = StreamingMarkdown()
+        final = stream.finish("# Head\n")
+        console = Console(width=40, color_system="truecolor")
+        for colour in ("#ff0000", "#00ff00"):
+            theme = Theme({"markdown.h1": colour})
+            segments = list(console.render(ThemedRenderable(final, theme)))
+            head = next(seg for seg in segments if "Head" in seg.text)
+            assert head.style.color.triplet.hex == colour
+        assert len(final.renderables[0]._lines) == 2
+
+    def test_fences_are_framed(self):
+        out = _render(StreamingMarkdown().finish("```\nx = 1\n```\n"))
+        assert "┌" in out and "x = 1" in out
@@ -69,3 +69,98 @@ def test_terminal_in_slash_commands():
     """The /terminal command should be registered."""
     from amplifier_tui.constants import SLASH_COMMANDS
     assert "/terminal" in SLASH_COMMANDS
+
+
+def _fed(text: str, **kw) -> Terminal:
+    t = Terminal(command="/bin/true", **kw)
+    t._feed(text)
+    t._update_lines()
+    return t
+
+
+def test_terminal_renders_style_runs():
+    """Rows are built from runs of equal pyte attributes."""
+    t = _fed("plain \x1b[1;31mred\x1b[0m \x1b[4mline\x1b[0m")
+    row = t._lines[0]
+    assert row.plain.startswith("plain red line")
+    spans = {row.plain[s.start : s.end]: s.style for s in row.spans}
+    assert spans["red"].bold and spans["red"].color.name == "red"
+    assert spans["line"].underline
+
+
+def test_terminal_rebuilds_only_dirty_rows():
+    """Unchanged rows keep their cached Text between frames."""
+    t = _fed("one\r\ntwo\r\nthree")
+    first, second = t._lines[0], t._lines[1]
+    t._feed("\x1b[1;1Hbye")
+    t._update_lines()
+    assert t._lines[0] is not first
+    assert t._lines[0].plain.startswith("bye")
+    assert t._lines[1] is second
+
+
+def test_terminal_styles_are_memoized():
+    """Cells with equal attributes share one Style object."""
+    t = _fed("\x1b[32mab\x1b[0m x \x1b[32mcd\x1b[0m")
+    row = t._lines[0]
+    styles = [s.style for s in row.spans if row.plain[s.start : s.end] in ("ab", "cd")]
+    assert len(styles) == 2 and styles[0] is styles[1]
+
+
+def test_terminal_render_is_frame_capped(monkeypatch):
+    """Output arriving within one frame is drawn once."""
+    async def _run():
+        t = Terminal(command="/bin/true", max_fps=20)
+        frames = []
+        monkeypatch.setattr(t, "refresh", lambda *a, **k: frames.append(1))
+        t._feed("a")
+        t._schedule_render()  # first frame draws immediately
+        for ch in "bcdef":
+            t._feed(ch)
+            t._schedule_render()
+        assert len(frames) == 1
+        await asyncio.sleep(0.1)
+        assert len(frames) == 2
+        assert t._lines[0].plain.startswith("abcdef")
+    asyncio.run(_run())
+
+
+def test_emulator_is_lossless_under_backpressure():
+    """A slow reader gets every byte, multibyte characters intact."""
+    import sys
+    from amplifier_tui.widgets.terminal import _TerminalEmulator
+
+    script = "import sys; sys.stdout.write('\\u00e9\\u4e2d' * 200000)"
+    async def _run():
+        emu = _TerminalEmulator(f'{sys.executable} -c "{script}"', queue_chunks=2)
+        emu.start()
+        chunks, paused = [], False
+        try:
+            while True:
+                message = await asyncio.wait_for(emu.send_queue.get(), 20)
+                if message[0] == "disconnect":
+                    break
+                if message[0] == "stdout":
+                    chunks.append(message[1])
+                    paused = paused or not emu._reading
+                    await asyncio.sleep(0.001)  # fall behind the child
+                emu.resume_reading()
+        finally:
+            emu.stop()
+        return "".join(chunks), paused
+    text, paused = asyncio.run(_run())
+    assert text == "é中" * 200000
+    assert paused
+
+
+def test_terminal_scrollback_pages_history():
+    """Lines scrolled off the top stay reachable via HistoryScreen."""
+    t = _fed("".join(f"line {i}\r\n" for i in range(100)), scrollback=50)
+    assert t._lines[0].plain.startswith("line 77")
+    t._screen.prev_page()
+    t._update_lines()
+    assert t._lines[0].plain.startswith("line 65")
+    assert t._screen.cursor.hidden
+    t._feed("more\r\n")  # new output returns to the bottom
+    t._update_lines()
+    assert t._lines[0].plain.startswith("line 78")
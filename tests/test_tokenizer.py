@@ -0,0 +1,79 @@
+"""Tests for the offline token counter."""
+
+from __future__ import annotations
+
+import pytest
+
+from amplifier_tui.core.features.tokenizer import TokenCounter, pretoken_count
+
+
+class TestPretokenCount:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("", 0),
+            ("Hello, world!", 4),  # Hello / , / " world" / !
+            ("it's fine", 3),  # it / 's / " fine"
+            ("1234567", 3),  # digits go in groups of three
+            ("你好世界", 4),  # one token per CJK character
+            ("internationalization", 4),  # long words split
+            ("x = 1\n\n    y = 2", 7),
+        ],
+    )
+    def test_counts(self, text: str, expected: int) -> None:
+        assert pretoken_count(text) == expected
+
+    def test_code_is_denser_than_prose(self) -> None:
+        code = '{"a": [1, 2, 3], "b": {"c": null}}'
+        prose = "the quick brown fox jumps over them"
+        assert pretoken_count(code) > 2 * pretoken_count(prose)
+
+
+class TestTokenCounter:
+    def test_cache_by_content(self) -> None:
+        calls: list[str] = []
+
+        def backend(text: str) -> int:
+            calls.append(text)
+            return len(text)
+
+        counter = TokenCounter(backend, cache_size=2)
+        a, b, c = "a" * 100, "b" * 100, "c" * 100
+        assert counter.count(a) == 100
+        assert counter.count("".join(["a"] * 100)) == 100  # equal text, new object
+        assert counter.hits == 1 and len(calls) == 1
+        counter.count(b)
+        counter.count(c)  # evicts a
+        counter.count(a)
+        assert calls == [a, b, c, a]
+
+    def test_short_texts_bypass_cache(self) -> None:
+        counter = TokenCounter(len)
+        assert counter.count("short") == 5
+        assert counter.count("") == 0
+        assert counter.hits == counter.misses == 0
+
+    def test_count_many_matches_count(self) -> None:
+        counter = TokenCounter()
+        texts = ["", "hi", "some longer text " * 10, "some longer text " * 10]
+        assert counter.count_many(texts) == [counter.count(t) for t in texts]
+        assert counter.hits >= 2
+
+    def test_calibration_moves_towards_observed_ratio(self) -> None:
+        counter = TokenCounter(len)
+        counter.calibrate(10, 40)  # too small a sample
+        assert counter.scale == 1.0
+        for _ in range(50):
+            counter.calibrate(100, 150)
+        assert counter.scale == pytest.approx(1.5, abs=0.01)
+        assert counter.count("x" * 100) == 150
+        counter.calibrate(100, 100_000)  # clamped
+        assert counter.scale <= 2.0
+
+    def test_set_backend_resets(self) -> None:
+        counter = TokenCounter(len)
+        counter.calibrate(100, 150)
+        counter.count("y" * 100)
+        counter.set_backend(lambda _t: 7)
+        assert counter.scale == 1.0
+        assert counter.count("y" * 100) == 7
@@ -0,0 +1,313 @@
+"""Tests for the persistent cross-session transcript index."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from amplifier_tui.core.features.project_search import ProjectSearch
+from amplifier_tui.core.features.transcript_index import (
+    TranscriptIndex,
+    count_matches,
+    extract_text,
+    make_snippet,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_session(
+    base: Path,
+    project: str,
+    session_id: str,
+    messages: list[dict],
+    meta: dict | None = None,
+) -> Path:
+    session_dir = base / project / "sessions" / session_id
+    session_dir.mkdir(parents=True, exist_ok=True)
+    transcript = session_dir / "transcript.jsonl"
+    with open(transcript, "w", encoding="utf-8") as fh:
+        for msg in messages:
+            fh.write(json.dumps(msg) + "\n")
+    if meta is not None:
+        (session_dir / "metadata.json").write_text(json.dumps(meta))
+    return transcript
+
+
+def _append(transcript: Path, messages: list[dict]) -> None:
+    with open(transcript, "a", encoding="utf-8") as fh:
+        for msg in messages:
+            fh.write(json.dumps(msg) + "\n")
+    # Make sure the mtime visibly changes on coarse-grained filesystems.
+    st = transcript.stat()
+    os.utime(transcript, (st.st_atime, st.st_mtime + 1))
+
+
+def _index(tmp_path: Path) -> tuple[TranscriptIndex, Path]:
+    projects = tmp_path / "projects"
+    projects.mkdir()
+    return TranscriptIndex(tmp_path / "index.db", projects), projects
+
+
+# ---------------------------------------------------------------------------
+# Helpers under test
+# ---------------------------------------------------------------------------
+
+
+class TestHelpers:
+    def test_extract_text_string(self):
+        assert extract_text("hello") == "hello"
+
+    def test_extract_text_blocks(self):
+        content = [
+            {"type": "text", "text": "one"},
+            {"type": "tool_use", "name": "bash"},
+            {"type": "text", "text": "two"},
+        ]
+        assert extract_text(content) == "one two"
+
+    def test_extract_text_other(self):
+        assert extract_text(None) == ""
+
+    def test_count_matches_overlapping(self):
+        assert count_matches("aaaa", "aa") == (3, 0)
+
+    def test_count_matches_none(self):
+        assert count_matches("abc", "z") == (0, -1)
+
+    def test_make_snippet_ellipsis(self):
+        text = "x" * 100 + "needle" + "y" * 100
+        snippet = make_snippet(text, "NEEDLE", before=5, after=5)
+        assert snippet == "...xxxxxneedleyyyyy..."
+
+    def test_make_snippet_no_ellipsis(self):
+        snippet = make_snippet("a needle b", "needle", ellipsis=False)
+        assert snippet == "a needle b"
+
+
+# ---------------------------------------------------------------------------
+# TranscriptIndex
+# ---------------------------------------------------------------------------
+
+
+class TestTranscriptIndex:
+    def test_empty_projects_dir(self, tmp_path):
+        index, _ = _index(tmp_path)
+        assert index.refresh() == 0
+        assert index.search("anything") == []
+
+    def test_blank_query(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(projects, "-p", "s1", [{"role": "user", "content": "hi"}])
+        assert index.search("   ") == []
+
+    def test_finds_user_and_assistant_text(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(
+            projects,
+            "-home-me-proj",
+            "s1",
+            [
+                {"role": "user", "content": "Fix the Filter bug"},
+                {
+                    "role": "assistant",
+                    "content": [{"type": "text", "text": "The filter is fixed"}],
+                },
+                {"role": "tool", "content": "filter filter filter"},
+            ],
+        )
+        results = index.search("filter")
+        assert len(results) == 1
+        m = results[0]
+        assert m.session_id == "s1"
+        assert m.project_dir == "-home-me-proj"
+        assert m.match_count == 2  # tool output is not indexed
+        assert m.first_role == "user"
+        assert m.last_role == "assistant"
+
+    def test_short_query_uses_fallback(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(projects, "-p", "s1", [{"role": "user", "content": "go ok"}])
+        results = index.search("ok")
+        assert [m.session_id for m in results] == ["s1"]
+
+    def test_skips_sub_sessions(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(projects, "-p", "s1_agent", [{"role": "user", "content": "xyz"}])
+        assert index.search("xyz") == []
+
+    def test_metadata_match(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(
+            projects,
+            "-p",
+            "s1",
+            [{"role": "user", "content": "hello"}],
+            meta={"name": "Refactor Parser", "description": ""},
+        )
+        results = index.search("parser")
+        assert len(results) == 1
+        assert results[0].meta_match == "Refactor Parser"
+        assert results[0].match_count == 1
+        assert index.search("parser", include_metadata=False) == []
+
+    def test_sorted_by_mtime(self, tmp_path):
+        index, projects = _index(tmp_path)
+        old = _make_session(projects, "-p", "old", [{"role": "user", "content": "abc"}])
+        new = _make_session(projects, "-p", "new", [{"role": "user", "content": "abc"}])
+        os.utime(old, (1000, 1000))
+        os.utime(new, (2000, 2000))
+        assert [m.session_id for m in index.search("abc")] == ["new", "old"]
+        assert [m.session_id for m in index.search("abc", limit=1)] == ["new"]
+
+    def test_session_ids_filter(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(projects, "-p", "a", [{"role": "user", "content": "abc"}])
+        _make_session(projects, "-p", "b", [{"role": "user", "content": "abc"}])
+        results = index.search("abc", session_ids=["b"])
+        assert [m.session_id for m in results] == ["b"]
+
+    def test_unchanged_files_not_reread(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(projects, "-p", "s1", [{"role": "user", "content": "abc"}])
+        assert index.refresh() == 1
+        assert index.refresh() == 0
+
+    def test_appended_turns_indexed_incrementally(self, tmp_path):
+        index, projects = _index(tmp_path)
+        transcript = _make_session(
+            projects, "-p", "s1", [{"role": "user", "content": "first turn"}]
+        )
+        index.refresh()
+        _append(transcript, [{"role": "assistant", "content": "second turn"}])
+        assert index.refresh() == 1
+        # No duplicate rows for the first turn.
+        assert index.stats() == {"sessions": 1, "messages": 2}
+        assert index.search("turn")[0].match_count == 2
+
+    def test_partial_tail_line_deferred(self, tmp_path):
+        index, projects = _index(tmp_path)
+        transcript = _make_session(
+            projects, "-p", "s1", [{"role": "user", "content": "done"}]
+        )
+        with open(transcript, "a", encoding="utf-8") as fh:
+            fh.write('{"role": "user", "content": "half')
+        index.refresh()
+        assert index.search("half") == []
+        with open(transcript, "a", encoding="utf-8") as fh:
+            fh.write(' written"}\n')
+        st = transcript.stat()
+        os.utime(transcript, (st.st_atime, st.st_mtime + 1))
+        assert [m.session_id for m in index.search("half written")] == ["s1"]
+
+    def test_rewritten_file_reindexed(self, tmp_path):
+        index, projects = _index(tmp_path)
+        transcript = _make_session(
+            projects, "-p", "s1", [{"role": "user", "content": "original words"}]
+        )
+        index.refresh()
+        transcript.write_text(json.dumps({"role": "user", "content": "new"}) + "\n")
+        st = transcript.stat()
+        os.utime(transcript, (st.st_atime, st.st_mtime + 1))
+        assert index.search("original") == []
+        assert index.stats()["messages"] == 1
+
+    def test_deleted_sessions_pruned(self, tmp_path):
+        index, projects = _index(tmp_path)
+        transcript = _make_session(
+            projects, "-p", "s1", [{"role": "user", "content": "abc"}]
+        )
+        index.refresh()
+        transcript.unlink()
+        index.refresh()
+        assert index.stats() == {"sessions": 0, "messages": 0}
+
+    def test_metadata_change_picked_up(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(
+            projects, "-p", "s1", [{"role": "user", "content": "x"}], meta={"name": "a"}
+        )
+        index.refresh()
+        meta = projects / "-p" / "sessions" / "s1" / "metadata.json"
+        meta.write_text(json.dumps({"name": "renamed"}))
+        st = meta.stat()
+        os.utime(meta, (st.st_atime, st.st_mtime + 1))
+        assert index.search("renamed")[0].name == "renamed"
+
+    def test_sessions_listing(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(projects, "-p", "s1", [{"role": "user", "content": "x"}])
+        index.refresh()
+        assert [s.session_id for s in index.sessions()] == ["s1"]
+
+    def test_persists_across_instances(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(projects, "-p", "s1", [{"role": "user", "content": "abc"}])
+        index.refresh()
+        again = TranscriptIndex(tmp_path / "index.db", projects)
+        assert again.refresh() == 0
+        assert again.search("abc", refresh=False)[0].session_id == "s1"
+
+    def test_refresh_throttled_by_max_age(self, tmp_path):
+        index, projects = _index(tmp_path)
+        transcript = _make_session(
+            projects, "-p", "s1", [{"role": "user", "content": "first"}]
+        )
+        assert not index.ready
+        assert index.refresh(max_age=60) == 1
+        assert index.ready
+        _append(transcript, [{"role": "assistant", "content": "second"}])
+        assert index.refresh(max_age=60) == 0  # still fresh
+        assert index.search("second", refresh=False) == []
+        assert index.refresh() == 1
+
+    def test_refresh_in_background(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(projects, "-p", "s1", [{"role": "user", "content": "abc"}])
+        assert index.refresh_in_background()
+        index._refresh_thread.join(timeout=10)
+        assert index.search("abc", refresh=False)[0].session_id == "s1"
+        # Fresh again: no second thread is started.
+        assert not index.refresh_in_background()
+
+
+# ---------------------------------------------------------------------------
+# ProjectSearch on top of the index
+# ---------------------------------------------------------------------------
+
+
+class TestProjectSearchIndex:
+    def test_reports_latest_match(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(
+            projects,
+            "-p",
+            "s1",
+            [
+                {"role": "user", "content": "old bug report"},
+                {"role": "assistant", "content": "the bug is fixed"},
+            ],
+        )
+        sessions = [
+            {"session_id": "s1", "project": "proj", "date_str": "01/01", "mtime": 1.0},
+            {"session_id": "s2", "project": "other", "date_str": "01/01", "mtime": 2.0},
+        ]
+        results = ProjectSearch.search(sessions, "bug", index=index)
+        assert len(results) == 1
+        assert results[0].role == "assistant"
+        assert results[0].match_context == "the bug is fixed"
+
+    def test_project_filter(self, tmp_path):
+        index, projects = _index(tmp_path)
+        _make_session(projects, "-p", "s1", [{"role": "user", "content": "bug"}])
+        sessions = [
+            {"session_id": "s1", "project": "proj", "date_str": "", "mtime": 1.0},
+        ]
+        assert (
+            ProjectSearch.search(sessions, "bug", project_filter="zzz", index=index)
+            == []
+        )
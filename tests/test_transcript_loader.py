@@ -0,0 +1,121 @@
+"""Tests for transcript loading helpers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from amplifier_tui.core import _json, transcript_loader
+from amplifier_tui.core.transcript_loader import (
+    DisplayBlock,
+    TranscriptTailReader,
+    load_transcript,
+    parse_message_blocks,
+)
+
+
+def _write_transcript(path: Path, n: int) -> Path:
+    with open(path, "w", encoding="utf-8") as fh:
+        for i in range(n):
+            fh.write(json.dumps({"role": "user", "content": f"message {i}"}) + "\n")
+    return path
+
+
+def _contents(messages: list[dict]) -> list[str]:
+    return [m["content"] for m in messages]
+
+
+class TestTranscriptTailReader:
+    def test_reads_newest_first_in_batches(self, tmp_path):
+        path = _write_transcript(tmp_path / "transcript.jsonl", 25)
+        reader = TranscriptTailReader(path, chunk_size=64)
+        assert _contents(reader.read_older(10)) == [
+            f"message {i}" for i in range(15, 25)
+        ]
+        assert _contents(reader.read_older(10)) == [
+            f"message {i}" for i in range(5, 15)
+        ]
+        assert not reader.exhausted
+        assert _contents(reader.read_older(10)) == [f"message {i}" for i in range(5)]
+        assert reader.exhausted
+        assert reader.read_older(10) == []
+
+    def test_skips_malformed_lines(self, tmp_path):
+        path = tmp_path / "transcript.jsonl"
+        path.write_text('{"role": "user", "content": "a"}\nnot json\n[1]\n\n')
+        reader = TranscriptTailReader(path)
+        assert _contents(reader.read_older(10)) == ["a"]
+        assert reader.exhausted
+
+    def test_ignores_lines_appended_later(self, tmp_path):
+        path = _write_transcript(tmp_path / "transcript.jsonl", 3)
+        reader = TranscriptTailReader(path)
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps({"role": "user", "content": "late"}) + "\n")
+        assert _contents(reader.read_older(10)) == [
+            "message 0",
+            "message 1",
+            "message 2",
+        ]
+
+    def test_missing_file(self, tmp_path):
+        reader = TranscriptTailReader(tmp_path / "missing.jsonl")
+        assert reader.exhausted
+        assert reader.read_older(5) == []
+
+
+class TestJsonBackend:
+    @pytest.mark.parametrize("backend", ["active", "stdlib"])
+    def test_load_transcript_matches_stdlib(self, tmp_path, monkeypatch, backend):
+        if backend == "stdlib":
+            monkeypatch.setattr(transcript_loader, "loads", json.loads)
+        path = tmp_path / "transcript.jsonl"
+        path.write_bytes(
+            '{"role": "user", "content": "caf\u00e9"}\n'.encode()
+            + b"not json\n[1]\n\n"
+            + b'{"role": "assistant", "content": [{"type": "text", "text": "ok"}]}\n'
+        )
+        assert list(load_transcript(path)) == [
+            {"role": "user", "content": "caf\u00e9"},
+            {"role": "assistant", "content": [{"type": "text", "text": "ok"}]},
+        ]
+
+    def test_decode_errors_cover_bad_input(self):
+        for bad in (b"{", b"\xff", "nope"):
+            with pytest.raises(_json.DECODE_ERRORS):
+                _json.loads(bad)
+
+
+class TestDisplayBlock:
+    def test_tool_result_text_is_built_on_first_read(self):
+        parts = [{"type": "text", "text": "line 1"}, {"type": "text", "text": "line 2"}]
+        (block,) = parse_message_blocks(
+            {"role": "tool", "tool_use_id": "t1", "content": parts}
+        )
+        assert block.kind == "tool_result"
+        assert not block.materialized
+        assert block.content == "line 1\nline 2"
+        assert block.materialized
+
+    def test_tool_input_is_not_copied(self):
+        tool_input = {"command": "ls"}
+        (block,) = parse_message_blocks(
+            {
+                "role": "assistant",
+                "content": [
+                    {
+                        "type": "tool_use",
+                        "name": "bash",
+                        "id": "t1",
+                        "input": tool_input,
+                    }
+                ],
+            }
+        )
+        assert block.tool_input is tool_input
+
+    def test_equality_compares_materialized_content(self):
+        lazy = DisplayBlock("tool_result", [{"type": "text", "text": "x"}], tool_id="a")
+        assert lazy == DisplayBlock("tool_result", "x", tool_id="a")
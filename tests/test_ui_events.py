@@ -0,0 +1,110 @@
+"""Tests for the coalescing UI event bus."""
+
+from __future__ import annotations
+
+import threading
+
+from amplifier_tui.core.features.ui_events import UiEventBus
+
+
+def _bus(wakes: list[int] | None = None, **kw) -> UiEventBus:
+    wakes = wakes if wakes is not None else []
+    return UiEventBus(lambda: wakes.append(1), **kw)
+
+
+class TestPostAndDrain:
+    def test_updates_run_in_order_on_drain(self):
+        calls: list[str] = []
+        bus = _bus()
+        bus.post("c1", calls.append, "a")
+        bus.post("c1", calls.append, "b")
+        assert calls == []
+
+        assert bus.drain() == 2
+        assert calls == ["a", "b"]
+        assert not bus.pending()
+
+    def test_wakes_once_per_batch(self):
+        wakes: list[int] = []
+        bus = _bus(wakes)
+        bus.post("c1", print)
+        bus.post("c2", print)
+        assert len(wakes) == 1
+        bus.drain()
+        bus.post("c1", print)
+        assert len(wakes) == 2
+
+    def test_keyed_updates_keep_only_the_latest(self):
+        calls: list[str] = []
+        bus = _bus()
+        bus.post("c1", calls.append, "Thinking...", key="status")
+        bus.post("c1", calls.append, "tool")
+        bus.post("c1", calls.append, "Running", key="status")
+        bus.post("c2", calls.append, "other", key="status")
+
+        bus.drain()
+        assert calls == ["tool", "Running", "other"]
+        assert bus.stats.coalesced == 1
+
+    def test_kwargs_and_failing_update(self):
+        calls: list[dict] = []
+
+        def boom() -> None:
+            raise RuntimeError("widget gone")
+
+        bus = _bus()
+        bus.post("c1", boom)
+        bus.post("c1", lambda **kw: calls.append(kw), conversation_id="c1")
+        bus.drain()
+        assert calls == [{"conversation_id": "c1"}]
+
+    def test_discard_drops_a_conversation(self):
+        calls: list[str] = []
+        bus = _bus()
+        bus.post("c1", calls.append, "a", key="status")
+        bus.post("c2", calls.append, "b")
+        bus.discard("c1")
+        bus.post("c1", calls.append, "c", key="status")
+
+        bus.drain()
+        assert calls == ["b", "c"]
+        assert bus.stats.coalesced == 0
+
+
+class TestFrames:
+    def test_delay_until_next_frame(self):
+        bus = _bus(frame=10.0)
+        assert bus.delay() == 0.0
+        bus.post("c1", print)
+        bus.drain()
+        assert 9.0 < bus.delay() <= 10.0
+
+    def test_stats_report_drain_time(self):
+        bus = _bus()
+        assert bus.stats.summary() == "no UI updates yet"
+        bus.post("c1", print)
+        bus.drain()
+        bus.drain()  # empty drains are not counted
+        stats = bus.stats
+        assert stats.posted == 1
+        assert stats.drains == 1
+        assert stats.max_drain_ms >= stats.last_drain_ms >= 0
+        assert "1 updates in 1 frames" in stats.summary()
+
+    def test_posting_from_worker_threads(self):
+        calls: list[int] = []
+        bus = _bus()
+        threads = [
+            threading.Thread(
+                target=lambda n=n: [
+                    bus.post(f"c{n}", calls.append, i) for i in range(100)
+                ]
+            )
+            for n in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        bus.drain()
+        assert len(calls) == 400
@@ -0,0 +1,140 @@
+"""Tests for the columnar per-turn usage store."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from amplifier_tui.core.features.usage_store import UsageStore, rolling_sum
+
+DAY = 86400.0
+
+
+def _events(path: Path, events: list[dict]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as fh:
+        for ev in events:
+            fh.write(json.dumps(ev) + "\n")
+    return path
+
+
+def _llm(ts: str, model: str, inp: int, out: int) -> dict:
+    return {
+        "ts": ts,
+        "event": "llm:response",
+        "data": {"model": model, "usage": {"input": inp, "output": out}},
+    }
+
+
+def _tool(ts: str, name: str) -> dict:
+    return {"ts": ts, "event": "tool:pre", "data": {"tool_name": name}}
+
+
+class TestQueries:
+    @pytest.fixture
+    def store(self) -> UsageStore:
+        store = UsageStore()
+        store.append(0, session="a", project="p", model="m1", input_tokens=10)
+        store.append(DAY, session="a", project="p", model="m2", output_tokens=5)
+        store.append(DAY + 1, session="b", project="q", model="m2", tool="bash")
+        # Out of time order: queries still see rows by timestamp.
+        store.append(0.5 * DAY, session="b", project="q", model="m1", input_tokens=1)
+        return store
+
+    def test_totals_range_and_grouping(self, store: UsageStore) -> None:
+        overall = store.totals()[""]
+        assert (overall.turns, overall.tool_calls, overall.tokens) == (3, 1, 16)
+        by_model = store.totals(0, DAY, by="model")
+        assert set(by_model) == {"m1"}
+        assert by_model["m1"].input_tokens == 11
+        assert store.totals(DAY, by="tool")["bash"].tool_calls == 1
+
+    def test_series_buckets(self, store: UsageStore) -> None:
+        assert store.series(0, 2 * DAY, DAY) == {"": [11, 5]}
+        assert store.series(0, 2 * DAY, DAY, by="project") == {
+            "p": [10, 5],
+            "q": [1, 0],
+        }
+
+    def test_unknown_group_rejected(self, store: UsageStore) -> None:
+        with pytest.raises(ValueError):
+            store.totals(by="input")
+
+    def test_rolling_sum(self) -> None:
+        assert rolling_sum([1, 2, 3, 4], 2) == [1, 3, 5, 7]
+
+
+class TestIngestion:
+    def test_incremental_sync_and_persistence(self, tmp_path: Path) -> None:
+        projects = tmp_path / "projects"
+        events = projects / "-home-u-dev-app" / "sessions" / "s1" / "events.jsonl"
+        _events(
+            events,
+            [
+                {"ts": "2026-01-05T10:00:00Z", "event": "session:start", "data": {}},
+                _llm("2026-01-05T10:00:01Z", "sonnet", 100, 20),
+                _tool("2026-01-05T10:00:02Z", "read_file"),
+            ],
+        )
+        store = UsageStore(tmp_path / "usage")
+        progress: list[tuple[int, int]] = []
+        assert store.sync_sessions(projects, lambda d, t: progress.append((d, t))) == 2
+        assert progress == [(1, 1)]
+        assert store.sync_sessions(projects) == 0  # nothing new
+
+        # A partial trailing line waits for its newline.
+        _events(events, [_llm("2026-01-05T10:01:00Z", "sonnet", 7, 3)])
+        with open(events, "a", encoding="utf-8") as fh:
+            fh.write('{"ts": "2026-01-05T10:02:00Z", "event": "llm:resp')
+        assert store.sync_sessions(projects) == 1
+
+        reopened = UsageStore(tmp_path / "usage")
+        assert len(reopened) == 3
+        totals = reopened.totals(by="project")["app"]
+        assert (totals.input_tokens, totals.output_tokens) == (107, 23)
+        assert reopened.totals(by="tool")["read_file"].tool_calls == 1
+        assert set(reopened.totals(by="model")) == {"sonnet"}
+        assert reopened.sync_sessions(projects) == 0  # offsets persisted
+
+    def test_tool_rows_keep_model_across_syncs(self, tmp_path: Path) -> None:
+        projects = tmp_path / "projects"
+        events = projects / "-home-u-dev-app" / "sessions" / "s1" / "events.jsonl"
+        _events(events, [_llm("2026-01-05T10:00:01Z", "sonnet", 1, 1)])
+        store = UsageStore(tmp_path / "usage")
+        assert store.sync_sessions(projects) == 1
+
+        # The next sync (here by a fresh process) starts after the llm row.
+        _events(events, [_tool("2026-01-05T10:00:02Z", "bash")])
+        reopened = UsageStore(tmp_path / "usage")
+        assert reopened.sync_sessions(projects) == 1
+        assert reopened.totals(by="model")["sonnet"].tool_calls == 1
+
+    def test_uncommitted_rows_are_dropped(self, tmp_path: Path) -> None:
+        store = UsageStore(tmp_path)
+        store.append(1.0, session="a", model="m", input_tokens=1)
+        store.flush()
+        # Simulate a crash after the columns were written but before meta.
+        with open(tmp_path / "ts.col", "ab") as fh:
+            fh.write(b"\0" * 5)
+        reopened = UsageStore(tmp_path)
+        assert len(reopened) == 1
+        reopened.append(2.0, session="b", model="n", input_tokens=2)
+        reopened.flush()
+        assert UsageStore(tmp_path).totals(by="session")["b"].input_tokens == 2
+
+    def test_corrupt_store_is_rebuilt(self, tmp_path: Path) -> None:
+        store = UsageStore(tmp_path)
+        store.append(1.0, session="a")
+        store.flush()
+        (tmp_path / "input.col").write_bytes(b"")
+        assert len(UsageStore(tmp_path)) == 0
+
+    def test_clear_removes_files(self, tmp_path: Path) -> None:
+        store = UsageStore(tmp_path)
+        store.append(1.0, session="a")
+        store.flush()
+        store.clear()
+        assert len(store) == 0
+        assert not (tmp_path / "meta.json").exists()
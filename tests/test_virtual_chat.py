@@ -0,0 +1,195 @@
+"""Tests for the virtualized transcript view."""
+
+from __future__ import annotations
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.containers import ScrollableContainer
+from textual.widgets import Static
+
+from amplifier_tui.widgets.virtual_chat import (
+    ChatRecord,
+    VirtualTranscript,
+    estimate_height,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _records(n: int) -> list[ChatRecord]:
+    return [
+        ChatRecord("user", f"message {i}\nsecond line", search_index=i)
+        for i in range(n)
+    ]
+
+
+def _build(record: ChatRecord) -> list[Static]:
+    return [Static(record.content, classes="chat-message")]
+
+
+class _ChatApp(App):
+    def compose(self) -> ComposeResult:
+        yield ScrollableContainer(id="chat")
+
+
+async def _settle(pilot, rounds: int = 4) -> None:
+    for _ in range(rounds):
+        await pilot.pause()
+
+
+# ---------------------------------------------------------------------------
+# Estimates
+# ---------------------------------------------------------------------------
+
+
+class TestEstimateHeight:
+    def test_wraps_long_lines(self):
+        short = ChatRecord("assistant", "x" * 10)
+        long = ChatRecord("assistant", "x" * 500)
+        assert estimate_height(long, 80) > estimate_height(short, 80)
+
+    def test_fixed_kinds(self):
+        assert estimate_height(ChatRecord("meta"), 80) == 1
+        assert estimate_height(ChatRecord("tool", "x" * 5000), 80) == 3
+
+    def test_folded_is_capped(self):
+        record = ChatRecord("assistant", "\n".join("line" for _ in range(100)))
+        unfolded = estimate_height(record, 80)
+        record.classes = {"folded"}
+        assert estimate_height(record, 80) < unfolded
+
+
+# ---------------------------------------------------------------------------
+# Windowing
+# ---------------------------------------------------------------------------
+
+
+class TestVirtualTranscript:
+    @pytest.mark.asyncio
+    async def test_only_window_is_mounted(self):
+        app = _ChatApp()
+        records = _records(1000)
+        async with app.run_test(size=(80, 24)) as pilot:
+            chat = app.query_one("#chat")
+            transcript = VirtualTranscript(records, _build)
+            await chat.mount(transcript)
+            await _settle(pilot)
+            mounted = [r for r in records if r.widget is not None]
+            assert 0 < len(mounted) < 200
+            # The view opens at the end of the transcript.
+            assert records[-1].widget is not None
+            assert chat.scroll_y == chat.max_scroll_y
+
+    @pytest.mark.asyncio
+    async def test_scrolling_releases_and_realizes(self):
+        app = _ChatApp()
+        records = _records(1000)
+        released: list[ChatRecord] = []
+        async with app.run_test(size=(80, 24)) as pilot:
+            chat = app.query_one("#chat")
+            transcript = VirtualTranscript(records, _build, on_release=released.append)
+            await chat.mount(transcript)
+            await _settle(pilot)
+            records[-1].widget.add_class("folded")
+            chat.scroll_home(animate=False)
+            await _settle(pilot)
+            assert records[0].widget is not None
+            assert records[-1].widget is None
+            assert records[-1] in released
+            assert "folded" in records[-1].classes
+
+    @pytest.mark.asyncio
+    async def test_realize_on_demand(self):
+        app = _ChatApp()
+        records = _records(1000)
+        realized: list[ChatRecord] = []
+        async with app.run_test(size=(80, 24)) as pilot:
+            chat = app.query_one("#chat")
+            transcript = VirtualTranscript(records, _build, on_realize=realized.append)
+            await chat.mount(transcript)
+            await _settle(pilot)
+            target = records[500]
+            assert target.widget is None
+            widget = transcript.realize(target)
+            assert widget is not None
+            assert target in realized
+            widget.scroll_visible(animate=False)
+            await _settle(pilot)
+            assert target.widget is widget
+            assert widget.region.overlaps(chat.region)
+
+    @pytest.mark.asyncio
+    async def test_discard_reindexes(self):
+        app = _ChatApp()
+        records = _records(10)
+        async with app.run_test(size=(80, 24)) as pilot:
+            chat = app.query_one("#chat")
+            transcript = VirtualTranscript(records, _build, page_size=4)
+            await chat.mount(transcript)
+            await _settle(pilot)
+            transcript.discard({2, 5})
+            await _settle(pilot)
+            remaining = list(transcript.records)
+            assert [r.content.split("\n")[0] for r in remaining[:3]] == [
+                "message 0",
+                "message 1",
+                "message 3",
+            ]
+            assert [r.search_index for r in remaining] == list(range(8))
+            assert records[2].widget is None
+
+    @pytest.mark.asyncio
+    async def test_set_released_class(self):
+        app = _ChatApp()
+        records = _records(1000)
+        async with app.run_test(size=(80, 24)) as pilot:
+            chat = app.query_one("#chat")
+            transcript = VirtualTranscript(records, _build)
+            await chat.mount(transcript)
+            await _settle(pilot)
+            transcript.set_released_class("folded", True)
+            assert "folded" in records[0].classes
+            # Mounted records keep their state on the widget.
+            assert "folded" not in (records[-1].classes or set())
+            transcript.set_released_class("folded", False)
+            assert "folded" not in records[0].classes
+
+    @pytest.mark.asyncio
+    async def test_history_joins_as_view_nears_top(self):
+        app = _ChatApp()
+        records = _records(1000)
+        async with app.run_test(size=(80, 24)) as pilot:
+            chat = app.query_one("#chat")
+            transcript = VirtualTranscript(records[900:], _build)
+            await chat.mount(transcript)
+            await _settle(pilot)
+            transcript.add_history(records[:900])
+            assert list(transcript.records) == records
+            await _settle(pilot)
+            # The tail is still in view; held history has not been paged in.
+            assert records[-1].widget is not None
+            pages = len(transcript.children)
+            assert records[899].widget is None
+            chat.scroll_home(animate=False)
+            await _settle(pilot, rounds=12)
+            assert len(transcript.children) > pages
+            assert records[899].widget is not None
+            assert list(transcript.records) == records
+
+    @pytest.mark.asyncio
+    async def test_realize_held_history(self):
+        app = _ChatApp()
+        records = _records(300)
+        async with app.run_test(size=(80, 24)) as pilot:
+            chat = app.query_one("#chat")
+            transcript = VirtualTranscript(records[250:], _build)
+            await chat.mount(transcript)
+            await _settle(pilot)
+            transcript.add_history(records[:250])
+            widget = transcript.realize(records[10])
+            assert widget is not None
+            await _settle(pilot)
+            assert widget.is_attached
+            assert list(transcript.records) == records
@@ -0,0 +1,132 @@
+"""Tests for the web session hub: shared conversations and per-client queues."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+
+from amplifier_tui.web.hub import SessionHub, WebClient
+from amplifier_tui.web.stream_protocol import STREAM_MODE_DELTA, STREAM_MODE_FULL
+
+
+class FakeSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+        self.closed_with: int | None = None
+
+    async def send_json(self, event: dict) -> None:
+        self.sent.append(event)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+
+class FakeApp:
+    """Stands in for WebApp: records attach/detach and shutdown."""
+
+    def __init__(self) -> None:
+        self.conversation_id = str(uuid.uuid4())
+        self.attached: list[WebClient] = []
+        self.busy = False
+        self.shut_down = False
+
+    @property
+    def clients(self) -> int:
+        return len(self.attached)
+
+    def attach(self, client: WebClient) -> None:
+        self.attached.append(client)
+        client.send({"type": "connected", "conversation_id": self.conversation_id})
+
+    def detach(self, client: WebClient) -> None:
+        self.attached.remove(client)
+
+    async def shutdown(self) -> None:
+        self.shut_down = True
+
+
+class TestWebClient:
+    @pytest.mark.asyncio
+    async def test_writes_queued_events_in_order(self):
+        ws = FakeSocket()
+        client = WebClient(ws)
+        for i in range(3):
+            client.send({"type": "n", "i": i})
+        client.close()
+        await client.run()
+        assert [e["i"] for e in ws.sent] == [0, 1, 2]
+        assert ws.closed_with is None
+
+    @pytest.mark.asyncio
+    async def test_slow_client_is_dropped(self):
+        ws = FakeSocket()
+        client = WebClient(ws, queue_size=2)
+        for i in range(5):
+            client.send({"type": "n", "i": i})
+        assert client.dropped
+        await client.run()
+        assert ws.sent == []
+        assert ws.closed_with == 1013
+
+    def test_stream_mode(self):
+        client = WebClient(FakeSocket())
+        assert client.stream_mode == STREAM_MODE_FULL
+        client.set_stream_mode(STREAM_MODE_DELTA)
+        client.set_stream_mode("bogus")
+        assert client.stream_mode == STREAM_MODE_DELTA
+
+
+class TestSessionHub:
+    @pytest.mark.asyncio
+    async def test_clients_share_a_conversation(self):
+        hub = SessionHub(FakeApp)
+        app, first, created = hub.attach(FakeSocket())
+        assert created
+        same, second, created = hub.attach(FakeSocket(), app.conversation_id)
+        assert same is app and not created
+        assert app.attached == [first, second]
+
+        other, _, created = hub.attach(FakeSocket(), "expired-id")
+        assert created and other is not app
+        assert hub.stats() == {"conversations": 2, "clients": 3, "idle": 0}
+
+    @pytest.mark.asyncio
+    async def test_conversation_outlives_its_clients(self):
+        hub = SessionHub(FakeApp, idle_timeout=0.05)
+        app, client, _ = hub.attach(FakeSocket())
+        hub.detach(app, client)
+        assert hub.stats()["idle"] == 1
+
+        # Reattaching before the timeout keeps the session
+        again, client, created = hub.attach(FakeSocket(), app.conversation_id)
+        assert again is app and not created
+        await asyncio.sleep(0.1)
+        assert not app.shut_down
+
+        hub.detach(app, client)
+        await asyncio.sleep(0.1)
+        assert app.shut_down
+        assert hub.stats() == {"conversations": 0, "clients": 0, "idle": 0}
+
+    @pytest.mark.asyncio
+    async def test_expiry_waits_for_running_turn(self):
+        hub = SessionHub(FakeApp, idle_timeout=0.01)
+        app, client, _ = hub.attach(FakeSocket())
+        app.busy = True
+        hub.detach(app, client)
+        await asyncio.sleep(0.1)
+        assert not app.shut_down
+        app.busy = False
+        await asyncio.sleep(1.1)
+        assert app.shut_down
+
+    @pytest.mark.asyncio
+    async def test_close_ends_every_conversation(self):
+        hub = SessionHub(FakeApp)
+        apps = [hub.attach(FakeSocket())[0] for _ in range(3)]
+        hub.detach(apps[0], apps[0].attached[0])
+        await hub.close()
+        assert all(app.shut_down for app in apps)
+        assert hub.stats()["conversations"] == 0
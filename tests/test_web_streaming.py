@@ -15,6 +15,7 @@ from unittest.mock import MagicMock
 
 from starlette.testclient import TestClient
 
+from amplifier_tui.web.stream_protocol import STREAM_MODE_DELTA
 from amplifier_tui.web.web_app import WebApp
 
 
@@ -37,9 +38,13 @@ def web_app(events):
     The streaming callbacks and display methods all go through _send_event,
     so capturing that is sufficient to test event shapes.
     """
-    mock_ws = MagicMock()
-    app = WebApp(mock_ws)
-    app._send_event = lambda ev: events.append(ev)
+    app = WebApp()
+
+    def send(ev, mode=""):
+        if mode != STREAM_MODE_DELTA:  # what a client in "full" mode receives
+            events.append(ev)
+
+    app._send_event = send
     return app
 
 
@@ -463,3 +468,32 @@ class TestEventContracts:
             assert len(events) == len(commands)
             for ev in events:
                 assert "type" in ev
+
+
+# ---------------------------------------------------------------------------
+# Session switching vs. running turns
+# ---------------------------------------------------------------------------
+
+
+class TestSwitchDuringTurn:
+    @pytest.mark.asyncio
+    async def test_switch_rejected_while_turn_running(self, web_app, events):
+        web_app.session_manager = MagicMock()
+        async with web_app._turn_lock:
+            await web_app.switch_to_session("abc123")
+        web_app.session_manager.resume_session.assert_not_called()
+        assert events[-1]["type"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_switch_holds_turn_lock(self, web_app, events):
+        held: list[bool] = []
+
+        async def _resume(*args, **kwargs):
+            held.append(web_app._turn_lock.locked())
+
+        web_app.session_manager = MagicMock()
+        web_app.session_manager.session = None
+        web_app.session_manager.resume_session = _resume
+        await web_app.switch_to_session("abc123")
+        assert held == [True]
+        assert not web_app._turn_lock.locked()
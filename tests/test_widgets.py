@@ -150,8 +150,8 @@ class TestTabState:
         """Each instance should get its own mutable containers."""
         ts1 = TabState(name="a", tab_id="1", container_id="c1")
         ts2 = TabState(name="b", tab_id="2", container_id="c2")
-        ts1.conversation.search_messages.append("x")
-        assert ts2.conversation.search_messages == []
+        ts1.conversation.search_messages.append(("user", "x", None))
+        assert len(ts2.conversation.search_messages) == 0
 
     def test_field_mutation(self):
         ts = TabState(name="a", tab_id="1", container_id="c1")
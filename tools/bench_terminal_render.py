@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark the embedded terminal: pyte feed + render throughput.
+
+Generates MBs of ANSI output shaped like a compiler run (coloured status
+words, long paths, progress lines rewritten with ``\\r``) and pushes it
+through :class:`~amplifier_tui.widgets.terminal.Terminal` in PTY-sized
+chunks.  Reports MB/s for:
+
+* ``feed``    -- pyte parsing only, never rendering
+* ``full``    -- rebuilding every row after every chunk (no dirty tracking)
+* ``dirty``   -- rendering only dirty rows after every chunk
+* ``capped``  -- dirty rows, at most one frame per ``--fps`` of simulated
+  arrival time (``--mbps`` of output, as a busy build produces)
+
+Usage:
+    python tools/bench_terminal_render.py [--mb 2] [--chunk 4096] [--fps 30]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from amplifier_tui.widgets.terminal import Terminal
+
+_LINES = [
+    "\x1b[1m\x1b[32m   Compiling\x1b[0m serde_derive v1.0.{n} (/home/dev/.cargo/registry/src/serde)\r\n",
+    "\x1b[1m\x1b[33mwarning\x1b[0m\x1b[1m: unused variable: `x{n}`\x1b[0m\r\n",
+    "\x1b[0m\x1b[1m\x1b[38;5;12m  --> \x1b[0msrc/module_{n}.rs:{n}:9\r\n",
+    "\x1b[1m\x1b[36m    Building\x1b[0m [=====>     ] {n}/812: tokio, hyper\r",
+    "\x1b[2K\x1b[1m\x1b[36m    Building\x1b[0m [=======>   ] {n}/812: regex\r",
+    "test tests::case_{n} ... \x1b[32mok\x1b[0m\r\n",
+]
+
+
+def _output(target_mb: float) -> str:
+    parts: list[str] = []
+    size = 0
+    n = 0
+    while size < target_mb * 1024 * 1024:
+        line = _LINES[n % len(_LINES)].format(n=n)
+        parts.append(line)
+        size += len(line)
+        n += 1
+    return "".join(parts)
+
+
+def _run(data: str, chunk: int, mode: str, fps: float, mbps: float) -> float:
+    t = Terminal(command="/bin/true")
+    t._screen.resize(50, 160)
+    frame = 1.0 / fps
+    arrival_per_char = 1.0 / (mbps * 1024 * 1024)
+    next_frame = 0.0
+    start = time.perf_counter()
+    for i in range(0, len(data), chunk):
+        t._feed(data[i : i + chunk])
+        if mode == "full":
+            t._screen.dirty.update(range(t._screen.lines))
+            t._update_lines()
+        elif mode == "dirty":
+            t._update_lines()
+        elif mode == "capped":
+            arrived = (i + chunk) * arrival_per_char
+            if arrived >= next_frame:
+                t._update_lines()
+                next_frame = arrived + frame
+    t._update_lines()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--mb", type=float, default=2.0, help="output size")
+    parser.add_argument("--chunk", type=int, default=4096, help="bytes per read")
+    parser.add_argument("--fps", type=float, default=30.0, help="frame cap")
+    parser.add_argument(
+        "--mbps", type=float, default=2.0, help="simulated output rate (capped)"
+    )
+    args = parser.parse_args()
+
+    data = _output(args.mb)
+    size_mb = len(data) / (1024 * 1024)
+    print(f"output: {size_mb:.1f} MB in {args.chunk}-byte chunks, 160x50 screen")
+    print(f"{'mode':<8} {'seconds':>9} {'MB/s':>9}")
+    for mode in ("feed", "full", "dirty", "capped"):
+        elapsed = _run(data, args.chunk, mode, args.fps, args.mbps)
+        print(f"{mode:<8} {elapsed:>9.2f} {size_mb / elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark transcript.jsonl parsing: stdlib json vs. the fast backend.
+
+Generates a synthetic transcript (user/assistant turns plus tool calls with
+large results, like real sessions) and reports parse time per MB for:
+
+* ``decode``  -- decoding every line (``load_transcript``)
+* ``blocks``  -- decoding + ``parse_message_blocks`` (transcript replay)
+
+for the stdlib decoder and for ``amplifier_tui.core._json`` (orjson when it
+is installed).
+
+Usage:
+    python tools/bench_transcript_parse.py [--mb 20] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from amplifier_tui.core import _json, transcript_loader
+from amplifier_tui.core.transcript_loader import load_transcript, parse_message_blocks
+
+
+def _write_transcript(path: Path, target_mb: float) -> float:
+    """Write a transcript of about *target_mb* megabytes; return its size."""
+    result_text = "\n".join(f"{i:05d}  src/module_{i % 40}.py: ok" for i in range(400))
+    turn = [
+        {"role": "user", "content": "Please refactor the parser and run the tests."},
+        {
+            "role": "assistant",
+            "content": [
+                {"type": "thinking", "thinking": "Look at the parser first. " * 20},
+                {"type": "text", "text": "Running the test suite now. " * 10},
+                {
+                    "type": "tool_use",
+                    "id": "toolu_01",
+                    "name": "bash",
+                    "input": {"command": "pytest -q", "timeout": 120},
+                },
+            ],
+        },
+        {
+            "role": "tool",
+            "tool_use_id": "toolu_01",
+            "content": [{"type": "text", "text": result_text}],
+        },
+        {"role": "assistant", "content": "All tests pass. " * 15},
+    ]
+    chunk = "".join(json.dumps(m) + "\n" for m in turn)
+    repeats = max(1, int(target_mb * 1024 * 1024 / len(chunk)))
+    path.write_text(chunk * repeats, encoding="utf-8")
+    return path.stat().st_size / (1024 * 1024)
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--mb", type=float, default=20.0, help="transcript size")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "transcript.jsonl"
+        size_mb = _write_transcript(path, args.mb)
+
+        def decode() -> None:
+            for _msg in load_transcript(path):
+                pass
+
+        def blocks() -> None:
+            for msg in load_transcript(path):
+                parse_message_blocks(msg)
+
+        results: dict[str, dict[str, float]] = {}
+        for backend, loads in (("json", json.loads), (_json.BACKEND, _json.loads)):
+            transcript_loader.loads = loads
+            results[backend] = {
+                "decode": _time(decode, args.repeat),
+                "blocks": _time(blocks, args.repeat),
+            }
+        transcript_loader.loads = _json.loads
+
+    print(f"transcript: {size_mb:.1f} MB, best of {args.repeat}")
+    print(f"{'backend':<8} {'decode ms/MB':>14} {'blocks ms/MB':>14}")
+    for backend, timings in results.items():
+        print(
+            f"{backend:<8} {timings['decode'] * 1000 / size_mb:>14.2f}"
+            f" {timings['blocks'] * 1000 / size_mb:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()